@@ -6,7 +6,8 @@ from django.contrib import admin
 from django.contrib.gis.admin import GISModelAdmin
 from django.utils.html import format_html
 from django.db.models import Count
-from apps.grievances.models import Grievance, GrievanceImage, Like, Area, GrievanceSecret
+from apps.grievances.models import Grievance, GrievanceImage, Like, Area, GrievanceSecret, GrievanceEvent, ArchivedGrievance
+from apps.grievances.archive import GrievanceArchiver, archived_grievance_count
 
 
 class GrievanceImageInline(admin.TabularInline):
@@ -33,14 +34,15 @@ class AreaAdmin(GISModelAdmin):
     list_display = ['name', 'leader', 'grievance_count', 'created_at']
     list_filter = ['created_at']
     search_fields = ['name', 'leader__email', 'leader__nickname']
-    readonly_fields = ['grievance_count', 'created_at', 'updated_at']
+    # 인접 구역은 build_area_adjacency 배치로만 계산 (피드 키 무효화 포함)
+    readonly_fields = ['grievance_count', 'neighbours', 'created_at', 'updated_at']
 
     fieldsets = (
         ('기본 정보', {
             'fields': ('name', 'leader')
         }),
         ('지리 정보', {
-            'fields': ('center_point', 'boundary')
+            'fields': ('center_point', 'boundary', 'neighbours')
         }),
         ('통계', {
             'fields': ('grievance_count', 'created_at', 'updated_at')
@@ -51,11 +53,11 @@ class AreaAdmin(GISModelAdmin):
         """N+1 쿼리 방지: 민원 개수를 annotate로 미리 계산"""
         queryset = super().get_queryset(request)
         return queryset.annotate(
-            _grievance_count=Count('grievances', distinct=True)
+            _grievance_count=Count('grievances', distinct=True) + archived_grievance_count()
         )
 
     def grievance_count(self, obj):
-        """해당 지역의 민원 개수 (annotate 사용)"""
+        """해당 지역의 민원 개수 (annotate 사용, 보관 민원 포함)"""
         return obj._grievance_count
     grievance_count.short_description = '민원 수'
     grievance_count.admin_order_field = '_grievance_count'  # 정렬 가능
@@ -82,14 +84,24 @@ class GrievanceAdmin(GISModelAdmin):
     )
 
     readonly_fields = ['id', 'created_at', 'updated_at', 'like_count_display']
+    list_select_related = ['user', 'area']
+
+    def get_queryset(self, request):
+        """N+1 쿼리 방지: 좋아요 개수를 annotate로 미리 계산"""
+        queryset = super().get_queryset(request)
+        return queryset.annotate(
+            _like_count=Count('likes', distinct=True)
+        )
 
     def user_email(self, obj):
         return obj.user.email if obj.user else '익명'
     user_email.short_description = '작성자'
 
     def like_count_display(self, obj):
-        return obj.like_count
+        """좋아요 개수 (annotate 사용)"""
+        return obj._like_count
     like_count_display.short_description = '좋아요'
+    like_count_display.admin_order_field = '_like_count'
 
 
 @admin.register(GrievanceImage)
@@ -117,3 +129,40 @@ class LikeAdmin(admin.ModelAdmin):
     list_filter = ['created_at']
     search_fields = ['user__email', 'grievance__title']
     readonly_fields = ['created_at']
+
+
+@admin.register(GrievanceEvent)
+class GrievanceEventAdmin(admin.ModelAdmin):
+    """민원 타임라인 이벤트 (추가 전용 로그 → 읽기 전용)"""
+    list_display = ['grievance_id', 'event_type', 'from_status', 'to_status', 'actor', 'actor_role', 'elapsed', 'created_at']
+    list_filter = ['event_type', 'actor_role', 'to_status']
+    search_fields = ['=grievance__id', 'actor__email']
+    list_select_related = ['actor']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(ArchivedGrievance)
+class ArchivedGrievanceAdmin(GISModelAdmin):
+    """보관 민원 (읽기 전용, 선택 항목 복원 가능)"""
+    list_display = ['title', 'category', 'area', 'status', 'visibility', 'like_count', 'created_at', 'completed_at', 'archived_at']
+    list_filter = ['category', 'visibility', 'area', 'archived_at']
+    search_fields = ['title', 'content', 'location', 'user__email']
+    list_select_related = ['area']
+    exclude = ['password_hash']
+    actions = ['restore_selected']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    @admin.action(description='선택한 보관 민원 복원')
+    def restore_selected(self, request, queryset):
+        restored = GrievanceArchiver().restore(queryset.values_list('pk', flat=True))
+        self.message_user(request, f'{restored}건을 복원했습니다.')
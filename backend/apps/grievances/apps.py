@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class GrievancesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.grievances'
+
+    def ready(self):
+        from apps.grievances import signals  # noqa: F401
@@ -0,0 +1,193 @@
+"""
+완료 민원 보관(아카이브)
+- 완료(resolved) 후 GRIEVANCE_ARCHIVE_AFTER_DAYS가 지난 민원을 좋아요 / 이미지 경로 / 비공개 패스워드와 함께
+  grievances_archive, likes_archive, grievance_images_archive로 배치 이동 (이미지 파일은 그대로)
+- 배치마다 짧은 트랜잭션: FOR UPDATE SKIP LOCKED로 대상 행만 잠그고 lock_timeout으로 대기 상한
+  → 다른 요청이 잡고 있는 행은 건너뛰고, 잠금 대기로 hot 테이블을 막지 않음
+- 배치 사이 GRIEVANCE_ARCHIVE_PAUSE_SECONDS 대기 (I/O, WAL 부담 분산)
+- restore()로 원래 테이블에 되돌림 (완료 상태 그대로면 다음 실행에서 다시 보관되므로 재처리 시 상태 변경)
+
+사용 예:
+    python manage.py archive_grievances --older-than-days 365 --batch-size 500
+    python manage.py archive_grievances --restore <민원 UUID>
+"""
+
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import OperationalError, connection, transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.grievances.models import (
+    ArchivedGrievance,
+    ArchivedGrievanceImage,
+    ArchivedLike,
+    Grievance,
+    GrievanceImage,
+    GrievanceSecret,
+    Like,
+)
+from apps.grievances.services import GrievanceVersionService
+
+logger = logging.getLogger('baro.archive')
+
+
+def _columns(model, prefix=''):
+    return ', '.join(prefix + connection.ops.quote_name(field.column) for field in model._meta.concrete_fields)
+
+
+def archived_grievance_count():
+    """구역별 보관 민원 수 (Area 쿼리셋 annotate용, 없으면 0)"""
+    counts = ArchivedGrievance.objects.filter(area=OuterRef('pk')).order_by().values('area').annotate(
+        total=Count('pk')
+    ).values('total')
+    return Coalesce(Subquery(counts), 0)
+
+
+class GrievanceArchiver:
+    """
+    민원 보관 / 복원
+
+    Attributes:
+        batch_size: 배치당 최대 민원 수
+        pause: 배치 사이 대기 (초)
+        lock_timeout_ms: 배치 트랜잭션의 잠금 대기 상한
+    """
+
+    grievance_table = Grievance._meta.db_table
+    secret_table = GrievanceSecret._meta.db_table
+    max_failures = 3
+
+    def __init__(self, batch_size=None, pause=None, lock_timeout_ms=None):
+        self.batch_size = batch_size or settings.GRIEVANCE_ARCHIVE_BATCH_SIZE
+        self.pause = settings.GRIEVANCE_ARCHIVE_PAUSE_SECONDS if pause is None else pause
+        self.lock_timeout_ms = lock_timeout_ms or settings.GRIEVANCE_ARCHIVE_LOCK_TIMEOUT_MS
+
+    @staticmethod
+    def cutoff(older_than_days=None, now=None):
+        days = settings.GRIEVANCE_ARCHIVE_AFTER_DAYS if older_than_days is None else older_than_days
+        return (now or timezone.now()) - timedelta(days=days)
+
+    def run(self, cutoff, max_batches=None):
+        """
+        대상이 없거나 max_batches에 도달할 때까지 배치 반복 (배치 사이 pause초 대기)
+
+        Returns:
+            보관한 민원 수
+        """
+        total, batches, failures = 0, 0, 0
+        while max_batches is None or batches < max_batches:
+            batches += 1
+            try:
+                moved = self.archive_batch(cutoff)
+            except OperationalError as e:
+                # lock_timeout 등 → 잠시 후 재시도, 연속 실패 시 중단
+                failures += 1
+                logger.warning('archive batch failed (%s/%s): %s', failures, self.max_failures, e)
+                if failures >= self.max_failures:
+                    break
+                time.sleep(self.pause)
+                continue
+
+            failures = 0
+            if moved == 0:
+                break
+            total += moved
+            logger.info('archived %s grievances (total %s)', moved, total)
+            if self.pause:
+                time.sleep(self.pause)
+        return total
+
+    def archive_batch(self, cutoff):
+        """완료 시각(없으면 수정 시각)이 cutoff 이전인 완료 민원 최대 batch_size건 보관"""
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute("SELECT set_config('lock_timeout', %s, true)", [str(self.lock_timeout_ms)])
+            cursor.execute(f"""
+                SELECT id, area_id FROM {self.grievance_table}
+                WHERE status = 'resolved' AND COALESCE(completed_at, updated_at) < %s
+                ORDER BY created_at
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            """, [cutoff, self.batch_size])
+            rows = cursor.fetchall()
+            if not rows:
+                return 0
+
+            ids = [row[0] for row in rows]
+            cursor.execute(f"""
+                INSERT INTO {ArchivedGrievance._meta.db_table} ({_columns(Grievance)}, like_count, password_hash, archived_at)
+                SELECT {_columns(Grievance, prefix='g.')},
+                       (SELECT count(*) FROM {Like._meta.db_table} l WHERE l.grievance_id = g.id),
+                       COALESCE(s.password_hash, ''),
+                       now()
+                FROM {self.grievance_table} g
+                LEFT JOIN {self.secret_table} s ON s.grievance_id = g.id
+                WHERE g.id = ANY(%s)
+            """, [ids])
+            self._move(cursor, GrievanceImage, ArchivedGrievanceImage, ids)
+            self._move(cursor, Like, ArchivedLike, ids)
+            cursor.execute(f'DELETE FROM {self.secret_table} WHERE grievance_id = ANY(%s)', [ids])
+            cursor.execute(f'DELETE FROM {self.grievance_table} WHERE id = ANY(%s)', [ids])
+
+            transaction.on_commit(lambda: self._bump(rows))
+        return len(ids)
+
+    def restore(self, grievance_ids):
+        """
+        보관 민원을 원래 테이블로 복원
+
+        Returns:
+            복원한 민원 수
+        """
+        ids = list(grievance_ids)
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT id, area_id FROM {ArchivedGrievance._meta.db_table} WHERE id = ANY(%s) FOR UPDATE',
+                [ids],
+            )
+            rows = cursor.fetchall()
+            if not rows:
+                return 0
+
+            ids = [row[0] for row in rows]
+            grievance_columns = _columns(Grievance)
+            cursor.execute(f"""
+                INSERT INTO {self.grievance_table} ({grievance_columns})
+                SELECT {grievance_columns} FROM {ArchivedGrievance._meta.db_table} WHERE id = ANY(%s)
+            """, [ids])
+            cursor.execute(f"""
+                INSERT INTO {self.secret_table} (grievance_id, password_hash, created_at)
+                SELECT id, password_hash, created_at FROM {ArchivedGrievance._meta.db_table}
+                WHERE id = ANY(%s) AND password_hash <> ''
+            """, [ids])
+            self._move(cursor, ArchivedGrievanceImage, GrievanceImage, ids)
+            self._move(cursor, ArchivedLike, Like, ids)
+            cursor.execute(f'DELETE FROM {ArchivedGrievance._meta.db_table} WHERE id = ANY(%s)', [ids])
+
+            transaction.on_commit(lambda: self._bump(rows))
+        return len(ids)
+
+    @staticmethod
+    def _move(cursor, source, target, grievance_ids):
+        """source → target 테이블로 해당 민원의 행 이동 (컬럼 구성 동일)"""
+        columns = _columns(target)
+        cursor.execute(f"""
+            WITH moved AS (
+                DELETE FROM {source._meta.db_table} WHERE grievance_id = ANY(%s) RETURNING {columns}
+            )
+            INSERT INTO {target._meta.db_table} ({columns}) SELECT {columns} FROM moved
+        """, [grievance_ids])
+
+    @staticmethod
+    def _bump(rows):
+        """SQL로 직접 옮기므로 시그널 대신 버전 증가 (목록/상세/구역 캐시 무효화)"""
+        keys = {GrievanceVersionService.GLOBAL_KEY}
+        for grievance_id, area_id in rows:
+            keys.add(GrievanceVersionService.item_key(grievance_id))
+            if area_id is not None:
+                keys.add(GrievanceVersionService.area_key(area_id))
+        GrievanceVersionService.bump(sorted(keys))
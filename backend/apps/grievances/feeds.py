@@ -0,0 +1,252 @@
+"""
+우리 동네 피드 (사용자 구역 + 인접 구역의 최근 공개 민원)
+- 인접 구역: Area.neighbours (build_area_adjacency 배치가 경계 / 중심 좌표로 미리 계산)
+- 구역별 피드 키 1개 = 그 구역 사용자의 홈 피드 (Redis sorted set, 점수 = 접수 시각 ms)
+  민원이 들어오면 해당 구역 + 인접 구역 키에 함께 추가 → 조회는 키 1개만 읽음
+  키마다 최근 NEIGHBOURHOOD_FEED_SIZE개만 유지, 그 이전 페이지는 PostgreSQL 조회
+- 갱신: 민원 생성 / 삭제 / 공개 범위·구역 변경 (signals)
+  이미 채워진 키에만 추가 (없는 키에 1건만 넣으면 나머지가 빠진 피드가 되므로, 없는 키는 조회 시 DB에서 한 번에 채움)
+- 조회: 캐시 1회 → 민원 행은 PK 배치 조회 1회 (GrievanceViewSet.neighbourhood)
+  Redis 장애 시 PostgreSQL 조회로 대체
+- DB 조회는 최근 NEIGHBOURHOOD_FEED_WINDOW_DAYS일로 제한 (created_at 하한 → grievances 월 파티션 프루닝)
+- 보관 / 대량 적재 등 시그널을 거치지 않는 변경은 키 TTL(NEIGHBOURHOOD_FEED_TTL)로 반영
+  (보관돼 사라진 민원은 PK 배치 조회에서 빠짐)
+
+Redis가 아닌 캐시(테스트 LocMem 등)는 같은 동작을 캐시 get/set으로 처리
+"""
+
+import heapq
+import logging
+import threading
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.grievances.models import Grievance
+from apps.grievances.services import AreaAdjacencyService
+from core import metrics
+
+logger = logging.getLogger('baro.feed')
+
+# 이미 있는 키에만 추가 + 유지 개수 초과분 제거 (키 존재 확인과 추가를 원자적으로)
+PUSH_SCRIPT = """
+for _, key in ipairs(KEYS) do
+    if redis.call('exists', key) == 1 then
+        redis.call('zadd', key, ARGV[2], ARGV[1])
+        redis.call('zremrangebyrank', key, 0, -(tonumber(ARGV[3]) + 1))
+    end
+end
+"""
+
+
+class RedisFeedStore:
+
+    def __init__(self, client):
+        self.client = client
+        self._push = client.register_script(PUSH_SCRIPT)
+
+    def push(self, keys, member, score, size):
+        self._push(keys=[cache.make_key(key) for key in keys], args=[member, score, size])
+
+    def remove(self, keys, member):
+        pipe = self.client.pipeline(transaction=False)
+        for key in keys:
+            pipe.zrem(cache.make_key(key), member)
+        pipe.execute()
+
+    def page(self, key, before, limit):
+        """
+        [(민원 ID, 점수)] 최신순 limit개 + 키 전체 개수 (왕복 1회)
+        키가 없으면 None
+        """
+        key = cache.make_key(key)
+        pipe = self.client.pipeline(transaction=False)
+        pipe.zrevrangebyscore(key, f'({before}' if before is not None else '+inf', '-inf',
+                              start=0, num=limit, withscores=True)
+        pipe.zcard(key)
+        rows, total = pipe.execute()
+        if not total:
+            return None
+        return [(member.decode(), int(score)) for member, score in rows], total
+
+    def fill(self, key, items, ttl):
+        """키 교체 (임시 키에 쓰고 RENAME → 조회 중에도 빈 피드가 보이지 않음)"""
+        key = cache.make_key(key)
+        pipe = self.client.pipeline(transaction=True)
+        pipe.delete(f'{key}:rebuild')
+        pipe.zadd(f'{key}:rebuild', dict(items))
+        pipe.expire(f'{key}:rebuild', ttl)
+        pipe.rename(f'{key}:rebuild', key)
+        pipe.execute()
+
+    def delete(self, keys):
+        if keys:
+            self.client.delete(*[cache.make_key(key) for key in keys])
+
+
+class CacheFeedStore:
+    """Redis가 아닌 캐시 백엔드용 (키별 {민원 ID: 점수} 딕셔너리, 프로세스 내 잠금)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def push(self, keys, member, score, size):
+        with self._lock:
+            for key in keys:
+                feed = cache.get(key)
+                if feed is None:
+                    continue
+                feed[member] = score
+                feed = dict(heapq.nlargest(size, feed.items(), key=lambda item: (item[1], item[0])))
+                cache.set(key, feed, timeout=settings.NEIGHBOURHOOD_FEED_TTL)
+
+    def remove(self, keys, member):
+        with self._lock:
+            for key in keys:
+                feed = cache.get(key)
+                if feed is not None and feed.pop(member, None) is not None:
+                    cache.set(key, feed, timeout=settings.NEIGHBOURHOOD_FEED_TTL)
+
+    def page(self, key, before, limit):
+        feed = cache.get(key)
+        if not feed:
+            return None
+        items = [item for item in feed.items() if before is None or item[1] < before]
+        return heapq.nlargest(limit, items, key=lambda item: (item[1], item[0])), len(feed)
+
+    def fill(self, key, items, ttl):
+        cache.set(key, dict(items), timeout=ttl)
+
+    def delete(self, keys):
+        cache.delete_many(keys)
+
+
+_redis_store = None
+_cache_store = CacheFeedStore()
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """django-redis 캐시면 sorted set, 아니면(테스트 LocMem 등) 캐시 get/set"""
+    global _redis_store
+    if not hasattr(cache, 'client'):
+        return _cache_store
+    if _redis_store is None:
+        with _store_lock:
+            if _redis_store is None:
+                from django_redis import get_redis_connection
+                _redis_store = RedisFeedStore(get_redis_connection('default'))
+    return _redis_store
+
+
+class NeighbourhoodFeed:
+
+    PREFIX = 'neighbourhood_feed:area:'
+
+    @classmethod
+    def key(cls, area_id):
+        return f'{cls.PREFIX}{area_id}'
+
+    @staticmethod
+    def score(created_at):
+        """접수 시각 → 점수 (epoch ms, 페이지 커서로도 사용)"""
+        return int(created_at.timestamp() * 1000)
+
+    @staticmethod
+    def from_score(score):
+        return datetime.fromtimestamp(score / 1000, tz=dt_timezone.utc)
+
+    @classmethod
+    def keys_for(cls, area_id):
+        """구역 민원이 보이는 피드 키 (해당 구역 + 인접 구역, 인접 관계는 대칭)"""
+        return [cls.key(neighbour_id) for neighbour_id in AreaAdjacencyService.neighbourhood(area_id)]
+
+    @classmethod
+    def add(cls, grievance):
+        """새 공개 민원 (구역 미지정 / 비공개는 대상 아님)"""
+        if grievance.area_id is None or grievance.visibility != 'public':
+            return
+        member = str(grievance.pk)
+        try:
+            get_store().push(
+                cls.keys_for(grievance.area_id), member,
+                cls.score(grievance.created_at), settings.NEIGHBOURHOOD_FEED_SIZE,
+            )
+        except Exception as e:
+            logger.warning('neighbourhood feed push failed (%s): %s', member, e)
+
+    @classmethod
+    def discard(cls, grievance, area_ids=()):
+        """삭제 / 비공개 전환 / 구역 이동 (area_ids: 제거할 구역, 기본은 현재 구역)"""
+        area_ids = {area_id for area_id in (area_ids or [grievance.area_id]) if area_id is not None}
+        if not area_ids:
+            return
+        member = str(grievance.pk)
+        try:
+            keys = {key for area_id in area_ids for key in cls.keys_for(area_id)}
+            get_store().remove(list(keys), member)
+        except Exception as e:
+            logger.warning('neighbourhood feed remove failed (%s): %s', member, e)
+
+    @classmethod
+    def sync(cls, grievance, previous_area_id, previous_visibility):
+        """민원 수정 후 반영 (signals, 구역 / 공개 범위가 바뀐 경우만)"""
+        if previous_area_id == grievance.area_id and previous_visibility == grievance.visibility:
+            return
+        if previous_visibility == 'public':
+            cls.discard(grievance, [previous_area_id])
+        cls.add(grievance)
+
+    @classmethod
+    def invalidate(cls, area_ids):
+        """인접 관계 변경 후 피드 키 삭제 (다음 조회 시 새 범위로 채움)"""
+        get_store().delete([cls.key(area_id) for area_id in area_ids])
+
+    @classmethod
+    def page(cls, area_id, limit, before=None):
+        """
+        구역 피드 최신순 limit개 [(민원 ID 문자열, 점수)]
+        before: 이 점수(접수 시각 ms)보다 이전 항목만 (이전 페이지 마지막 항목의 점수)
+        - 키가 있으면 캐시 1회
+        - 키가 없으면 DB에서 최근 NEIGHBOURHOOD_FEED_SIZE개로 채운 뒤 반환
+        - 유지 개수 밖(오래된 페이지) / Redis 장애 시 DB 조회
+        """
+        key = cls.key(area_id)
+        size = settings.NEIGHBOURHOOD_FEED_SIZE
+        try:
+            cached = get_store().page(key, before, limit)
+        except Exception as e:
+            logger.warning('neighbourhood feed read failed, falling back to database: %s', e)
+            metrics.NEIGHBOURHOOD_FEED_READS.labels('database').inc()
+            return cls.recent_from_db(area_id, limit, before)
+
+        if cached is None:
+            metrics.NEIGHBOURHOOD_FEED_READS.labels('rebuild').inc()
+            items = cls.recent_from_db(area_id, size)
+            if items:
+                try:
+                    get_store().fill(key, items, settings.NEIGHBOURHOOD_FEED_TTL)
+                except Exception as e:
+                    logger.warning('neighbourhood feed fill failed (%s): %s', area_id, e)
+            return [item for item in items if before is None or item[1] < before][:limit]
+
+        items, total = cached
+        if len(items) < limit and total >= size:
+            metrics.NEIGHBOURHOOD_FEED_READS.labels('database').inc()
+            return cls.recent_from_db(area_id, limit, before)
+        metrics.NEIGHBOURHOOD_FEED_READS.labels('cache').inc()
+        return items
+
+    @classmethod
+    def recent_from_db(cls, area_id, limit, before=None):
+        """구역 + 인접 구역 최근 공개 민원 (인덱스 (area, -created_at), 피드 기간 내 파티션만)"""
+        since = timezone.now() - timedelta(days=settings.NEIGHBOURHOOD_FEED_WINDOW_DAYS)
+        queryset = Grievance.objects.filter(
+            area_id__in=AreaAdjacencyService.neighbourhood(area_id), visibility='public', created_at__gte=since
+        )
+        if before is not None:
+            queryset = queryset.filter(created_at__lt=cls.from_score(before))
+        rows = queryset.order_by('-created_at', '-id').values_list('id', 'created_at')[:limit]
+        return [(str(grievance_id), cls.score(created_at)) for grievance_id, created_at in rows]
@@ -0,0 +1,268 @@
+"""
+구역 / 카테고리별 좋아요 순위 (Redis sorted set)
+- 대상: 공개 + 미완료 민원 중 좋아요 1개 이상 (점수 = 좋아요 수)
+- 키: 전체 / 구역별 / 카테고리별 / 구역 + 카테고리별, 키마다 상위 LEADERBOARD_SIZE개만 유지
+- 갱신: 좋아요 토글(뷰에서 현재 좋아요 수로 ZADD), 민원 저장 / 삭제(signals → 상태 / 공개 범위 / 구역 / 카테고리 반영)
+  ZADD는 절대값이라 순서가 뒤바뀌거나 중복 호출돼도 마지막 값으로 수렴
+- 보정: reconcile_leaderboards 배치가 PostgreSQL 집계로 키 전체를 원자적으로 교체 (잘려 나간 하위 민원 복구 포함)
+- 조회: ZREVRANGE 1회 → 민원 행은 PK 배치 조회 1회 (GrievanceViewSet.top)
+  Redis 장애 시 PostgreSQL 집계로 대체
+
+Redis가 아닌 캐시(테스트 LocMem 등)는 같은 동작을 캐시 get/set으로 처리
+"""
+
+import heapq
+import logging
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from apps.grievances.models import Grievance
+from core import metrics
+
+logger = logging.getLogger('baro.leaderboard')
+
+
+class RedisLeaderboardStore:
+
+    def __init__(self, client):
+        self.client = client
+
+    def set_score(self, keys, member, score, size):
+        pipe = self.client.pipeline(transaction=False)
+        for key in keys:
+            key = cache.make_key(key)
+            pipe.zadd(key, {member: score})
+            pipe.zremrangebyrank(key, 0, -(size + 1))
+        pipe.execute()
+
+    def remove(self, keys, member):
+        pipe = self.client.pipeline(transaction=False)
+        for key in keys:
+            pipe.zrem(cache.make_key(key), member)
+        pipe.execute()
+
+    def top(self, key, limit):
+        rows = self.client.zrevrange(cache.make_key(key), 0, limit - 1, withscores=True)
+        return [(member.decode(), int(score)) for member, score in rows]
+
+    def replace(self, boards):
+        """{키: {민원 ID: 점수}} → 키별로 임시 키에 쓰고 RENAME (조회 중에도 빈 순위가 보이지 않음)"""
+        pipe = self.client.pipeline(transaction=True)
+        for key, scores in boards.items():
+            key = cache.make_key(key)
+            if scores:
+                pipe.delete(f'{key}:rebuild')
+                pipe.zadd(f'{key}:rebuild', scores)
+                pipe.rename(f'{key}:rebuild', key)
+            else:
+                pipe.delete(key)
+        pipe.execute()
+
+    def keys(self):
+        prefix = cache.make_key(GrievanceLeaderboard.PREFIX)
+        return [
+            key.decode()[len(prefix) - len(GrievanceLeaderboard.PREFIX):]
+            for key in self.client.scan_iter(match=f'{prefix}*', count=1000)
+            if not key.endswith(b':rebuild')
+        ]
+
+
+class CacheLeaderboardStore:
+    """Redis가 아닌 캐시 백엔드용 (키별 {민원 ID: 점수} 딕셔너리, 프로세스 내 잠금)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def set_score(self, keys, member, score, size):
+        with self._lock:
+            for key in keys:
+                board = cache.get(key, {})
+                board[member] = score
+                cache.set(key, dict(heapq.nlargest(size, board.items(), key=lambda item: item[1])), timeout=None)
+
+    def remove(self, keys, member):
+        with self._lock:
+            for key in keys:
+                board = cache.get(key, {})
+                if board.pop(member, None) is not None:
+                    cache.set(key, board, timeout=None)
+
+    def top(self, key, limit):
+        board = cache.get(key, {})
+        return heapq.nlargest(limit, board.items(), key=lambda item: (item[1], item[0]))
+
+    def replace(self, boards):
+        with self._lock:
+            for key, scores in boards.items():
+                cache.set(key, dict(scores), timeout=None)
+
+    def keys(self):
+        return list(cache.get(GrievanceLeaderboard.INDEX_KEY, ()))
+
+
+_redis_store = None
+_cache_store = CacheLeaderboardStore()
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """django-redis 캐시면 sorted set, 아니면(테스트 LocMem 등) 캐시 get/set"""
+    global _redis_store
+    if not hasattr(cache, 'client'):
+        return _cache_store
+    if _redis_store is None:
+        with _store_lock:
+            if _redis_store is None:
+                from django_redis import get_redis_connection
+                _redis_store = RedisLeaderboardStore(get_redis_connection('default'))
+    return _redis_store
+
+
+class GrievanceLeaderboard:
+
+    PREFIX = 'leaderboard:'
+    INDEX_KEY = 'leaderboard_index'  # CacheLeaderboardStore 전용 (키 목록)
+
+    @classmethod
+    def key(cls, area_id=None, category=None):
+        parts = []
+        if area_id is not None:
+            parts.append(f'area:{area_id}')
+        if category is not None:
+            parts.append(f'category:{category}')
+        return cls.PREFIX + (':'.join(parts) or 'all')
+
+    @classmethod
+    def keys_for(cls, area_id, category):
+        """민원 1건이 속하는 키 (전체 / 구역 / 카테고리 / 구역 + 카테고리)"""
+        keys = [cls.key(), cls.key(category=category)]
+        if area_id is not None:
+            keys += [cls.key(area_id=area_id), cls.key(area_id=area_id, category=category)]
+        return keys
+
+    @staticmethod
+    def is_eligible(grievance):
+        return grievance.visibility == 'public' and grievance.status != 'resolved'
+
+    @classmethod
+    def update(cls, grievance, like_count):
+        """좋아요 토글 후 현재 좋아요 수 반영 (대상이 아니거나 0이면 제거)"""
+        member = str(grievance.pk)
+        keys = cls.keys_for(grievance.area_id, grievance.category)
+        try:
+            store = get_store()
+            if cls.is_eligible(grievance) and like_count > 0:
+                store.set_score(keys, member, like_count, settings.LEADERBOARD_SIZE)
+                cls._remember(keys)
+            else:
+                store.remove(keys, member)
+        except Exception as e:
+            logger.warning('leaderboard update failed (%s): %s', member, e)
+
+    @classmethod
+    def sync(cls, grievance, previous=()):
+        """
+        민원 저장 후 반영 (signals)
+        previous: 이전 (구역 ID, 카테고리) → 바뀌었으면 이전 키에서 제거
+        """
+        member = str(grievance.pk)
+        stale = {key for area_id, category in previous for key in cls.keys_for(area_id, category)}
+        if cls.is_eligible(grievance):
+            stale -= set(cls.keys_for(grievance.area_id, grievance.category))
+            like_count = grievance.likes.count()
+            if stale:
+                cls._remove(stale, member)
+            cls.update(grievance, like_count)
+        else:
+            cls._remove(stale | set(cls.keys_for(grievance.area_id, grievance.category)), member)
+
+    @classmethod
+    def discard(cls, grievance, previous=()):
+        """민원 삭제"""
+        keys = set(cls.keys_for(grievance.area_id, grievance.category))
+        keys.update(key for area_id, category in previous for key in cls.keys_for(area_id, category))
+        cls._remove(keys, str(grievance.pk))
+
+    @classmethod
+    def _remove(cls, keys, member):
+        try:
+            get_store().remove(list(keys), member)
+        except Exception as e:
+            logger.warning('leaderboard remove failed (%s): %s', member, e)
+
+    @classmethod
+    def _remember(cls, keys):
+        """LocMem 등 키 목록 조회가 안 되는 캐시에서 보정 대상 키 기록"""
+        if isinstance(get_store(), CacheLeaderboardStore):
+            index = cache.get(cls.INDEX_KEY, set())
+            if not index.issuperset(keys):
+                cache.set(cls.INDEX_KEY, index | set(keys), timeout=None)
+
+    @classmethod
+    def top(cls, limit, area_id=None, category=None):
+        """
+        상위 limit개 [(민원 ID 문자열, 좋아요 수)] (Redis 1회)
+        Redis 장애 시 PostgreSQL 집계
+        """
+        try:
+            rows = get_store().top(cls.key(area_id, category), limit)
+            metrics.LEADERBOARD_READS.labels('redis').inc()
+            return rows
+        except Exception as e:
+            logger.warning('leaderboard read failed, falling back to database: %s', e)
+            metrics.LEADERBOARD_READS.labels('database').inc()
+            return cls.top_from_db(limit, area_id, category)
+
+    @staticmethod
+    def eligible_counts():
+        """순위 대상 민원별 좋아요 수 (PostgreSQL 집계)"""
+        return Grievance.objects.filter(visibility='public').exclude(status='resolved').order_by().annotate(
+            total=Count('likes')
+        ).filter(total__gt=0)
+
+    @classmethod
+    def top_from_db(cls, limit, area_id=None, category=None):
+        filters = Q()
+        if area_id is not None:
+            filters &= Q(area_id=area_id)
+        if category is not None:
+            filters &= Q(category=category)
+        rows = cls.eligible_counts().filter(filters).order_by('-total', '-id').values_list('id', 'total')[:limit]
+        return [(str(grievance_id), total) for grievance_id, total in rows]
+
+    @classmethod
+    def reconcile(cls):
+        """
+        PostgreSQL 집계로 모든 키 재구성 (집계 쿼리 1회 + 키별 원자적 교체)
+        Returns:
+            {'keys': 재구성한 키 수, 'drift': 기존 Redis 값과 달랐던 키 수, 'removed': 비운 키 수}
+        """
+        size = settings.LEADERBOARD_SIZE
+        boards = defaultdict(list)
+        rows = cls.eligible_counts().values_list('id', 'area_id', 'category', 'total')
+        for grievance_id, area_id, category, total in rows.iterator(chunk_size=5000):
+            for key in cls.keys_for(area_id, category):
+                board = boards[key]
+                item = (total, str(grievance_id))
+                if len(board) < size:
+                    heapq.heappush(board, item)
+                elif item > board[0]:
+                    heapq.heapreplace(board, item)
+
+        store = get_store()
+        existing = set(store.keys())
+        replacements = {key: {member: total for total, member in board} for key, board in boards.items()}
+        removed = existing - set(replacements)
+        drift = sum(
+            1 for key, scores in replacements.items()
+            if dict(store.top(key, size)) != scores
+        )
+
+        store.replace({**replacements, **{key: {} for key in removed}})
+        if isinstance(store, CacheLeaderboardStore):
+            cache.set(cls.INDEX_KEY, set(replacements), timeout=None)
+        return {'keys': len(replacements), 'drift': drift, 'removed': len(removed)}
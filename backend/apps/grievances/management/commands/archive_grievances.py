@@ -0,0 +1,69 @@
+"""
+완료 민원 보관 / 복원
+- 기본: 대상이 없을 때까지 배치 이동 (배치 사이 --pause초 대기) 후 종료 → cron
+- --loop: 백그라운드 워커로 상시 실행 (대상 소진 후 --interval초 대기 후 반복)
+
+사용 예:
+    python manage.py archive_grievances --dry-run
+    python manage.py archive_grievances --older-than-days 365 --batch-size 500 --pause 1
+    python manage.py archive_grievances --loop --interval 3600
+    python manage.py archive_grievances --restore 3f0e... 8b1c...
+"""
+
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+from django.db.models.functions import Coalesce
+
+from apps.grievances.archive import GrievanceArchiver
+from apps.grievances.models import Grievance
+
+
+class Command(BaseCommand):
+    help = '오래된 완료 민원을 보관 테이블로 이동 (또는 복원)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--older-than-days', type=int, help='완료 후 경과 일수 (기본: GRIEVANCE_ARCHIVE_AFTER_DAYS)')
+        parser.add_argument('--batch-size', type=int, help='배치당 민원 수 (기본: GRIEVANCE_ARCHIVE_BATCH_SIZE)')
+        parser.add_argument('--pause', type=float, help='배치 사이 대기 초 (기본: GRIEVANCE_ARCHIVE_PAUSE_SECONDS)')
+        parser.add_argument('--max-batches', type=int, help='실행당 최대 배치 수')
+        parser.add_argument('--loop', action='store_true', help='종료하지 않고 주기적으로 반복')
+        parser.add_argument('--interval', type=int, default=3600, help='--loop 반복 간격 (초)')
+        parser.add_argument('--dry-run', action='store_true', help='보관 대상 수만 출력')
+        parser.add_argument('--restore', nargs='+', metavar='GRIEVANCE_ID', help='복원할 보관 민원 ID')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] is not None and options['batch_size'] < 1:
+            raise CommandError('--batch-size는 1 이상이어야 합니다')
+
+        archiver = GrievanceArchiver(batch_size=options['batch_size'], pause=options['pause'])
+
+        if options['restore']:
+            try:
+                ids = [uuid.UUID(value) for value in options['restore']]
+            except ValueError as e:
+                raise CommandError(f'잘못된 민원 ID: {e}')
+            restored = archiver.restore(ids)
+            self.stdout.write(self.style.SUCCESS(f'복원: {restored}/{len(options["restore"])}건'))
+            return
+
+        if options['dry_run']:
+            cutoff = archiver.cutoff(options['older_than_days'])
+            count = Grievance.objects.annotate(
+                _finished_at=Coalesce('completed_at', 'updated_at')
+            ).filter(status='resolved', _finished_at__lt=cutoff).count()
+            self.stdout.write(f'보관 대상: {count:,}건 ({cutoff:%Y-%m-%d} 이전 완료)')
+            return
+
+        while True:
+            # 장기 실행 시 기준 시각이 따라가도록 매 회차 계산
+            cutoff = archiver.cutoff(options['older_than_days'])
+            archived = archiver.run(cutoff, max_batches=options['max_batches'])
+            self.stdout.write(self.style.SUCCESS(f'보관: {archived:,}건 ({cutoff:%Y-%m-%d} 이전 완료)'))
+
+            if not options['loop']:
+                break
+            close_old_connections()
+            time.sleep(options['interval'])
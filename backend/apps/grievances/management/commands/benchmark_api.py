@@ -0,0 +1,325 @@
+"""
+API 부하 벤치마크
+엔드포인트별 p50 / p95 / p99 지연시간과 처리량(RPS)을 JSON으로 기록해 커밋 간 비교
+
+- 기본: 프로세스 내부 실행 (django.test.Client, 미들웨어 포함 전체 요청 경로)
+  외부 API(Naver 역지오코딩, Kakao / Naver 로그인)는 core.provider_stubs 스텁 서버로 대체
+- --base-url: 실행 중인 서버(runserver / gunicorn)를 HTTP로 호출
+  이 경우 서버는 스텁 URL 환경변수로 띄워야 함 (python manage.py run_provider_stubs 참고)
+
+사용 예:
+    python manage.py generate_synthetic_data --users 1000 --grievances 50000
+    python manage.py benchmark_api --requests 500 --concurrency 8 --output bench/$(git rev-parse --short HEAD).json
+    python manage.py benchmark_api --base-url http://127.0.0.1:8000 --endpoints list,detail,nearby
+"""
+
+import io
+import json
+import random
+import statistics
+import subprocess
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone as dt_timezone
+
+import requests
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import Client, override_settings
+
+from apps.grievances.models import Area, Grievance
+from apps.users.models import CustomUser
+from apps.users.tokens import RefreshToken
+from core.provider_stubs import ProviderStubServer
+
+
+ENDPOINTS = ['list', 'search', 'nearby', 'detail', 'create', 'like', 'kakao_login', 'naver_login']
+SEARCH_TERMS = ['주차', '가로등', '쓰레기', '소음', '공원', '도로', 'CCTV', '악취']
+
+
+def percentile(sorted_values, pct):
+    """선형 보간 백분위수 (sorted_values는 오름차순)"""
+    if not sorted_values:
+        return None
+    index = (len(sorted_values) - 1) * pct / 100
+    lower = int(index)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (index - lower)
+
+
+class InProcessTransport:
+    """django.test.Client 기반 호출 (스레드별 Client 사용)"""
+
+    def __init__(self):
+        self._local = threading.local()
+
+    @property
+    def client(self):
+        if not hasattr(self._local, 'client'):
+            self._local.client = Client(HTTP_HOST='localhost')
+        return self._local.client
+
+    def request(self, method, path, token=None, data=None, multipart=False):
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'} if token else {}
+        if method == 'GET':
+            response = self.client.get(path, data, **headers)
+        elif multipart:
+            filename, content = data['images']
+            data = {**data, 'images': SimpleUploadedFile(filename, content, content_type='image/jpeg')}
+            response = getattr(self.client, method.lower())(path, data, **headers)
+        else:
+            response = getattr(self.client, method.lower())(
+                path, json.dumps(data or {}), content_type='application/json', **headers
+            )
+        return response.status_code
+
+    def close(self):
+        # 작업 스레드가 연 DB 연결은 스레드 종료 시 정리되지 않으므로 명시적으로 닫음
+        connection.close()
+
+
+class HTTPTransport:
+    """requests 기반 호출 (스레드별 Session, keep-alive)"""
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip('/')
+        self._local = threading.local()
+
+    @property
+    def session(self):
+        if not hasattr(self._local, 'session'):
+            self._local.session = requests.Session()
+        return self._local.session
+
+    def request(self, method, path, token=None, data=None, multipart=False):
+        headers = {'Authorization': f'Bearer {token}'} if token else {}
+        url = f'{self.base_url}{path}'
+        if method == 'GET':
+            response = self.session.get(url, params=data, headers=headers, timeout=30)
+        elif multipart:
+            fields = {key: value for key, value in data.items() if key != 'images'}
+            filename, content = data['images']
+            response = self.session.request(
+                method, url, data=fields, files={'images': (filename, content, 'image/jpeg')},
+                headers=headers, timeout=30,
+            )
+        else:
+            response = self.session.request(method, url, json=data, headers=headers, timeout=30)
+        return response.status_code
+
+    def close(self):
+        pass
+
+
+class Command(BaseCommand):
+    help = 'API 엔드포인트별 지연시간(p50/p95/p99)과 처리량 측정 → JSON 기록'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--endpoints', default=','.join(ENDPOINTS), help=f'쉼표 구분 ({", ".join(ENDPOINTS)})')
+        parser.add_argument('--requests', type=int, default=200, help='엔드포인트별 요청 수')
+        parser.add_argument('--concurrency', type=int, default=4, help='동시 요청 수 (스레드)')
+        parser.add_argument('--warmup', type=int, default=10, help='엔드포인트별 워밍업 요청 수 (집계 제외)')
+        parser.add_argument('--page-size', type=int, default=20)
+        parser.add_argument('--base-url', default='', help='실행 중인 서버 주소 (미지정 시 프로세스 내부 실행)')
+        parser.add_argument('--stub-latency', type=float, default=0.0, help='스텁 외부 API 응답 지연 (초)')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--output', default='', help='결과 JSON 파일 경로 (미지정 시 표준 출력)')
+
+    def handle(self, *args, **options):
+        endpoints = [name.strip() for name in options['endpoints'].split(',') if name.strip()]
+        unknown = set(endpoints) - set(ENDPOINTS)
+        if unknown:
+            raise CommandError(f'알 수 없는 엔드포인트: {", ".join(sorted(unknown))}')
+
+        self.rng = random.Random(options['seed'])
+        self.page_size = options['page_size']
+        self._prepare_fixtures()
+
+        if options['base_url']:
+            transport = HTTPTransport(options['base_url'])
+            results = self._run_all(transport, endpoints, options)
+            stub_requests = None
+        else:
+            stub = ProviderStubServer(
+                areas=[(area.name, area.center_point.y, area.center_point.x) for area in self.areas],
+                latency=options['stub_latency'],
+            )
+            stub.start_in_thread()
+            try:
+                # 부하 생성기는 단일 IP / 소수 유저 → 요청 제한 해제
+                with override_settings(ALLOWED_HOSTS=['*'], THROTTLE_BUCKETS={}, **stub.urls()):
+                    results = self._run_all(InProcessTransport(), endpoints, options)
+            finally:
+                stub.shutdown()
+                stub.server_close()
+            stub_requests = stub.requests
+
+        report = {
+            'meta': self._meta(options, stub_requests),
+            'endpoints': results,
+        }
+        output = json.dumps(report, ensure_ascii=False, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output)
+            self.stdout.write(self.style.SUCCESS(f'결과 저장: {options["output"]}'))
+        else:
+            self.stdout.write(output)
+
+    def _prepare_fixtures(self):
+        """벤치마크 대상 데이터: 공개 민원 ID, 구역 중심점, 사용자 JWT"""
+        self.areas = list(Area.objects.exclude(name='미지정').order_by('id'))
+        self.grievance_ids = [
+            str(pk) for pk in Grievance.objects.filter(visibility='public')
+            .order_by('-created_at').values_list('id', flat=True)[:5000]
+        ]
+        if not self.areas or not self.grievance_ids:
+            raise CommandError('데이터가 없습니다. generate_synthetic_data를 먼저 실행하세요')
+
+        user_ids = list(CustomUser.objects.filter(is_active=True).order_by('id').values_list('id', flat=True)[:200])
+        self.tokens = [
+            str(RefreshToken.for_user(user).access_token)
+            for user in CustomUser.objects.filter(id__in=user_ids)
+        ]
+        if not self.tokens:
+            raise CommandError('사용자가 없습니다. generate_synthetic_data를 먼저 실행하세요')
+
+        from PIL import Image
+        buffer = io.BytesIO()
+        Image.new('RGB', (32, 32), (120, 160, 200)).save(buffer, format='JPEG')
+        self.image_bytes = buffer.getvalue()
+
+    def _random_point(self):
+        area = self.rng.choice(self.areas)
+        return (
+            round(area.center_point.y + self.rng.gauss(0, 0.01), 6),
+            round(area.center_point.x + self.rng.gauss(0, 0.01), 6),
+        )
+
+    def _build_request(self, name):
+        """(method, path, token, data, multipart) - 난수 생성은 메인 스레드에서만 수행"""
+        token = self.rng.choice(self.tokens)
+        if name == 'list':
+            return 'GET', '/api/grievances/', token, {'page': self.rng.randint(1, 5), 'page_size': self.page_size}, False
+        if name == 'search':
+            return 'GET', '/api/grievances/', token, {'search': self.rng.choice(SEARCH_TERMS), 'page_size': self.page_size}, False
+        if name == 'nearby':
+            lat, lng = self._random_point()
+            return 'GET', '/api/grievances/nearby/', token, {'lat': lat, 'lng': lng, 'radius': 3, 'page_size': self.page_size}, False
+        if name == 'detail':
+            return 'GET', f'/api/grievances/{self.rng.choice(self.grievance_ids)}/', token, None, False
+        if name == 'create':
+            lat, lng = self._random_point()
+            return 'POST', '/api/grievances/', token, {
+                'title': f'벤치마크 민원 {uuid.uuid4().hex[:8]}',
+                'content': '부하 테스트로 생성된 민원입니다',
+                'category': self.rng.choice(['traffic', 'env', 'safety', 'facility']),
+                'latitude': lat,
+                'longitude': lng,
+                'visibility': 'public',
+                'images': ('bench.jpg', self.image_bytes),
+            }, True
+        if name == 'like':
+            return 'PATCH', f'/api/grievances/{self.rng.choice(self.grievance_ids)}/like/', token, None, False
+        # 소셜 로그인: 토큰 풀을 재사용해 신규 가입 / 기존 사용자 조회가 섞이도록 함
+        provider = 'kakao' if name == 'kakao_login' else 'naver'
+        return 'POST', f'/api/auth/{provider}/', None, {'access_token': f'bench-{self.rng.randint(1, 500)}'}, False
+
+    def _run_all(self, transport, endpoints, options):
+        results = {}
+        for name in endpoints:
+            self.stdout.write(f'[{name}] 워밍업 {options["warmup"]}건, 측정 {options["requests"]}건 ...')
+            if options['warmup']:
+                self._run_endpoint(transport, name, options['warmup'], options['concurrency'])
+            results[name] = self._run_endpoint(transport, name, options['requests'], options['concurrency'])
+            summary = results[name]
+            self.stdout.write(
+                f'  p50 {summary["p50_ms"]}ms / p95 {summary["p95_ms"]}ms / p99 {summary["p99_ms"]}ms, '
+                f'{summary["rps"]} req/s, 오류 {summary["errors"]}건'
+            )
+        return results
+
+    def _run_endpoint(self, transport, name, count, concurrency):
+        planned = [self._build_request(name) for _ in range(count)]
+
+        def call(request):
+            method, path, token, data, multipart = request
+            started = time.perf_counter()
+            try:
+                status_code = transport.request(method, path, token, data, multipart)
+            except requests.RequestException:
+                status_code = None
+            return time.perf_counter() - started, status_code
+
+        # 작업 스레드마다 정확히 한 번씩 정리 (Barrier로 서로 다른 스레드에 분배)
+        barrier = threading.Barrier(concurrency)
+
+        def close(_):
+            transport.close()
+            barrier.wait()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            outcomes = list(executor.map(call, planned))
+            wall = time.perf_counter() - started
+            list(executor.map(close, range(concurrency)))
+
+        return self._summarize(outcomes, wall)
+
+    @staticmethod
+    def _summarize(outcomes, wall):
+        latencies = sorted(elapsed * 1000 for elapsed, _ in outcomes)
+        status_counts = {}
+        for _, status_code in outcomes:
+            key = str(status_code) if status_code is not None else 'error'
+            status_counts[key] = status_counts.get(key, 0) + 1
+        errors = sum(
+            count for key, count in status_counts.items()
+            if key == 'error' or int(key) >= 400
+        )
+
+        def ms(value):
+            return round(value, 2) if value is not None else None
+
+        return {
+            'count': len(outcomes),
+            'errors': errors,
+            'status': status_counts,
+            'p50_ms': ms(percentile(latencies, 50)),
+            'p95_ms': ms(percentile(latencies, 95)),
+            'p99_ms': ms(percentile(latencies, 99)),
+            'mean_ms': ms(statistics.fmean(latencies)) if latencies else None,
+            'max_ms': ms(latencies[-1]) if latencies else None,
+            'rps': round(len(outcomes) / wall, 1) if wall > 0 else None,
+        }
+
+    def _meta(self, options, stub_requests):
+        try:
+            commit = subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'],
+                capture_output=True, text=True, check=True, cwd=settings.BASE_DIR,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+
+        return {
+            'commit': commit,
+            'timestamp': datetime.now(dt_timezone.utc).isoformat(),
+            'mode': 'http' if options['base_url'] else 'in-process',
+            'base_url': options['base_url'] or None,
+            'requests': options['requests'],
+            'concurrency': options['concurrency'],
+            'warmup': options['warmup'],
+            'page_size': options['page_size'],
+            'stub_latency': options['stub_latency'],
+            'stub_requests': stub_requests,
+            'dataset': {
+                'users': CustomUser.objects.count(),
+                'grievances': Grievance.objects.count(),
+                'areas': len(self.areas),
+            },
+        }
@@ -0,0 +1,124 @@
+"""
+DB 연결 재사용 효과 측정
+- connect: 요청마다 새 연결 (CONN_MAX_AGE=0과 동일) → 연결 수립 + 쿼리
+- reuse: 영구 연결 1개 재사용 → 쿼리만
+- reuse_health_check: 재사용 + 매 요청 헬스 체크 (CONN_HEALTH_CHECKS=True와 동일한 SELECT 1 추가)
+- --requests-path: CONN_MAX_AGE 0 / 60으로 실제 API 요청 경로 비교 (django.test.Client)
+  (응답 캐시가 적용되는 비로그인 목록은 DB를 거치지 않으므로 nearby 등 사용)
+
+사용 예:
+    python manage.py benchmark_db_connections --iterations 200
+    python manage.py benchmark_db_connections --requests-path '/api/grievances/nearby/?lat=37.5&lng=127.0' --output conn.json
+"""
+
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connections
+from django.test import Client, override_settings
+
+from apps.grievances.management.commands.benchmark_api import percentile
+
+
+QUERY = 'SELECT id FROM areas ORDER BY id LIMIT 1'
+
+
+def summarize(samples):
+    values = sorted(sample * 1000 for sample in samples)
+    return {
+        'p50_ms': round(percentile(values, 50), 3),
+        'p95_ms': round(percentile(values, 95), 3),
+        'mean_ms': round(sum(values) / len(values), 3),
+    }
+
+
+class Command(BaseCommand):
+    help = 'DB 연결 수립 비용 vs 연결 재사용 비교 (요청당 절감 시간)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=100)
+        parser.add_argument('--database', default='default')
+        parser.add_argument('--requests-path', default='', help='지정 시 해당 API 경로를 CONN_MAX_AGE 0 / 60으로 비교')
+        parser.add_argument('--output', default='', help='결과 JSON 파일 경로 (미지정 시 표준 출력)')
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        if iterations < 1:
+            raise CommandError('--iterations는 1 이상이어야 합니다')
+        alias = options['database']
+
+        results = {
+            'connect': summarize(self._run(alias, iterations, reuse=False)),
+            'reuse': summarize(self._run(alias, iterations, reuse=True)),
+            'reuse_health_check': summarize(self._run(alias, iterations, reuse=True, health_check=True)),
+        }
+        results['saving_per_request_ms'] = round(results['connect']['mean_ms'] - results['reuse']['mean_ms'], 3)
+
+        if options['requests_path']:
+            results['requests'] = {
+                f'conn_max_age_{max_age}': summarize(self._run_requests(alias, options['requests_path'], iterations, max_age))
+                for max_age in (0, 60)
+            }
+
+        report = {
+            'meta': {
+                'database': alias,
+                'host': connections[alias].settings_dict['HOST'],
+                'iterations': iterations,
+            },
+            'results': results,
+        }
+        output = json.dumps(report, ensure_ascii=False, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output)
+            self.stdout.write(self.style.SUCCESS(f'결과 저장: {options["output"]}'))
+        else:
+            self.stdout.write(output)
+
+    @staticmethod
+    def _run(alias, iterations, reuse, health_check=False):
+        """요청 1건 = (필요 시 연결) + 쿼리 1개, 별도 연결 객체 사용"""
+        wrapper = connections.create_connection(alias)
+        samples = []
+        try:
+            for _ in range(iterations):
+                started = time.perf_counter()
+                if health_check and wrapper.connection is not None:
+                    wrapper.is_usable()
+                with wrapper.cursor() as cursor:
+                    cursor.execute(QUERY)
+                    cursor.fetchall()
+                if not reuse:
+                    wrapper.close()
+                samples.append(time.perf_counter() - started)
+        finally:
+            wrapper.close()
+        return samples
+
+    @staticmethod
+    def _run_requests(alias, path, iterations, max_age):
+        """
+        CONN_MAX_AGE를 바꿔 전체 요청 경로 측정
+        테스트 Client는 요청 시작/종료 시 연결 정리를 하지 않으므로 WSGI 핸들러처럼 직접 호출
+        """
+        connection = connections[alias]
+        original = connection.settings_dict['CONN_MAX_AGE']
+        connection.close()
+        connection.settings_dict['CONN_MAX_AGE'] = max_age
+        client = Client(HTTP_HOST='localhost')
+        samples = []
+        try:
+            with override_settings(ALLOWED_HOSTS=['*']):
+                client.get(path)  # 워밍업 (URL / 뷰 import)
+                for _ in range(iterations):
+                    started = time.perf_counter()
+                    close_old_connections()
+                    client.get(path)
+                    close_old_connections()
+                    samples.append(time.perf_counter() - started)
+        finally:
+            connection.close()
+            connection.settings_dict['CONN_MAX_AGE'] = original
+        return samples
@@ -0,0 +1,129 @@
+"""
+grievances 파티션 프루닝 확인 벤치마크
+주요 조회(최신 피드, 구역 피드, 최근 30일 집계)를 EXPLAIN (ANALYZE, BUFFERS)로 실행해
+실제로 읽은 파티션 수 / 버퍼 / 실행 시간을 JSON으로 출력
+
+- 실행되지 않은 파티션 노드(Actual Loops = 0)와 계획 단계에서 제거된 파티션(Subplans Removed)은
+  '읽은 파티션'에서 제외
+- 파티션 전/후 비교: migration 0008 적용 전 커밋에서 같은 명령 실행
+- feed / area_feed는 실제 우리 동네 피드 DB 조회처럼 created_at 하한(NEIGHBOURHOOD_FEED_WINDOW_DAYS) 포함
+- list_unbounded: 기간 조건 없는 목록 API(GET /api/grievances/) 정렬 조회
+  프루닝 대상이 아님 → LIMIT이 최신 파티션에서 채워지면 나머지는 실행되지 않을 뿐,
+  필터가 드물게 맞으면 모든 파티션을 읽음 (페이지 COUNT(*)도 모든 파티션 대상)
+
+사용 예:
+    python manage.py benchmark_partitions --repeat 5
+    python manage.py benchmark_partitions --output partitions-$(git rev-parse --short HEAD).json
+"""
+
+import json
+import statistics
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+from django.utils import timezone
+
+from apps.grievances.models import Area, Grievance
+from apps.grievances.partitions import GrievancePartitionManager
+
+
+def walk_plan(node):
+    yield node
+    for child in node.get('Plans', []):
+        yield from walk_plan(child)
+
+
+def summarize_plan(plan):
+    """EXPLAIN JSON → 읽은 grievances 파티션, 제거된 서브플랜 수, 공유 버퍼 히트/읽기"""
+    root = plan['Plan']
+    scanned, removed = set(), 0
+    for node in walk_plan(root):
+        removed += node.get('Subplans Removed', 0)
+        relation = node.get('Relation Name', '')
+        if relation.startswith('grievances') and node.get('Actual Loops', 0) > 0:
+            scanned.add(relation)
+    return {
+        'execution_ms': plan.get('Execution Time'),
+        'planning_ms': plan.get('Planning Time'),
+        'partitions_scanned': sorted(scanned),
+        'subplans_removed': removed,
+        'shared_hit_blocks': root.get('Shared Hit Blocks', 0),
+        'shared_read_blocks': root.get('Shared Read Blocks', 0),
+    }
+
+
+class Command(BaseCommand):
+    help = 'grievances 피드/구역/기간 조회의 파티션 프루닝 및 실행 시간 측정'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=3, help='쿼리별 반복 횟수 (실행 시간 중앙값)')
+        parser.add_argument('--page-size', type=int, default=20)
+        parser.add_argument('--area', type=int, help='구역 피드 대상 구역 ID (기본: 민원이 가장 많은 구역)')
+        parser.add_argument('--output', help='결과 JSON 파일 경로 (생략 시 stdout)')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('PostgreSQL에서만 실행할 수 있습니다')
+        if options['repeat'] < 1:
+            raise CommandError('--repeat는 1 이상이어야 합니다')
+
+        area_id = options['area'] or (
+            Area.objects.annotate(total=Count('grievances')).order_by('-total').values_list('pk', flat=True).first()
+        )
+        page = options['page_size']
+        now = timezone.now()
+        since = now - timedelta(days=30)
+        feed_since = now - timedelta(days=settings.NEIGHBOURHOOD_FEED_WINDOW_DAYS)
+
+        queries = {
+            'feed': Grievance.objects.filter(
+                visibility='public', created_at__gte=feed_since
+            ).order_by('-created_at')[:page],
+            'area_feed': Grievance.objects.filter(
+                area_id=area_id, visibility='public', created_at__gte=feed_since
+            ).order_by('-created_at')[:page],
+            'last_30_days': Grievance.objects.filter(created_at__gte=since).values('status').annotate(
+                total=Count('id')
+            ),
+            'list_unbounded': Grievance.objects.filter(area_id=area_id).order_by('-created_at')[:page],
+        }
+
+        manager = GrievancePartitionManager()
+        partitioned = manager.is_partitioned()
+        results = {
+            'meta': {
+                'partitioned': partitioned,
+                'partitions': len(manager.partitions()) if partitioned else 0,
+                'grievances': Grievance.objects.count(),
+                'area_id': area_id,
+                'feed_window_days': settings.NEIGHBOURHOOD_FEED_WINDOW_DAYS,
+                'repeat': options['repeat'],
+            },
+            'queries': {},
+        }
+
+        for name, queryset in queries.items():
+            runs = [
+                summarize_plan(json.loads(queryset.explain(format='json', analyze=True, buffers=True))[0])
+                for _ in range(options['repeat'])
+            ]
+            summary = runs[-1]  # 버퍼 수치는 캐시가 데워진 마지막 실행 기준
+            summary['execution_ms'] = round(statistics.median(run['execution_ms'] for run in runs), 3)
+            summary['planning_ms'] = round(statistics.median(run['planning_ms'] for run in runs), 3)
+            results['queries'][name] = summary
+
+            self.stderr.write(
+                f'{name:<14} {summary["execution_ms"]:>9.3f}ms  '
+                f'파티션 {len(summary["partitions_scanned"])}개 읽음 / {summary["subplans_removed"]}개 제거'
+            )
+
+        output = json.dumps(results, ensure_ascii=False, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output)
+            self.stderr.write(self.style.SUCCESS(f'결과 저장: {options["output"]}'))
+        else:
+            self.stdout.write(output)
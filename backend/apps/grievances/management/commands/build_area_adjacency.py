@@ -0,0 +1,37 @@
+"""
+인접 구역 재계산 (우리 동네 피드 범위)
+- 경계가 둘 다 있으면 경계 간 거리, 없으면 중심 좌표 간 거리로 판정 (AreaAdjacencyService)
+- 재계산 후 구역별 피드 키 삭제 → 다음 조회 시 새 범위로 채움
+- 구역 경계 / 중심 좌표를 바꾼 뒤 실행
+
+사용 예:
+    python manage.py build_area_adjacency
+    python manage.py build_area_adjacency --radius-km 4 --tolerance-m 100
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.grievances.feeds import NeighbourhoodFeed
+from apps.grievances.models import Area
+from apps.grievances.services import AreaAdjacencyService
+
+
+class Command(BaseCommand):
+    help = '인접 구역(우리 동네 피드 범위) 재계산'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tolerance-m', type=int, default=None,
+                            help='경계 간 허용 거리 (m, 기본 NEIGHBOURHOOD_BOUNDARY_TOLERANCE_M)')
+        parser.add_argument('--radius-km', type=float, default=None,
+                            help='경계가 없는 구역의 중심 좌표 간 거리 (km, 기본 NEIGHBOURHOOD_RADIUS_KM)')
+
+    def handle(self, *args, **options):
+        if options['radius_km'] is not None and options['radius_km'] <= 0:
+            raise CommandError('--radius-km는 0보다 커야 합니다')
+
+        pairs = AreaAdjacencyService.rebuild(tolerance_m=options['tolerance_m'], radius_km=options['radius_km'])
+        area_ids = list(Area.objects.values_list('pk', flat=True))
+        NeighbourhoodFeed.invalidate(area_ids)
+        self.stdout.write(self.style.SUCCESS(
+            f'구역 {len(area_ids):,}개, 인접 쌍 {pairs:,}개 (피드 키 초기화)'
+        ))
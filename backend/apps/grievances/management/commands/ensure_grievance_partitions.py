@@ -0,0 +1,40 @@
+"""
+grievances 월 파티션 사전 생성 (cron / 배포 후 실행)
+- 현재 월 ~ --months-ahead개월 뒤 파티션이 없으면 생성
+- 기본 파티션(grievances_default)에 쌓인 행은 해당 월 파티션으로 이동
+
+사용 예:
+    python manage.py ensure_grievance_partitions --months-ahead 3
+    python manage.py ensure_grievance_partitions --list
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.grievances.partitions import GrievancePartitionManager
+
+
+class Command(BaseCommand):
+    help = 'grievances 월 단위 파티션 생성'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--months-ahead', type=int, default=3, help='미리 만들 미래 파티션 개월 수')
+        parser.add_argument('--database', default='default')
+        parser.add_argument('--list', action='store_true', help='생성 후 파티션 목록 출력')
+
+    def handle(self, *args, **options):
+        if options['months_ahead'] < 0:
+            raise CommandError('--months-ahead는 0 이상이어야 합니다')
+
+        manager = GrievancePartitionManager(using=options['database'])
+        if not manager.is_partitioned():
+            raise CommandError('grievances 테이블이 파티션 테이블이 아닙니다 (PostgreSQL + migration 0008 필요)')
+
+        created = manager.ensure(months_ahead=options['months_ahead'])
+        if created:
+            self.stdout.write(self.style.SUCCESS(f'파티션 {len(created)}개 생성: {", ".join(created)}'))
+        else:
+            self.stdout.write('생성할 파티션 없음')
+
+        if options['list']:
+            for name, bound, rows in manager.partitions():
+                self.stdout.write(f'  {name:<24} {bound}  (~{max(rows, 0):,}행)')
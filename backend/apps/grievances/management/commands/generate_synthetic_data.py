@@ -0,0 +1,262 @@
+"""
+부하 테스트용 합성 데이터 생성
+- 사용자 N명 (시민 / 인증 정치인 / 관리자)
+- 서울 25개 구 중심점 주변에 분포된 민원 (26개 Area 배정, 미지정 포함)
+- 인기 편중(Zipf) 좋아요, 민원별 0~3개 이미지
+- --seed 고정 시 동일한 데이터 재현
+
+사용 예:
+    python manage.py generate_synthetic_data --users 10000 --grievances 200000 --likes 2000000
+    python manage.py generate_synthetic_data --clear
+"""
+
+import io
+import itertools
+import random
+import time
+import uuid
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.gis.geos import Point
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from faker import Faker
+
+from apps.grievances.models import Area, Grievance, GrievanceImage, GrievanceSecret, Like
+from apps.grievances.services import GrievanceVersionService, HotScoreService
+from apps.users.models import CustomUser
+
+
+SYNTHETIC_EMAIL_DOMAIN = 'synthetic.baro.test'
+SYNTHETIC_PASSWORD = 'synthetic-password'
+PLACEHOLDER_IMAGE = 'synthetic/placeholder.png'
+
+# 카테고리별 제목 템플릿
+TITLES = {
+    'traffic': ['불법 주정차 단속 요청', '횡단보도 신호 시간 조정', '도로 포트홀 보수', '버스 정류장 안내판 고장'],
+    'env': ['쓰레기 무단 투기', '악취 민원', '재활용 수거 지연', '하수구 막힘'],
+    'safety': ['가로등 고장', '어두운 골목 CCTV 설치 요청', '보도블록 파손', '위험 축대 점검'],
+    'facility': ['공원 벤치 파손', '놀이터 시설 점검', '공중화장실 청소 요청', '운동기구 고장'],
+    'animal': ['유기견 신고', '길고양이 급식소 민원', '비둘기 배설물', '멧돼지 출몰'],
+    'admin': ['민원 처리 지연 문의', '주민센터 운영 시간 문의', '안내 표지판 오류', '행정 서류 발급 문의'],
+    'etc': ['소음 민원', '공사장 먼지', '불법 현수막', '기타 불편 사항'],
+}
+STATUS_WEIGHTS = [('pending', 60), ('in_progress', 25), ('resolved', 15)]
+
+
+class Command(BaseCommand):
+    help = '부하 테스트용 합성 사용자/민원/좋아요/이미지 데이터 생성'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000, help='생성할 사용자 수')
+        parser.add_argument('--grievances', type=int, default=10000, help='생성할 민원 수')
+        parser.add_argument('--likes', type=int, default=50000, help='생성할 좋아요 수 (중복 제거 후 일부 줄어들 수 있음)')
+        parser.add_argument('--private-ratio', type=float, default=0.1, help='비공개 민원 비율')
+        parser.add_argument('--max-images', type=int, default=3, help='민원당 최대 이미지 수')
+        parser.add_argument('--zipf', type=float, default=1.1, help='좋아요 편중 지수 (클수록 소수 민원에 집중)')
+        parser.add_argument('--days', type=int, default=365, help='생성 시각 분포 기간 (일)')
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--clear', action='store_true', help='기존 합성 데이터만 삭제하고 종료')
+
+    def handle(self, *args, **options):
+        if options['clear']:
+            self._clear()
+            return
+
+        self.rng = random.Random(options['seed'])
+        self.faker = Faker('ko_KR')
+        self.faker.seed_instance(options['seed'])
+        self.batch_size = options['batch_size']
+
+        areas = list(Area.objects.order_by('id'))
+        if not areas:
+            self.stderr.write('Area가 없습니다. migrate를 먼저 실행하세요')
+            return
+
+        if options['users'] < 1:
+            raise CommandError('--users는 1 이상이어야 합니다')
+
+        started = time.perf_counter()
+        users = self._create_users(options['users'], areas)
+        grievance_ids = self._create_grievances(options, users, areas)
+        self._create_likes(options['likes'], options['zipf'], users, grievance_ids)
+        self._create_images(options['max_images'], grievance_ids)
+        self._refresh_hot_scores()
+
+        # bulk_create는 시그널을 거치지 않으므로 캐시 버전 직접 증가
+        GrievanceVersionService.bump_areas([area.pk for area in areas])
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f'합성 데이터 생성 완료: {elapsed:.1f}초 (seed={options["seed"]})'))
+
+    def _report(self, label, count, started):
+        elapsed = time.perf_counter() - started
+        rate = count / elapsed if elapsed > 0 else count
+        self.stdout.write(f'  {label}: {count:,}건, {elapsed:.2f}초 ({rate:,.0f}건/초)')
+
+    def _batches(self, iterable):
+        iterator = iter(iterable)
+        while batch := list(itertools.islice(iterator, self.batch_size)):
+            yield batch
+
+    def _clear(self):
+        """합성 사용자와 그 민원(좋아요/이미지/패스워드는 CASCADE) 삭제"""
+        users = CustomUser.objects.filter(email__endswith=f'@{SYNTHETIC_EMAIL_DOMAIN}')
+        with transaction.atomic():
+            deleted, _ = Grievance.objects.filter(user__in=users).delete()
+            user_count, _ = users.delete()
+        GrievanceVersionService.bump_areas(Area.objects.values_list('id', flat=True))
+        self.stdout.write(self.style.SUCCESS(f'합성 데이터 삭제 완료 (민원 관련 {deleted:,}행, 사용자 관련 {user_count:,}행)'))
+
+    def _create_users(self, count, areas):
+        """사용자: 시민 95%, 인증 정치인 4%, 관리자 1% (패스워드 해시는 1회만 계산)"""
+        started = time.perf_counter()
+        password = make_password(SYNTHETIC_PASSWORD)
+        offset = CustomUser.objects.filter(email__endswith=f'@{SYNTHETIC_EMAIL_DOMAIN}').count()
+        now = timezone.now()
+
+        def build(index):
+            role = self.rng.choices(['citizen', 'politician', 'admin'], weights=[95, 4, 1])[0]
+            name = self.faker.name()
+            return CustomUser(
+                email=f'user{offset + index}@{SYNTHETIC_EMAIL_DOMAIN}',
+                password=password,
+                name=name,
+                nickname=name,
+                role=role,
+                is_verified=role != 'citizen',
+                area=self.rng.choice(areas),
+                date_joined=now,
+            )
+
+        for batch in self._batches(build(index) for index in range(count)):
+            CustomUser.objects.bulk_create(batch)
+
+        users = list(
+            CustomUser.objects.filter(email__endswith=f'@{SYNTHETIC_EMAIL_DOMAIN}')
+            .order_by('id').values_list('id', flat=True)
+        )
+        self._report('사용자', count, started)
+        return users
+
+    def _create_grievances(self, options, users, areas):
+        """
+        민원: 구역 중심점 주변 정규분포(σ ≈ 1.3km) 좌표, 최근 N일 사이 생성 시각
+        created_at은 auto_now_add라 bulk_create 후 bulk_update로 덮어씀
+        """
+        started = time.perf_counter()
+        count = options['grievances']
+        now = timezone.now()
+        max_age = timedelta(days=options['days']).total_seconds()
+        secret_hash = make_password('1234')
+        seoul_areas = [area for area in areas if area.name != '미지정'] or areas
+        area_by_id = {area.pk: area for area in areas}
+        fallback = next((area for area in areas if area.name == '미지정'), None)
+        statuses, status_weights = zip(*STATUS_WEIGHTS)
+        categories = list(TITLES)
+
+        def build(_):
+            area = self.rng.choice(seoul_areas)
+            lat = area.center_point.y + self.rng.gauss(0, 0.012)
+            lng = area.center_point.x + self.rng.gauss(0, 0.015)
+            # 1% 는 구역 판정 실패 케이스 재현 (미지정)
+            if fallback and self.rng.random() < 0.01:
+                area = fallback
+
+            category = self.rng.choice(categories)
+            status = self.rng.choices(statuses, weights=status_weights)[0]
+            created_at = now - timedelta(seconds=self.rng.random() * max_age)
+            return Grievance(
+                id=uuid.UUID(int=self.rng.getrandbits(128), version=4),
+                user_id=self.rng.choice(users),
+                title=f'{self.rng.choice(TITLES[category])} ({self.faker.street_name()})',
+                content=self.faker.paragraph(nb_sentences=4),
+                category=category,
+                status=status,
+                visibility='private' if self.rng.random() < options['private_ratio'] else 'public',
+                area_id=area.pk,
+                location=area.name,
+                latitude=lat,
+                longitude=lng,
+                point=Point(lng, lat, srid=4326),
+                created_at=created_at,
+                updated_at=created_at,
+                completed_at=created_at + timedelta(days=self.rng.randint(1, 30)) if status == 'resolved' else None,
+            )
+
+        grievance_ids = []
+        for batch in self._batches(build(index) for index in range(count)):
+            timestamps = [(obj.created_at, obj.updated_at) for obj in batch]
+            with transaction.atomic():
+                Grievance.objects.bulk_create(batch)
+                for obj, (created_at, updated_at) in zip(batch, timestamps):
+                    obj.created_at, obj.updated_at = created_at, updated_at
+                Grievance.objects.bulk_update(batch, ['created_at', 'updated_at'])
+                GrievanceSecret.objects.bulk_create([
+                    GrievanceSecret(grievance=obj, password_hash=secret_hash)
+                    for obj in batch if obj.visibility == 'private'
+                ])
+            grievance_ids += [obj.pk for obj in batch]
+
+        self._report(f'민원 (구역 {len(area_by_id)}개)', count, started)
+        return grievance_ids
+
+    def _create_likes(self, count, zipf, users, grievance_ids):
+        """좋아요: 민원 인기도 ∝ 1 / rank^zipf (상위 소수 민원에 집중)"""
+        if not users or not grievance_ids:
+            return
+        started = time.perf_counter()
+
+        ranked = grievance_ids[:]
+        self.rng.shuffle(ranked)
+        weights = list(itertools.accumulate(1 / (rank ** zipf) for rank in range(1, len(ranked) + 1)))
+
+        seen = set()
+
+        def build(_):
+            grievance_id = self.rng.choices(ranked, cum_weights=weights)[0]
+            user_id = self.rng.choice(users)
+            if (user_id, grievance_id) in seen:
+                return None
+            seen.add((user_id, grievance_id))
+            return Like(user_id=user_id, grievance_id=grievance_id)
+
+        created = 0
+        likes = (like for like in map(build, range(count)) if like is not None)
+        for batch in self._batches(likes):
+            Like.objects.bulk_create(batch, ignore_conflicts=True)
+            created += len(batch)
+        self._report('좋아요', created, started)
+
+    def _refresh_hot_scores(self):
+        """인기 점수: bulk_create / 생성 시각 덮어쓰기 후 전체 재계산"""
+        started = time.perf_counter()
+        self._report('인기 점수', HotScoreService.refresh_all(batch_size=self.batch_size), started)
+
+    def _create_images(self, max_images, grievance_ids):
+        """이미지: 공용 placeholder 파일 1개를 참조 (파일 I/O 없이 행만 생성)"""
+        if max_images <= 0 or not grievance_ids:
+            return
+        started = time.perf_counter()
+
+        if not default_storage.exists(PLACEHOLDER_IMAGE):
+            from PIL import Image
+            buffer = io.BytesIO()
+            Image.new('RGB', (64, 64), (200, 200, 200)).save(buffer, format='PNG')
+            default_storage.save(PLACEHOLDER_IMAGE, ContentFile(buffer.getvalue()))
+
+        def build():
+            for grievance_id in grievance_ids:
+                for order in range(self.rng.randint(0, max_images)):
+                    yield GrievanceImage(grievance_id=grievance_id, image=PLACEHOLDER_IMAGE, order=order)
+
+        created = 0
+        for batch in self._batches(build()):
+            GrievanceImage.objects.bulk_create(batch)
+            created += len(batch)
+        self._report('이미지', created, started)
@@ -0,0 +1,383 @@
+"""
+레거시 데이터 일괄 이관
+Project_baro_Database 스키마(USER, AREA, COMPLAIN, COMPLAIN_MEDIA, COMPLAIN_SECRET) CSV 내보내기를
+CustomUser, Area, Grievance, GrievanceImage, GrievanceSecret으로 적재
+
+처리 방식:
+- PostgreSQL COPY로 임시 스테이징 테이블에 적재 (행 단위 save() 없음)
+- INSERT ... SELECT ... ON CONFLICT 집합 연산으로 업서트 (재실행 가능)
+- 사용자는 새 이메일만 추가: 이미 있는 계정(새 시스템 가입자 / 이전 실행에서 이관된 계정)의
+  패스워드 / 역할 / 인증 여부는 CSV로 덮어쓰지 않음
+- 좌표(point, 위도/경도)와 구역 배정은 SQL에서 계산
+- 사용자 / 비공개 민원 패스워드 해시는 SQL CASE로 Django 형식 변환 (password_hash_sql, 해시 재계산 없음)
+  레거시 Argon2 → argon2$..., Django 해시는 그대로, 그 외(빈 값 / 알 수 없는 형식)는 '!'(검증 불가)
+
+사용 예:
+    python manage.py import_legacy /data/legacy_export
+    python manage.py import_legacy /data/legacy_export --dry-run
+"""
+
+import csv
+import re
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hashers
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from apps.grievances.models import Area, Grievance
+from apps.grievances.services import GrievanceVersionService
+
+
+# 레거시 테이블 → 스테이징 테이블 컬럼 (모두 text로 받아 SQL에서 변환)
+STAGING_TABLES = {
+    'AREA': ('legacy_area', ('area_id', 'name', 'center_point', 'leader_user_id', 'boundary')),
+    'USER': ('legacy_user', (
+        'user_id', 'email', 'password_hash', 'nickname', 'role', 'party',
+        'is_verified', 'reputation', 'user_create', 'area_id',
+    )),
+    'COMPLAIN': ('legacy_complain', (
+        'complain_id', 'complainer_id', 'area_id', 'title', 'content', 'status',
+        'category', 'visibility', 'location', 'created_at', 'completed_at',
+    )),
+    'COMPLAIN_MEDIA': ('legacy_media', ('media_id', 'complain_id', 'image_url')),
+    'COMPLAIN_SECRET': ('legacy_secret', ('complain_id', 'password_hash')),
+}
+
+# 레거시 상태 → 현재 STATUS_CHOICES ('Rejected'는 대응 값이 없어 완료로 처리)
+STATUS_MAP = {
+    'Pending': 'pending',
+    'Processing': 'in_progress',
+    'Completed': 'resolved',
+    'Rejected': 'resolved',
+}
+
+# 레거시 정수 ID → 결정적 UUID (재실행 시 동일 ID → ON CONFLICT 업서트)
+COMPLAIN_UUID_SQL = "md5('baro-legacy-complain:' || {})::uuid"
+MEDIA_UUID_SQL = "md5('baro-legacy-media:' || {})::uuid"
+
+
+def password_hash_sql(column):
+    """
+    레거시 패스워드 해시 컬럼 → Django 해시 형식 SQL 식 (사용자 / 비공개 민원 패스워드 공통)
+    - 레거시 Argon2($argon2id$...)는 'argon2' 접두어만 붙임 (Argon2PasswordHasher로 검증)
+    - PASSWORD_HASHERS 형식(<algorithm>$...)이면 그대로
+    - 그 외(빈 값 / 알 수 없는 형식)는 '!' (검증 불가, 레거시는 평문을 저장하지 않으므로 평문으로 보지 않음)
+    """
+    algorithms = '|'.join(re.escape(hasher.algorithm) for hasher in get_hashers())
+    value = f'trim({column})'
+    return (
+        f"CASE WHEN left({value}, 7) = '$argon2' THEN 'argon2' || {value} "
+        f"WHEN {value} ~ '^({algorithms})\\$' THEN {value} "
+        f"ELSE '!' END"
+    )
+
+
+class Command(BaseCommand):
+    help = '레거시 CSV(USER, AREA, COMPLAIN, COMPLAIN_MEDIA, COMPLAIN_SECRET)를 COPY + 집합 업서트로 일괄 이관'
+
+    def add_arguments(self, parser):
+        parser.add_argument('data_dir', help='레거시 CSV 파일 디렉터리 (USER.csv 또는 "Project_baro_Database - USER.csv" 형식)')
+        parser.add_argument('--dry-run', action='store_true', help='적재 후 롤백 (검증용)')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('PostgreSQL(PostGIS) 데이터베이스에서만 실행할 수 있습니다')
+
+        data_dir = Path(options['data_dir'])
+        files = {table: self._find_file(data_dir, table) for table in STAGING_TABLES}
+        if not files['COMPLAIN'] and not files['USER'] and not files['AREA']:
+            raise CommandError(f'{data_dir}에서 레거시 CSV 파일을 찾을 수 없습니다')
+
+        started = time.perf_counter()
+
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                for table, path in files.items():
+                    if path:
+                        self._copy(cursor, table, path)
+
+                if files['AREA']:
+                    self._upsert_areas(cursor)
+                self._build_area_map(cursor, has_areas=bool(files['AREA']))
+
+                if files['USER']:
+                    self._upsert_users(cursor)
+                self._build_user_map(cursor, has_users=bool(files['USER']))
+
+                if files['AREA'] and files['USER']:
+                    self._update_area_leaders(cursor)
+                if files['COMPLAIN']:
+                    self._upsert_grievances(cursor)
+                if files['COMPLAIN_MEDIA']:
+                    self._upsert_images(cursor)
+                if files['COMPLAIN_SECRET']:
+                    self._upsert_secrets(cursor)
+
+            if options['dry_run']:
+                transaction.set_rollback(True)
+                self.stdout.write(self.style.WARNING('--dry-run: 모든 변경을 롤백했습니다'))
+
+        if not options['dry_run']:
+            # 시그널을 거치지 않으므로 캐시/ETag 버전 직접 증가
+            area_ids = Area.objects.values_list('id', flat=True)
+            GrievanceVersionService.bump_areas(area_ids)
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f'이관 완료: 총 {elapsed:.1f}초'))
+
+    # ------------------------------------------------------------------
+    # 적재 단계
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _find_file(data_dir, table):
+        for name in (f'{table}.csv', f'Project_baro_Database - {table}.csv'):
+            path = data_dir / name
+            if path.exists():
+                return path
+        return None
+
+    def _report(self, label, rows, started):
+        elapsed = time.perf_counter() - started
+        rate = rows / elapsed if elapsed > 0 else rows
+        self.stdout.write(f'  {label}: {rows:,}행, {elapsed:.2f}초 ({rate:,.0f}행/초)')
+
+    def _read_header(self, path, table):
+        """CSV 헤더 검증 후 COPY 컬럼 목록 반환"""
+        _, columns = STAGING_TABLES[table]
+        with open(path, encoding='utf-8-sig', newline='') as f:
+            header = next(csv.reader(f), [])
+        header = [column.strip() for column in header]
+        unknown = [column for column in header if column not in columns]
+        if unknown:
+            raise CommandError(f'{path.name}: 알 수 없는 컬럼 {unknown} (허용: {list(columns)})')
+        return header
+
+    def _copy(self, cursor, table, path):
+        """스테이징 테이블 생성 + COPY FROM STDIN"""
+        staging, columns = STAGING_TABLES[table]
+        header = self._read_header(path, table)
+        started = time.perf_counter()
+
+        column_defs = ', '.join(f'{column} text' for column in columns)
+        cursor.execute(f'CREATE TEMP TABLE {staging} ({column_defs}) ON COMMIT DROP')
+
+        copy_sql = f"COPY {staging} ({', '.join(header)}) FROM STDIN WITH (FORMAT csv, HEADER true)"
+        with open(path, encoding='utf-8-sig', newline='') as f:
+            cursor.copy_expert(copy_sql, f)
+
+        cursor.execute(f'ANALYZE {staging}')
+        cursor.execute(f'SELECT count(*) FROM {staging}')
+        self._report(f'COPY {table}', cursor.fetchone()[0], started)
+
+    def _upsert_areas(self, cursor):
+        """구역: 이름 기준 업서트 (기존 26개 구역 ID 유지)"""
+        started = time.perf_counter()
+        cursor.execute("""
+            INSERT INTO areas (name, center_point, boundary, created_at, updated_at)
+            SELECT DISTINCT ON (name)
+                   name,
+                   ST_SetSRID(center_point::geometry, 4326)::geography,
+                   ST_Multi(ST_SetSRID(NULLIF(boundary, '')::geometry, 4326))::geography,
+                   now(), now()
+            FROM legacy_area
+            WHERE COALESCE(name, '') <> '' AND COALESCE(center_point, '') <> ''
+            ORDER BY name, area_id
+            ON CONFLICT (name) DO UPDATE SET
+                center_point = EXCLUDED.center_point,
+                boundary = COALESCE(EXCLUDED.boundary, areas.boundary),
+                updated_at = now()
+        """)
+        self._report('업서트 Area', cursor.rowcount, started)
+
+    def _build_area_map(self, cursor, has_areas):
+        """레거시 area_id → 현재 Area.id 매핑"""
+        if has_areas:
+            cursor.execute("""
+                CREATE TEMP TABLE legacy_area_map ON COMMIT DROP AS
+                SELECT la.area_id, a.id
+                FROM legacy_area la JOIN areas a ON a.name = la.name
+            """)
+        else:
+            cursor.execute('CREATE TEMP TABLE legacy_area_map (area_id text, id bigint) ON COMMIT DROP')
+        cursor.execute('CREATE INDEX ON legacy_area_map (area_id)')
+
+    def _upsert_users(self, cursor):
+        """
+        사용자: 이메일 기준 신규 추가 (패스워드 해시는 password_hash_sql 규칙으로 변환)
+        이미 있는 이메일은 건너뜀 (ON CONFLICT DO NOTHING)
+        - 기존 계정의 패스워드 / role / is_verified를 CSV 값으로 바꾸면 계정 탈취 / 권한 상승이 가능
+        - raw SQL 갱신은 post_save(JWT 유저 캐시 삭제)를 거치지 않음
+        레거시 민원 / 구역 담당자는 _build_user_map에서 같은 이메일의 기존 계정에 연결
+        """
+        started = time.perf_counter()
+        cursor.execute(f"""
+            INSERT INTO users (
+                password, is_superuser, first_name, last_name, is_staff, is_active, date_joined,
+                email, name, phone_number, role, nickname, party, is_verified, reputation,
+                area_id, created_at, updated_at
+            )
+            SELECT DISTINCT ON (lower(u.email))
+                   {password_hash_sql('u.password_hash')},
+                   false, '', '', false, true,
+                   COALESCE(NULLIF(u.user_create, '')::timestamptz, now()),
+                   trim(u.email), '', '',
+                   CASE WHEN u.role IN ('citizen', 'politician', 'admin') THEN u.role ELSE 'citizen' END,
+                   left(COALESCE(u.nickname, ''), 50),
+                   NULLIF(u.party, ''),
+                   COALESCE(lower(u.is_verified) IN ('true', 't', '1', 'y', 'yes'), false),
+                   GREATEST(COALESCE(NULLIF(u.reputation, '')::integer, 0), 0),
+                   am.id,
+                   COALESCE(NULLIF(u.user_create, '')::timestamptz, now()),
+                   now()
+            FROM legacy_user u
+            LEFT JOIN legacy_area_map am ON am.area_id = u.area_id
+            WHERE COALESCE(u.email, '') <> '' AND length(trim(u.email)) <= 254
+            ORDER BY lower(u.email), u.user_id
+            ON CONFLICT (email) DO NOTHING
+        """)
+        self._report('추가 CustomUser (기존 이메일 제외)', cursor.rowcount, started)
+
+    def _build_user_map(self, cursor, has_users):
+        """레거시 user_id → 현재 CustomUser.id 매핑"""
+        if has_users:
+            cursor.execute("""
+                CREATE TEMP TABLE legacy_user_map ON COMMIT DROP AS
+                SELECT lu.user_id, u.id
+                FROM legacy_user lu JOIN users u ON u.email = trim(lu.email)
+            """)
+        else:
+            cursor.execute('CREATE TEMP TABLE legacy_user_map (user_id text, id bigint) ON COMMIT DROP')
+        cursor.execute('CREATE INDEX ON legacy_user_map (user_id)')
+
+    def _update_area_leaders(self, cursor):
+        started = time.perf_counter()
+        cursor.execute("""
+            UPDATE areas a
+            SET leader_id = um.id, updated_at = now()
+            FROM legacy_area la
+            JOIN legacy_area_map am ON am.area_id = la.area_id
+            JOIN legacy_user_map um ON um.user_id = la.leader_user_id
+            WHERE a.id = am.id AND a.leader_id IS DISTINCT FROM um.id
+        """)
+        self._report('Area 담당자 연결', cursor.rowcount, started)
+
+    def _upsert_grievances(self, cursor):
+        """
+        민원 업서트
+        - location(geometry) → point, latitude, longitude
+        - 구역: 레거시 area_id → 경계 포함 구역 → 가장 가까운 중심점 → '미지정' 순서
+        """
+        started = time.perf_counter()
+        categories = [choice[0] for choice in Grievance.CATEGORY_CHOICES]
+        status_cases = ' '.join(
+            f"WHEN '{legacy}' THEN '{current}'" for legacy, current in STATUS_MAP.items()
+        )
+        cursor.execute(f"""
+            WITH src AS (
+                SELECT DISTINCT ON (c.complain_id) c.*, ST_SetSRID(c.location::geometry, 4326) AS geom
+                FROM legacy_complain c
+                WHERE COALESCE(c.location, '') <> ''
+                ORDER BY c.complain_id
+            ),
+            assigned AS (
+                SELECT s.*, um.id AS new_user_id,
+                       COALESCE(
+                           am.id,
+                           (SELECT a.id FROM areas a
+                            WHERE a.boundary IS NOT NULL AND ST_Covers(a.boundary, s.geom::geography)
+                            LIMIT 1),
+                           (SELECT a.id FROM areas a
+                            WHERE a.name <> '미지정'
+                            ORDER BY a.center_point <-> s.geom::geography
+                            LIMIT 1),
+                           (SELECT a.id FROM areas a WHERE a.name = '미지정')
+                       ) AS new_area_id
+                FROM src s
+                LEFT JOIN legacy_user_map um ON um.user_id = s.complainer_id
+                LEFT JOIN legacy_area_map am ON am.area_id = s.area_id
+            )
+            INSERT INTO grievances (
+                id, user_id, title, content, category, status, visibility,
+                area_id, location, latitude, longitude, point,
+                created_at, updated_at, completed_at
+            )
+            SELECT {COMPLAIN_UUID_SQL.format('s.complain_id')},
+                   s.new_user_id,
+                   left(COALESCE(s.title, ''), 200),
+                   COALESCE(s.content, ''),
+                   CASE WHEN s.category = ANY(%s) THEN s.category ELSE 'etc' END,
+                   CASE s.status {status_cases} ELSE 'pending' END,
+                   CASE WHEN s.visibility = 'private' THEN 'private' ELSE 'public' END,
+                   s.new_area_id,
+                   COALESCE(a.name, ''),
+                   ST_Y(s.geom), ST_X(s.geom), s.geom::geography,
+                   COALESCE(g.created_at, NULLIF(s.created_at, '')::timestamptz, now()),
+                   now(),
+                   NULLIF(s.completed_at, '')::timestamptz
+            FROM assigned s
+            LEFT JOIN areas a ON a.id = s.new_area_id
+            -- grievances PK는 (id, created_at) (파티션 키 포함) → 재실행 시 기존 created_at 유지해야 충돌 감지
+            LEFT JOIN grievances g ON g.id = {COMPLAIN_UUID_SQL.format('s.complain_id')}
+            ON CONFLICT (id, created_at) DO UPDATE SET
+                user_id = EXCLUDED.user_id,
+                title = EXCLUDED.title,
+                content = EXCLUDED.content,
+                category = EXCLUDED.category,
+                status = EXCLUDED.status,
+                visibility = EXCLUDED.visibility,
+                area_id = EXCLUDED.area_id,
+                location = EXCLUDED.location,
+                latitude = EXCLUDED.latitude,
+                longitude = EXCLUDED.longitude,
+                point = EXCLUDED.point,
+                completed_at = EXCLUDED.completed_at,
+                updated_at = now()
+        """, [categories])
+        self._report('업서트 Grievance', cursor.rowcount, started)
+
+        cursor.execute("SELECT count(*) FROM legacy_complain WHERE status = 'Rejected'")
+        rejected = cursor.fetchone()[0]
+        if rejected:
+            self.stdout.write(self.style.WARNING(f"  'Rejected' 상태 {rejected:,}건은 'resolved'로 이관했습니다"))
+
+        cursor.execute("SELECT count(*) FROM legacy_complain WHERE COALESCE(location, '') = ''")
+        skipped = cursor.fetchone()[0]
+        if skipped:
+            self.stdout.write(self.style.WARNING(f'  좌표 없는 민원 {skipped:,}건은 건너뛰었습니다'))
+
+    def _upsert_images(self, cursor):
+        """민원 이미지: MEDIA_URL 접두사 제거 후 스토리지 경로로 저장, 순서는 media_id 순"""
+        started = time.perf_counter()
+        media_prefix = r'^(https?://[^/]+)?' + re.escape(settings.MEDIA_URL)
+        cursor.execute(f"""
+            INSERT INTO grievance_images (id, grievance_id, image, "order", created_at)
+            SELECT {MEDIA_UUID_SQL.format('m.media_id')},
+                   g.id,
+                   regexp_replace(m.image_url, %s, ''),
+                   (row_number() OVER (PARTITION BY m.complain_id ORDER BY m.media_id::bigint) - 1)::smallint,
+                   now()
+            FROM (SELECT DISTINCT ON (media_id) * FROM legacy_media ORDER BY media_id) m
+            JOIN grievances g ON g.id = {COMPLAIN_UUID_SQL.format('m.complain_id')}
+            WHERE COALESCE(m.image_url, '') <> ''
+            ON CONFLICT (id) DO UPDATE SET
+                image = EXCLUDED.image,
+                "order" = EXCLUDED."order"
+        """, [media_prefix])
+        self._report('업서트 GrievanceImage', cursor.rowcount, started)
+
+    def _upsert_secrets(self, cursor):
+        """비공개 민원 패스워드 (visibility='private'인 민원만, 해시는 사용자와 같은 password_hash_sql 규칙)"""
+        started = time.perf_counter()
+        cursor.execute(f"""
+            INSERT INTO grievance_secrets (grievance_id, password_hash, created_at)
+            SELECT g.id, {password_hash_sql('s.password_hash')}, now()
+            FROM (SELECT DISTINCT ON (complain_id) * FROM legacy_secret ORDER BY complain_id) s
+            JOIN grievances g ON g.id = {COMPLAIN_UUID_SQL.format('s.complain_id')}
+            WHERE g.visibility = 'private'
+            ON CONFLICT (grievance_id) DO UPDATE SET password_hash = EXCLUDED.password_hash
+        """)
+        self._report('업서트 GrievanceSecret', cursor.rowcount, started)
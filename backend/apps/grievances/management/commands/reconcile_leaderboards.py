@@ -0,0 +1,38 @@
+"""
+좋아요 순위(Redis sorted set) 보정
+- PostgreSQL 집계(공개 + 미완료 민원별 좋아요 수)로 전체 / 구역 / 카테고리 / 구역 + 카테고리 키를 재구성
+- 키별로 임시 키에 쓴 뒤 RENAME → 조회 중에도 빈 순위가 보이지 않음
+- Redis 유실 / 장애 복구 후, 요청 경로 갱신 누락분과 키별 상위 LEADERBOARD_SIZE개 밖으로 잘린 민원 복구 → 주기 cron
+
+사용 예:
+    python manage.py reconcile_leaderboards
+    python manage.py reconcile_leaderboards --loop --interval 900
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.grievances.leaderboards import GrievanceLeaderboard
+
+
+class Command(BaseCommand):
+    help = '좋아요 순위 Redis sorted set을 PostgreSQL 기준으로 재구성'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help='종료하지 않고 주기적으로 반복')
+        parser.add_argument('--interval', type=int, default=900, help='--loop 반복 간격 (초)')
+
+    def handle(self, *args, **options):
+        while True:
+            started = time.perf_counter()
+            stats = GrievanceLeaderboard.reconcile()
+            self.stdout.write(self.style.SUCCESS(
+                f'순위 키 {stats["keys"]:,}개 재구성 (불일치 {stats["drift"]:,}개, 비운 키 {stats["removed"]:,}개) '
+                f'{time.perf_counter() - started:.2f}초'
+            ))
+            if not options['loop']:
+                break
+            close_old_connections()
+            time.sleep(options['interval'])
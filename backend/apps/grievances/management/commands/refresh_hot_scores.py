@@ -0,0 +1,56 @@
+"""
+인기(hot) 정렬 점수 재계산
+- 기본: 마지막 실행 이후 '최근 좋아요'(HOT_SCORE_WINDOW_DAYS) 기간을 벗어난 좋아요가 있는 민원만 재계산 → cron
+  (좋아요 / 상태 변경 시 점수는 요청 경로에서 바로 갱신되므로 배치는 기간 경과분만 처리)
+- --lookback-minutes: 실행 간격보다 약간 길게 지정 (기본 90분 → 매시간 cron)
+- --all: 전체 재계산 (HOT_SCORE_* 설정 변경, import_legacy / 대량 적재 후)
+- --loop: 상시 실행 (--interval초마다 반복, lookback은 interval 기준 자동 설정)
+
+사용 예:
+    python manage.py refresh_hot_scores
+    python manage.py refresh_hot_scores --all
+    python manage.py refresh_hot_scores --loop --interval 600
+"""
+
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from apps.grievances.services import HotScoreService
+
+
+class Command(BaseCommand):
+    help = '인기순(ordering=hot) 정렬 점수 재계산'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--lookback-minutes', type=int, default=90, help='기간 경과 좋아요 조회 범위 (분)')
+        parser.add_argument('--batch-size', type=int, default=1000, help='UPDATE 1회당 민원 수')
+        parser.add_argument('--all', action='store_true', help='전체 민원 재계산')
+        parser.add_argument('--loop', action='store_true', help='종료하지 않고 주기적으로 반복')
+        parser.add_argument('--interval', type=int, default=600, help='--loop 반복 간격 (초)')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size는 1 이상이어야 합니다')
+
+        if options['all']:
+            started = time.perf_counter()
+            updated = HotScoreService.refresh_all(batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(
+                f'전체 재계산: {updated:,}건 갱신 ({time.perf_counter() - started:.1f}초)'
+            ))
+            return
+
+        lookback = timedelta(minutes=options['lookback_minutes'])
+        if options['loop']:
+            lookback = max(lookback, timedelta(seconds=options['interval'] * 1.5))
+
+        while True:
+            updated = HotScoreService.refresh_expired(lookback, batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f'기간 경과 재계산: {updated:,}건 갱신'))
+            if not options['loop']:
+                break
+            close_old_connections()
+            time.sleep(options['interval'])
@@ -0,0 +1,43 @@
+"""
+외부 API 스텁 서버 실행 (HTTP 모드 벤치마크용)
+
+사용 예:
+    python manage.py run_provider_stubs --port 8765 --latency 0.05
+    NAVER_GEOCODE_API_URL=http://127.0.0.1:8765/map-reversegeocode/v2/gc \
+    KAKAO_USER_INFO_URL=http://127.0.0.1:8765/v2/user/me \
+    NAVER_USER_INFO_URL=http://127.0.0.1:8765/v1/nid/me \
+        gunicorn config.wsgi
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.grievances.models import Area
+from core.provider_stubs import ProviderStubServer
+
+
+class Command(BaseCommand):
+    help = 'Naver 역지오코딩 / Kakao / Naver 로그인 / 푸시 발송 API 스텁 서버 실행'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8765)
+        parser.add_argument('--latency', type=float, default=0.0, help='응답 지연 (초)')
+
+    def handle(self, *args, **options):
+        areas = [
+            (area.name, area.center_point.y, area.center_point.x)
+            for area in Area.objects.exclude(name='미지정')
+        ]
+        server = ProviderStubServer((options['host'], options['port']), areas=areas, latency=options['latency'])
+
+        self.stdout.write(self.style.SUCCESS(f'스텁 서버 실행: {server.base_url} (구역 {len(areas)}개)'))
+        for name, url in server.urls().items():
+            self.stdout.write(f'  {name}={url}')
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            self.stdout.write(f'요청 수: {server.requests}')
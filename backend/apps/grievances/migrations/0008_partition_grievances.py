@@ -0,0 +1,120 @@
+# grievances 테이블을 created_at 기준 월 단위 RANGE 파티션으로 전환
+#
+# - PostgreSQL 파티션 테이블의 PK/UNIQUE는 파티션 키를 포함해야 하므로 PK는 (id, created_at)
+#   (Django 모델의 pk는 그대로 id, UUID4라 id 중복은 발생하지 않음)
+# - 파티션 테이블의 (id)만 참조하는 FK는 만들 수 없으므로 likes / grievance_images /
+#   grievance_secrets의 grievance FK는 db_constraint=False (CASCADE는 Django ORM이 처리)
+# - 기존 인덱스(Meta.indexes, db_index)는 같은 이름으로 부모 테이블에 다시 생성 → 파티션별 인덱스 자동 생성
+# - 이후 월 파티션은 `manage.py ensure_grievance_partitions`로 생성 (범위 밖 행은 grievances_default)
+
+import re
+from datetime import datetime, timezone as dt_timezone
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+MONTHS_AHEAD = 3
+
+
+def _month_start(value):
+    value = value.astimezone(dt_timezone.utc)
+    return datetime(value.year, value.month, 1, tzinfo=dt_timezone.utc)
+
+
+def _add_months(value, months):
+    index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=index // 12, month=index % 12 + 1)
+
+
+def _swap_table(cursor, partitioned):
+    """grievances → grievances_old 로 바꾸고 같은 구조의 새 테이블(파티션 여부 선택)로 데이터 복사"""
+    cursor.execute('ALTER TABLE grievances RENAME TO grievances_old')
+    cursor.execute('ALTER TABLE grievances_old RENAME CONSTRAINT grievances_pkey TO grievances_old_pkey')
+
+    # 기존 인덱스 / FK 정의 보관 (PK 제외)
+    cursor.execute("""
+        SELECT indexname, indexdef FROM pg_indexes
+        WHERE tablename = 'grievances_old' AND indexname <> 'grievances_old_pkey'
+    """)
+    indexes = cursor.fetchall()
+    cursor.execute("""
+        SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint
+        WHERE conrelid = 'grievances_old'::regclass AND contype = 'f'
+    """)
+    foreign_keys = cursor.fetchall()
+
+    if partitioned:
+        cursor.execute("""
+            CREATE TABLE grievances (LIKE grievances_old INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+            PARTITION BY RANGE (created_at)
+        """)
+        cursor.execute('ALTER TABLE grievances ADD CONSTRAINT grievances_pkey PRIMARY KEY (id, created_at)')
+
+        cursor.execute('SELECT min(created_at) FROM grievances_old')
+        now = datetime.now(dt_timezone.utc)
+        oldest = cursor.fetchone()[0] or now
+        month, last = _month_start(min(oldest, now)), _add_months(_month_start(now), MONTHS_AHEAD)
+        while month <= last:
+            cursor.execute(
+                f'CREATE TABLE grievances_p{month:%Y%m} PARTITION OF grievances FOR VALUES FROM (%s) TO (%s)',
+                [month, _add_months(month, 1)],
+            )
+            month = _add_months(month, 1)
+        cursor.execute('CREATE TABLE grievances_default PARTITION OF grievances DEFAULT')
+    else:
+        cursor.execute("""
+            CREATE TABLE grievances (LIKE grievances_old INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+        """)
+        cursor.execute('ALTER TABLE grievances ADD CONSTRAINT grievances_pkey PRIMARY KEY (id)')
+
+    for name, definition in foreign_keys:
+        cursor.execute(f'ALTER TABLE grievances ADD CONSTRAINT {name} {definition}')
+
+    cursor.execute('INSERT INTO grievances SELECT * FROM grievances_old')
+
+    for name, definition in indexes:
+        cursor.execute(f'DROP INDEX {name}')
+        cursor.execute(re.sub(r' ON (?:ONLY )?((?:\w+\.)?)grievances_old ', r' ON \1grievances ', definition))
+
+    cursor.execute('DROP TABLE grievances_old CASCADE')
+
+
+def partition_grievances(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        _swap_table(cursor, partitioned=True)
+
+
+def unpartition_grievances(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        _swap_table(cursor, partitioned=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('grievances', '0007_area_leader'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='like',
+            name='grievance',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='likes', to='grievances.grievance', verbose_name='민원'),
+        ),
+        migrations.AlterField(
+            model_name='grievanceimage',
+            name='grievance',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='images', to='grievances.grievance', verbose_name='민원'),
+        ),
+        migrations.AlterField(
+            model_name='grievancesecret',
+            name='grievance',
+            field=models.OneToOneField(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='secret', serialize=False, to='grievances.grievance', verbose_name='민원'),
+        ),
+        migrations.RunPython(partition_grievances, unpartition_grievances),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 5.0.1 on 2026-10-19 10:00
+
+import django.contrib.gis.db.models.fields
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('grievances', '0008_partition_grievances'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedGrievance',
+            fields=[
+                ('id', models.UUIDField(editable=False, primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=200, verbose_name='제목')),
+                ('content', models.TextField(verbose_name='내용')),
+                ('category', models.CharField(choices=[('traffic', '교통/주차'), ('env', '환경/위생'), ('safety', '안전/치안'), ('facility', '공원/시설'), ('animal', '동물'), ('admin', '일반행정'), ('etc', '기타')], default='etc', max_length=20, verbose_name='카테고리')),
+                ('status', models.CharField(choices=[('pending', '대기중'), ('in_progress', '처리중'), ('resolved', '완료')], default='resolved', max_length=20, verbose_name='상태')),
+                ('visibility', models.CharField(choices=[('public', '공개'), ('private', '비공개')], default='public', max_length=20, verbose_name='공개 범위')),
+                ('location', models.CharField(blank=True, max_length=200, verbose_name='지역')),
+                ('latitude', models.FloatField(verbose_name='위도')),
+                ('longitude', models.FloatField(verbose_name='경도')),
+                ('point', django.contrib.gis.db.models.fields.PointField(blank=True, geography=True, null=True, srid=4326, verbose_name='좌표')),
+                ('created_at', models.DateTimeField(verbose_name='생성일')),
+                ('updated_at', models.DateTimeField(verbose_name='수정일')),
+                ('completed_at', models.DateTimeField(blank=True, null=True, verbose_name='완료 시각')),
+                ('like_count', models.PositiveIntegerField(default=0, verbose_name='좋아요 수')),
+                ('password_hash', models.CharField(blank=True, max_length=255, verbose_name='패스워드 해시')),
+                ('archived_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='보관일')),
+                ('area', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='archived_grievances', to='grievances.area', verbose_name='발생 지역')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='archived_grievances', to=settings.AUTH_USER_MODEL, verbose_name='작성자')),
+            ],
+            options={
+                'verbose_name': '보관 민원',
+                'verbose_name_plural': '보관 민원',
+                'db_table': 'grievances_archive',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['area'], name='grievances__area_id_eb15e4_idx'), models.Index(fields=['user', '-created_at'], name='grievances__user_id_cfc589_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedGrievanceImage',
+            fields=[
+                ('id', models.UUIDField(editable=False, primary_key=True, serialize=False)),
+                ('image', models.ImageField(upload_to='grievances/images/%Y/%m/%d/', verbose_name='이미지')),
+                ('order', models.PositiveSmallIntegerField(default=0, verbose_name='순서')),
+                ('created_at', models.DateTimeField(verbose_name='생성일')),
+                ('grievance', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='images', to='grievances.archivedgrievance', verbose_name='보관 민원')),
+            ],
+            options={
+                'verbose_name': '보관 민원 이미지',
+                'verbose_name_plural': '보관 민원 이미지',
+                'db_table': 'grievance_images_archive',
+                'ordering': ['order', 'created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedLike',
+            fields=[
+                ('id', models.UUIDField(editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(verbose_name='생성일')),
+                ('grievance', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='likes', to='grievances.archivedgrievance', verbose_name='보관 민원')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_likes', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '보관 민원 좋아요',
+                'verbose_name_plural': '보관 민원 좋아요',
+                'db_table': 'likes_archive',
+                'unique_together': {('user', 'grievance')},
+            },
+        ),
+    ]
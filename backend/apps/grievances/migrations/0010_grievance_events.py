@@ -0,0 +1,37 @@
+# Generated by Django 5.0.1 on 2026-10-19 14:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('grievances', '0009_grievance_archive'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GrievanceEvent',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('actor_role', models.CharField(choices=[('author', '작성자'), ('leader', '구역 담당자'), ('official', '정치인/관리자'), ('citizen', '시민'), ('anonymous', '비로그인')], max_length=20, verbose_name='행위자 역할')),
+                ('event_type', models.CharField(choices=[('created', '접수'), ('status_changed', '상태 변경'), ('edited', '수정')], max_length=20, verbose_name='이벤트')),
+                ('from_status', models.CharField(blank=True, max_length=20, verbose_name='이전 상태')),
+                ('to_status', models.CharField(blank=True, max_length=20, verbose_name='변경 상태')),
+                ('changes', models.JSONField(blank=True, default=list, verbose_name='변경 필드')),
+                ('elapsed', models.DurationField(verbose_name='접수 후 경과')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='기록 시각')),
+                ('actor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='grievance_events', to=settings.AUTH_USER_MODEL, verbose_name='행위자')),
+                ('grievance', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='events', to='grievances.grievance', verbose_name='민원')),
+            ],
+            options={
+                'verbose_name': '민원 이벤트',
+                'verbose_name_plural': '민원 이벤트',
+                'db_table': 'grievance_events',
+                'indexes': [models.Index(fields=['grievance', 'created_at'], name='grievance_events_timeline')],
+            },
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.0.1 on 2026-10-19 15:00
+#
+# 인기(hot) 정렬 점수 컬럼 + 인덱스
+# - grievances_archive도 같은 컬럼 추가 (archive.py가 Grievance 컬럼 목록으로 행 복사)
+# - db_default=0 → import_legacy 등 컬럼을 지정하지 않는 raw INSERT도 그대로 동작
+# - 기존 행은 인덱스 생성 전에 HotScoreService와 같은 식으로 한 번 채움
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_hot_scores(apps, schema_editor):
+    schema_editor.execute("""
+        UPDATE grievances g SET hot_score = (
+            log(1 + (SELECT count(*) FROM likes l WHERE l.grievance_id = g.id AND l.created_at >= %s))
+            + extract(epoch FROM g.created_at) / %s
+            - CASE WHEN g.status = 'resolved' THEN %s ELSE 0 END
+        )::double precision
+    """, [
+        timezone.now() - timedelta(days=settings.HOT_SCORE_WINDOW_DAYS),
+        float(settings.HOT_SCORE_GRAVITY_SECONDS),
+        settings.HOT_SCORE_RESOLVED_PENALTY,
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('grievances', '0010_grievance_events'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='grievance',
+            name='hot_score',
+            field=models.FloatField(db_default=models.Value(0.0), default=0, verbose_name='인기 점수'),
+        ),
+        migrations.AddField(
+            model_name='archivedgrievance',
+            name='hot_score',
+            field=models.FloatField(db_default=models.Value(0.0), default=0, verbose_name='인기 점수'),
+        ),
+        migrations.RunPython(backfill_hot_scores, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='grievance',
+            index=models.Index(fields=['-hot_score', '-id'], name='grievances_hot_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='grievance',
+            index=models.Index(fields=['area', '-hot_score', '-id'], name='grievances_area_hot_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='like',
+            index=models.Index(fields=['created_at'], name='likes_created_at_idx'),
+        ),
+    ]
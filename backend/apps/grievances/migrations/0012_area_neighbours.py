@@ -0,0 +1,41 @@
+# Generated by Django 5.0.1 on 2026-10-19 17:00
+#
+# 인접 구역 (우리 동네 피드 범위)
+# - 기존 구역은 AreaAdjacencyService와 같은 식으로 한 번 채움
+#   (경계가 둘 다 있으면 경계 간 거리, 없으면 중심 좌표 간 거리)
+# - 이후 구역 경계 / 좌표 변경 시: python manage.py build_area_adjacency
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def build_adjacency(apps, schema_editor):
+    schema_editor.execute("""
+        INSERT INTO area_neighbours (from_area_id, to_area_id)
+        SELECT a.id, b.id
+        FROM areas a JOIN areas b ON a.id <> b.id
+        WHERE CASE
+            WHEN a.boundary IS NOT NULL AND b.boundary IS NOT NULL
+                THEN ST_DWithin(a.boundary, b.boundary, %s)
+            ELSE ST_DWithin(a.center_point, b.center_point, %s)
+        END
+    """, [
+        float(settings.NEIGHBOURHOOD_BOUNDARY_TOLERANCE_M),
+        settings.NEIGHBOURHOOD_RADIUS_KM * 1000,
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('grievances', '0011_hot_score'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='area',
+            name='neighbours',
+            field=models.ManyToManyField(blank=True, db_table='area_neighbours', to='grievances.area', verbose_name='인접 구역'),
+        ),
+        migrations.RunPython(build_adjacency, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.0.1 on 2026-10-19 18:00
+#
+# 중복 민원 감지용 제목 trigram 인덱스
+# - pg_trgm 확장 (PostgreSQL 13+는 trusted 확장이라 DB 소유자 권한으로 생성 가능)
+# - 부모 테이블에 생성 → 월 파티션별 인덱스 자동 생성
+# - 한글 trigram은 DB LC_CTYPE이 C가 아닐 때(ko_KR.UTF-8, en_US.UTF-8 등)만 추출됨
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('grievances', '0012_area_neighbours'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='grievance',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='grievances_title_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,159 @@
+"""
+민원 ViewSet 믹스인
+- 조건부 GET (ETag / Last-Modified)
+- 버전 기반 응답 캐시 (비로그인 피드)
+
+두 기능 모두 GrievanceVersionService의 버전 카운터를 사용하며,
+요청당 Redis 조회는 한 번만 수행
+버전으로 ETag / 캐시 키를 만드는 요청은 최근 변경이 복제본에 반영되기 전이면 primary에서 읽음 (core.db_router)
+"""
+
+import hashlib
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers, patch_cache_control
+from django.utils.http import http_date
+from rest_framework import status
+
+from apps.grievances.services import GrievanceVersionService
+from core import db_router
+
+
+class VersionedViewMixin:
+    """
+    버전 카운터 조회 공통 로직
+    하위 클래스에서 get_version_keys()를 구현
+    """
+
+    def get_version_keys(self):
+        raise NotImplementedError
+
+    def get_version_state(self):
+        """(versions, last_modified) 또는 None (요청당 1회만 조회)"""
+        if not hasattr(self, '_version_state'):
+            self._version_state = GrievanceVersionService.get_state(self.get_version_keys())
+            if self._version_state is not None:
+                # 지연된 복제본의 변경 전 행이 새 버전(ETag / 캐시 키)으로 저장되지 않도록
+                db_router.require_primary_since(self._version_state[1])
+        return self._version_state
+
+    def get_normalized_query(self):
+        """쿼리 파라미터 정규화 (키/값 정렬, 빈 값 제거)"""
+        return sorted(
+            (key, sorted(value for value in values if value != ''))
+            for key, values in self.request.query_params.lists()
+            if any(value != '' for value in values)
+        )
+
+
+class ConditionalGetMixin(VersionedViewMixin):
+    """
+    조건부 GET
+    - ETag / Last-Modified를 버전 카운터로 계산 (DB 조회 없음)
+    - If-None-Match / If-Modified-Since 일치 시 직렬화 없이 304 반환
+    - is_liked, is_accessible이 사용자마다 다르므로 사용자 정보(id, role, 인증 여부)를 ETag에 포함
+    - Redis 장애 시 조건부 처리 생략 (일반 응답)
+    """
+
+    def check_not_modified(self, request):
+        """변경이 없으면 304 응답 반환, 아니면 None"""
+        self._condition = None
+
+        state = self.get_version_state()
+        if state is None:
+            return None
+        versions, last_modified = state
+
+        user = request.user
+        if user.is_authenticated:
+            viewer = (user.pk, user.role, user.is_verified)
+            # 본인 역할/인증 변경도 Last-Modified에 반영
+            if last_modified is not None and user.updated_at:
+                last_modified = max(last_modified, int(user.updated_at.timestamp()))
+        else:
+            viewer = None
+
+        fingerprint = repr((request.path, self.get_normalized_query(), versions, viewer))
+        etag = '"%s"' % hashlib.md5(fingerprint.encode()).hexdigest()
+        self._condition = (etag, last_modified)
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is not None:
+            self._patch_condition_headers(response)
+        return response
+
+    def _patch_condition_headers(self, response):
+        """ETag, Last-Modified 및 사용자별 캐시 헤더 설정"""
+        etag, last_modified = self._condition
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+        patch_vary_headers(response, ['Authorization'])
+        patch_cache_control(response, private=True, no_cache=True)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if getattr(self, '_condition', None) and response.status_code == status.HTTP_200_OK:
+            self._patch_condition_headers(response)
+        return response
+
+
+class VersionedResponseCacheMixin(VersionedViewMixin):
+    """
+    버전 기반 응답 캐시 (Redis)
+    - 키: 액션 + URL 인자 + 호스트 + 정규화된 쿼리 파라미터 + 버전
+    - 쓰기 시 버전만 증가시키면 이전 키는 더 이상 조회되지 않음 → O(1) 무효화
+    - 렌더링된 JSON 바이트를 저장하므로 히트 시 DB 조회/직렬화 모두 생략
+    """
+
+    response_cache_timeout = 60 * 5  # 5분 (버전 변경 시 즉시 무효화)
+    response_cache_anonymous_only = True  # 사용자별 필드가 있으면 비로그인만 캐시
+
+    def get_response_cache_key(self, request):
+        """캐시 키 생성 (캐시 불가 시 None)"""
+        if request.method != 'GET':
+            return None
+        if self.response_cache_anonymous_only and request.user.is_authenticated:
+            return None
+
+        state = self.get_version_state()
+        if state is None:
+            return None
+        versions, _ = state
+
+        fingerprint = repr((
+            self.action,
+            sorted(self.kwargs.items()),
+            request.build_absolute_uri('/'),  # 페이징 next/previous URL에 호스트 포함
+            self.get_normalized_query(),
+            versions,
+        ))
+        return f'response_cache:{self.basename}:{hashlib.md5(fingerprint.encode()).hexdigest()}'
+
+    def get_cached_response(self, request):
+        """캐시 히트 시 저장된 JSON으로 응답, 미스 시 None (응답 렌더링 후 저장 예약)"""
+        self._response_cache_key = self.get_response_cache_key(request)
+        if self._response_cache_key is None:
+            return None
+
+        content = cache.get(self._response_cache_key)
+        if content is None:
+            return None
+        return HttpResponse(content, content_type='application/json')
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+
+        cache_key = getattr(self, '_response_cache_key', None)
+        if (
+            cache_key
+            and response.status_code == status.HTTP_200_OK
+            and hasattr(response, 'add_post_render_callback')
+            and not response.is_rendered
+        ):
+            timeout = self.response_cache_timeout
+            response.add_post_render_callback(
+                lambda rendered: cache.set(cache_key, rendered.content, timeout)
+            )
+        return response
@@ -5,7 +5,9 @@
 
 import uuid
 from django.db import models
+from django.utils import timezone
 from django.contrib.gis.db import models as gis_models
+from django.contrib.postgres.indexes import GinIndex
 from django.contrib.gis.geos import Point
 from django.core.validators import FileExtensionValidator
 from apps.users.models import CustomUser
@@ -49,6 +51,15 @@ class Area(models.Model):
         blank=True
     )
 
+    # 인접 구역 (우리 동네 피드 범위, build_area_adjacency 배치가 경계 / 중심 좌표로 계산)
+    neighbours = models.ManyToManyField(
+        'self',
+        symmetrical=True,
+        blank=True,
+        db_table='area_neighbours',
+        verbose_name='인접 구역'
+    )
+
     created_at = models.DateTimeField('생성일', auto_now_add=True)
     updated_at = models.DateTimeField('수정일', auto_now=True)
 
@@ -152,6 +163,9 @@ class Grievance(models.Model):
     longitude = models.FloatField('경도')
     point = gis_models.PointField('좌표', geography=True, srid=4326, null=True, blank=True)
 
+    # 인기 정렬 점수 (HotScoreService: 좋아요 / 상태 변경 시 갱신 + refresh_hot_scores 배치)
+    hot_score = models.FloatField('인기 점수', default=0, db_default=0.0)
+
     # 타임스탬프
     created_at = models.DateTimeField('생성일', auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField('수정일', auto_now=True)
@@ -173,15 +187,32 @@ class Grievance(models.Model):
             models.Index(fields=['user', '-created_at']),
             models.Index(fields=['visibility']),
             models.Index(fields=['area', '-created_at']),
+            # ordering=hot 키셋 페이지네이션 (전체 / 구역 필터)
+            models.Index(fields=['-hot_score', '-id'], name='grievances_hot_idx'),
+            models.Index(fields=['area', '-hot_score', '-id'], name='grievances_area_hot_idx'),
+            # 중복 민원 감지 (제목 trigram 유사도, DuplicateGrievanceService)
+            GinIndex(fields=['title'], name='grievances_title_trgm', opclasses=['gin_trgm_ops']),
         ]
 
     def __str__(self):
         return f"[{self.get_category_display()}] {self.title} ({self.location})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """DB에서 읽은 시점의 area_id / category / visibility 기록 (구역 변경 시 이전 구역 캐시 무효화, 순위 / 피드 키 정리용)"""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_area_id = instance.__dict__.get('area_id')
+        instance._loaded_category = instance.__dict__.get('category')
+        instance._loaded_visibility = instance.__dict__.get('visibility')
+        return instance
+
     def save(self, *args, **kwargs):
-        """저장 시 Point 객체 자동 생성"""
+        """저장 시 Point 객체 자동 생성, 새 민원은 인기 점수 초기값 설정"""
         if self.latitude and self.longitude and not self.point:
             self.point = Point(self.longitude, self.latitude, srid=4326)
+        if self._state.adding and not self.hot_score:
+            from apps.grievances.services import HotScoreService
+            self.hot_score = HotScoreService.score(0, self.created_at or timezone.now(), self.status)
         super().save(*args, **kwargs)
 
     def get_like_count(self):
@@ -206,7 +237,8 @@ class GrievanceImage(models.Model):
         Grievance,
         on_delete=models.CASCADE,
         related_name='images',
-        verbose_name='민원'
+        verbose_name='민원',
+        db_constraint=False  # grievances가 파티션 테이블이라 (id) 단독 FK 불가 (0008 참고)
     )
     image = models.ImageField(
         '이미지',
@@ -247,7 +279,8 @@ class Like(models.Model):
         Grievance,
         on_delete=models.CASCADE,
         related_name='likes',
-        verbose_name='민원'
+        verbose_name='민원',
+        db_constraint=False  # grievances가 파티션 테이블이라 (id) 단독 FK 불가 (0008 참고)
     )
     created_at = models.DateTimeField('생성일', auto_now_add=True)
 
@@ -259,6 +292,8 @@ class Like(models.Model):
         indexes = [
             models.Index(fields=['user', 'grievance']),
             models.Index(fields=['grievance', '-created_at']),
+            # 인기 점수 배치: '최근 좋아요' 기간을 벗어난 좋아요가 있는 민원 찾기
+            models.Index(fields=['created_at'], name='likes_created_at_idx'),
         ]
 
     def __str__(self):
@@ -276,7 +311,8 @@ class GrievanceSecret(models.Model):
         on_delete=models.CASCADE,
         primary_key=True,
         related_name='secret',
-        verbose_name='민원'
+        verbose_name='민원',
+        db_constraint=False  # grievances가 파티션 테이블이라 (id) 단독 FK 불가 (0008 참고)
     )
 
     password_hash = models.CharField(
@@ -304,3 +340,193 @@ class GrievanceSecret(models.Model):
         """패스워드 검증"""
         from django.contrib.auth.hashers import check_password
         return check_password(raw_password, self.password_hash)
+
+
+class GrievanceEventQuerySet(models.QuerySet):
+
+    def timeline(self):
+        """
+        시간순 타임라인 (행위자 JOIN 포함)
+        Prefetch('events', queryset=GrievanceEvent.objects.timeline())로 여러 민원에 한 번에 사용 가능
+        """
+        return self.select_related('actor').order_by('created_at', 'id')
+
+    def recent(self):
+        """최신순 (상세 응답의 최근 N건 등)"""
+        return self.select_related('actor').order_by('-created_at', '-id')
+
+
+class GrievanceEvent(models.Model):
+    """
+    민원 타임라인 이벤트 (추가 전용 로그)
+    - 접수 / 상태 변경 / 수정을 행위자, 행위자 역할(작성자 / 구역 담당자 / 정치인·관리자)과 함께 기록
+    - 기록 후 수정하지 않음 (상태 변경 경로에서는 INSERT 1건)
+    - elapsed: 민원 접수 후 경과 시간 → 첫 응답 / 처리 소요 시간을 이벤트만으로 집계
+    - 민원이 보관(아카이브)돼도 grievance_id 기준으로 그대로 남음
+    """
+
+    EVENT_CHOICES = [
+        ('created', '접수'),
+        ('status_changed', '상태 변경'),
+        ('edited', '수정'),
+    ]
+
+    ACTOR_ROLE_CHOICES = [
+        ('author', '작성자'),
+        ('leader', '구역 담당자'),
+        ('official', '정치인/관리자'),
+        ('citizen', '시민'),
+        ('anonymous', '비로그인'),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    grievance = models.ForeignKey(
+        Grievance,
+        on_delete=models.CASCADE,
+        related_name='events',
+        verbose_name='민원',
+        db_constraint=False  # grievances가 파티션 테이블이라 (id) 단독 FK 불가 (0008 참고)
+    )
+    actor = models.ForeignKey(
+        CustomUser,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='grievance_events',
+        verbose_name='행위자'
+    )
+    actor_role = models.CharField('행위자 역할', max_length=20, choices=ACTOR_ROLE_CHOICES)
+    event_type = models.CharField('이벤트', max_length=20, choices=EVENT_CHOICES)
+    from_status = models.CharField('이전 상태', max_length=20, blank=True)
+    to_status = models.CharField('변경 상태', max_length=20, blank=True)
+    changes = models.JSONField('변경 필드', default=list, blank=True)
+    elapsed = models.DurationField('접수 후 경과')
+    created_at = models.DateTimeField('기록 시각', auto_now_add=True)
+
+    objects = GrievanceEventQuerySet.as_manager()
+
+    class Meta:
+        db_table = 'grievance_events'
+        verbose_name = '민원 이벤트'
+        verbose_name_plural = '민원 이벤트'
+        indexes = [
+            models.Index(fields=['grievance', 'created_at'], name='grievance_events_timeline'),
+        ]
+
+    def __str__(self):
+        return f'{self.grievance_id} {self.get_event_type_display()}'
+
+
+class ArchivedGrievance(models.Model):
+    """
+    보관(아카이브) 민원
+    완료 후 GRIEVANCE_ARCHIVE_AFTER_DAYS가 지난 민원을 grievances에서 옮겨 보관
+    - 컬럼은 Grievance와 동일 (archive.py가 컬럼 목록으로 행 단위 복사)
+    - 좋아요 수 / 비공개 패스워드 해시는 보관 시점 값으로 고정
+    - 상세 조회(GrievanceViewSet.retrieve)와 구역 민원 수에 그대로 반영
+    """
+
+    id = models.UUIDField(primary_key=True, editable=False)
+    user = models.ForeignKey(
+        CustomUser,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='archived_grievances',
+        verbose_name='작성자'
+    )
+
+    title = models.CharField('제목', max_length=200)
+    content = models.TextField('내용')
+    category = models.CharField('카테고리', max_length=20, choices=Grievance.CATEGORY_CHOICES, default='etc')
+    status = models.CharField('상태', max_length=20, choices=Grievance.STATUS_CHOICES, default='resolved')
+    visibility = models.CharField('공개 범위', max_length=20, choices=Grievance.VISIBILITY_CHOICES, default='public')
+
+    area = models.ForeignKey(
+        Area,
+        on_delete=models.PROTECT,
+        related_name='archived_grievances',
+        verbose_name='발생 지역',
+        null=True,
+        blank=True
+    )
+
+    location = models.CharField('지역', max_length=200, blank=True)
+    latitude = models.FloatField('위도')
+    longitude = models.FloatField('경도')
+    point = gis_models.PointField('좌표', geography=True, srid=4326, null=True, blank=True)
+    hot_score = models.FloatField('인기 점수', default=0, db_default=0.0)
+
+    created_at = models.DateTimeField('생성일')
+    updated_at = models.DateTimeField('수정일')
+    completed_at = models.DateTimeField('완료 시각', null=True, blank=True)
+
+    # 보관 시점 값
+    like_count = models.PositiveIntegerField('좋아요 수', default=0)
+    password_hash = models.CharField('패스워드 해시', max_length=255, blank=True)
+    archived_at = models.DateTimeField('보관일', auto_now_add=True, db_index=True)
+
+    class Meta:
+        db_table = 'grievances_archive'
+        verbose_name = '보관 민원'
+        verbose_name_plural = '보관 민원'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['area']),
+            models.Index(fields=['user', '-created_at']),
+        ]
+
+    def __str__(self):
+        return f"[보관] {self.title} ({self.location})"
+
+    def is_liked_by(self, user):
+        """특정 유저가 좋아요 했는지 확인 (보관 시점 기준)"""
+        if not user or not user.is_authenticated:
+            return False
+        return self.likes.filter(user=user).exists()
+
+
+class ArchivedGrievanceImage(models.Model):
+    """보관 민원 이미지 (파일은 그대로 두고 경로만 옮김)"""
+
+    id = models.UUIDField(primary_key=True, editable=False)
+    grievance = models.ForeignKey(
+        ArchivedGrievance,
+        on_delete=models.CASCADE,
+        related_name='images',
+        verbose_name='보관 민원'
+    )
+    image = models.ImageField('이미지', upload_to='grievances/images/%Y/%m/%d/')
+    order = models.PositiveSmallIntegerField('순서', default=0)
+    created_at = models.DateTimeField('생성일')
+
+    class Meta:
+        db_table = 'grievance_images_archive'
+        verbose_name = '보관 민원 이미지'
+        verbose_name_plural = '보관 민원 이미지'
+        ordering = ['order', 'created_at']
+
+
+class ArchivedLike(models.Model):
+    """보관 민원 좋아요"""
+
+    id = models.UUIDField(primary_key=True, editable=False)
+    user = models.ForeignKey(
+        CustomUser,
+        on_delete=models.CASCADE,
+        related_name='archived_likes',
+        verbose_name='사용자'
+    )
+    grievance = models.ForeignKey(
+        ArchivedGrievance,
+        on_delete=models.CASCADE,
+        related_name='likes',
+        verbose_name='보관 민원'
+    )
+    created_at = models.DateTimeField('생성일')
+
+    class Meta:
+        db_table = 'likes_archive'
+        verbose_name = '보관 민원 좋아요'
+        verbose_name_plural = '보관 민원 좋아요'
+        unique_together = [('user', 'grievance')]
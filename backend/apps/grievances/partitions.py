@@ -0,0 +1,156 @@
+"""
+민원 테이블 월 단위 범위 파티션 관리 (PostgreSQL)
+- grievances는 created_at 기준 RANGE 파티션 (migration 0008)
+- 파티션 이름: grievances_pYYYYMM, 범위는 UTC 월 경계
+- 범위 밖 행은 grievances_default로 들어가며, 해당 월 파티션 생성 시 자동으로 옮김
+- 미래 파티션을 미리 만들어 기본 파티션을 비워 두는 것이 전제
+  (기본 파티션에 행이 있으면 이동 중 grievances 전체 잠금, GrievancePartitionManager 참고)
+
+사용 예 (cron 등으로 매일 실행):
+    python manage.py ensure_grievance_partitions --months-ahead 3
+"""
+
+from datetime import datetime, timezone as dt_timezone
+
+from django.db import connections, transaction
+
+
+def month_start(value):
+    """해당 시각이 속한 월의 1일 00:00 (UTC)"""
+    value = value.astimezone(dt_timezone.utc)
+    return datetime(value.year, value.month, 1, tzinfo=dt_timezone.utc)
+
+
+def add_months(value, months):
+    index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=index // 12, month=index % 12 + 1)
+
+
+def month_range(start, end):
+    """start 월부터 end 월까지(포함) 각 월의 시작 시각"""
+    current, last = month_start(start), month_start(end)
+    while current <= last:
+        yield current
+        current = add_months(current, 1)
+
+
+class GrievancePartitionManager:
+    """
+    grievances 파티션 생성/조회
+
+    기본 파티션이 비어 있을 때 (평소, 미래 파티션 사전 생성):
+    - 빈 테이블을 만들어 범위 CHECK 제약을 건 뒤 ATTACH PARTITION
+    - 부모 grievances에는 SHARE UPDATE EXCLUSIVE만 (조회 / 쓰기 계속 가능)
+      새 테이블과 기본 파티션에는 ACCESS EXCLUSIVE지만 둘 다 비어 있어 검사가 즉시 끝남
+    - CREATE TABLE ... PARTITION OF는 부모에 ACCESS EXCLUSIVE를 잡으므로 사용하지 않음
+
+    기본 파티션에 해당 월 행이 있을 때 (사전 생성 누락):
+    - DETACH → 월 파티션 생성 → 행 이동 → ATTACH를 한 트랜잭션으로 실행
+    - DETACH PARTITION이 부모 grievances에 ACCESS EXCLUSIVE를 잡아 이동이 끝날 때까지
+      민원 조회 / 쓰기가 모두 대기 (DETACH ... CONCURRENTLY는 기본 파티션이 있는 테이블에 쓸 수 없음)
+    - 잠금 대기가 다른 요청을 막지 않도록 lock_timeout을 넘기면 실패 (트래픽이 적을 때 재실행)
+    """
+
+    table = 'grievances'
+    default_partition = 'grievances_default'
+    lock_timeout = '5s'  # 기본 파티션 행 이동 시 부모 잠금 대기 한도
+
+    def __init__(self, using='default'):
+        self.using = using
+        self.connection = connections[using]
+
+    @classmethod
+    def partition_name(cls, start):
+        return f'{cls.table}_p{start:%Y%m}'
+
+    def is_partitioned(self):
+        if self.connection.vendor != 'postgresql':
+            return False
+        with self.connection.cursor() as cursor:
+            cursor.execute("""
+                SELECT EXISTS (
+                    SELECT 1 FROM pg_partitioned_table pt
+                    JOIN pg_class c ON c.oid = pt.partrelid
+                    WHERE c.relname = %s AND pg_table_is_visible(c.oid)
+                )
+            """, [self.table])
+            return cursor.fetchone()[0]
+
+    def partitions(self):
+        """[(파티션 이름, 범위 표현식, 예상 행 수)]"""
+        with self.connection.cursor() as cursor:
+            cursor.execute("""
+                SELECT child.relname, pg_get_expr(child.relpartbound, child.oid), child.reltuples::bigint
+                FROM pg_inherits i
+                JOIN pg_class parent ON parent.oid = i.inhparent
+                JOIN pg_class child ON child.oid = i.inhrelid
+                WHERE parent.relname = %s AND pg_table_is_visible(parent.oid)
+                ORDER BY child.relname
+            """, [self.table])
+            return cursor.fetchall()
+
+    def ensure(self, months_ahead=3, now=None):
+        """
+        현재 월 ~ months_ahead개월 뒤까지, 그리고 기본 파티션에 쌓인 행의 월 파티션 생성
+
+        Returns:
+            생성한 파티션 이름 목록
+        """
+        if not self.is_partitioned():
+            return []
+
+        now = now or datetime.now(dt_timezone.utc)
+        existing = {name for name, _, _ in self.partitions()}
+
+        with self.connection.cursor() as cursor:
+            cursor.execute(f'SELECT min(created_at), max(created_at) FROM {self.default_partition}')
+            oldest_default, newest_default = cursor.fetchone()
+
+        start, end = now, add_months(month_start(now), months_ahead)
+        if oldest_default:
+            start, end = min(oldest_default, start), max(newest_default, end)
+
+        created = []
+        for month in month_range(start, end):
+            name = self.partition_name(month)
+            if name not in existing:
+                self.create_partition(month)
+                created.append(name)
+        return created
+
+    def create_partition(self, start):
+        """월 파티션 1개 생성 (기본 파티션에 해당 범위 행이 있으면 이동)"""
+        end = add_months(start, 1)
+        name = self.partition_name(start)
+        bounds = [start, end]
+
+        with transaction.atomic(using=self.using), self.connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT EXISTS (SELECT 1 FROM {self.default_partition} WHERE created_at >= %s AND created_at < %s)',
+                bounds,
+            )
+            has_default_rows = cursor.fetchone()[0]
+
+            if not has_default_rows:
+                # CHECK 제약이 범위를 보장하므로 ATTACH 시 새 테이블 검사 생략, 인덱스 / PK는 ATTACH가 생성
+                cursor.execute(f'CREATE TABLE {name} (LIKE {self.table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+                cursor.execute(
+                    f'ALTER TABLE {name} ADD CONSTRAINT {name}_bounds CHECK (created_at >= %s AND created_at < %s)',
+                    bounds,
+                )
+                cursor.execute(f'ALTER TABLE {self.table} ATTACH PARTITION {name} FOR VALUES FROM (%s) TO (%s)', bounds)
+                cursor.execute(f'ALTER TABLE {name} DROP CONSTRAINT {name}_bounds')
+                return
+
+            cursor.execute(f"SET LOCAL lock_timeout = '{self.lock_timeout}'")
+            cursor.execute(f'ALTER TABLE {self.table} DETACH PARTITION {self.default_partition}')
+            cursor.execute(f'CREATE TABLE {name} PARTITION OF {self.table} FOR VALUES FROM (%s) TO (%s)', bounds)
+            cursor.execute(f"""
+                WITH moved AS (
+                    DELETE FROM {self.default_partition}
+                    WHERE created_at >= %s AND created_at < %s
+                    RETURNING *
+                )
+                INSERT INTO {name} SELECT * FROM moved
+            """, bounds)
+            cursor.execute(f'ALTER TABLE {self.table} ATTACH PARTITION {self.default_partition} DEFAULT')
@@ -17,3 +17,22 @@ class IsOwnerOrReadOnly(BasePermission):
 
         # 쓰기는 소유자만 (익명 민원의 경우 수정 불가)
         return obj.user and obj.user == request.user
+
+
+class IsAreaLeaderOrVerifiedOfficial(BasePermission):
+    """
+    구역 담당자 또는 인증된 정치인/관리자만 허용
+    (구역 담당자는 뷰에서 담당 구역으로 범위 제한)
+    """
+
+    message = '구역 담당자 또는 인증된 정치인/관리자만 접근할 수 있습니다'
+
+    def has_permission(self, request, view):
+        user = request.user
+        if not user or not user.is_authenticated:
+            return False
+
+        if user.role in ['admin', 'politician'] and user.is_verified:
+            return True
+
+        return user.led_areas.exists()
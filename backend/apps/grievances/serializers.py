@@ -3,11 +3,19 @@
 Flutter 앱의 GrievanceModel과 정확히 매칭되는 JSON 형식 제공
 """
 
-from rest_framework import serializers
-from apps.grievances.models import Grievance, GrievanceImage, Like, Area, GrievanceSecret
+from collections import defaultdict
 
+from django.core.files.storage import FileSystemStorage
+from django.db import transaction
+from django.db.models import Count
+from django.utils.encoding import filepath_to_uri
+from rest_framework import exceptions, serializers, status
+from apps.grievances.models import Grievance, GrievanceImage, Like, Area, GrievanceSecret, GrievanceEvent
+from core import metrics
+from core.timing import TimedListSerializer, TimedSerializerMixin, timed
 
-class AreaSerializer(serializers.ModelSerializer):
+
+class AreaSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """행정동 시리얼라이저"""
 
     leader_name = serializers.CharField(source='leader.nickname', read_only=True, allow_null=True)
@@ -15,6 +23,7 @@ class AreaSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Area
+        list_serializer_class = TimedListSerializer
         fields = [
             'id', 'name', 'center_point',
             'leader', 'leader_name',
@@ -33,7 +42,7 @@ class GrievanceImageSerializer(serializers.ModelSerializer):
         fields = ['id', 'image', 'order']
 
 
-class GrievanceListSerializer(serializers.ModelSerializer):
+class GrievanceListSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     민원 목록용 시리얼라이저
     - Flutter GrievanceModel과 정확히 매칭
@@ -52,6 +61,7 @@ class GrievanceListSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Grievance
+        list_serializer_class = TimedListSerializer
         fields = [
             'id', 'title', 'content', 'category', 'location',
             'latitude', 'longitude',
@@ -66,6 +76,9 @@ class GrievanceListSerializer(serializers.ModelSerializer):
         """현재 요청한 유저가 좋아요 했는지 확인"""
         request = self.context.get('request')
         if request and request.user.is_authenticated:
+            # ViewSet에서 annotate한 값 우선 사용 (없으면 개별 쿼리)
+            if hasattr(obj, '_is_liked'):
+                return obj._is_liked
             return obj.is_liked_by(request.user)
         return False
 
@@ -92,12 +105,12 @@ class GrievanceListSerializer(serializers.ModelSerializer):
 
         user = request.user
 
-        # 작성자 본인
-        if obj.user == user:
+        # 작성자 본인 (FK id 비교로 추가 쿼리 방지)
+        if obj.user_id == user.pk:
             return True
 
         # 지역 담당자
-        if hasattr(obj.area, 'leader') and obj.area.leader == user:
+        if obj.area is not None and obj.area.leader_id == user.pk:
             return True
 
         # 인증된 정치인/관리자
@@ -107,6 +120,177 @@ class GrievanceListSerializer(serializers.ModelSerializer):
         return False
 
 
+class GrievanceListRowSerializer:
+    """
+    민원 목록 고속 직렬화 (ModelSerializer 우회)
+    - .values() 행에서 GrievanceListSerializer와 동일한 JSON 생성
+    - 이미지/좋아요 여부는 페이지 단위 배치 쿼리 1회씩
+    - 미디어 URL은 요청당 한 번만 절대 경로로 계산
+
+    사용 예:
+        rows = queryset.prefetch_related(None).values(*GrievanceListRowSerializer.value_fields)
+        data = GrievanceListRowSerializer(page, context={'request': request}).data
+    """
+
+    value_fields = (
+        'id', 'title', 'content', 'category', 'location',
+        'latitude', 'longitude',
+        'area_id', 'area__name', 'area__leader_id',
+        'status', 'visibility', 'like_count',
+        'user_id', 'user__name', 'user__first_name', 'user__last_name', 'user__email',
+        'created_at', 'updated_at', 'completed_at',
+        'hot_score',  # 응답에는 없음 (ordering=hot 커서 위치 계산용)
+    )
+    max_images = 5  # 목록에서는 최대 5개 (GrievanceListSerializer.get_images와 동일)
+
+    # DRF 필드의 시간대 변환/ISO 포맷 규칙을 그대로 재사용
+    _datetime_field = serializers.DateTimeField()
+
+    def __init__(self, rows, context=None):
+        self.rows = list(rows)
+        self.context = context or {}
+
+    @property
+    def data(self):
+        with timed('serialize'):
+            return self._serialize()
+
+    def _serialize(self):
+        request = self.context.get('request')
+        user = request.user if request else None
+        is_authenticated = bool(user and user.is_authenticated)
+
+        ids = [row['id'] for row in self.rows]
+        images = self._get_image_urls(ids, request)
+        liked_ids = self._get_liked_ids(ids, user) if is_authenticated else set()
+        is_official = is_authenticated and user.role in ['admin', 'politician'] and user.is_verified
+
+        to_datetime = self._datetime_field.to_representation
+        results = []
+        for row in self.rows:
+            grievance_id = row['id']
+
+            # is_accessible: GrievanceListSerializer.get_is_accessible과 동일한 규칙
+            if row['visibility'] == 'public':
+                is_accessible = True
+            elif not is_authenticated:
+                is_accessible = False
+            else:
+                is_accessible = (
+                    row['user_id'] == user.pk
+                    or (row['area_id'] is not None and row['area__leader_id'] == user.pk)
+                    or is_official
+                )
+
+            item = {
+                'id': str(grievance_id),
+                'title': row['title'],
+                'content': row['content'],
+                'category': row['category'],
+                'location': row['location'],
+                'latitude': float(row['latitude']),
+                'longitude': float(row['longitude']),
+            }
+            # area가 없으면 기존 시리얼라이저처럼 area_id/area_name 키 생략
+            if row['area_id'] is not None:
+                item['area_id'] = row['area_id']
+                item['area_name'] = row['area__name']
+            item.update({
+                'status': row['status'],
+                'visibility': row['visibility'],
+                'is_accessible': is_accessible,
+                'like_count': row['like_count'],
+                'is_liked': grievance_id in liked_ids,
+                'images': images.get(grievance_id, []),
+                'user_id': str(row['user_id']) if row['user_id'] is not None else None,
+                'user_name': self._get_user_name(row),
+                'created_at': to_datetime(row['created_at']),
+                'updated_at': to_datetime(row['updated_at']),
+                'completed_at': to_datetime(row['completed_at']) if row['completed_at'] is not None else None,
+            })
+            results.append(item)
+        return results
+
+    @staticmethod
+    def _get_user_name(row):
+        """CustomUser.full_name과 동일한 규칙"""
+        if row['user_id'] is None:
+            return None
+        if row['user__name']:
+            return row['user__name']
+        if row['user__first_name'] and row['user__last_name']:
+            return f"{row['user__last_name']}{row['user__first_name']}"
+        return row['user__email']
+
+    def _get_liked_ids(self, ids, user):
+        """현재 유저가 좋아요한 민원 ID (배치 쿼리 1회)"""
+        if not ids:
+            return set()
+        return set(
+            Like.objects.filter(user=user, grievance_id__in=ids)
+            .values_list('grievance_id', flat=True)
+        )
+
+    def _get_image_urls(self, ids, request):
+        """민원별 이미지 URL 목록 (배치 쿼리 1회, 최대 max_images개)"""
+        if not ids:
+            return {}
+
+        storage = GrievanceImage._meta.get_field('image').storage
+        if isinstance(storage, FileSystemStorage):
+            # 로컬 스토리지: MEDIA_URL을 한 번만 절대 경로로 만들고 파일 경로만 이어붙임
+            base_url = storage.base_url
+            if request:
+                base_url = request.build_absolute_uri(base_url)
+
+            def build_url(name):
+                return base_url + filepath_to_uri(name).lstrip('/')
+        else:
+            def build_url(name):
+                url = storage.url(name)
+                return request.build_absolute_uri(url) if request else url
+
+        urls = defaultdict(list)
+        image_rows = GrievanceImage.objects.filter(grievance_id__in=ids).order_by(
+            'grievance_id', 'order', 'created_at'
+        ).values_list('grievance_id', 'image')
+        for grievance_id, name in image_rows:
+            grievance_urls = urls[grievance_id]
+            if len(grievance_urls) < self.max_images:
+                grievance_urls.append(build_url(name))
+        return urls
+
+
+def duplicate_candidates_data(candidates, context, limit):
+    """
+    중복 후보(DuplicateGrievanceService.candidates) → 목록 항목 형식 + similarity / distance_m
+    (중복 확인 API, 민원 생성 시 중복 확인 공용)
+    """
+    candidates = candidates.annotate(like_count=Count('likes'))[:limit]
+    rows = list(candidates.values(*GrievanceListRowSerializer.value_fields, 'similarity', 'distance'))
+    data = GrievanceListRowSerializer(rows, context=context).data
+    for item, row in zip(data, rows):
+        item['similarity'] = round(row['similarity'], 3)
+        item['distance_m'] = round(row['distance'].m, 1)
+    return data
+
+
+class DuplicateGrievanceError(exceptions.APIException):
+    """민원 생성 시 중복 후보가 있음 (409, details.duplicates에 후보 목록)"""
+
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = '같은 위치에 비슷한 민원이 이미 접수되어 있습니다'
+    default_code = 'duplicate'
+
+    def __init__(self, duplicates):
+        super().__init__()
+        # 숫자 필드(like_count, similarity 등)를 그대로 응답하도록 ErrorDetail 변환 없이 지정
+        self.detail = {'duplicates': duplicates}
+
+    def __str__(self):
+        return str(self.default_detail)
+
+
 class GrievanceDetailSerializer(GrievanceListSerializer):
     """
     민원 상세용 시리얼라이저
@@ -121,13 +305,45 @@ class GrievanceDetailSerializer(GrievanceListSerializer):
         return [img.image.url for img in images]
 
 
+class GrievanceEventSerializer(serializers.ModelSerializer):
+    """
+    민원 타임라인 이벤트
+    GrievanceEvent.objects.timeline() / recent() (actor JOIN) 기준 → 행마다 추가 쿼리 없음
+    """
+    actor_id = serializers.IntegerField(read_only=True, allow_null=True)
+    actor_name = serializers.CharField(source='actor.full_name', read_only=True, allow_null=True)
+    elapsed_seconds = serializers.SerializerMethodField()
+
+    class Meta:
+        model = GrievanceEvent
+        fields = [
+            'id', 'event_type', 'from_status', 'to_status', 'changes',
+            'actor_id', 'actor_name', 'actor_role',
+            'elapsed_seconds', 'created_at'
+        ]
+
+    def get_elapsed_seconds(self, obj):
+        return int(obj.elapsed.total_seconds())
+
+
+class GrievanceEventCompactSerializer(serializers.ModelSerializer):
+    """상세 응답에 포함하는 최근 이벤트 (?events=N)"""
+
+    class Meta:
+        model = GrievanceEvent
+        fields = ['event_type', 'from_status', 'to_status', 'actor_role', 'created_at']
+
+
 class GrievanceCreateSerializer(serializers.ModelSerializer):
     """
     민원 생성용 시리얼라이저
     - Multipart 이미지 업로드 처리
     - 역지오코딩으로 위도/경도 → 지역명 변환
     - AreaMatcher로 area 자동 매칭
+    - check_duplicates=true면 같은 위치의 비슷한 민원이 있을 때 생성하지 않고 409 (DuplicateGrievanceError)
     """
+    DUPLICATE_LIMIT = 3  # 409 응답에 포함할 중복 후보 수
+
     images = serializers.ListField(
         child=serializers.ImageField(max_length=1000000, allow_empty_file=False),
         write_only=True,
@@ -144,13 +360,16 @@ class GrievanceCreateSerializer(serializers.ModelSerializer):
         help_text='비공개 민원일 경우 필수'
     )
 
+    # 중복 확인 (선택, 후보가 있으면 409 → 클라이언트가 기존 민원 좋아요 제안 후 false로 재요청)
+    check_duplicates = serializers.BooleanField(write_only=True, required=False, default=False)
+
     class Meta:
         model = Grievance
         fields = [
             'id', 'title', 'content', 'category',
             'latitude', 'longitude',
             'visibility', 'password',
-            'images', 'status'
+            'images', 'status', 'check_duplicates'
         ]
         read_only_fields = ['id', 'status']
 
@@ -176,11 +395,19 @@ class GrievanceCreateSerializer(serializers.ModelSerializer):
         return value
 
     def validate(self, attrs):
-        """비공개 민원은 패스워드 필수"""
+        """비공개 민원은 패스워드 필수, check_duplicates면 중복 후보 확인"""
         if attrs.get('visibility') == 'private' and not attrs.get('password'):
             raise serializers.ValidationError({
                 'password': '비공개 민원은 패스워드가 필요합니다.'
             })
+
+        if attrs.pop('check_duplicates', False):
+            from apps.grievances.services import DuplicateGrievanceService
+
+            candidates = DuplicateGrievanceService.candidates(attrs['title'], attrs['latitude'], attrs['longitude'])
+            duplicates = duplicate_candidates_data(candidates, self.context, self.DUPLICATE_LIMIT)
+            if duplicates:
+                raise DuplicateGrievanceError(duplicates)
         return attrs
 
     def create(self, validated_data):
@@ -191,10 +418,11 @@ class GrievanceCreateSerializer(serializers.ModelSerializer):
         3. 역지오코딩으로 좌표 → 지역명 변환
         4. AreaMatcher로 area 매칭
         5. 민원 생성
-        6. 이미지들 생성
+        6. 이미지들 생성 (bulk_create 1회, 이미지 수와 무관한 쿼리 수)
         7. 비공개 민원이면 패스워드 생성
+        5~7은 한 트랜잭션 → 버전 증가(on_commit)가 이미지까지 저장된 뒤 실행
         """
-        from apps.grievances.services import ReverseGeocoder, AreaMatcher
+        from apps.grievances.services import ReverseGeocoder, AreaMatcher, GrievanceEventService
 
         images_data = validated_data.pop('images', [])
         password = validated_data.pop('password', None)
@@ -216,21 +444,24 @@ class GrievanceCreateSerializer(serializers.ModelSerializer):
         area = area_matcher.match_area(location_name, lat, lng)
         validated_data['area'] = area
 
-        # 민원 생성
-        grievance = Grievance.objects.create(**validated_data)
-
-        # 이미지들 생성
-        for idx, image_data in enumerate(images_data):
-            GrievanceImage.objects.create(
-                grievance=grievance,
-                image=image_data,
-                order=idx
-            )
-
-        # 비공개 민원 패스워드 생성 (NEW)
-        if grievance.visibility == 'private' and password:
-            secret = GrievanceSecret(grievance=grievance)
-            secret.set_password(password)
-            secret.save()
+        with transaction.atomic():
+            # 민원 생성 + 타임라인 접수 이벤트
+            grievance = Grievance.objects.create(**validated_data)
+            GrievanceEventService.record_created(grievance, actor=validated_data.get('user'))
+
+            # 이미지들 생성 (파일 저장은 bulk_create 중 ImageField.pre_save에서, 버전 증가는 민원 시그널이 담당)
+            if images_data:
+                with timed('storage'), metrics.IMAGE_PROCESSING_DURATION.labels('store').time():
+                    GrievanceImage.objects.bulk_create([
+                        GrievanceImage(grievance=grievance, image=image_data, order=idx)
+                        for idx, image_data in enumerate(images_data)
+                    ])
+
+            # 비공개 민원 패스워드 생성 (NEW)
+            if grievance.visibility == 'private' and password:
+                secret = GrievanceSecret(grievance=grievance)
+                with timed('hash'):
+                    secret.set_password(password)
+                secret.save()
 
         return grievance
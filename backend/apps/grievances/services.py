@@ -2,15 +2,34 @@
 민원 관련 서비스 레이어
 - 역지오코딩 (Naver Map API)
 - 주변 민원 검색 (PostGIS)
+- 변경 버전 카운터 (조건부 GET)
+- 타임라인 이벤트 기록 (접수 / 상태 변경 / 수정)
+- 인기(hot) 정렬 점수 계산 / 갱신
+- 인접 구역 계산 (우리 동네 피드)
+- 중복 민원 감지 (반경 + 기간 + 제목 유사도)
+- 대용량 내보내기 (CSV / NDJSON 스트리밍)
 """
 
+import csv
+import io
+import math
+import time
+import zlib
+import orjson
 import requests
 import logging
+from datetime import timedelta
 from django.conf import settings
 from django.core.cache import cache
+from django.db import connection, transaction
 from django.contrib.gis.geos import Point
 from django.contrib.gis.db.models.functions import Distance
-from apps.grievances.models import Grievance, Area
+from django.contrib.gis.measure import D
+from django.contrib.postgres.search import TrigramSimilarity
+from django.utils import timezone
+from apps.grievances.models import Grievance, Area, GrievanceEvent, Like
+from core import metrics
+from core.timing import timed
 
 logger = logging.getLogger(__name__)
 
@@ -24,8 +43,8 @@ class ReverseGeocoder:
     def __init__(self):
         self.client_id = settings.NAVER_MAP_CLIENT_ID
         self.client_secret = settings.NAVER_MAP_CLIENT_SECRET
-        # 최신 API 엔드포인트 (2025)
-        self.api_url = "https://maps.apigw.ntruss.com/map-reversegeocode/v2/gc"
+        # 최신 API 엔드포인트 (2025) - settings.NAVER_GEOCODE_API_URL
+        self.api_url = settings.NAVER_GEOCODE_API_URL
 
     def get_location_name(self, latitude, longitude):
         """
@@ -45,7 +64,9 @@ class ReverseGeocoder:
         # 캐시 확인 (7일간 유지)
         cached_location = cache.get(cache_key)
         if cached_location:
+            metrics.GEOCODE_CACHE.labels('hit').inc()
             return cached_location
+        metrics.GEOCODE_CACHE.labels('miss').inc()
 
         try:
             # Naver Map API 요청
@@ -59,12 +80,19 @@ class ReverseGeocoder:
                 'orders': 'addr'  # 지번 주소 우선
             }
 
-            response = requests.get(
-                self.api_url,
-                headers=headers,
-                params=params,
-                timeout=5
-            )
+            started = time.perf_counter()
+            try:
+                with timed('geocode', external=True):
+                    response = requests.get(
+                        self.api_url,
+                        headers=headers,
+                        params=params,
+                        timeout=5
+                    )
+            except requests.exceptions.RequestException:
+                metrics.record_external_call('naver_geocode', time.perf_counter() - started)
+                raise
+            metrics.record_external_call('naver_geocode', time.perf_counter() - started, response.status_code)
             response.raise_for_status()
 
             data = response.json()
@@ -133,6 +161,7 @@ class AreaMatcher:
     """
 
     @staticmethod
+    @timed('area_match')
     def match_area(location_name, latitude, longitude):
         """
         location_name (Naver 역지오코딩 결과)와 좌표를 기반으로 Area 찾기
@@ -172,3 +201,405 @@ class AreaMatcher:
         # Strategy 3: Fallback to default
         logger.warning(f"No area match found for {location_name} ({latitude}, {longitude}), using default")
         return Area.objects.get(name='미지정')
+
+
+class GrievanceVersionService:
+    """
+    민원 변경 버전 카운터 (Redis)
+    - 전체 / 구역별 / 민원별 / 구역 메타(담당자 등) 키를 INCR로 관리
+    - 조건부 GET(ETag, Last-Modified) 계산에 사용 → DB 조회 없이 304 판단
+    - 키가 없으면(유실/만료) 현재 시각(ms)으로 초기화해 과거 버전과 겹치지 않게 함
+    """
+
+    GLOBAL_KEY = 'grievance_version:all'
+    AREAS_KEY = 'grievance_version:areas'
+
+    @staticmethod
+    def area_key(area_id):
+        return f'grievance_version:area:{area_id}'
+
+    @staticmethod
+    def item_key(grievance_id):
+        return f'grievance_version:item:{grievance_id}'
+
+    @staticmethod
+    def _modified_key(key):
+        return f'{key}:modified'
+
+    @classmethod
+    def get_state(cls, keys):
+        """
+        버전 목록과 마지막 변경 시각 조회 (Redis 왕복 1~2회)
+
+        Returns:
+            (versions 튜플, last_modified epoch 초 또는 None)
+            Redis 장애 시 None
+        """
+        keys = list(keys)
+        modified_keys = [cls._modified_key(key) for key in keys]
+        values = cache.get_many(keys + modified_keys) or {}
+
+        missing = [key for key in keys if key not in values]
+        if missing:
+            initial = int(time.time() * 1000)
+            for key in missing:
+                cache.add(key, initial, timeout=None)
+            values.update(cache.get_many(missing) or {})
+            if any(key not in values for key in missing):
+                return None
+
+        modified = [values[key] for key in modified_keys if key in values]
+        last_modified = max(modified) if len(modified) == len(keys) else None
+        return tuple(values[key] for key in keys), last_modified
+
+    @classmethod
+    def bump(cls, keys):
+        """버전 증가 + 변경 시각 기록 (쓰기 경로에서 호출)"""
+        now = int(time.time())
+        for key in keys:
+            try:
+                cache.incr(key)
+            except ValueError:
+                # 키 없음 → 현재 시각 기반으로 초기화 후 증가
+                cache.add(key, int(time.time() * 1000), timeout=None)
+                try:
+                    cache.incr(key)
+                except ValueError:
+                    pass
+        cache.set_many({cls._modified_key(key): now for key in keys}, timeout=None)
+
+    @classmethod
+    def bump_grievance(cls, grievance_id, area_ids=()):
+        """민원 1건 변경: 해당 민원 + 소속 구역 + 전체 버전 증가"""
+        keys = [cls.item_key(grievance_id), cls.GLOBAL_KEY]
+        keys += [cls.area_key(area_id) for area_id in set(area_ids) if area_id is not None]
+        cls.bump(keys)
+
+    @classmethod
+    def bump_areas(cls, area_ids=()):
+        """구역 정보(이름, 담당자) 변경: 구역 메타 + 해당 구역 + 전체 버전 증가"""
+        keys = [cls.AREAS_KEY, cls.GLOBAL_KEY]
+        keys += [cls.area_key(area_id) for area_id in set(area_ids) if area_id is not None]
+        cls.bump(keys)
+
+
+class GrievanceEventService:
+    """
+    타임라인 이벤트 기록 (추가 전용, 호출마다 INSERT 1건)
+    - 호출하는 쪽의 트랜잭션 안에서 실행 (변경과 함께 커밋 / 롤백)
+    - grievance.area는 호출하는 쪽에서 이미 로드된 상태 (담당자 판별에 추가 쿼리 없음)
+    """
+
+    # 수정 이벤트로 기록할 필드
+    EDIT_FIELDS = ('title', 'content', 'category', 'visibility', 'status', 'latitude', 'longitude', 'completed_at')
+
+    @staticmethod
+    def actor_role(grievance, user):
+        if user is None or not user.is_authenticated:
+            return 'anonymous'
+        if grievance.area_id is not None and grievance.area.leader_id == user.pk:
+            return 'leader'
+        if user.role in ['admin', 'politician'] and user.is_verified:
+            return 'official'
+        if grievance.user_id == user.pk:
+            return 'author'
+        return 'citizen'
+
+    @classmethod
+    def _record(cls, grievance, actor, event_type, elapsed=None, **fields):
+        if actor is not None and not actor.is_authenticated:
+            actor = None
+        if elapsed is None:
+            elapsed = timezone.now() - grievance.created_at
+        return GrievanceEvent.objects.create(
+            grievance=grievance,
+            actor=actor,
+            actor_role=cls.actor_role(grievance, actor),
+            event_type=event_type,
+            elapsed=elapsed,
+            **fields,
+        )
+
+    @classmethod
+    def record_created(cls, grievance, actor=None):
+        return cls._record(grievance, actor, 'created', elapsed=timedelta(0), to_status=grievance.status)
+
+    @classmethod
+    def record_status_change(cls, grievance, old_status, actor=None):
+        event = cls._record(
+            grievance, actor, 'status_changed', from_status=old_status, to_status=grievance.status
+        )
+        metrics.GRIEVANCE_STATUS_ELAPSED.labels(grievance.status).observe(event.elapsed.total_seconds())
+        return event
+
+    @classmethod
+    def record_edit(cls, grievance, before, actor=None):
+        """
+        before: 수정 전 EDIT_FIELDS 값 (snapshot()) → 바뀐 필드가 없으면 기록하지 않음
+        """
+        changes = [field for field in cls.EDIT_FIELDS if getattr(grievance, field) != before[field]]
+        if not changes:
+            return None
+        status_fields = {}
+        if 'status' in changes:
+            status_fields = {'from_status': before['status'], 'to_status': grievance.status}
+        return cls._record(grievance, actor, 'edited', changes=changes, **status_fields)
+
+    @classmethod
+    def snapshot(cls, grievance):
+        return {field: getattr(grievance, field) for field in cls.EDIT_FIELDS}
+
+
+class HotScoreService:
+    """
+    인기(hot) 정렬 점수 (grievances.hot_score, 인덱스 grievances_hot_idx / grievances_area_hot_idx)
+    점수 = log10(1 + 최근 HOT_SCORE_WINDOW_DAYS일 좋아요) + 접수 epoch / HOT_SCORE_GRAVITY_SECONDS
+           - (완료 민원이면 HOT_SCORE_RESOLVED_PENALTY)
+    - 접수 시각 항은 시간이 지나도 변하지 않으므로 점수는 좋아요 / 상태 변경 때만 바뀜 (요청 시 계산 없음)
+    - 예외: 좋아요가 '최근' 기간을 벗어날 때 → refresh_hot_scores 배치가 해당 민원만 재계산
+    """
+
+    @staticmethod
+    def score(recent_likes, created_at, status):
+        """Python 계산 (새 민원 초기값, SCORE_SQL과 같은 식)"""
+        penalty = settings.HOT_SCORE_RESOLVED_PENALTY if status == 'resolved' else 0
+        return math.log10(1 + recent_likes) + created_at.timestamp() / settings.HOT_SCORE_GRAVITY_SECONDS - penalty
+
+    @classmethod
+    def _refresh_sql(cls):
+        grievances, likes = Grievance._meta.db_table, Like._meta.db_table
+        return f"""
+            WITH scores AS (
+                SELECT g.id, g.created_at, (
+                    log(1 + (SELECT count(*) FROM {likes} l WHERE l.grievance_id = g.id AND l.created_at >= %(since)s))
+                    + extract(epoch FROM g.created_at) / %(gravity)s
+                    - CASE WHEN g.status = 'resolved' THEN %(penalty)s ELSE 0 END
+                )::double precision AS score
+                FROM {grievances} g
+                WHERE g.id = ANY(%(ids)s)
+            )
+            UPDATE {grievances} g SET hot_score = s.score
+            FROM scores s
+            WHERE g.id = s.id AND g.created_at = s.created_at AND g.hot_score IS DISTINCT FROM s.score
+        """
+
+    @classmethod
+    def refresh(cls, grievance_ids):
+        """지정 민원 점수 재계산 (UPDATE 1회, 점수가 바뀐 행만 기록) → 갱신 행 수"""
+        grievance_ids = list(grievance_ids)
+        if not grievance_ids:
+            return 0
+        with connection.cursor() as cursor:
+            cursor.execute(cls._refresh_sql(), {
+                'ids': grievance_ids,
+                'since': timezone.now() - timedelta(days=settings.HOT_SCORE_WINDOW_DAYS),
+                'gravity': float(settings.HOT_SCORE_GRAVITY_SECONDS),
+                'penalty': settings.HOT_SCORE_RESOLVED_PENALTY,
+            })
+            return cursor.rowcount
+
+    @classmethod
+    def refresh_expired(cls, lookback, batch_size=1000):
+        """
+        마지막 실행 이후 '최근' 기간을 벗어난 좋아요가 있는 민원만 재계산 (주기 배치)
+        lookback: 실행 간격보다 약간 길게 (누락 방지, 중복 재계산은 변경 없음으로 끝남)
+        """
+        boundary = timezone.now() - timedelta(days=settings.HOT_SCORE_WINDOW_DAYS)
+        ids = Like.objects.filter(
+            created_at__gte=boundary - lookback, created_at__lt=boundary
+        ).order_by().values_list('grievance_id', flat=True).distinct()
+        return cls._refresh_batches(ids.iterator(chunk_size=batch_size), batch_size)
+
+    @classmethod
+    def refresh_all(cls, batch_size=1000):
+        """전체 재계산 (설정 변경 / 대량 적재 후)"""
+        ids = Grievance.objects.order_by().values_list('pk', flat=True)
+        return cls._refresh_batches(ids.iterator(chunk_size=batch_size), batch_size)
+
+    @classmethod
+    def _refresh_batches(cls, ids, batch_size):
+        updated, batch = 0, []
+        for grievance_id in ids:
+            batch.append(grievance_id)
+            if len(batch) >= batch_size:
+                updated += cls.refresh(batch)
+                batch = []
+        return updated + cls.refresh(batch)
+
+
+class AreaAdjacencyService:
+    """
+    인접 구역 계산 (Area.neighbours → 우리 동네 피드 범위)
+    - 경계(boundary)가 둘 다 있으면 경계 간 거리 NEIGHBOURHOOD_BOUNDARY_TOLERANCE_M 이내 (맞닿은 구역, 경계 데이터 오차 허용)
+    - 하나라도 없으면 중심 좌표 간 거리 NEIGHBOURHOOD_RADIUS_KM 이내
+    - 구역 수가 적어(수백 개) 전체를 한 번에 다시 계산
+    """
+
+    @classmethod
+    def rebuild(cls, tolerance_m=None, radius_km=None):
+        """인접 관계 전체 재계산 (DELETE + INSERT ... SELECT 1회) → 인접 구역 쌍 수"""
+        if tolerance_m is None:
+            tolerance_m = settings.NEIGHBOURHOOD_BOUNDARY_TOLERANCE_M
+        if radius_km is None:
+            radius_km = settings.NEIGHBOURHOOD_RADIUS_KM
+
+        through = Area.neighbours.through._meta.db_table
+        areas = Area._meta.db_table
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {through}')
+            cursor.execute(f"""
+                INSERT INTO {through} (from_area_id, to_area_id)
+                SELECT a.id, b.id
+                FROM {areas} a JOIN {areas} b ON a.id <> b.id
+                WHERE CASE
+                    WHEN a.boundary IS NOT NULL AND b.boundary IS NOT NULL
+                        THEN ST_DWithin(a.boundary, b.boundary, %(tolerance)s)
+                    ELSE ST_DWithin(a.center_point, b.center_point, %(radius)s)
+                END
+            """, {'tolerance': float(tolerance_m), 'radius': radius_km * 1000})
+            # 대칭 관계라 양방향 행이 함께 들어감
+            return cursor.rowcount // 2
+
+    @staticmethod
+    def neighbourhood(area_id):
+        """구역 + 인접 구역 ID 목록"""
+        through = Area.neighbours.through
+        return [area_id, *through.objects.filter(from_area_id=area_id).values_list('to_area_id', flat=True)]
+
+
+class DuplicateGrievanceService:
+    """
+    중복 민원 감지 (같은 위치에 이미 접수된 비슷한 민원)
+    - 후보: 반경 DUPLICATE_RADIUS_M 이내 + 최근 DUPLICATE_WINDOW_DAYS일 + 제목 trigram 유사 (% 연산자)
+      좌표 공간 인덱스 / 접수 시각(파티션 프루닝) / 제목 trigram 인덱스(grievances_title_trgm)를 함께 사용
+    - 공개 + 미완료 민원만 (비공개 민원은 노출 불가, 완료 민원은 재발 신고일 수 있음)
+    - 제목 유사도 높은 순, 같으면 가까운 순
+    """
+
+    @staticmethod
+    def candidates(title, latitude, longitude, radius_m=None, exclude_id=None):
+        """
+        중복 후보 QuerySet (similarity: 제목 유사도 0~1, distance: 거리)
+        슬라이스 전 QuerySet을 반환하므로 호출 측에서 annotate / 개수 제한
+        """
+        if radius_m is None:
+            radius_m = settings.DUPLICATE_RADIUS_M
+        point = Point(longitude, latitude, srid=4326)
+
+        queryset = Grievance.objects.filter(
+            created_at__gte=timezone.now() - timedelta(days=settings.DUPLICATE_WINDOW_DAYS),
+            point__dwithin=(point, D(m=radius_m)),
+            title__trigram_similar=title,
+            visibility='public',
+        ).exclude(status='resolved')
+        if exclude_id is not None:
+            queryset = queryset.exclude(pk=exclude_id)
+
+        return queryset.annotate(
+            similarity=TrigramSimilarity('title', title),
+            distance=Distance('point', point),
+        ).filter(similarity__gte=settings.DUPLICATE_SIMILARITY).order_by('-similarity', 'distance')
+
+
+class GrievanceExportService:
+    """
+    민원 대용량 내보내기 (CSV / NDJSON 스트리밍)
+    - QuerySet.iterator() → PostgreSQL 서버 사이드 커서로 일정 메모리 유지 (OFFSET 없음)
+    - 행을 chunk_bytes 단위로 모아서 전송 (작은 write 다수 방지)
+    - gzip 선택 시 스트리밍 압축
+    - CSV는 수식으로 시작하는 문자열 셀(= + - @, 탭 / CR) 앞에 ' 추가 (스프레드시트 수식 실행 방지)
+      NDJSON은 그대로 (스프레드시트가 해석하지 않음)
+    """
+
+    # 스프레드시트가 수식으로 해석하는 셀 시작 문자 (OWASP CSV Injection)
+    FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+    columns = (
+        'id', 'title', 'content', 'category', 'status', 'visibility',
+        'location', 'latitude', 'longitude', 'area_id', 'area__name',
+        'like_count', 'user_id', 'created_at', 'updated_at', 'completed_at',
+    )
+    # 출력 헤더 (area__name → area_name)
+    headers = tuple(column.replace('__', '_') for column in columns)
+
+    FORMATS = {
+        'csv': ('text/csv; charset=utf-8', 'csv'),
+        'ndjson': ('application/x-ndjson', 'ndjson'),
+    }
+
+    def __init__(self, queryset, export_format='csv', use_gzip=False,
+                 cursor_chunk_size=2000, chunk_bytes=64 * 1024):
+        if export_format not in self.FORMATS:
+            raise ValueError(f'지원하지 않는 형식입니다: {export_format}')
+        self.queryset = queryset.prefetch_related(None).values_list(*self.columns)
+        self.export_format = export_format
+        self.use_gzip = use_gzip
+        self.cursor_chunk_size = cursor_chunk_size
+        self.chunk_bytes = chunk_bytes
+
+    @property
+    def content_type(self):
+        if self.use_gzip:
+            return 'application/gzip'
+        return self.FORMATS[self.export_format][0]
+
+    @property
+    def filename(self):
+        extension = self.FORMATS[self.export_format][1]
+        return f'grievances.{extension}.gz' if self.use_gzip else f'grievances.{extension}'
+
+    def _rows(self):
+        return self.queryset.iterator(chunk_size=self.cursor_chunk_size)
+
+    @classmethod
+    def csv_safe(cls, value):
+        """사용자 입력 문자열 셀만 이스케이프 (숫자 / 날짜 셀은 그대로, 음수 좌표 등)"""
+        if isinstance(value, str) and value.startswith(cls.FORMULA_PREFIXES):
+            return f"'{value}"
+        return value
+
+    def _iter_csv(self):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        buffer.write('\ufeff')  # Excel 한글 인코딩 인식용 BOM
+        writer.writerow(self.headers)
+
+        csv_safe = self.csv_safe
+        for row in self._rows():
+            writer.writerow([csv_safe(value) for value in row])
+            if buffer.tell() >= self.chunk_bytes:
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+
+    def _iter_ndjson(self):
+        chunk = bytearray()
+        headers = self.headers
+
+        for row in self._rows():
+            chunk += orjson.dumps(dict(zip(headers, row)))
+            chunk += b'\n'
+            if len(chunk) >= self.chunk_bytes:
+                yield bytes(chunk)
+                chunk.clear()
+
+        if chunk:
+            yield bytes(chunk)
+
+    def _gzip(self, chunks):
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+    def stream(self):
+        """응답 본문 제너레이터 (bytes)"""
+        chunks = self._iter_csv() if self.export_format == 'csv' else self._iter_ndjson()
+        if self.use_gzip:
+            chunks = self._gzip(chunks)
+        return chunks
@@ -0,0 +1,127 @@
+"""
+민원 시그널
+변경 시 버전 카운터 증가 (조건부 GET / 응답 캐시 무효화), 좋아요 순위(leaderboards) / 우리 동네 피드(feeds) 반영
+
+Redis 반영(버전 / 순위 / 피드)은 transaction.on_commit으로 커밋 후 실행
+- 트랜잭션(update_status, perform_update 등) 안에서 먼저 버전을 올리면, 커밋 전 동시 요청이 변경 전 행을
+  새 버전으로 캐시 / ETag 응답해 다음 쓰기까지 남음
+- 트랜잭션 밖(autocommit)이면 즉시 실행, 롤백되면 실행 안 됨
+- 콜백 실행 시점에는 인스턴스가 바뀌었을 수 있어(삭제 후 pk=None 등) 신호 시점 복사본 / 값 사용
+  (_loaded_* 갱신은 다음 저장 비교용이라 신호 시점에 바로)
+
+Note: Like는 시그널을 연결하지 않음
+      (민원 삭제 시 CASCADE fast-delete 유지, 좋아요 토글은 뷰에서 직접 증가)
+"""
+
+import copy
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.grievances.feeds import NeighbourhoodFeed
+from apps.grievances.leaderboards import GrievanceLeaderboard
+from apps.grievances.models import Grievance, GrievanceImage, Area
+from apps.grievances.services import GrievanceVersionService
+from apps.users.models import CustomUser
+
+
+# 순위 반영은 _loaded_area_id를 갱신하는 bump_grievance_version보다 먼저 연결 (이전 구역 키 제거에 사용)
+@receiver(post_save, sender=Grievance)
+def sync_grievance_leaderboard(sender, instance, created, **kwargs):
+    """상태 / 공개 범위 / 구역 / 카테고리 변경 (새 민원은 좋아요가 없어 대상 아님)"""
+    if created:
+        return
+    previous = [(getattr(instance, '_loaded_area_id', None), getattr(instance, '_loaded_category', None))]
+    previous = [item for item in previous if item[1] is not None]
+    snapshot = copy.copy(instance)
+    transaction.on_commit(lambda: GrievanceLeaderboard.sync(snapshot, previous))
+    instance._loaded_category = instance.category
+
+
+@receiver(post_delete, sender=Grievance)
+def discard_grievance_leaderboard(sender, instance, **kwargs):
+    snapshot = copy.copy(instance)
+    transaction.on_commit(lambda: GrievanceLeaderboard.discard(snapshot))
+
+
+# 피드 반영도 _loaded_area_id를 쓰므로 bump_grievance_version보다 먼저 연결
+@receiver(post_save, sender=Grievance)
+def sync_neighbourhood_feed(sender, instance, created, **kwargs):
+    """새 공개 민원 추가, 공개 범위 / 구역 변경 반영"""
+    snapshot = copy.copy(instance)
+    if created:
+        transaction.on_commit(lambda: NeighbourhoodFeed.add(snapshot))
+    elif hasattr(instance, '_loaded_visibility'):
+        previous_area_id, previous_visibility = getattr(instance, '_loaded_area_id', None), instance._loaded_visibility
+        transaction.on_commit(lambda: NeighbourhoodFeed.sync(snapshot, previous_area_id, previous_visibility))
+    instance._loaded_visibility = instance.visibility
+
+
+@receiver(post_delete, sender=Grievance)
+def discard_neighbourhood_feed(sender, instance, **kwargs):
+    snapshot = copy.copy(instance)
+    area_ids = [instance.area_id, getattr(instance, '_loaded_area_id', None)]
+    transaction.on_commit(lambda: NeighbourhoodFeed.discard(snapshot, area_ids))
+
+
+@receiver(post_save, sender=Grievance)
+@receiver(post_delete, sender=Grievance)
+def bump_grievance_version(sender, instance, **kwargs):
+    """민원 생성/수정/삭제 (이전 구역 포함)"""
+    grievance_id, area_ids = instance.pk, [instance.area_id, getattr(instance, '_loaded_area_id', None)]
+    transaction.on_commit(lambda: GrievanceVersionService.bump_grievance(grievance_id, area_ids))
+    instance._loaded_area_id = instance.area_id
+
+
+@receiver(post_save, sender=GrievanceImage)
+@receiver(post_delete, sender=GrievanceImage)
+def bump_grievance_image_version(sender, instance, origin=None, **kwargs):
+    """민원 이미지 추가/삭제"""
+    if isinstance(origin, Grievance):
+        # 민원 삭제에 따른 CASCADE → 민원 시그널에서 처리
+        return
+
+    area_ids = []
+    if GrievanceImage.grievance.is_cached(instance):
+        area_ids.append(instance.grievance.area_id)
+    else:
+        area_ids += Grievance.objects.filter(pk=instance.grievance_id).values_list('area_id', flat=True)
+    grievance_id = instance.grievance_id
+    transaction.on_commit(lambda: GrievanceVersionService.bump_grievance(grievance_id, area_ids))
+
+
+@receiver(post_save, sender=Area)
+def bump_area_version(sender, instance, **kwargs):
+    """구역 이름/담당자 변경 (is_accessible, area_name에 영향)"""
+    area_id = instance.pk
+    transaction.on_commit(lambda: GrievanceVersionService.bump_areas([area_id]))
+
+
+@receiver(post_save, sender=CustomUser)
+def bump_user_display_name_version(sender, instance, created, update_fields=None, **kwargs):
+    """
+    작성자 / 구역 담당자 이름 변경 (민원 user_name, 구역 leader_name에 영향)
+    - 새 유저는 작성한 민원 / 담당 구역이 없어 대상 아님
+    - 읽은 시점 값을 모르는 필드(지연 로딩 후 접근, DB에서 읽지 않은 인스턴스)는 변경으로 간주
+    """
+    fields = CustomUser.DISPLAY_NAME_FIELDS
+    if created or (update_fields is not None and not set(update_fields) & set(fields)):
+        return
+    loaded = getattr(instance, '_loaded_display_name', (None,) * len(fields))
+    current = tuple(instance.__dict__.get(name) for name in fields)
+    instance._loaded_display_name = current
+    if all(after is None or before == after for before, after in zip(loaded, current)):
+        return
+
+    rows = list(Grievance.objects.filter(user_id=instance.pk).values_list('id', 'area_id'))
+    grievance_ids = [grievance_id for grievance_id, _ in rows]
+    area_ids = [area_id for _, area_id in rows]
+    area_ids += Area.objects.filter(leader_id=instance.pk).values_list('id', flat=True)
+
+    def bump():
+        keys = [GrievanceVersionService.item_key(grievance_id) for grievance_id in grievance_ids]
+        keys += [GrievanceVersionService.area_key(area_id) for area_id in set(area_ids) if area_id is not None]
+        GrievanceVersionService.bump([GrievanceVersionService.GLOBAL_KEY, GrievanceVersionService.AREAS_KEY, *keys])
+
+    transaction.on_commit(bump)
@@ -1,3 +1,1313 @@
-from django.test import TestCase
+import csv
+import io
+import json
+import shutil
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.http import JsonResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from apps.grievances.models import (
+    Area, ArchivedGrievance, Grievance, GrievanceEvent, GrievanceImage, GrievanceSecret, Like,
+)
+from apps.grievances.serializers import GrievanceListSerializer, GrievanceListRowSerializer
+from apps.grievances.views import GrievanceViewSet
+from apps.users.models import CustomUser
+from core.renderers import ORJSONRenderer
+from core.testing import CREATE_IMAGE_COUNTS, QUERY_SCALE_SIZES, png_upload, sql_fingerprint
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+# 버전 카운터/응답 캐시 테스트용 (개발 Redis 데이터와 분리)
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class GrievanceListRowSerializerGoldenTest(TestCase):
+    """GrievanceListRowSerializer + ORJSONRenderer 출력이 기존 시리얼라이저와 바이트 단위로 같은지 검증"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.area = Area.objects.get(name='강남구')
+        cls.leader = CustomUser.objects.create_user(email='leader@baro.app', password='pw', name='담당자')
+        cls.area.leader = cls.leader
+        cls.area.save()
+
+        cls.author = CustomUser.objects.create_user(
+            email='author@baro.app', password='pw', first_name='길동', last_name='홍'
+        )
+        cls.viewer = CustomUser.objects.create_user(email='viewer@baro.app', password='pw')
+        cls.official = CustomUser.objects.create_user(
+            email='official@baro.app', password='pw', role='politician', is_verified=True
+        )
+
+        cls.public = Grievance.objects.create(
+            user=cls.author, title='포트홀', content='도로 파손 ', category='traffic',
+            location='강남구', latitude=37.4979, longitude=127.0276, area=cls.area,
+        )
+        cls.private = Grievance.objects.create(
+            user=cls.author, title='비공개 민원', content='내용', visibility='private',
+            location='강남구', latitude=37.5, longitude=127.03, area=cls.area,
+        )
+        cls.anonymous = Grievance.objects.create(
+            title='익명 민원', content='내용', location='37.1000, 127.1000',
+            latitude=37.1, longitude=127.1,
+        )
+
+        for order in range(7):
+            GrievanceImage.objects.create(
+                grievance=cls.public,
+                image=SimpleUploadedFile(f'사진 {order}.png', b'png', content_type='image/png'),
+                order=order,
+            )
+        Like.objects.create(user=cls.viewer, grievance=cls.public)
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def _request(self, user=None):
+        request = APIRequestFactory().get('/api/grievances/')
+        request = Request(request)
+        if user is not None:
+            request.user = user
+        return request
+
+    def _assert_same_json(self, user=None):
+        request = self._request(user)
+        queryset = GrievanceViewSet.queryset.order_by('-created_at')
+
+        expected = JSONRenderer().render(
+            GrievanceListSerializer(queryset, many=True, context={'request': request}).data
+        )
+        rows = queryset.prefetch_related(None).values(*GrievanceListRowSerializer.value_fields)
+        actual = ORJSONRenderer().render(
+            GrievanceListRowSerializer(rows, context={'request': request}).data
+        )
+        self.assertEqual(actual, expected)
+
+    def test_anonymous_matches_list_serializer(self):
+        self._assert_same_json()
+
+    def test_viewer_matches_list_serializer(self):
+        self._assert_same_json(self.viewer)
+
+    def test_author_matches_list_serializer(self):
+        self._assert_same_json(self.author)
+
+    def test_area_leader_matches_list_serializer(self):
+        self._assert_same_json(self.leader)
+
+    def test_official_matches_list_serializer(self):
+        self._assert_same_json(self.official)
+
+    def test_list_endpoint_matches_list_serializer(self):
+        client = APIClient()
+        client.force_authenticate(self.viewer)
+        response = client.get('/api/grievances/')
+
+        request = self._request(self.viewer)
+        queryset = GrievanceViewSet.queryset.filter(visibility='public').order_by('-created_at')
+        expected = GrievanceListSerializer(queryset, many=True, context={'request': request}).data
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'], json.loads(JSONRenderer().render(expected)))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class GrievanceConditionalGetTest(TestCase):
+    """ETag / Last-Modified 기반 304 응답 검증"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.area = Area.objects.get(name='강남구')
+        cls.user = CustomUser.objects.create_user(email='viewer@baro.app', password='pw')
+        cls.other = CustomUser.objects.create_user(email='other@baro.app', password='pw')
+        cls.grievance = Grievance.objects.create(
+            title='포트홀', content='도로 파손', location='강남구',
+            latitude=37.4979, longitude=127.0276, area=cls.area,
+        )
+
+    def setUp(self):
+        cache.clear()  # 테스트 간 롤백된 데이터와 버전 카운터 불일치 방지
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_list_returns_304_when_unchanged(self):
+        response = self.client.get('/api/grievances/')
+        etag = response['ETag']
+
+        response = self.client.get('/api/grievances/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_detail_etag_changes_after_like(self):
+        url = f'/api/grievances/{self.grievance.pk}/'
+        etag = self.client.get(url)['ETag']
+
+        self.client.patch(f'{url}like/')
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['is_liked'])
+
+    def test_area_list_etag_changes_after_status_update(self):
+        url = f'/api/grievances/?area={self.area.pk}'
+        etag = self.client.get(url)['ETag']
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.grievance.status = 'in_progress'
+            self.grievance.save(update_fields=['status'])
+            # 커밋 전에는 버전 유지 (동시 요청이 변경 전 행을 새 버전으로 캐시하지 않도록)
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        for callback in callbacks:
+            callback()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_detail_etag_changes_after_author_rename(self):
+        author = CustomUser.objects.create_user(email='author@baro.app', password='pw', name='김작성')
+        grievance = Grievance.objects.create(
+            title='가로등 고장', content='불이 안 켜짐', location='강남구',
+            latitude=37.4979, longitude=127.0276, area=self.area, user=author,
+        )
+        url = f'/api/grievances/{grievance.pk}/'
+        etag = self.client.get(url)['ETag']
+
+        author = CustomUser.objects.get(pk=author.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            author.name = '이작성'
+            author.save(update_fields=['name'])
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['user_name'], '이작성')
+
+    def test_etag_is_user_aware(self):
+        url = f'/api/grievances/{self.grievance.pk}/'
+        etag = self.client.get(url)['ETag']
+
+        other_client = APIClient()
+        other_client.force_authenticate(self.other)
+        response = other_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class AnonymousResponseCacheTest(TestCase):
+    """비로그인 피드 응답 캐시"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.area = Area.objects.get(name='강남구')
+        cls.user = CustomUser.objects.create_user(email='viewer@baro.app', password='pw')
+        cls.grievance = Grievance.objects.create(
+            title='포트홀', content='도로 파손', location='강남구',
+            latitude=37.4979, longitude=127.0276, area=cls.area,
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_second_anonymous_request_skips_database(self):
+        url = f'/api/grievances/?area={self.area.pk}&page=1'
+        first = self.client.get(url)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(f'/api/grievances/?page=1&area={self.area.pk}')
+        self.assertEqual(second.content, first.content)
+
+    def test_like_invalidates_cached_page(self):
+        url = '/api/grievances/'
+        self.client.get(url)
+
+        client = APIClient()
+        client.force_authenticate(self.user)
+        client.patch(f'/api/grievances/{self.grievance.pk}/like/')
+
+        response = self.client.get(url)
+        self.assertEqual(response.json()['results'][0]['like_count'], 1)
+
+    def test_cached_page_reflects_author_rename(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.grievance.user = self.user
+            self.grievance.save(update_fields=['user'])
+        url = f'/api/grievances/?area={self.area.pk}'
+        self.assertEqual(self.client.get(url).json()['results'][0]['user_name'], 'viewer@baro.app')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            author = CustomUser.objects.get(pk=self.user.pk)
+            author.name = '김시민'
+            author.save(update_fields=['name'])
+
+        response = self.client.get(url)
+        self.assertEqual(response.json()['results'][0]['user_name'], '김시민')
+
+    def test_cached_area_reflects_leader_rename(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.area.leader = self.user
+            self.area.save(update_fields=['leader'])
+        url = f'/api/areas/{self.area.pk}/'
+        self.assertEqual(self.client.get(url).json()['leader_name'], '')
+
+        leader = CustomUser.objects.get(pk=self.user.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            leader.nickname = '구청장'
+            leader.save(update_fields=['nickname'])
+
+        self.assertEqual(self.client.get(url).json()['leader_name'], '구청장')
+
+    def test_area_list_reflects_new_grievance(self):
+        before = {area['name']: area['grievance_count'] for area in self.client.get('/api/areas/').json()['results']}
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Grievance.objects.create(
+                title='쓰레기 무단투기', content='내용', location='강남구',
+                latitude=37.5, longitude=127.03, area=self.area,
+            )
+
+        after = {area['name']: area['grievance_count'] for area in self.client.get('/api/areas/').json()['results']}
+        self.assertEqual(after['강남구'], before['강남구'] + 1)
+
+
+class GrievanceExportTest(TestCase):
+    """CSV / NDJSON 내보내기 권한 및 범위"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.gangnam = Area.objects.get(name='강남구')
+        cls.seocho = Area.objects.get(name='서초구')
+        cls.leader = CustomUser.objects.create_user(email='leader@baro.app', password='pw')
+        cls.gangnam.leader = cls.leader
+        cls.gangnam.save()
+        cls.official = CustomUser.objects.create_user(
+            email='official@baro.app', password='pw', role='admin', is_verified=True
+        )
+        cls.citizen = CustomUser.objects.create_user(email='citizen@baro.app', password='pw')
+
+        for area in (cls.gangnam, cls.seocho):
+            Grievance.objects.create(
+                title=f'{area.name} 민원', content='내용', location=area.name,
+                latitude=37.5, longitude=127.0, area=area,
+            )
+
+    def _export(self, user, query=''):
+        client = APIClient()
+        client.force_authenticate(user)
+        return client.get(f'/api/grievances/export/{query}')
+
+    def test_citizen_is_forbidden(self):
+        self.assertEqual(self._export(self.citizen).status_code, 403)
+
+    def test_official_exports_all_as_csv(self):
+        response = self._export(self.official)
+        self.assertEqual(response.status_code, 200)
+        lines = b''.join(response.streaming_content).decode('utf-8-sig').splitlines()
+        self.assertEqual(lines[0].split(',')[:3], ['id', 'title', 'content'])
+        self.assertEqual(len(lines), 3)
+
+    def test_csv_escapes_formula_cells(self):
+        Grievance.objects.create(
+            title='=HYPERLINK("http://evil.example","클릭")', content='@SUM(1+1)', location='-강남구',
+            latitude=37.5, longitude=-127.0, area=self.gangnam,
+        )
+        response = self._export(self.official, '?search=HYPERLINK')
+        rows = list(csv.reader(b''.join(response.streaming_content).decode('utf-8-sig').splitlines()))
+        row = dict(zip(rows[0], rows[1]))
+        self.assertEqual(row['title'], '\'=HYPERLINK("http://evil.example","클릭")')
+        self.assertEqual(row['content'], "'@SUM(1+1)")
+        self.assertEqual(row['location'], "'-강남구")
+        self.assertEqual(row['longitude'], '-127.0')  # 숫자 셀은 그대로
+
+        ndjson = self._export(self.official, '?search=HYPERLINK&export_format=ndjson')
+        self.assertEqual(json.loads(b''.join(ndjson.streaming_content))['content'], '@SUM(1+1)')
+
+    def test_leader_exports_only_led_area_as_ndjson(self):
+        response = self._export(self.leader, '?export_format=ndjson')
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual([row['area_name'] for row in rows], ['강남구'])
+
+    def test_gzip(self):
+        import gzip
+        response = self._export(self.official, '?export_format=ndjson&gzip=1')
+        self.assertEqual(response['Content-Type'], 'application/gzip')
+        self.assertEqual(len(gzip.decompress(b''.join(response.streaming_content)).splitlines()), 2)
+
+
+class ImportLegacyCommandTest(TestCase):
+    """레거시 CSV 일괄 이관 (COPY + 업서트)"""
+
+    def _write(self, directory, name, rows):
+        with open(f'{directory}/{name}.csv', 'w', encoding='utf-8', newline='') as f:
+            csv.writer(f).writerows(rows)
+
+    def test_import_is_idempotent(self):
+        from django.core.management import call_command
+
+        with tempfile.TemporaryDirectory() as directory:
+            self._write(directory, 'AREA', [
+                ['area_id', 'name', 'center_point', 'leader_user_id'],
+                ['101', '강남구', 'POINT(127.0495556 37.5172363)', '1'],
+            ])
+            self._write(directory, 'USER', [
+                ['user_id', 'email', 'password_hash', 'nickname', 'role', 'is_verified', 'user_create', 'area_id'],
+                ['1', 'leader@baro.app', '$argon2id$v=19$m=65536,t=3,p=4$c2FsdA$aGFzaA', '담당자', 'politician', 'true',
+                 '2024-01-01T00:00:00+09:00', '101'],
+                ['2', 'md5@baro.app', '{MD5}5f4dcc3b5aa765d61d8327deb882cf99', '옛 형식', 'citizen', 'false', '', ''],
+            ])
+            self._write(directory, 'COMPLAIN', [
+                ['complain_id', 'complainer_id', 'area_id', 'title', 'content', 'status', 'visibility', 'location'],
+                ['1', '1', '101', '포트홀', '내용', 'Processing', 'private', 'POINT(127.0276 37.4979)'],
+                ['2', '1', '', '위치만 있는 민원', '내용', 'Pending', 'public', 'SRID=4326;POINT(127.0325 37.4837)'],
+            ])
+            self._write(directory, 'COMPLAIN_MEDIA', [
+                ['media_id', 'complain_id', 'image_url'],
+                ['1', '1', '/media/grievances/images/a.jpg'],
+                ['2', '1', 'grievances/images/b.jpg'],
+            ])
+            # 레거시 Argon2id 해시 (평문 '1234')
+            self._write(directory, 'COMPLAIN_SECRET', [
+                ['complain_id', 'password_hash'],
+                ['1', '$argon2id$v=19$m=19456,t=2,p=1$bGVnYWN5c2FsdDEyMzQ1Ng$KfaD8oaAXKaCn4Zw/+8bopjzqtozIMzZ0vxpbOvKD9s'],
+            ])
+
+            for _ in range(2):
+                call_command('import_legacy', directory, stdout=io.StringIO())
+
+        leader = CustomUser.objects.get(email='leader@baro.app')
+        self.assertTrue(leader.password.startswith('argon2$argon2id$'))
+        # 알 수 없는 해시 형식은 비공개 패스워드와 같은 규칙으로 검증 불가('!')
+        self.assertFalse(CustomUser.objects.get(email='md5@baro.app').has_usable_password())
+        self.assertEqual(Area.objects.get(name='강남구').leader, leader)
+
+        self.assertEqual(Grievance.objects.count(), 2)
+        private = Grievance.objects.get(title='포트홀')
+        self.assertEqual(private.status, 'in_progress')
+        self.assertEqual(private.area.name, '강남구')
+        self.assertAlmostEqual(private.latitude, 37.4979)
+        self.assertEqual(
+            list(private.images.values_list('image', flat=True)),
+            ['grievances/images/a.jpg', 'grievances/images/b.jpg'],
+        )
+        self.assertTrue(private.secret.password_hash.startswith('argon2$argon2id$'))
+        self.assertTrue(private.secret.check_password('1234'))
+
+        # area_id 없는 민원은 좌표로 가장 가까운 구역 배정
+        self.assertEqual(Grievance.objects.get(title='위치만 있는 민원').area.name, '서초구')
+
+    def test_existing_user_is_not_overwritten(self):
+        from django.core.management import call_command
+
+        existing = CustomUser.objects.create_user(email='citizen@baro.app', password='live-password', nickname='시민')
+        password = existing.password
+
+        with tempfile.TemporaryDirectory() as directory:
+            self._write(directory, 'USER', [
+                ['user_id', 'email', 'password_hash', 'nickname', 'role', 'is_verified'],
+                ['7', 'citizen@baro.app', '$argon2id$v=19$m=65536,t=3,p=4$c2FsdA$aGFzaA', '레거시', 'admin', 'true'],
+            ])
+            self._write(directory, 'COMPLAIN', [
+                ['complain_id', 'complainer_id', 'title', 'content', 'status', 'visibility', 'location'],
+                ['1', '7', '포트홀', '내용', 'Pending', 'public', 'POINT(127.0276 37.4979)'],
+            ])
+            call_command('import_legacy', directory, stdout=io.StringIO())
+
+        existing.refresh_from_db()
+        self.assertEqual(existing.password, password)
+        self.assertTrue(existing.check_password('live-password'))
+        self.assertEqual((existing.role, existing.is_verified, existing.nickname), ('citizen', False, '시민'))
+        # 레거시 민원은 같은 이메일의 기존 계정에 연결
+        self.assertEqual(Grievance.objects.get(title='포트홀').user, existing)
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, CACHES=LOCMEM_CACHES)
+class GenerateSyntheticDataCommandTest(TestCase):
+    """부하 테스트용 합성 데이터 생성"""
+
+    def _generate(self, **options):
+        from django.core.management import call_command
+        call_command(
+            'generate_synthetic_data', users=20, grievances=50, likes=200, seed=7,
+            stdout=io.StringIO(), **options
+        )
+
+    def test_generate_and_clear(self):
+        self._generate()
+
+        synthetic = Grievance.objects.filter(user__email__endswith='@synthetic.baro.test')
+        self.assertEqual(CustomUser.objects.filter(email__endswith='@synthetic.baro.test').count(), 20)
+        self.assertGreater(synthetic.count(), 0)
+        self.assertFalse(Grievance.objects.filter(area__isnull=True).exists())
+        self.assertFalse(Grievance.objects.filter(visibility='private', secret__isnull=True).exists())
+        self.assertTrue(Like.objects.exists())
+
+        self._generate(clear=True)
+        self.assertFalse(CustomUser.objects.filter(email__endswith='@synthetic.baro.test').exists())
+        self.assertFalse(synthetic.exists())
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, CACHES=LOCMEM_CACHES)
+class QueryCountRegressionTest(TestCase):
+    """
+    엔드포인트별 SQL 쿼리 수 / 형태 고정
+    - 페이지 크기(목록) 또는 이미지/좋아요/민원 수(상세, 구역, 내보내기, 삭제)를 1 / 20 / 100으로,
+      생성은 업로드 이미지 수를 1 / 5 / 10으로 바꿔도 정규화된 쿼리 목록이 같아야 함
+      → 행마다 쿼리가 늘어나는 N+1 회귀 시 실패
+    - 인증 엔드포인트(가입 / 로그인 / 내 정보 / 소셜 로그인)는 apps.users.tests.AuthQueryCountTest
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.leader = CustomUser.objects.create_user(email='leader@baro.app', password='pw')
+        cls.author = CustomUser.objects.create_user(email='author@baro.app', password='pw', name='작성자')
+        cls.viewer = CustomUser.objects.create_user(email='viewer@baro.app', password='pw')
+        cls.official = CustomUser.objects.create_user(
+            email='official@baro.app', password='pw', role='admin', is_verified=True
+        )
+        cls.superuser = CustomUser.objects.create_superuser(email='super@baro.app', password='pw')
+        cls.likers = likers = CustomUser.objects.bulk_create([
+            CustomUser(email=f'liker{index}@baro.app', password='!') for index in range(max(QUERY_SCALE_SIZES))
+        ])
+
+        # 크기별 구역: 민원 1 / 20 / 100건 (비공개 민원 포함)
+        cls.areas, cls.public_targets, cls.private_targets = {}, {}, {}
+        for size, area_name in zip(QUERY_SCALE_SIZES, ('종로구', '중구', '강남구')):
+            area = Area.objects.get(name=area_name)
+            area.leader = cls.leader
+            area.save()
+            cls.areas[size] = area
+
+            grievances = [
+                Grievance.objects.create(
+                    user=cls.author, title=f'{area_name} 민원 {index}', content='내용',
+                    visibility='private' if index % 4 == 3 else 'public',
+                    location=area_name, latitude=37.5 + index / 10000, longitude=127.0, area=area,
+                )
+                for index in range(size)
+            ]
+            Like.objects.bulk_create([Like(user=cls.viewer, grievance=g) for g in grievances[::2]])
+
+            # 상세 대상: 이미지 / 좋아요 size개
+            public_target = grievances[0]
+            private_target = Grievance.objects.create(
+                user=cls.author, title=f'{area_name} 비공개', content='내용', visibility='private',
+                location=area_name, latitude=37.5, longitude=127.0, area=area,
+            )
+            GrievanceSecret.objects.create(grievance=private_target, password_hash=make_password('1234'))
+            for target in (public_target, private_target):
+                GrievanceImage.objects.bulk_create([
+                    GrievanceImage(grievance=target, image=f'grievances/images/{index}.png', order=index)
+                    for index in range(size)
+                ])
+                Like.objects.bulk_create(
+                    [Like(user=liker, grievance=target) for liker in likers[:size]], ignore_conflicts=True
+                )
+            cls.public_targets[size] = public_target
+            cls.private_targets[size] = private_target
+
+    def _fingerprints(self, method, path, user=None, data=None, force_login=False, data_format='json'):
+        """요청 1회에 실행된 쿼리의 정규화 목록"""
+        cache.clear()
+        client = APIClient()
+        if force_login:
+            client.force_login(user)
+        elif user is not None:
+            client.force_authenticate(user)
+
+        options = {'format': data_format} if data is not None else {}
+        with CaptureQueriesContext(connection) as context, self.captureOnCommitCallbacks(execute=True):
+            response = getattr(client, method)(path, data, **options)
+            if response.streaming:
+                b''.join(response.streaming_content)
+
+        self.assertLess(response.status_code, 400, path)
+        return [sql_fingerprint(query['sql']) for query in context.captured_queries]
+
+    def assertQueriesConstant(self, build, sizes=QUERY_SCALE_SIZES):
+        """build(size) → 쿼리 지문 목록 (크기와 무관하게 동일해야 함)"""
+        build(sizes[0])  # 워밍업 (ContentType 등 프로세스 캐시)
+        baseline = build(sizes[0])
+        for size in sizes[1:]:
+            with self.subTest(size=size):
+                fingerprints = build(size)
+                self.assertEqual(len(fingerprints), len(baseline), '\n'.join(fingerprints))
+                self.assertEqual(fingerprints, baseline)
+
+    def test_list_anonymous(self):
+        self.assertQueriesConstant(
+            lambda size: self._fingerprints('get', f'/api/grievances/?page_size={size}')
+        )
+
+    def test_list_authenticated(self):
+        self.assertQueriesConstant(
+            lambda size: self._fingerprints('get', f'/api/grievances/?page_size={size}', self.viewer)
+        )
+
+    def test_list_search_filter_ordering(self):
+        self.assertQueriesConstant(lambda size: self._fingerprints(
+            'get', f'/api/grievances/?page_size={size}&search=민원&ordering=-like_count&status=pending',
+            self.official,
+        ))
+
+    def test_list_by_area(self):
+        self.assertQueriesConstant(lambda size: self._fingerprints(
+            'get', f'/api/grievances/?area={self.areas[size].pk}&page_size=100', self.leader
+        ))
+
+    def test_nearby(self):
+        self.assertQueriesConstant(lambda size: self._fingerprints(
+            'get', f'/api/grievances/nearby/?lat=37.5&lng=127.0&radius=50&page_size={size}', self.viewer
+        ))
+
+    def test_retrieve(self):
+        self.assertQueriesConstant(lambda size: self._fingerprints(
+            'get', f'/api/grievances/{self.public_targets[size].pk}/', self.viewer
+        ))
+
+    def test_retrieve_private_as_leader(self):
+        self.assertQueriesConstant(lambda size: self._fingerprints(
+            'get', f'/api/grievances/{self.private_targets[size].pk}/', self.leader
+        ))
+
+    @mock.patch('apps.grievances.services.ReverseGeocoder.get_location_name', return_value='강남구')
+    def test_create(self, _):
+        # 비공개 + 이미지 size장 (이미지 저장은 bulk_create 1회)
+        self.assertQueriesConstant(lambda size: self._fingerprints('post', '/api/grievances/', self.author, {
+            'title': '신규 민원', 'content': '내용', 'category': 'traffic', 'latitude': 37.5, 'longitude': 127.0,
+            'visibility': 'private', 'password': '1234',
+            'images': [png_upload(f'{index}.png') for index in range(size)],
+        }, data_format='multipart'), sizes=CREATE_IMAGE_COUNTS)
+
+    def test_destroy(self):
+        # 이미지 / 좋아요 size개인 민원 삭제 (CASCADE 대상 행 수와 무관)
+        def build(size):
+            target = Grievance.objects.create(
+                user=self.author, title='삭제 대상', content='내용', location=self.areas[size].name,
+                latitude=37.5, longitude=127.0, area=self.areas[size],
+            )
+            GrievanceImage.objects.bulk_create([
+                GrievanceImage(grievance=target, image=f'grievances/images/{index}.png', order=index)
+                for index in range(size)
+            ])
+            Like.objects.bulk_create([Like(user=liker, grievance=target) for liker in self.likers[:size]])
+            return self._fingerprints('delete', f'/api/grievances/{target.pk}/', self.author)
+        self.assertQueriesConstant(build)
+
+    def test_partial_update(self):
+        self.assertQueriesConstant(lambda size: self._fingerprints(
+            'patch', f'/api/grievances/{self.public_targets[size].pk}/', self.author, {'title': '수정'}
+        ))
+
+    def test_like_toggle(self):
+        # 좋아요 → 취소 한 쌍으로 측정 (상태 원복)
+        def build(size):
+            path = f'/api/grievances/{self.public_targets[size].pk}/like/'
+            return self._fingerprints('patch', path, self.author) + self._fingerprints('patch', path, self.author)
+        self.assertQueriesConstant(build)
+
+    def test_update_status(self):
+        self.assertQueriesConstant(lambda size: self._fingerprints(
+            'patch', f'/api/grievances/{self.public_targets[size].pk}/update_status/',
+            self.leader, {'status': 'in_progress'},
+        ))
+
+    def test_verify_password(self):
+        self.assertQueriesConstant(lambda size: self._fingerprints(
+            'post', f'/api/grievances/{self.private_targets[size].pk}/verify_password/',
+            self.viewer, {'password': '1234'},
+        ))
+
+    def test_export(self):
+        self.assertQueriesConstant(lambda size: self._fingerprints(
+            'get', f'/api/grievances/export/?area={self.areas[size].pk}', self.official
+        ))
+
+    def test_area_list(self):
+        self.assertQueriesConstant(
+            lambda size: self._fingerprints('get', f'/api/areas/?page_size={size}')
+        )
+
+    def test_area_retrieve(self):
+        self.assertQueriesConstant(
+            lambda size: self._fingerprints('get', f'/api/areas/{self.areas[size].pk}/')
+        )
+
+    def test_admin_changelist(self):
+        self.assertQueriesConstant(lambda size: self._fingerprints(
+            'get', f'/admin/grievances/grievance/?area__id__exact={self.areas[size].pk}',
+            self.superuser, force_login=True,
+        ))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ServerTimingMiddlewareTest(TestCase):
+    """샘플링된 요청에만 구조화 로그, Server-Timing 헤더는 스태프 사용자에게만"""
+
+    @classmethod
+    def setUpTestData(cls):
+        Grievance.objects.create(
+            title='포트홀', content='내용', location='강남구', latitude=37.5, longitude=127.0,
+            area=Area.objects.get(name='강남구'),
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    @override_settings(SERVER_TIMING_SAMPLE_RATE=1.0, SERVER_TIMING_HEADER=True)
+    def test_sampled_request_has_breakdown(self):
+        self.client.force_authenticate(CustomUser.objects.create_user(
+            email='staff@baro.app', password='pw', is_staff=True
+        ))
+        with self.assertLogs('baro.timing', level='INFO') as logs:
+            response = self.client.get('/api/grievances/')
+
+        metrics = [entry.split(';')[0] for entry in response['Server-Timing'].split(', ')]
+        self.assertEqual(metrics[0], 'db')
+        self.assertIn('serialize', metrics)
+        self.assertIn('render', metrics)
+        self.assertEqual(metrics[-1], 'total')
+
+        fields = logs.records[0].timing
+        self.assertEqual(fields['status'], 200)
+        self.assertGreater(fields['query_count'], 0)
+
+    @override_settings(SERVER_TIMING_SAMPLE_RATE=0.0)
+    def test_unsampled_request_has_no_header(self):
+        self.assertFalse(self.client.get('/api/grievances/').has_header('Server-Timing'))
+
+    @override_settings(SERVER_TIMING_SAMPLE_RATE=1.0, SERVER_TIMING_HEADER=True)
+    def test_header_hidden_from_non_staff(self):
+        with self.assertLogs('baro.timing', level='INFO'):
+            self.assertFalse(self.client.get('/api/grievances/').has_header('Server-Timing'))
+        self.client.force_authenticate(CustomUser.objects.create_user(email='citizen@baro.app', password='pw'))
+        with self.assertLogs('baro.timing', level='INFO'):
+            self.assertFalse(self.client.get('/api/grievances/').has_header('Server-Timing'))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class PrometheusMetricsTest(TestCase):
+    """/metrics 엔드포인트 (Prometheus 텍스트 형식)"""
+
+    @override_settings(METRICS_ALLOWED_IPS=['127.0.0.0/8'])
+    def test_request_metrics_are_exported(self):
+        self.client.get('/api/grievances/')
+        response = self.client.get('/metrics')
+
+        self.assertEqual(response.status_code, 200)
+        body = response.content.decode()
+        self.assertIn('baro_http_responses_total{method="GET",status="200",view="grievance-list"}', body)
+        self.assertIn('baro_db_queries_per_request_bucket{le="1.0",view="grievance-list"}', body)
+
+    @override_settings(METRICS_AUTH_TOKEN='secret')
+    def test_token_required_when_configured(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 401)
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer secret')
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(METRICS_AUTH_TOKEN='', METRICS_ALLOWED_IPS=['10.0.4.0/24'])
+    def test_closed_by_default_outside_allowed_ips(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+        self.assertEqual(self.client.get('/metrics', HTTP_X_FORWARDED_FOR='10.0.4.2').status_code, 403)
+        self.assertEqual(self.client.get('/metrics', REMOTE_ADDR='10.0.4.2').status_code, 200)
+
+
+class GrievancePartitionTest(TestCase):
+    """grievances 월 파티션 (migration 0008)"""
+
+    def test_month_helpers(self):
+        from datetime import datetime, timezone as dt_timezone
+        from apps.grievances.partitions import GrievancePartitionManager, add_months, month_range
+
+        start = datetime(2025, 11, 15, 9, tzinfo=dt_timezone.utc)
+        self.assertEqual(add_months(datetime(2025, 12, 1, tzinfo=dt_timezone.utc), 1).strftime('%Y%m'), '202601')
+        self.assertEqual(
+            [GrievancePartitionManager.partition_name(month) for month in month_range(start, add_months(start, 2))],
+            ['grievances_p202511', 'grievances_p202512', 'grievances_p202601'],
+        )
+
+    def test_ensure_moves_default_rows_into_new_partition(self):
+        from datetime import timedelta
+        from django.utils import timezone
+        from apps.grievances.partitions import GrievancePartitionManager
+
+        manager = GrievancePartitionManager()
+        if not manager.is_partitioned():
+            self.skipTest('파티션 테이블 아님')
+
+        user = CustomUser.objects.create_user(email='partition@baro.app', password='pw')
+        grievance = Grievance.objects.create(user=user, title='미래 민원', content='내용', latitude=37.5, longitude=127.0)
+        future = timezone.now() + timedelta(days=365 * 3)
+        Grievance.objects.filter(pk=grievance.pk).update(created_at=future)
+
+        created = manager.ensure(months_ahead=0)
+
+        name = manager.partition_name(future)
+        self.assertIn(name, created)
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT count(*) FROM {name}')
+            self.assertEqual(cursor.fetchone()[0], 1)
+        self.assertEqual(manager.ensure(months_ahead=0), [])
+        self.assertEqual(Grievance.objects.get(pk=grievance.pk).title, '미래 민원')
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, CACHES=LOCMEM_CACHES)
+class GrievanceArchiveTest(TestCase):
+    """오래된 완료 민원 보관 / 복원"""
+
+    @classmethod
+    def setUpTestData(cls):
+        from datetime import timedelta
+        from django.utils import timezone
+
+        cls.area = Area.objects.get(name='강남구')
+        cls.user = CustomUser.objects.create_user(email='archive@baro.app', password='pw')
+        cls.old = Grievance.objects.create(
+            user=cls.user, title='오래된 완료 민원', content='내용', status='resolved', visibility='private',
+            location='강남구', latitude=37.4979, longitude=127.0276, area=cls.area,
+        )
+        Grievance.objects.filter(pk=cls.old.pk).update(completed_at=timezone.now() - timedelta(days=400))
+        secret = GrievanceSecret(grievance=cls.old)
+        secret.set_password('1234')
+        secret.save()
+        Like.objects.create(user=cls.user, grievance=cls.old)
+        GrievanceImage.objects.create(
+            grievance=cls.old, image=SimpleUploadedFile('a.png', b'png', content_type='image/png')
+        )
+        cls.recent = Grievance.objects.create(
+            user=cls.user, title='최근 완료 민원', content='내용', status='resolved',
+            location='강남구', latitude=37.4979, longitude=127.0276, area=cls.area,
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _archive(self):
+        from apps.grievances.archive import GrievanceArchiver
+
+        archiver = GrievanceArchiver(batch_size=10, pause=0)
+        with self.captureOnCommitCallbacks(execute=True):
+            return archiver.run(archiver.cutoff(older_than_days=365))
+
+    def test_archive_keeps_detail_and_area_count(self):
+        url = f'/api/grievances/{self.old.pk}/'
+        before = self.client.get(url).json()
+        area_count = self.client.get(f'/api/areas/{self.area.pk}/').json()['grievance_count']
+
+        self.assertEqual(self._archive(), 1)
+
+        self.assertFalse(Grievance.objects.filter(pk=self.old.pk).exists())
+        self.assertTrue(Grievance.objects.filter(pk=self.recent.pk).exists())
+        self.assertEqual(Like.objects.filter(grievance_id=self.old.pk).count(), 0)
+
+        archived = ArchivedGrievance.objects.get(pk=self.old.pk)
+        self.assertEqual(archived.like_count, 1)
+        self.assertEqual(archived.images.count(), 1)
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), before)
+        self.assertEqual(self.client.get(f'/api/areas/{self.area.pk}/').json()['grievance_count'], area_count)
+
+        # 비로그인 사용자에게는 비공개 보관 민원도 숨김
+        self.assertEqual(APIClient().get(url).status_code, 404)
+
+    def test_restore_moves_rows_back(self):
+        from apps.grievances.archive import GrievanceArchiver
+
+        self._archive()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(GrievanceArchiver().restore([self.old.pk]), 1)
+
+        grievance = Grievance.objects.get(pk=self.old.pk)
+        self.assertEqual(grievance.likes.count(), 1)
+        self.assertEqual(grievance.images.count(), 1)
+        self.assertTrue(grievance.secret.check_password('1234'))
+        self.assertFalse(ArchivedGrievance.objects.exists())
+
+
+@override_settings(DATABASE_REPLICAS=['replica_1'], REPLICA_MAX_LAG_SECONDS=5, CACHES=LOCMEM_CACHES)
+class ReplicaRoutingTest(SimpleTestCase):
+    """읽기 복제본 라우팅 (복제 지연은 mock, 실제 복제본 테스트는 check_replicas 참고)"""
+
+    def setUp(self):
+        from core.db_router import ReplicaHealth
+
+        cache.clear()
+        ReplicaHealth.reset()
+
+    def _route(self, use_replica, lag=0.5):
+        """요청 상태 활성화 후 (쓰기 전 읽기, 쓰기 후 읽기) 대상 DB"""
+        from core import db_router
+
+        router = db_router.ReplicaRouter()
+        token = db_router.activate(db_router.RoutingState(use_replica))
+        try:
+            with mock.patch.object(db_router.ReplicaHealth, 'lag', return_value=lag):
+                before = router.db_for_read(Grievance)
+                router.db_for_write(Grievance)
+                return before, router.db_for_read(Grievance)
+        finally:
+            db_router.deactivate(token)
+
+    def test_reads_after_write_go_to_primary(self):
+        self.assertEqual(self._route(use_replica=True), ('replica_1', 'default'))
+
+    def test_lagging_replica_falls_back_to_primary(self):
+        self.assertEqual(self._route(use_replica=True, lag=30), ('default', 'default'))
+        self.assertEqual(self._route(use_replica=True, lag=None), ('default', 'default'))
+
+    def test_versioned_reads_after_recent_change_use_primary(self):
+        import time
+        from core import db_router
+
+        for last_modified, expected in [(time.time() - 2, False), (None, False), (time.time() - 60, True)]:
+            state = db_router.RoutingState(use_replica=True)
+            token = db_router.activate(state)
+            try:
+                db_router.require_primary_since(last_modified)
+            finally:
+                db_router.deactivate(token)
+            self.assertEqual(state.use_replica, expected)
+
+    def test_outside_request_uses_primary(self):
+        from core.db_router import ReplicaRouter
+
+        self.assertEqual(ReplicaRouter().db_for_read(Grievance), 'default')
+
+    def test_writer_is_pinned_to_primary(self):
+        from rest_framework_simplejwt.tokens import AccessToken
+        from core import db_router
+        from core.middleware import ReplicaRoutingMiddleware
+
+        seen = []
+
+        def view(request):
+            state = db_router.get_current_state()
+            seen.append(state.use_replica)
+            if request.method == 'POST':
+                db_router.ReplicaRouter().db_for_write(Grievance)
+            return JsonResponse({})
+
+        token = AccessToken()
+        token['user_id'] = 'writer'
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        middleware = ReplicaRoutingMiddleware(view)
+        factory = RequestFactory()
+
+        middleware(factory.get('/api/grievances/', **headers))
+        middleware(factory.post('/api/grievances/', **headers))
+        middleware(factory.get('/api/grievances/', **headers))
+        middleware(factory.get('/api/grievances/'))
+
+        self.assertEqual(seen, [True, False, False, True])
+
+
+class DatabaseConnectionMetricsTest(TestCase):
+    """core.db.backends.postgis 연결 지표"""
+
+    def _sample(self, name, **labels):
+        from prometheus_client import REGISTRY
+
+        return REGISTRY.get_sample_value(name, {'database': 'default', **labels}) or 0
+
+    def test_connect_and_close_are_counted(self):
+        from django.db import connections
+
+        opened = self._sample('baro_db_connections_opened_total')
+        closed = self._sample('baro_db_connections_closed_total', reason='explicit')
+
+        wrapper = connections.create_connection('default')
+        wrapper.ensure_connection()
+        wrapper.close()
+
+        self.assertEqual(self._sample('baro_db_connections_opened_total'), opened + 1)
+        self.assertEqual(self._sample('baro_db_connections_closed_total', reason='explicit'), closed + 1)
+
+    def test_expired_connection_closed_as_max_age(self):
+        from django.db import connections
+
+        closed = self._sample('baro_db_connections_closed_total', reason='max_age')
+
+        wrapper = connections.create_connection('default')
+        wrapper.settings_dict = {**wrapper.settings_dict, 'CONN_MAX_AGE': 0}
+        wrapper.ensure_connection()
+        wrapper.close_if_unusable_or_obsolete()
+
+        self.assertIsNone(wrapper.connection)
+        self.assertEqual(self._sample('baro_db_connections_closed_total', reason='max_age'), closed + 1)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class GrievanceTimelineTest(TestCase):
+    """추가 전용 타임라인 이벤트 (상태 변경 / 수정 기록, 타임라인 API, 상세 최근 이벤트)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        from apps.grievances.services import GrievanceEventService
+
+        cls.area = Area.objects.get(name='강남구')
+        cls.leader = CustomUser.objects.create_user(email='leader@baro.app', password='pw', name='담당자')
+        cls.area.leader = cls.leader
+        cls.area.save()
+        cls.author = CustomUser.objects.create_user(email='author@baro.app', password='pw')
+        cls.grievance = Grievance.objects.create(
+            user=cls.author, title='가로등 고장', content='내용', visibility='private',
+            location='강남구', latitude=37.4979, longitude=127.0276, area=cls.area,
+        )
+        GrievanceEventService.record_created(cls.grievance, actor=cls.author)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.leader)
+
+    def test_status_change_is_single_insert(self):
+        table = GrievanceEvent._meta.db_table
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.patch(
+                f'/api/grievances/{self.grievance.pk}/update_status/', {'status': 'in_progress'}, format='json'
+            )
+        self.assertEqual(response.status_code, 200)
+
+        event_queries = [q['sql'] for q in ctx.captured_queries if f'"{table}"' in q['sql']]
+        self.assertEqual(len(event_queries), 1)
+        self.assertTrue(event_queries[0].startswith(f'INSERT INTO "{table}"'))
+
+        event = GrievanceEvent.objects.recent().filter(grievance=self.grievance).first()
+        self.assertEqual((event.event_type, event.from_status, event.to_status), ('status_changed', 'pending', 'in_progress'))
+        self.assertEqual((event.actor, event.actor_role), (self.leader, 'leader'))
+
+    def test_timeline_in_order(self):
+        url = f'/api/grievances/{self.grievance.pk}/'
+        self.client.patch(f'{url}update_status/', {'status': 'in_progress'}, format='json')
+        self.client.patch(f'{url}update_status/', {'status': 'resolved'}, format='json')
+
+        response = self.client.get(f'{url}timeline/')
+        self.assertEqual(response.status_code, 200)
+        events = response.json()['events']
+        self.assertEqual([e['event_type'] for e in events], ['created', 'status_changed', 'status_changed'])
+        self.assertEqual([e['to_status'] for e in events], ['pending', 'in_progress', 'resolved'])
+        self.assertEqual(events[0]['actor_role'], 'author')
+        self.assertEqual(events[2]['actor_name'], '담당자')
+
+        # 비로그인 사용자에게는 비공개 민원 타임라인도 숨김
+        self.assertEqual(APIClient().get(f'{url}timeline/').status_code, 404)
+
+    def test_detail_embeds_latest_events(self):
+        url = f'/api/grievances/{self.grievance.pk}/'
+        self.client.patch(f'{url}update_status/', {'status': 'in_progress'}, format='json')
+
+        self.assertNotIn('events', self.client.get(url).json())
+        events = self.client.get(url, {'events': 1}).json()['events']
+        self.assertEqual(events, [{
+            'event_type': 'status_changed', 'from_status': 'pending', 'to_status': 'in_progress',
+            'actor_role': 'leader', 'created_at': events[0]['created_at'],
+        }])
+
+    def test_edit_records_changed_fields(self):
+        self.client.force_authenticate(self.author)
+        url = f'/api/grievances/{self.grievance.pk}/'
+        self.client.patch(url, {'title': '가로등 고장 (2곳)'}, format='json')
+        self.client.patch(url, {'title': '가로등 고장 (2곳)'}, format='json')  # 변경 없음 → 기록 안 함
+
+        edits = GrievanceEvent.objects.filter(grievance=self.grievance, event_type='edited')
+        self.assertEqual([(e.changes, e.actor_role) for e in edits], [(['title'], 'author')])
+
+
+@override_settings(CACHES=LOCMEM_CACHES, HOT_SCORE_GRAVITY_SECONDS=10 ** 9)
+class HotOrderingTest(TestCase):
+    """인기순(ordering=hot): 좋아요 / 상태 변경 시 점수 갱신, 키셋 페이징, 기간 경과 재계산"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [CustomUser.objects.create_user(email=f'hot{index}@baro.app', password='pw') for index in range(2)]
+        cls.official = CustomUser.objects.create_user(
+            email='official@baro.app', password='pw', role='politician', is_verified=True
+        )
+        cls.liked, cls.plain, cls.done = [
+            Grievance.objects.create(user=cls.users[0], title=title, content='내용', latitude=37.5, longitude=127.0)
+            for title in ('좋아요 많은 민원', '좋아요 없는 민원', '완료될 민원')
+        ]
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def like(self, grievance):
+        for user in self.users:
+            self.client.force_authenticate(user)
+            self.client.patch(f'/api/grievances/{grievance.pk}/like/')
+        self.client.force_authenticate(None)
+
+    def hot_ids(self, url='/api/grievances/?ordering=hot&page_size=2'):
+        ids = []
+        while url:
+            body = self.client.get(url).json()
+            ids += [item['id'] for item in body['results']]
+            url = body['next']
+        return ids
+
+    def test_new_grievance_gets_initial_score(self):
+        self.assertGreater(self.plain.hot_score, 0)
+        self.assertGreaterEqual(self.done.hot_score, self.liked.hot_score)  # 나중에 접수 → 같거나 높음
+
+    def test_likes_and_status_reorder(self):
+        self.like(self.liked)
+        self.like(self.done)
+        self.client.force_authenticate(self.official)
+        self.client.patch(f'/api/grievances/{self.done.pk}/update_status/', {'status': 'resolved'}, format='json')
+        self.client.force_authenticate(None)
+
+        # 키셋 페이징으로 끝까지 순회해도 누락 / 중복 없음
+        self.assertEqual(self.hot_ids(), [str(self.liked.pk), str(self.plain.pk), str(self.done.pk)])
+
+        first = self.client.get('/api/grievances/?ordering=hot&page_size=1').json()
+        self.assertEqual(first['results'][0]['like_count'], 2)
+        self.assertNotIn('count', first)
+
+    def test_expired_likes_recomputed_by_batch(self):
+        from datetime import timedelta
+        from django.utils import timezone
+        from apps.grievances.services import HotScoreService
+
+        self.like(self.plain)
+        boosted = Grievance.objects.get(pk=self.plain.pk).hot_score
+
+        Like.objects.filter(grievance=self.plain).update(created_at=timezone.now() - timedelta(days=8))
+        self.assertEqual(HotScoreService.refresh_expired(lookback=timedelta(days=2)), 1)
+        self.assertLess(Grievance.objects.get(pk=self.plain.pk).hot_score, boosted)
+        self.assertEqual(HotScoreService.refresh_expired(lookback=timedelta(days=2)), 0)  # 변경 없는 행은 기록 안 함
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class LeaderboardTest(TestCase):
+    """구역 / 카테고리별 좋아요 순위 (좋아요 / 상태 변경 / 삭제 반영, 보정, 조회 쿼리 수)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.area = Area.objects.get(name='강남구')
+        cls.other_area = Area.objects.get(name='중구')
+        cls.users = [CustomUser.objects.create_user(email=f'fan{index}@baro.app', password='pw') for index in range(2)]
+        cls.official = CustomUser.objects.create_user(
+            email='official@baro.app', password='pw', role='politician', is_verified=True
+        )
+
+        def create(title, category, area, visibility='public'):
+            return Grievance.objects.create(
+                user=cls.users[0], title=title, content='내용', category=category, visibility=visibility,
+                location=area.name, latitude=37.5, longitude=127.0, area=area,
+            )
+        cls.road = create('도로 파손', 'traffic', cls.area)
+        cls.trash = create('쓰레기 무단 투기', 'env', cls.area)
+        cls.secret = create('비공개 민원', 'env', cls.area, visibility='private')
+        cls.elsewhere = create('다른 구역 민원', 'traffic', cls.other_area)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.like(self.road, self.users)
+        self.like(self.trash, self.users[:1])
+        self.like(self.secret, self.users[:1])
+        self.like(self.elsewhere, self.users[:1])
+
+    def like(self, grievance, users):
+        for user in users:
+            self.client.force_authenticate(user)
+            self.client.patch(f'/api/grievances/{grievance.pk}/like/')
+        self.client.force_authenticate(None)
+
+    def top(self, **params):
+        response = self.client.get('/api/grievances/top/', params)
+        self.assertEqual(response.status_code, 200)
+        return [(item['title'], item['like_count']) for item in response.json()['results']]
+
+    def test_area_and_category_boards(self):
+        # 순위 조회(캐시 1회) 외 DB: 민원 PK 배치 조회 + 이미지 배치 조회
+        with self.assertNumQueries(2):
+            self.assertEqual(self.top(area=self.area.pk), [('도로 파손', 2), ('쓰레기 무단 투기', 1)])
+        self.assertEqual(self.top(area=self.area.pk, category='env'), [('쓰레기 무단 투기', 1)])
+        self.assertEqual(self.top(category='traffic', limit=1), [('도로 파손', 2)])
+        self.assertEqual(self.client.get('/api/grievances/top/', {'category': 'unknown'}).status_code, 400)
+
+    def test_status_change_unlike_and_delete(self):
+        self.client.force_authenticate(self.official)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(f'/api/grievances/{self.road.pk}/update_status/', {'status': 'resolved'}, format='json')
+        self.assertEqual(self.top(area=self.area.pk), [('쓰레기 무단 투기', 1)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(f'/api/grievances/{self.road.pk}/update_status/', {'status': 'in_progress'}, format='json')
+        self.assertEqual(self.top(area=self.area.pk), [('도로 파손', 2), ('쓰레기 무단 투기', 1)])
+
+        self.like(self.trash, self.users[:1])  # 좋아요 취소 → 0건
+        with self.captureOnCommitCallbacks(execute=True):
+            Grievance.objects.get(pk=self.road.pk).delete()
+        self.assertEqual(self.top(area=self.area.pk), [])
+
+    def test_reconcile_rebuilds_from_database(self):
+        from apps.grievances.leaderboards import GrievanceLeaderboard
+
+        cache.clear()
+        self.assertEqual(self.top(area=self.area.pk), [])
+
+        stats = GrievanceLeaderboard.reconcile()
+        self.assertEqual(stats['drift'], stats['keys'])
+        self.assertEqual(self.top(area=self.area.pk), [('도로 파손', 2), ('쓰레기 무단 투기', 1)])
+        overall = self.top()
+        self.assertEqual(overall[0], ('도로 파손', 2))
+        self.assertCountEqual(overall[1:], [('다른 구역 민원', 1), ('쓰레기 무단 투기', 1)])  # 비공개 제외
+        self.assertEqual(GrievanceLeaderboard.reconcile()['drift'], 0)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class NeighbourhoodFeedTest(TestCase):
+    """우리 동네 피드 (인접 구역 범위, 키 채움 / 생성·비공개 전환·삭제 반영, 페이지, 조회 쿼리 수)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        from datetime import timedelta
+        from django.utils import timezone
+
+        cls.area = Area.objects.get(name='강남구')
+        cls.near = Area.objects.get(name='서초구')
+        cls.far = Area.objects.get(name='은평구')
+        cls.area.neighbours.set([cls.near])
+        cls.resident = CustomUser.objects.create_user(email='resident@baro.app', password='pw', area=cls.area)
+
+        def create(title, area, minutes_ago, visibility='public'):
+            grievance = Grievance.objects.create(
+                user=cls.resident, title=title, content='내용', visibility=visibility,
+                location=area.name, latitude=37.5, longitude=127.0, area=area,
+            )
+            # 접수 시각을 분 단위로 벌려 정렬 고정 (시그널을 거치지 않는 UPDATE)
+            Grievance.objects.filter(pk=grievance.pk).update(created_at=timezone.now() - timedelta(minutes=minutes_ago))
+            return grievance
+        cls.home = create('우리 구역 민원', cls.area, 30)
+        cls.next_door = create('인접 구역 민원', cls.near, 20)
+        cls.secret = create('비공개 민원', cls.area, 10, visibility='private')
+        cls.elsewhere = create('먼 구역 민원', cls.far, 5)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.resident)
+
+    def feed(self, **params):
+        response = self.client.get('/api/grievances/neighbourhood/', params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def titles(self, **params):
+        return [item['title'] for item in self.feed(**params)['results']]
+
+    def test_area_and_neighbours_only(self):
+        self.assertEqual(self.titles(), ['인접 구역 민원', '우리 구역 민원'])
+        # 채워진 키: 캐시 1회 외 DB는 민원 PK 배치 조회 + 이미지 / 좋아요 여부 배치 조회
+        with self.assertNumQueries(3):
+            self.assertEqual(self.titles(), ['인접 구역 민원', '우리 구역 민원'])
+
+    def test_signals_update_materialized_feed(self):
+        self.titles()  # 키 채움
+        with self.captureOnCommitCallbacks(execute=True):
+            created = Grievance.objects.create(
+                user=self.resident, title='새 민원', content='내용', location=self.near.name,
+                latitude=37.5, longitude=127.0, area=self.near,
+            )
+        self.assertEqual(self.titles(), ['새 민원', '인접 구역 민원', '우리 구역 민원'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            created.visibility = 'private'
+            created.save()
+        self.assertEqual(self.titles(), ['인접 구역 민원', '우리 구역 민원'])
+
+        home = Grievance.objects.get(pk=self.home.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            home.area = self.far
+            home.save()
+        self.assertEqual(self.titles(), ['인접 구역 민원'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Grievance.objects.get(pk=self.next_door.pk).delete()
+        self.assertEqual(self.titles(), [])
+
+    def test_pagination_and_missing_area(self):
+        first = self.feed(limit=1)
+        self.assertEqual([item['title'] for item in first['results']], ['인접 구역 민원'])
+        second = self.feed(limit=1, before=first['next'])
+        self.assertEqual([item['title'] for item in second['results']], ['우리 구역 민원'])
+        self.assertEqual(self.feed(limit=1, before=second['next']), {'next': None, 'results': []})
+        self.assertIsNone(self.feed(limit=5)['next'])
+
+        self.client.force_authenticate(CustomUser.objects.create_user(email='nomad@baro.app', password='pw'))
+        self.assertEqual(self.client.get('/api/grievances/neighbourhood/').status_code, 400)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class DuplicateDetectionTest(TestCase):
+    """중복 민원 감지 (반경 / 기간 / 제목 유사도 / 완료 제외, 생성 시 409)"""
+
+    LAT, LNG = 37.4979, 127.0276
+
+    @classmethod
+    def setUpTestData(cls):
+        from datetime import timedelta
+        from django.utils import timezone
+
+        cls.area = Area.objects.get(name='강남구')
+        cls.user = CustomUser.objects.create_user(email='reporter@baro.app', password='pw')
+
+        def create(title, lat=cls.LAT, lng=cls.LNG, **fields):
+            return Grievance.objects.create(
+                user=cls.user, title=title, content='내용', category='traffic',
+                location='강남구', latitude=lat, longitude=lng, area=cls.area, **fields
+            )
+        cls.existing = create('강남역 앞 도로 포트홀')
+        create('강남역 앞 도로 포트홀', status='resolved')
+        create('강남역 앞 도로 포트홀', lat=cls.LAT + 0.01)  # 약 1.1km
+        create('가로등 고장')
+        old = create('강남역 앞 도로 포트홀')
+        Grievance.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=60))
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def test_duplicates_endpoint(self):
+        response = self.client.get('/api/grievances/duplicates/', {
+            'title': '강남역 도로 포트홀', 'lat': self.LAT + 0.0005, 'lng': self.LNG,
+        })
+        self.assertEqual(response.status_code, 200)
+        results = response.json()['results']
+        self.assertEqual([item['id'] for item in results], [str(self.existing.pk)])
+        self.assertGreater(results[0]['similarity'], 0.3)
+        self.assertLess(results[0]['distance_m'], 100)
+
+        self.assertEqual(self.client.get('/api/grievances/duplicates/', {'lat': self.LAT, 'lng': self.LNG}).status_code, 400)
+
+    def test_create_with_duplicate_check(self):
+        payload = {
+            'title': '강남역 도로 포트홀', 'content': '큰 구멍', 'category': 'traffic',
+            'latitude': self.LAT, 'longitude': self.LNG, 'visibility': 'public',
+        }
+        response = self.client.post('/api/grievances/', {**payload, 'check_duplicates': True}, format='json')
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['details']['duplicates'][0]['id'], str(self.existing.pk))
+
+        # 확인 없이(기본값) 제출하면 그대로 생성
+        with mock.patch('apps.grievances.services.ReverseGeocoder.get_location_name', return_value='강남구'):
+            response = self.client.post('/api/grievances/', payload, format='json')
+        self.assertEqual(response.status_code, 201)
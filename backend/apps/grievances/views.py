@@ -7,32 +7,69 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
-from django.db.models import Count, Prefetch
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Prefetch, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.core.exceptions import ValidationError
+from django.http import Http404, StreamingHttpResponse
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 
-from apps.grievances.models import Grievance, GrievanceImage, Like, Area, GrievanceSecret
+from apps.grievances.models import (
+    Grievance, GrievanceImage, Like, Area, GrievanceSecret, GrievanceEvent,
+    ArchivedGrievance, ArchivedGrievanceImage, ArchivedLike,
+)
+from apps.grievances.archive import archived_grievance_count
+from apps.grievances.feeds import NeighbourhoodFeed
+from apps.grievances.leaderboards import GrievanceLeaderboard
 from apps.grievances.serializers import (
     GrievanceListSerializer,
+    GrievanceListRowSerializer,
     GrievanceDetailSerializer,
     GrievanceCreateSerializer,
+    GrievanceEventSerializer,
+    duplicate_candidates_data,
+    GrievanceEventCompactSerializer,
     AreaSerializer
 )
-from apps.grievances.permissions import IsOwnerOrReadOnly
-from apps.grievances.services import NearbyGrievanceService
-from core.pagination import StandardResultsSetPagination
+from apps.grievances.permissions import IsOwnerOrReadOnly, IsAreaLeaderOrVerifiedOfficial
+from apps.grievances.mixins import ConditionalGetMixin, VersionedResponseCacheMixin
+from apps.grievances.services import (
+    NearbyGrievanceService,
+    GrievanceVersionService,
+    GrievanceExportService,
+    GrievanceEventService,
+    HotScoreService,
+    DuplicateGrievanceService,
+)
+from apps.notifications.services import NotificationOutboxService
+from core.pagination import HotOrderingFilter, HotScoreCursorPagination, StandardResultsSetPagination
+from core.timing import timed
+
+
+def like_count_subquery():
+    """민원별 좋아요 수 (상관 서브쿼리, GROUP BY 없이 페이지 행에만 계산)"""
+    counts = Like.objects.filter(grievance=OuterRef('pk')).order_by().values('grievance').annotate(
+        total=Count('pk')
+    ).values('total')
+    return Coalesce(Subquery(counts), 0)
 
 
-class AreaViewSet(viewsets.ReadOnlyModelViewSet):
+class AreaViewSet(VersionedResponseCacheMixin, viewsets.ReadOnlyModelViewSet):
     """
     행정동 ViewSet (읽기 전용)
 
     엔드포인트:
     - list: GET /api/areas/ - 행정동 목록
     - retrieve: GET /api/areas/{id}/ - 행정동 상세 (담당자, 민원 수 포함)
+
+    응답 캐시:
+    - 사용자별 필드가 없으므로 로그인 여부와 무관하게 캐시
+    - 민원 생성/삭제/구역 변경 및 구역 정보 변경 시 버전 증가로 무효화
     """
     queryset = Area.objects.select_related('leader').annotate(
-        grievance_count=Count('grievances')  # 민원 개수 계산
+        grievance_count=Count('grievances') + archived_grievance_count()  # 민원 개수 (보관 민원 포함)
     ).order_by('name')
 
     serializer_class = AreaSerializer
@@ -41,8 +78,30 @@ class AreaViewSet(viewsets.ReadOnlyModelViewSet):
     search_fields = ['name']
     ordering_fields = ['name', 'grievance_count', 'created_at']
 
+    response_cache_anonymous_only = False
+
+    def get_version_keys(self):
+        """목록: 전체 버전 / 상세: 해당 구역 버전 (+ 구역 메타)"""
+        if self.action == 'retrieve':
+            key = GrievanceVersionService.area_key(self.kwargs[self.lookup_field])
+        else:
+            key = GrievanceVersionService.GLOBAL_KEY
+        return [key, GrievanceVersionService.AREAS_KEY]
+
+    def list(self, request, *args, **kwargs):
+        cached = self.get_cached_response(request)
+        if cached is not None:
+            return cached
+        return super().list(request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        cached = self.get_cached_response(request)
+        if cached is not None:
+            return cached
+        return super().retrieve(request, *args, **kwargs)
 
-class GrievanceViewSet(viewsets.ModelViewSet):
+
+class GrievanceViewSet(ConditionalGetMixin, VersionedResponseCacheMixin, viewsets.ModelViewSet):
     """
     민원 CRUD ViewSet
 
@@ -56,6 +115,27 @@ class GrievanceViewSet(viewsets.ModelViewSet):
     커스텀 액션:
     - like: PATCH /api/grievances/{id}/like/ - 좋아요 토글
     - nearby: GET /api/grievances/nearby/?lat=&lng=&radius= - 주변 민원
+    - duplicates: GET /api/grievances/duplicates/?title=&lat=&lng= - 접수 전 중복 후보 (반경 + 기간 + 제목 유사도)
+    - export: GET /api/grievances/export/?export_format=csv|ndjson&gzip=1 - 대용량 내보내기 (담당자/관리자)
+    - top: GET /api/grievances/top/?area=&category=&limit=10 - 좋아요 순위 (공개 + 미완료, Redis sorted set)
+    - neighbourhood: GET /api/grievances/neighbourhood/?limit=20&before= - 우리 동네 피드 (내 구역 + 인접 구역, 로그인)
+    - timeline: GET /api/grievances/{id}/timeline/ - 접수 / 상태 변경 / 수정 이벤트 (시간순)
+      상세 응답에 최근 이벤트 포함: GET /api/grievances/{id}/?events=N (최신순, 최대 EMBED_EVENTS_MAX건)
+
+    인기순 (list?ordering=hot):
+    - 미리 계산된 hot_score 인덱스 순서 + 키셋(커서) 페이징 (HotScoreCursorPagination)
+    - 점수는 좋아요 / 상태 변경 시 갱신, '최근 좋아요' 기간 경과분은 refresh_hot_scores 배치
+
+    조건부 GET (list, retrieve):
+    - ETag / Last-Modified를 Redis 버전 카운터로 계산 (DB 조회 없음)
+    - If-None-Match / If-Modified-Since 일치 시 직렬화 없이 304 반환
+
+    응답 캐시 (list, 비로그인):
+    - 비로그인 사용자는 공개 민원만 보므로 응답이 모두 동일 → 렌더링된 JSON 캐시
+    - 민원 생성/수정/삭제/좋아요/상태 변경 시 버전 증가로 즉시 무효화
+
+    요청 제한 (core.throttling, 로그인 유저 / 비로그인 IP별 토큰 버킷):
+    - 생성 / 수정 / 삭제 / 상태 변경: write, 좋아요: like, 비공개 패스워드 확인: password
     """
 
     # 쿼리 최적화 (N+1 문제 방지)
@@ -64,39 +144,99 @@ class GrievanceViewSet(viewsets.ModelViewSet):
     ).annotate(
         like_count=Count('likes')  # 좋아요 개수 미리 계산
     )
+    # 인기순: 전체 집계(GROUP BY) 대신 페이지 행에만 좋아요 수 계산 → hot_score 인덱스 순서 그대로 LIMIT
+    hot_queryset = Grievance.objects.select_related('user', 'area').annotate(like_count=like_count_subquery())
 
     permission_classes = []  # 임시로 인증 비활성화 (테스트용)
     # pagination_class = None  # ✅ 페이지네이션 활성화됨 (Phase 2 최적화)
     parser_classes = [MultiPartParser, FormParser, JSONParser]  # 모든 액션에서 multipart 지원
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, SearchFilter, HotOrderingFilter]  # ordering=hot → hot_score 순서
     filterset_fields = ['status', 'location', 'category', 'visibility', 'area']
     search_fields = ['title', 'content', 'location']  # 검색 가능 필드
     ordering_fields = ['created_at', 'updated_at', 'like_count']
     ordering = ['-created_at']  # 최신순 정렬
-
-    def get_queryset(self):
+    EMBED_EVENTS_MAX = 20  # 상세 응답에 포함할 최근 이벤트 최대 수
+    TOP_LIMIT_MAX = 50  # 좋아요 순위 최대 조회 수
+    FEED_LIMIT_MAX = 50  # 우리 동네 피드 페이지 최대 크기
+    DUPLICATE_LIMIT_MAX = 10  # 중복 후보 최대 조회 수
+    DUPLICATE_RADIUS_MAX_M = 1000  # 중복 후보 최대 반경 (m)
+    throttle_scopes = {
+        'create': 'write',
+        'update': 'write',
+        'partial_update': 'write',
+        'destroy': 'write',
+        'update_status': 'write',
+        'like': 'like',
+        'verify_password': 'password',
+    }
+
+    def get_visibility_filter(self):
         """
-        비공개 민원 필터링
+        비공개 민원 필터링 조건 (민원 / 보관 민원 공용)
         - 공개 민원: 모두에게 노출
         - 비공개 민원: 작성자, 담당자, 인증된 정치인/관리자만 노출
         """
-        queryset = super().get_queryset()
         user = self.request.user
 
         # 인증되지 않은 사용자: 공개 민원만
         if not user.is_authenticated:
-            return queryset.filter(visibility='public')
+            return Q(visibility='public')
 
         # 인증된 사용자: 공개 민원 + 접근 가능한 비공개 민원
-        from django.db.models import Q
-
         accessible_private = Q(visibility='private') & (
             Q(user=user) |  # 작성자 본인
             Q(area__leader=user) |  # 지역 담당자
             (Q(user__role__in=['admin', 'politician']) & Q(user__is_verified=True))  # 인증된 정치인/관리자
         )
+        return Q(visibility='public') | accessible_private
+
+    def is_hot_ordering(self):
+        return self.action == 'list' and self.request.query_params.get('ordering') == 'hot'
 
-        return queryset.filter(Q(visibility='public') | accessible_private)
+    @property
+    def paginator(self):
+        """ordering=hot이면 키셋 페이징"""
+        if not hasattr(self, '_paginator') and self.is_hot_ordering():
+            self._paginator = HotScoreCursorPagination()
+        return super().paginator
+
+    def get_queryset(self):
+        """비공개 민원 필터링 + 좋아요 여부 annotate"""
+        if self.is_hot_ordering():
+            queryset = self.hot_queryset.all()
+        else:
+            queryset = super().get_queryset()
+        queryset = queryset.filter(self.get_visibility_filter())
+        user = self.request.user
+
+        if not user.is_authenticated:
+            return queryset
+
+        # 좋아요 여부 미리 계산 (N+1 문제 방지, GrievanceListSerializer.get_is_liked에서 사용)
+        return queryset.annotate(
+            _is_liked=Exists(Like.objects.filter(grievance=OuterRef('pk'), user=user))
+        )
+
+    def get_archived_object(self):
+        """
+        보관 민원 조회 (상세 조회에서 grievances에 없을 때)
+        - 필드 구성이 같아 GrievanceDetailSerializer로 동일한 JSON 반환
+        - like_count는 보관 시점 값
+        """
+        queryset = ArchivedGrievance.objects.select_related('user', 'area').prefetch_related(
+            Prefetch('images', queryset=ArchivedGrievanceImage.objects.order_by('order'))
+        ).filter(self.get_visibility_filter())
+
+        user = self.request.user
+        if user.is_authenticated:
+            queryset = queryset.annotate(
+                _is_liked=Exists(ArchivedLike.objects.filter(grievance=OuterRef('pk'), user=user))
+            )
+
+        try:
+            return queryset.get(pk=self.kwargs[self.lookup_field])
+        except (ArchivedGrievance.DoesNotExist, ValueError, ValidationError):
+            raise Http404
 
     def get_serializer_class(self):
         """액션별 시리얼라이저 선택"""
@@ -106,6 +246,88 @@ class GrievanceViewSet(viewsets.ModelViewSet):
             return GrievanceDetailSerializer
         return GrievanceListSerializer
 
+    def list_response(self, queryset):
+        """
+        목록 고속 응답 (list, nearby 공용)
+        - 모델 인스턴스 대신 .values() 행으로 페이징 후 GrievanceListRowSerializer로 직렬화
+        - JSON 형식은 GrievanceListSerializer와 동일
+        """
+        rows = queryset.prefetch_related(None).values(*GrievanceListRowSerializer.value_fields)
+
+        page = self.paginate_queryset(rows)
+        context = self.get_serializer_context()
+        if page is not None:
+            serializer = GrievanceListRowSerializer(page, context=context)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = GrievanceListRowSerializer(rows, context=context)
+        return Response(serializer.data)
+
+    def get_version_keys(self):
+        """
+        조건부 GET / 응답 캐시에 사용할 버전 키
+        - 상세 / 타임라인: 해당 민원 버전 (이벤트는 민원 저장과 함께 기록되므로 같은 버전으로 무효화)
+        - area 필터 목록: 해당 구역 버전
+        - 그 외 목록: 전체 버전
+        구역 메타(담당자, 이름)는 is_accessible/area_name에 영향을 주므로 항상 포함
+        """
+        if self.action in ('retrieve', 'timeline'):
+            key = GrievanceVersionService.item_key(self.kwargs[self.lookup_field])
+        else:
+            area = self.request.query_params.get('area', '')
+            if area.isdigit():
+                key = GrievanceVersionService.area_key(area)
+            else:
+                key = GrievanceVersionService.GLOBAL_KEY
+        return [key, GrievanceVersionService.AREAS_KEY]
+
+    def list(self, request, *args, **kwargs):
+        """민원 목록 (고속 직렬화 경로, 조건부 GET, 비로그인 응답 캐시)"""
+        not_modified = self.check_not_modified(request)
+        if not_modified is not None:
+            return not_modified
+
+        cached = self.get_cached_response(request)
+        if cached is not None:
+            return cached
+
+        queryset = self.filter_queryset(self.get_queryset())
+        return self.list_response(queryset)
+
+    def get_object_or_archived(self):
+        try:
+            return self.get_object()
+        except Http404:
+            # 보관된 오래된 완료 민원
+            return self.get_archived_object()
+
+    def retrieve(self, request, *args, **kwargs):
+        """민원 상세 (조건부 GET 지원, ?events=N이면 최근 이벤트 N건 포함)"""
+        not_modified = self.check_not_modified(request)
+        if not_modified is not None:
+            return not_modified
+
+        instance = self.get_object_or_archived()
+        serializer = self.get_serializer(instance)
+        data = serializer.data
+
+        limit = request.query_params.get('events', '')
+        if limit.isdigit() and int(limit) > 0:
+            events = GrievanceEvent.objects.recent().filter(
+                grievance_id=instance.pk
+            )[:min(int(limit), self.EMBED_EVENTS_MAX)]
+            data['events'] = GrievanceEventCompactSerializer(events, many=True).data
+        return Response(data)
+
+    def perform_update(self, serializer):
+        """수정 + 타임라인 수정 이벤트 (바뀐 필드가 있을 때만)"""
+        before = GrievanceEventService.snapshot(serializer.instance)
+        with transaction.atomic():
+            grievance = serializer.save()
+            GrievanceEventService.record_edit(grievance, before, actor=self.request.user)
+            if grievance.status != before['status']:
+                HotScoreService.refresh([grievance.pk])
+
     def create(self, request, *args, **kwargs):
         """
         민원 생성 후 GrievanceListSerializer로 응답 반환
@@ -152,8 +374,13 @@ class GrievanceViewSet(viewsets.ModelViewSet):
         else:
             is_liked = True
 
+        # 좋아요 수/여부 변경 → 인기 점수 갱신 + 버전 증가 (Like는 시그널 미사용)
+        HotScoreService.refresh([grievance.pk])
+        GrievanceVersionService.bump_grievance(grievance.pk, [grievance.area_id])
+
         # 업데이트된 민원 반환 (기본 queryset 사용하여 like_count 포함)
         grievance = self.get_queryset().get(pk=grievance.pk)
+        GrievanceLeaderboard.update(grievance, grievance.like_count)
 
         serializer = self.get_serializer(grievance)
         return Response(serializer.data)
@@ -193,14 +420,178 @@ class GrievanceViewSet(viewsets.ModelViewSet):
         # like_count annotate 추가
         queryset = queryset.annotate(like_count=Count('likes'))
 
-        # 페이징 적용
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+        # 페이징 + 고속 직렬화
+        return self.list_response(queryset)
 
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+    @action(detail=False, methods=['get'])
+    def duplicates(self, request):
+        """
+        중복 후보 (접수 전 확인 → 기존 민원 좋아요 제안)
+        Query params:
+        - title: 제목 (필수)
+        - lat / lng: 좌표 (필수)
+        - radius: 반경 (m, 기본 DUPLICATE_RADIUS_M, 최대 DUPLICATE_RADIUS_MAX_M)
+        - limit: 개수 (기본 5, 최대 DUPLICATE_LIMIT_MAX)
+
+        최근 DUPLICATE_WINDOW_DAYS일 공개 + 미완료 민원 중 제목 유사도 높은 순 (similarity, distance_m 포함)
+        """
+        title = request.query_params.get('title', '').strip()
+        if not title:
+            return Response({'error': 'title 파라미터가 필요합니다'}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            lat = float(request.query_params['lat'])
+            lng = float(request.query_params['lng'])
+            radius = float(request.query_params.get('radius', settings.DUPLICATE_RADIUS_M))
+        except KeyError:
+            return Response({'error': 'lat와 lng 파라미터가 필요합니다'}, status=status.HTTP_400_BAD_REQUEST)
+        except ValueError:
+            return Response({'error': 'lat, lng, radius는 숫자여야 합니다'}, status=status.HTTP_400_BAD_REQUEST)
+
+        limit = request.query_params.get('limit', '5')
+        if not limit.isdigit() or int(limit) < 1:
+            return Response({'error': 'limit은 1 이상의 숫자여야 합니다'}, status=status.HTTP_400_BAD_REQUEST)
+
+        candidates = DuplicateGrievanceService.candidates(
+            title, lat, lng, radius_m=min(max(radius, 1), self.DUPLICATE_RADIUS_MAX_M)
+        )
+        data = duplicate_candidates_data(
+            candidates, self.get_serializer_context(), min(int(limit), self.DUPLICATE_LIMIT_MAX)
+        )
+        return Response({'results': data})
+
+    @action(detail=False, methods=['get'])
+    def top(self, request):
+        """
+        좋아요 순위 (공개 + 미완료 민원)
+        Query params:
+        - area: 구역 ID (선택)
+        - category: 카테고리 (선택, area와 함께 사용 가능)
+        - limit: 개수 (기본 10, 최대 TOP_LIMIT_MAX)
+
+        순위는 Redis 1회 조회, 민원 행은 PK 배치 조회 1회 (좋아요 수는 순위 점수 사용, 집계 없음)
+        """
+        area = request.query_params.get('area') or None
+        category = request.query_params.get('category') or None
+        limit = request.query_params.get('limit', '10')
+
+        if area is not None and not area.isdigit():
+            return Response({'error': 'area는 숫자여야 합니다'}, status=status.HTTP_400_BAD_REQUEST)
+        valid_categories = [choice[0] for choice in Grievance.CATEGORY_CHOICES]
+        if category is not None and category not in valid_categories:
+            return Response(
+                {'error': f'유효하지 않은 카테고리입니다. 가능한 값: {", ".join(valid_categories)}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not limit.isdigit() or int(limit) < 1:
+            return Response({'error': 'limit은 1 이상의 숫자여야 합니다'}, status=status.HTTP_400_BAD_REQUEST)
+        limit = min(int(limit), self.TOP_LIMIT_MAX)
+
+        ranked = GrievanceLeaderboard.top(limit, int(area) if area else None, category)
+
+        fields = [field for field in GrievanceListRowSerializer.value_fields if field != 'like_count']
+        queryset = Grievance.objects.filter(pk__in=[grievance_id for grievance_id, _ in ranked], visibility='public')
+        rows = {str(row['id']): row for row in queryset.values(*fields)}
+        # 순위 순서 유지 (보정 전 삭제된 민원은 건너뜀)
+        ordered = [
+            {**rows[grievance_id], 'like_count': total}
+            for grievance_id, total in ranked if grievance_id in rows
+        ]
+
+        serializer = GrievanceListRowSerializer(ordered, context=self.get_serializer_context())
+        return Response({'results': serializer.data})
+
+    @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
+    def neighbourhood(self, request):
+        """
+        우리 동네 피드 (내 거주/담당 구역 + 인접 구역의 공개 민원, 최신순)
+        Query params:
+        - limit: 개수 (기본 20, 최대 FEED_LIMIT_MAX)
+        - before: 이전 페이지 응답의 next 값 (없으면 첫 페이지)
+
+        구역별 피드는 캐시 1회 조회, 민원 행은 PK 배치 조회 1회 (apps.grievances.feeds)
+        """
+        area_id = request.user.area_id
+        if area_id is None:
+            return Response(
+                {'error': '거주/담당 지역이 설정되지 않았습니다'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        limit = request.query_params.get('limit', '20')
+        before = request.query_params.get('before') or None
+        if not limit.isdigit() or int(limit) < 1:
+            return Response({'error': 'limit은 1 이상의 숫자여야 합니다'}, status=status.HTTP_400_BAD_REQUEST)
+        if before is not None and not before.isdigit():
+            return Response({'error': 'before는 숫자여야 합니다'}, status=status.HTTP_400_BAD_REQUEST)
+        limit = min(int(limit), self.FEED_LIMIT_MAX)
+
+        items = NeighbourhoodFeed.page(area_id, limit, int(before) if before else None)
+
+        queryset = Grievance.objects.filter(
+            pk__in=[grievance_id for grievance_id, _ in items], visibility='public'
+        ).annotate(like_count=like_count_subquery())
+        rows = {str(row['id']): row for row in queryset.values(*GrievanceListRowSerializer.value_fields)}
+        # 피드 순서 유지 (TTL 전 보관 / 삭제된 민원은 건너뜀)
+        ordered = [rows[grievance_id] for grievance_id, _ in items if grievance_id in rows]
+
+        serializer = GrievanceListRowSerializer(ordered, context=self.get_serializer_context())
+        return Response({
+            'next': items[-1][1] if len(items) == limit else None,
+            'results': serializer.data,
+        })
+
+    @action(detail=False, methods=['get'], permission_classes=[IsAreaLeaderOrVerifiedOfficial])
+    def export(self, request):
+        """
+        민원 내보내기 (CSV / NDJSON 스트리밍)
+        Query params:
+        - export_format: csv (기본) 또는 ndjson
+        - gzip: 1이면 gzip 압축 (.gz 파일)
+        - 목록과 동일한 필터/검색/정렬 파라미터 (status, area, search, ordering 등)
+
+        권한:
+        - 인증된 정치인/관리자: 필터 조건의 전체 민원
+        - 구역 담당자: 담당 구역 민원만
+        """
+        export_format = request.query_params.get('export_format', 'csv')
+        if export_format not in GrievanceExportService.FORMATS:
+            return Response(
+                {'error': f'유효하지 않은 export_format입니다. 가능한 값: {", ".join(GrievanceExportService.FORMATS)}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        use_gzip = request.query_params.get('gzip') in ('1', 'true')
+
+        queryset = self.filter_queryset(self.get_queryset())
+
+        user = request.user
+        if not (user.role in ['admin', 'politician'] and user.is_verified):
+            queryset = queryset.filter(area__leader=user)
+
+        exporter = GrievanceExportService(queryset, export_format=export_format, use_gzip=use_gzip)
+        response = StreamingHttpResponse(exporter.stream(), content_type=exporter.content_type)
+        response['Content-Disposition'] = f'attachment; filename="{exporter.filename}"'
+        return response
+
+    @action(detail=True, methods=['get'])
+    def timeline(self, request, pk=None):
+        """
+        민원 타임라인 (접수 / 상태 변경 / 수정, 시간순)
+        - 상세와 같은 접근 권한 (비공개 민원은 작성자 / 담당자 / 인증된 정치인·관리자), 보관 민원 포함
+        - 이벤트는 행위자 JOIN 쿼리 1회 (이벤트 수와 무관)
+        - 조건부 GET: 해당 민원 버전 기준
+        """
+        not_modified = self.check_not_modified(request)
+        if not_modified is not None:
+            return not_modified
+
+        instance = self.get_object_or_archived()
+        events = GrievanceEvent.objects.timeline().filter(grievance_id=instance.pk)
+        return Response({
+            'grievance_id': str(instance.pk),
+            'status': instance.status,
+            'events': GrievanceEventSerializer(events, many=True).data,
+        })
 
     @action(detail=True, methods=['post'])
     def verify_password(self, request, pk=None):
@@ -229,7 +620,8 @@ class GrievanceViewSet(viewsets.ModelViewSet):
         # GrievanceSecret 확인
         try:
             secret = grievance.secret
-            is_valid = secret.check_password(password)
+            with timed('hash'):
+                is_valid = secret.check_password(password)
 
             if is_valid:
                 # 패스워드 맞으면 민원 상세 반환
@@ -265,7 +657,7 @@ class GrievanceViewSet(viewsets.ModelViewSet):
         user = request.user
 
         # 권한 확인
-        is_area_leader = hasattr(grievance.area, 'leader') and grievance.area.leader == user
+        is_area_leader = grievance.area is not None and grievance.area.leader_id == user.pk
         is_verified_official = user.role in ['admin', 'politician'] and user.is_verified
 
         if not (is_area_leader or is_verified_official):
@@ -290,6 +682,7 @@ class GrievanceViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        old_status = grievance.status
         grievance.status = new_status
 
         # completed_at 업데이트 (선택)
@@ -300,7 +693,13 @@ class GrievanceViewSet(viewsets.ModelViewSet):
             from django.utils import timezone
             grievance.completed_at = timezone.now()
 
-        grievance.save(update_fields=['status', 'completed_at'])
+        # 상태 변경 + 타임라인 이벤트 + 알림 아웃박스 기록을 한 트랜잭션으로 (발송은 dispatch_notifications 워커)
+        with transaction.atomic():
+            grievance.save(update_fields=['status', 'completed_at'])
+            if new_status != old_status:
+                GrievanceEventService.record_status_change(grievance, old_status, actor=user)
+                HotScoreService.refresh([grievance.pk])
+                NotificationOutboxService.enqueue_status_change(grievance, old_status, actor=user)
 
         return Response({
             'status': grievance.status,
@@ -0,0 +1,62 @@
+"""
+모니터링 관리자 페이지
+"""
+
+import json
+
+from django.contrib import admin
+from django.db.models import Count, OuterRef, Subquery
+from django.utils.html import format_html
+
+from apps.monitoring.models import SlowQuery
+
+
+@admin.register(SlowQuery)
+class SlowQueryAdmin(admin.ModelAdmin):
+    """느린 쿼리 (실행 계획 포함)"""
+    list_display = ['created_at', 'kind', 'view_name', 'duration_ms', 'has_plan', 'same_shape_count', 'sql_preview']
+    list_filter = ['kind', 'view_name', 'database', 'created_at']
+    search_fields = ['sql', 'view_name', 'path', 'fingerprint']
+    date_hierarchy = 'created_at'
+    ordering = ['-created_at']
+    readonly_fields = [
+        'created_at', 'view_name', 'method', 'path', 'query_params', 'database', 'kind',
+        'fingerprint', 'duration_ms', 'sql', 'params', 'plan_display', 'explain_error',
+    ]
+    exclude = ['plan']
+
+    def get_queryset(self, request):
+        """N+1 쿼리 방지: 같은 지문(쿼리 형태)의 기록 수를 annotate로 미리 계산"""
+        queryset = super().get_queryset(request)
+        same_shape = SlowQuery.objects.filter(
+            fingerprint=OuterRef('fingerprint')
+        ).values('fingerprint').annotate(count=Count('id')).values('count')
+        return queryset.annotate(_same_shape_count=Subquery(same_shape))
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_plan(self, obj):
+        return obj.plan is not None
+    has_plan.boolean = True
+    has_plan.short_description = '실행 계획'
+
+    def same_shape_count(self, obj):
+        """같은 형태 쿼리 기록 수 (annotate 사용)"""
+        return obj._same_shape_count
+    same_shape_count.short_description = '동일 형태'
+    same_shape_count.admin_order_field = '_same_shape_count'
+
+    def sql_preview(self, obj):
+        return obj.sql[:120]
+    sql_preview.short_description = 'SQL'
+
+    def plan_display(self, obj):
+        """실행 계획 (EXPLAIN JSON)"""
+        if obj.plan is None:
+            return '-'
+        return format_html('<pre style="white-space: pre-wrap;">{}</pre>', json.dumps(obj.plan, indent=2, ensure_ascii=False))
+    plan_display.short_description = '실행 계획'
@@ -0,0 +1,45 @@
+"""
+읽기 복제본 상태 확인
+- 복제본별 접속 여부 / 복제 지연 / 라우팅 대상 여부 출력
+- --watch: 주기적으로 반복 (복제 지연 재현 테스트 시 사용)
+
+사용 예:
+    DB_REPLICA_HOSTS=localhost:5433 python manage.py check_replicas
+    python manage.py check_replicas --watch 2
+"""
+
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.db_router import ReplicaHealth
+
+
+class Command(BaseCommand):
+    help = '읽기 복제본 접속 / 복제 지연 확인'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--watch', type=float, metavar='SECONDS', help='지정한 간격으로 반복 출력')
+
+    def handle(self, *args, **options):
+        if not settings.DATABASE_REPLICAS:
+            raise CommandError('설정된 복제본이 없습니다 (DB_REPLICA_HOSTS)')
+
+        while True:
+            ReplicaHealth.reset()
+            for alias in settings.DATABASE_REPLICAS:
+                database = settings.DATABASES[alias]
+                lag = ReplicaHealth.lag(alias)
+                if lag is None:
+                    status = self.style.ERROR('접속 불가 → primary 사용')
+                elif lag > settings.REPLICA_MAX_LAG_SECONDS:
+                    status = self.style.WARNING(f'지연 {lag:.2f}s > {settings.REPLICA_MAX_LAG_SECONDS}s → 제외')
+                else:
+                    status = self.style.SUCCESS(f'지연 {lag:.2f}s → 사용')
+                self.stdout.write(f'{alias:<12} {database["HOST"]}:{database["PORT"]}  {status}')
+
+            if not options['watch']:
+                break
+            time.sleep(options['watch'])
+            self.stdout.write('')
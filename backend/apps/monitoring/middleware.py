@@ -0,0 +1,41 @@
+"""
+모니터링 미들웨어
+"""
+
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.signals import request_finished
+from django.db import connections
+
+from apps.monitoring.services import SlowQueryCollector, SlowQueryRecorder, defer, record_pending
+
+
+class SlowQueryMiddleware:
+    """
+    느린 쿼리 수집 (opt-in: SLOW_QUERY_ENABLED=True)
+    - 요청 중 SLOW_QUERY_THRESHOLD_MS 이상 걸린 쿼리를 뷰/경로/파라미터와 함께 기록
+    - EXPLAIN / 저장은 응답 전송이 끝난 뒤 request_finished에서 실행
+      (응답 지연에 포함되지 않고, 수집 대상 쿼리에도 포함되지 않음)
+    - 비활성화 시 미들웨어 체인에서 제외되어 비용 없음
+    """
+
+    def __init__(self, get_response):
+        if not settings.SLOW_QUERY_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.recorder = SlowQueryRecorder()
+        request_finished.connect(record_pending, dispatch_uid='baro.slow_query')
+
+    def __call__(self, request):
+        collectors = [SlowQueryCollector(connection.alias) for connection in connections.all()]
+        with ExitStack() as stack:
+            for connection, collector in zip(connections.all(), collectors):
+                stack.enter_context(connection.execute_wrapper(collector))
+            response = self.get_response(request)
+
+        captured = [entry for collector in collectors for entry in collector.captured]
+        if captured:
+            defer(self.recorder, request, captured)
+        return response
@@ -0,0 +1,39 @@
+# Generated by Django 5.0.1 on 2026-10-19 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SlowQuery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('view_name', models.CharField(blank=True, db_index=True, max_length=200, verbose_name='뷰')),
+                ('method', models.CharField(blank=True, max_length=10, verbose_name='HTTP 메서드')),
+                ('path', models.CharField(blank=True, max_length=500, verbose_name='경로')),
+                ('query_params', models.JSONField(blank=True, default=dict, verbose_name='쿼리 파라미터')),
+                ('database', models.CharField(default='default', max_length=50, verbose_name='DB')),
+                ('kind', models.CharField(choices=[('spatial', '공간 검색'), ('search', '텍스트 검색'), ('other', '기타')], db_index=True, default='other', max_length=10, verbose_name='유형')),
+                ('fingerprint', models.CharField(db_index=True, help_text='리터럴을 제거한 SQL의 MD5 (같은 형태의 쿼리 묶기)', max_length=32, verbose_name='쿼리 지문')),
+                ('sql', models.TextField(verbose_name='SQL')),
+                ('params', models.JSONField(blank=True, help_text='SELECT만 저장', null=True, verbose_name='파라미터')),
+                ('duration_ms', models.FloatField(db_index=True, verbose_name='실행 시간(ms)')),
+                ('plan', models.JSONField(blank=True, help_text='EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)', null=True, verbose_name='실행 계획')),
+                ('explain_error', models.CharField(blank=True, max_length=500, verbose_name='EXPLAIN 오류')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='기록 시각')),
+            ],
+            options={
+                'verbose_name': '느린 쿼리',
+                'verbose_name_plural': '느린 쿼리',
+                'db_table': 'slow_queries',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
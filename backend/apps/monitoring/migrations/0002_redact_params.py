@@ -0,0 +1,23 @@
+# Generated by Django 5.0.1 on 2026-10-19 18:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='slowquery',
+            name='params',
+            field=models.JSONField(blank=True, help_text='SELECT만, 값 대신 타입 이름 (개인정보 제외)', null=True, verbose_name='파라미터 타입'),
+        ),
+        migrations.AlterField(
+            model_name='slowquery',
+            name='query_params',
+            field=models.JSONField(blank=True, default=dict, help_text='이름만 (값 제외)', verbose_name='쿼리 파라미터'),
+        ),
+    ]
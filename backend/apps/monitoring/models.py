@@ -0,0 +1,49 @@
+"""
+모니터링 모델
+- 느린 쿼리 기록 (실행 계획 포함)
+"""
+
+from django.db import models
+
+
+class SlowQuery(models.Model):
+    """
+    느린 쿼리 기록
+    SlowQueryMiddleware가 임계값(SLOW_QUERY_THRESHOLD_MS)을 넘은 쿼리를 요청 정보와 함께 저장
+    샘플링된 SELECT는 EXPLAIN (ANALYZE, BUFFERS) 실행 계획 포함
+    """
+
+    KIND_CHOICES = [
+        ('spatial', '공간 검색'),  # ST_* / 거리 연산 (nearby, 구역 매칭)
+        ('search', '텍스트 검색'),  # LIKE / ILIKE (SearchFilter)
+        ('other', '기타'),
+    ]
+
+    view_name = models.CharField('뷰', max_length=200, blank=True, db_index=True)
+    method = models.CharField('HTTP 메서드', max_length=10, blank=True)
+    path = models.CharField('경로', max_length=500, blank=True)
+    query_params = models.JSONField('쿼리 파라미터', default=dict, blank=True, help_text='이름만 (값 제외)')
+
+    database = models.CharField('DB', max_length=50, default='default')
+    kind = models.CharField('유형', max_length=10, choices=KIND_CHOICES, default='other', db_index=True)
+    fingerprint = models.CharField(
+        '쿼리 지문', max_length=32, db_index=True,
+        help_text='리터럴을 제거한 SQL의 MD5 (같은 형태의 쿼리 묶기)'
+    )
+    sql = models.TextField('SQL')
+    params = models.JSONField('파라미터 타입', null=True, blank=True, help_text='SELECT만, 값 대신 타입 이름 (개인정보 제외)')
+    duration_ms = models.FloatField('실행 시간(ms)', db_index=True)
+
+    plan = models.JSONField('실행 계획', null=True, blank=True, help_text='EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)')
+    explain_error = models.CharField('EXPLAIN 오류', max_length=500, blank=True)
+
+    created_at = models.DateTimeField('기록 시각', auto_now_add=True, db_index=True)
+
+    class Meta:
+        db_table = 'slow_queries'
+        verbose_name = '느린 쿼리'
+        verbose_name_plural = '느린 쿼리'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"[{self.get_kind_display()}] {self.view_name or self.path} {self.duration_ms:.0f}ms"
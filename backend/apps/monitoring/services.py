@@ -0,0 +1,199 @@
+"""
+느린 쿼리 수집 서비스
+- 요청 중 임계값을 넘은 쿼리 기록 (connection.execute_wrapper)
+- 응답 전송이 끝난 뒤(request_finished) 샘플링된 SELECT에 EXPLAIN (ANALYZE, BUFFERS) 실행
+  (응답 지연에는 포함되지 않지만 EXPLAIN 동안 워커는 점유됨 → 샘플링 비율로 조절)
+- SLOW_QUERY_STORE 설정에 따라 slow_queries 테이블 또는 로그에 저장
+- 개인정보: 쿼리 파라미터 / 요청 쿼리스트링 값은 저장하지 않음 (타입 / 이름만),
+  실행 계획 조건식의 문자열 리터럴도 '?'로 치환
+"""
+
+import hashlib
+import logging
+import random
+import re
+import threading
+import time
+
+from django.conf import settings
+from django.db import DatabaseError, connections, transaction
+
+from apps.monitoring.models import SlowQuery
+
+logger = logging.getLogger('baro.slow_query')
+
+SPATIAL_PATTERN = re.compile(r'\bST_\w+|<->|::geography', re.IGNORECASE)
+SEARCH_PATTERN = re.compile(r'\bI?LIKE\b', re.IGNORECASE)
+SELECT_PATTERN = re.compile(r'^\s*(SELECT|WITH)\b', re.IGNORECASE)
+LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'")
+
+
+def normalize_sql(sql):
+    """쿼리 형태 비교용 정규화 (문자열/숫자 리터럴, IN 목록, 플레이스홀더 제거)"""
+    sql = LITERAL_PATTERN.sub('?', sql)
+    sql = re.sub(r'%s', '?', sql)
+    sql = re.sub(r'\b\d+(?:\.\d+)?\b', '?', sql)
+    sql = re.sub(r'IN \([^)]*\)', 'IN (...)', sql)
+    return re.sub(r'\s+', ' ', sql).strip()
+
+
+def classify_sql(sql):
+    """공간 검색 / 텍스트 검색 / 기타"""
+    if SPATIAL_PATTERN.search(sql):
+        return 'spatial'
+    if SEARCH_PATTERN.search(sql):
+        return 'search'
+    return 'other'
+
+
+def redact_plan(node):
+    """실행 계획 조건식(Filter, Index Cond 등)의 문자열 리터럴 제거 (파라미터 값이 그대로 들어감)"""
+    if isinstance(node, list):
+        return [redact_plan(item) for item in node]
+    if not isinstance(node, dict):
+        return node
+    return {
+        key: LITERAL_PATTERN.sub("'?'", value) if isinstance(value, str) and key.endswith(('Cond', 'Filter'))
+        else redact_plan(value)
+        for key, value in node.items()
+    }
+
+
+class SlowQueryCollector:
+    """
+    요청 1건의 느린 쿼리 수집기 (execute_wrapper로 사용)
+
+    Attributes:
+        captured: [(alias, sql, params, duration_ms)] - 요청당 최대 max_per_request개
+    """
+
+    def __init__(self, alias):
+        self.alias = alias
+        self.threshold = settings.SLOW_QUERY_THRESHOLD_MS / 1000
+        self.max_per_request = settings.SLOW_QUERY_MAX_PER_REQUEST
+        self.captured = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started
+            if duration >= self.threshold and not many and len(self.captured) < self.max_per_request:
+                self.captured.append((self.alias, sql, params, duration * 1000))
+
+
+class SlowQueryRecorder:
+    """
+    수집된 쿼리 저장 + 실행 계획 샘플링
+    - EXPLAIN ANALYZE는 쿼리를 실제로 다시 실행하므로 SELECT만, SLOW_QUERY_EXPLAIN_SAMPLE_RATE 비율만 수행
+    - SLOW_QUERY_EXPLAIN_KINDS에 지정한 유형(spatial / search)은 샘플링 없이 항상 수행 (기본: 없음)
+    - statement_timeout으로 EXPLAIN 자체의 최대 시간 제한
+    - 요청 경로에서 호출하지 않음: 미들웨어가 defer()로 넘기고 request_finished에서 record_pending()
+    """
+
+    def __init__(self):
+        self.sample_rate = settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE
+        self.explain_kinds = set(settings.SLOW_QUERY_EXPLAIN_KINDS)
+        self.explain_timeout_ms = settings.SLOW_QUERY_EXPLAIN_TIMEOUT_MS
+        self.store = settings.SLOW_QUERY_STORE
+
+    @staticmethod
+    def request_context(request):
+        """요청 정보 (응답 후 기록하므로 요청 객체 대신 값만 보관, 쿼리스트링은 이름만)"""
+        resolver_match = getattr(request, 'resolver_match', None)
+        return {
+            'view_name': resolver_match.view_name if resolver_match else '',
+            'method': request.method,
+            'path': request.path[:500],
+            'query_params': {key: '?' for key in request.GET},
+        }
+
+    def record(self, context, captured):
+        entries = []
+        for alias, sql, params, duration_ms in captured:
+            kind = classify_sql(sql)
+            is_select = bool(SELECT_PATTERN.match(sql))
+            plan, explain_error = None, ''
+            if is_select and (kind in self.explain_kinds or random.random() < self.sample_rate):
+                plan, explain_error = self.explain(alias, sql, params)
+                plan = redact_plan(plan)
+
+            entries.append(SlowQuery(
+                database=alias,
+                kind=kind,
+                fingerprint=hashlib.md5(normalize_sql(sql).encode()).hexdigest(),
+                sql=sql,
+                params=self._param_types(params) if is_select else None,
+                duration_ms=round(duration_ms, 2),
+                plan=plan,
+                explain_error=explain_error[:500],
+                **context,
+            ))
+
+        if self.store == 'db':
+            SlowQuery.objects.bulk_create(entries)
+        else:
+            for entry in entries:
+                logger.warning(
+                    'slow query %.1fms [%s] %s', entry.duration_ms, entry.kind, entry.view_name or entry.path,
+                    extra={'slow_query': {
+                        'view_name': entry.view_name,
+                        'path': entry.path,
+                        'query_params': entry.query_params,
+                        'kind': entry.kind,
+                        'fingerprint': entry.fingerprint,
+                        'sql': entry.sql,
+                        'duration_ms': entry.duration_ms,
+                        'plan': entry.plan,
+                    }},
+                )
+
+    @staticmethod
+    def _param_types(params):
+        """파라미터 값 대신 타입 이름만 (검색어 / 좌표 / 이메일 등 개인정보 저장 방지)"""
+        if not params:
+            return None
+        if isinstance(params, dict):
+            return {key: type(value).__name__ for key, value in params.items()}
+        return [type(param).__name__ for param in params]
+
+    def explain(self, alias, sql, params):
+        """(실행 계획 JSON, 오류 메시지) - 실패해도 요청 트랜잭션에 영향 없도록 savepoint 사용"""
+        connection = connections[alias]
+        if connection.vendor != 'postgresql':
+            return None, 'PostgreSQL에서만 지원'
+
+        try:
+            with transaction.atomic(using=alias), connection.cursor() as cursor:
+                cursor.execute("SELECT current_setting('statement_timeout')")
+                previous_timeout = cursor.fetchone()[0]
+                cursor.execute("SELECT set_config('statement_timeout', %s, true)", [str(self.explain_timeout_ms)])
+                cursor.execute(f'EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}', params)
+                plan = cursor.fetchone()[0]
+                # set_config(..., true)는 바깥 트랜잭션 종료까지 유지되므로 원복
+                cursor.execute("SELECT set_config('statement_timeout', %s, true)", [previous_timeout])
+        except DatabaseError as e:
+            return None, str(e)
+
+        return plan[0] if isinstance(plan, list) else plan, ''
+
+
+_pending = threading.local()
+
+
+def defer(recorder, request, captured):
+    """요청 중 수집한 쿼리를 응답 전송 후 기록하도록 보관 (워커 스레드별)"""
+    if not hasattr(_pending, 'jobs'):
+        _pending.jobs = []
+    _pending.jobs.append((recorder, recorder.request_context(request), captured))
+
+
+def record_pending(**kwargs):
+    """request_finished 수신: 보관된 쿼리 EXPLAIN + 저장 (실패해도 다음 요청에 영향 없음)"""
+    jobs, _pending.jobs = getattr(_pending, 'jobs', []), []
+    for recorder, context, captured in jobs:
+        try:
+            recorder.record(context, captured)
+        except Exception:
+            logger.exception('slow query record failed (%s)', context['view_name'] or context['path'])
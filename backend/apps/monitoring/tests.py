@@ -0,0 +1,63 @@
+from django.core.signals import request_finished
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+
+from apps.monitoring.models import SlowQuery
+from apps.monitoring.services import (
+    SlowQueryCollector, SlowQueryRecorder, classify_sql, defer, normalize_sql, record_pending, redact_plan,
+)
+
+
+class SlowQueryClassificationTest(TestCase):
+    """쿼리 유형 분류 / 지문 정규화"""
+
+    def test_classify(self):
+        self.assertEqual(classify_sql('SELECT * FROM grievances WHERE ST_DWithin("point", %s, %s)'), 'spatial')
+        self.assertEqual(classify_sql('SELECT * FROM grievances WHERE UPPER("title"::text) LIKE UPPER(%s)'), 'search')
+        self.assertEqual(classify_sql('SELECT 1'), 'other')
+
+    def test_normalize_ignores_literals(self):
+        self.assertEqual(
+            normalize_sql("SELECT * FROM t WHERE id IN (1, 2, 3) AND name = 'a'  LIMIT 20"),
+            normalize_sql("SELECT * FROM t WHERE id IN (4) AND name = 'b' LIMIT 100"),
+        )
+
+    def test_redact_plan_literals(self):
+        plan = {'Plan': {'Filter': "((name)::text ~~ '%홍길동%'::text)", 'Plans': [
+            {'Index Cond': "(email = 'a@baro.app'::text)", 'Relation Name': 'users'},
+        ]}}
+        self.assertEqual(redact_plan(plan), {'Plan': {'Filter': "((name)::text ~~ '?'::text)", 'Plans': [
+            {'Index Cond': "(email = '?'::text)", 'Relation Name': 'users'},
+        ]}})
+
+
+@override_settings(SLOW_QUERY_THRESHOLD_MS=0, SLOW_QUERY_EXPLAIN_SAMPLE_RATE=1.0, SLOW_QUERY_STORE='db')
+class SlowQueryRecorderTest(TestCase):
+    """임계값 초과 쿼리 저장 + EXPLAIN (ANALYZE, BUFFERS), 응답 전송 후 기록"""
+
+    def capture(self):
+        collector = SlowQueryCollector(connection.alias)
+        with connection.execute_wrapper(collector), connection.cursor() as cursor:
+            cursor.execute('SELECT name FROM areas WHERE name LIKE %s', ['%구'])
+        return collector.captured
+
+    def test_select_is_recorded_with_plan(self):
+        request = RequestFactory().get('/api/grievances/', {'search': '구'})
+        SlowQueryRecorder().record(SlowQueryRecorder.request_context(request), self.capture())
+
+        slow_query = SlowQuery.objects.get()
+        self.assertEqual(slow_query.kind, 'search')
+        self.assertEqual(slow_query.params, ['str'])  # 값은 저장하지 않음
+        self.assertEqual(slow_query.query_params, {'search': '?'})
+        self.assertIn('Plan', slow_query.plan)
+        self.assertNotIn('%구', str(slow_query.plan))
+        self.assertEqual(slow_query.explain_error, '')
+
+    def test_deferred_until_request_finished(self):
+        defer(SlowQueryRecorder(), RequestFactory().get('/api/grievances/'), self.capture())
+        self.assertFalse(SlowQuery.objects.exists())
+
+        request_finished.connect(record_pending, dispatch_uid='baro.slow_query')
+        self.addCleanup(request_finished.disconnect, dispatch_uid='baro.slow_query')
+        request_finished.send(sender=self.__class__)
+        self.assertEqual(SlowQuery.objects.count(), 1)
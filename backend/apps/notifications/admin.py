@@ -0,0 +1,32 @@
+"""
+알림 관리자 페이지
+"""
+
+from django.contrib import admin
+
+from apps.notifications.models import Device, NotificationOutbox
+
+
+@admin.register(NotificationOutbox)
+class NotificationOutboxAdmin(admin.ModelAdmin):
+    """알림 아웃박스 (발송 대기 / 재시도 확인용, 읽기 전용)"""
+    list_display = ['id', 'event', 'grievance_id', 'created_at', 'attempts', 'claimed_until', 'processed_at']
+    list_filter = ['event', ('processed_at', admin.EmptyFieldListFilter)]
+    search_fields = ['=grievance__id']
+    ordering = ['-id']
+    readonly_fields = ['grievance', 'event', 'payload', 'created_at', 'attempts', 'claimed_until', 'processed_at']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(Device)
+class DeviceAdmin(admin.ModelAdmin):
+    """푸시 기기"""
+    list_display = ['user', 'platform', 'created_at', 'updated_at']
+    list_filter = ['platform']
+    search_fields = ['user__email']
+    raw_id_fields = ['user']
@@ -0,0 +1,144 @@
+"""
+상태 변경 알림 벤치마크
+좋아요 N명(기본 10만)이 달린 민원 1건의 상태를 바꿨을 때
+요청 경로 비용(상태 변경 + 아웃박스 기록)과 워커 발송 처리량(기기 토큰/초)을 JSON으로 출력
+
+- 사용자 / 좋아요 / 기기는 generate_series로 한 번에 INSERT, 전체를 트랜잭션 안에서 실행 후 롤백 (DB에 남지 않음)
+- 기본 발송기: InMemorySender (DB 확장 + 배치 구성 비용만 측정)
+- --http: 로컬 스텁 푸시 게이트웨이(core.provider_stubs)로 실제 HTTP 발송
+
+사용 예:
+    python manage.py benchmark_notifications --likers 100000
+    python manage.py benchmark_notifications --likers 100000 --devices-per-user 2 --http --output notify.json
+"""
+
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import override_settings
+
+from apps.grievances.models import Grievance, Like
+from apps.notifications.models import Device
+from apps.notifications.senders import InMemorySender, PushGatewaySender
+from apps.notifications.services import NotificationDispatcher, NotificationOutboxService
+from apps.users.models import CustomUser
+from core.provider_stubs import ProviderStubServer
+
+
+class Command(BaseCommand):
+    help = '좋아요 N명 민원의 상태 변경 알림 기록 / 발송 처리량 측정 (실행 후 롤백)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--likers', type=int, default=100000, help='좋아요 누른 사용자 수')
+        parser.add_argument('--devices-per-user', type=int, default=1, help='사용자당 기기 수')
+        parser.add_argument('--batch-size', type=int, help='배치당 아웃박스 행 수 (기본: NOTIFICATION_BATCH_SIZE)')
+        parser.add_argument('--http', action='store_true', help='로컬 스텁 푸시 게이트웨이로 HTTP 발송')
+        parser.add_argument('--output', help='결과 JSON 파일 경로 (생략 시 stdout)')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('PostgreSQL에서만 실행할 수 있습니다')
+        if options['likers'] < 1 or options['devices_per_user'] < 1:
+            raise CommandError('--likers / --devices-per-user는 1 이상이어야 합니다')
+
+        stub = None
+        if options['http']:
+            stub = ProviderStubServer()
+            stub.start_in_thread()
+        try:
+            with override_settings(**(stub.urls() if stub else {})):
+                results = self._run(options, stub)
+        finally:
+            if stub:
+                stub.shutdown()
+                stub.server_close()
+
+        output = json.dumps(results, ensure_ascii=False, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output)
+            self.stderr.write(self.style.SUCCESS(f'결과 저장: {options["output"]}'))
+        else:
+            self.stdout.write(output)
+
+    def _run(self, options, stub):
+        likers = options['likers']
+        sender = PushGatewaySender() if stub else InMemorySender()
+        InMemorySender.clear()
+
+        with transaction.atomic():
+            started = time.perf_counter()
+            actor, grievance = self._seed(likers, options['devices_per_user'])
+            seed_seconds = time.perf_counter() - started
+
+            # 요청 경로: 상태 변경 + 아웃박스 INSERT (update_status와 같은 구성)
+            started = time.perf_counter()
+            with transaction.atomic():
+                old_status = grievance.status
+                grievance.status = 'in_progress'
+                grievance.save(update_fields=['status', 'updated_at'])
+                NotificationOutboxService.enqueue_status_change(grievance, old_status, actor=actor)
+            request_ms = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            totals = NotificationDispatcher(
+                sender=sender, batch_size=options['batch_size'], coalesce_seconds=0
+            ).run()
+            dispatch_seconds = time.perf_counter() - started
+
+            transaction.set_rollback(True)
+
+        InMemorySender.clear()
+        self.stderr.write(
+            f'요청 경로 {request_ms:.2f}ms / 발송 {dispatch_seconds:.2f}s '
+            f'({totals["tokens"] / dispatch_seconds:,.0f} tokens/s, 메시지 {totals["messages"]:,}건)'
+        )
+        return {
+            'meta': {
+                'likers': likers,
+                'devices_per_user': options['devices_per_user'],
+                'sender': type(sender).__name__,
+                'seed_seconds': round(seed_seconds, 3),
+            },
+            'request_path_ms': round(request_ms, 3),
+            'dispatch': {
+                **totals,
+                'seconds': round(dispatch_seconds, 3),
+                'tokens_per_second': round(totals['tokens'] / dispatch_seconds, 1),
+                'gateway_tokens': stub.requests.get('push_tokens', 0) if stub else None,
+            },
+        }
+
+    def _seed(self, likers, devices_per_user):
+        """벤치마크용 사용자 / 민원 / 좋아요 / 기기 생성 (트랜잭션 롤백으로 정리)"""
+        actor = CustomUser.objects.create_user(
+            email=f'bench-actor-{time.time_ns()}@example.com', password=None, role='politician', is_verified=True
+        )
+        grievance = Grievance.objects.create(
+            user=actor, title='알림 벤치마크', content='알림 벤치마크', latitude=37.5, longitude=127.0
+        )
+        prefix = f'bench-notify-{time.time_ns()}'
+        with connection.cursor() as cursor:
+            cursor.execute(f"""
+                INSERT INTO {CustomUser._meta.db_table} (
+                    password, is_superuser, first_name, last_name, is_staff, is_active, date_joined,
+                    email, name, phone_number, role, nickname, is_verified, reputation, created_at, updated_at
+                )
+                SELECT '!', false, '', '', false, true, now(),
+                       %s || '-' || n || '@example.com', '', '', 'citizen', '', false, 0, now(), now()
+                FROM generate_series(1, %s) AS n
+            """, [prefix, likers])
+            cursor.execute(f"""
+                INSERT INTO {Like._meta.db_table} (id, user_id, grievance_id, created_at)
+                SELECT gen_random_uuid(), u.id, %s, now()
+                FROM {CustomUser._meta.db_table} u WHERE u.email LIKE %s
+            """, [grievance.pk, f'{prefix}-%'])
+            cursor.execute(f"""
+                INSERT INTO {Device._meta.db_table} (user_id, token, platform, created_at, updated_at)
+                SELECT u.id, %s || '-' || u.id || '-' || d, 'android', now(), now()
+                FROM {CustomUser._meta.db_table} u CROSS JOIN generate_series(1, %s) AS d
+                WHERE u.email LIKE %s
+            """, [prefix, devices_per_user, f'{prefix}-%'])
+        return actor, grievance
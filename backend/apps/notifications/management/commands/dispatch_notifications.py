@@ -0,0 +1,50 @@
+"""
+상태 변경 알림 발송 워커
+- 기본: 발송 대상이 없을 때까지 배치 처리 후 종료 → cron
+- --loop: 상시 실행 (대상 소진 후 --interval초 대기 후 반복, 여러 프로세스 동시 실행 가능)
+
+사용 예:
+    python manage.py dispatch_notifications
+    python manage.py dispatch_notifications --loop --interval 5
+    python manage.py dispatch_notifications --purge-days 7
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from apps.notifications.services import NotificationDispatcher
+
+
+class Command(BaseCommand):
+    help = '알림 아웃박스를 배치로 읽어 푸시 발송'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, help='배치당 아웃박스 행 수 (기본: NOTIFICATION_BATCH_SIZE)')
+        parser.add_argument('--max-batches', type=int, help='실행당 최대 배치 수')
+        parser.add_argument('--loop', action='store_true', help='종료하지 않고 주기적으로 반복')
+        parser.add_argument('--interval', type=float, default=5, help='--loop 반복 간격 (초)')
+        parser.add_argument('--purge-days', type=int, help='발송 완료 후 지정 일수가 지난 행 삭제 후 종료')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] is not None and options['batch_size'] < 1:
+            raise CommandError('--batch-size는 1 이상이어야 합니다')
+
+        if options['purge_days'] is not None:
+            deleted = NotificationDispatcher.purge(options['purge_days'])
+            self.stdout.write(self.style.SUCCESS(f'삭제: {deleted:,}건'))
+            return
+
+        dispatcher = NotificationDispatcher(batch_size=options['batch_size'])
+        while True:
+            totals = dispatcher.run(max_batches=options['max_batches'])
+            if totals['events'] or not options['loop']:
+                self.stdout.write(self.style.SUCCESS(
+                    f'이벤트 {totals["events"]:,}건 → 수신자 {totals["recipients"]:,}명, '
+                    f'메시지 {totals["messages"]:,}건, 기기 {totals["tokens"]:,}대'
+                ))
+            if not options['loop']:
+                break
+            close_old_connections()
+            time.sleep(options['interval'])
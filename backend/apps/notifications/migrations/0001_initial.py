@@ -0,0 +1,53 @@
+# Generated by Django 5.0.1 on 2026-10-19 13:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('grievances', '0009_grievance_archive'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event', models.CharField(choices=[('status_changed', '상태 변경')], max_length=30, verbose_name='이벤트')),
+                ('payload', models.JSONField(default=dict, help_text='이전/새 상태, 제목, 변경한 사용자 ID', verbose_name='내용')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='기록 시각')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')),
+                ('claimed_until', models.DateTimeField(blank=True, null=True, verbose_name='점유 만료')),
+                ('processed_at', models.DateTimeField(blank=True, null=True, verbose_name='발송 완료')),
+                ('grievance', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='notification_events', to='grievances.grievance', verbose_name='민원')),
+            ],
+            options={
+                'verbose_name': '알림 아웃박스',
+                'verbose_name_plural': '알림 아웃박스',
+                'db_table': 'notification_outbox',
+                'indexes': [models.Index(condition=models.Q(('processed_at__isnull', True)), fields=['id'], name='notification_outbox_pending')],
+            },
+        ),
+        migrations.CreateModel(
+            name='Device',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=255, unique=True, verbose_name='기기 토큰')),
+                ('platform', models.CharField(choices=[('android', 'Android'), ('ios', 'iOS'), ('web', 'Web')], default='android', max_length=10, verbose_name='플랫폼')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='등록일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='devices', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '푸시 기기',
+                'verbose_name_plural': '푸시 기기',
+                'db_table': 'notification_devices',
+            },
+        ),
+    ]
@@ -0,0 +1,78 @@
+"""
+알림 모델
+- 알림 아웃박스: 민원 상태 변경과 같은 트랜잭션에서 기록 → 워커(dispatch_notifications)가 배치 발송
+- 푸시 기기 토큰
+"""
+
+from django.db import models
+
+from apps.grievances.models import Grievance
+from apps.users.models import CustomUser
+
+
+class NotificationOutbox(models.Model):
+    """
+    알림 아웃박스 (트랜잭셔널 아웃박스)
+    상태 변경이 커밋되면 반드시 기록이 남고, 롤백되면 함께 사라짐
+    워커가 claimed_until까지 점유 후 발송 → processed_at 기록 (실패 시 점유 만료 후 재시도)
+    """
+
+    EVENT_CHOICES = [
+        ('status_changed', '상태 변경'),
+    ]
+
+    grievance = models.ForeignKey(
+        Grievance,
+        on_delete=models.CASCADE,
+        related_name='notification_events',
+        verbose_name='민원',
+        db_constraint=False  # grievances가 파티션 테이블이라 (id) 단독 FK 불가 (grievances 0008 참고)
+    )
+    event = models.CharField('이벤트', max_length=30, choices=EVENT_CHOICES)
+    payload = models.JSONField('내용', default=dict, help_text='이전/새 상태, 제목, 변경한 사용자 ID')
+    created_at = models.DateTimeField('기록 시각', auto_now_add=True)
+
+    attempts = models.PositiveSmallIntegerField('시도 횟수', default=0)
+    claimed_until = models.DateTimeField('점유 만료', null=True, blank=True)
+    processed_at = models.DateTimeField('발송 완료', null=True, blank=True)
+
+    class Meta:
+        db_table = 'notification_outbox'
+        verbose_name = '알림 아웃박스'
+        verbose_name_plural = '알림 아웃박스'
+        indexes = [
+            # 미발송 행만 담는 부분 인덱스 (발송 완료 행이 쌓여도 워커 조회 비용 일정)
+            models.Index(fields=['id'], name='notification_outbox_pending', condition=models.Q(processed_at__isnull=True)),
+        ]
+
+    def __str__(self):
+        return f'{self.get_event_display()} {self.grievance_id}'
+
+
+class Device(models.Model):
+    """푸시 알림 기기 토큰 (FCM 등록 토큰)"""
+
+    PLATFORM_CHOICES = [
+        ('android', 'Android'),
+        ('ios', 'iOS'),
+        ('web', 'Web'),
+    ]
+
+    user = models.ForeignKey(
+        CustomUser,
+        on_delete=models.CASCADE,
+        related_name='devices',
+        verbose_name='사용자'
+    )
+    token = models.CharField('기기 토큰', max_length=255, unique=True)
+    platform = models.CharField('플랫폼', max_length=10, choices=PLATFORM_CHOICES, default='android')
+    created_at = models.DateTimeField('등록일', auto_now_add=True)
+    updated_at = models.DateTimeField('수정일', auto_now=True)
+
+    class Meta:
+        db_table = 'notification_devices'
+        verbose_name = '푸시 기기'
+        verbose_name_plural = '푸시 기기'
+
+    def __str__(self):
+        return f'{self.user_id} {self.platform}'
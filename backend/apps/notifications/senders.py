@@ -0,0 +1,84 @@
+"""
+푸시 발송기 (NOTIFICATION_SENDER 설정으로 선택)
+- send(messages): 메시지 목록 발송 → 전달한 기기 토큰 수
+  메시지: {'tokens': [...], 'title': str, 'body': str, 'data': {...}} (tokens는 batch_size 이하)
+- LoggingSender: 로그만 남김 (개발 기본값)
+- InMemorySender: 발송 내용을 클래스 변수에 보관 (테스트 / 벤치마크)
+- PushGatewaySender: NOTIFICATION_PUSH_URL로 HTTP 발송 (멀티캐스트 형식, core.provider_stubs 스텁 서버로 로컬 확인)
+"""
+
+import logging
+import threading
+
+import requests
+from django.conf import settings
+from django.utils.module_loading import import_string
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger('baro.notifications')
+
+
+class BaseSender:
+    batch_size = 500  # 메시지 1건당 최대 기기 토큰 수 (FCM 멀티캐스트 한도)
+
+    def send(self, messages):
+        raise NotImplementedError
+
+
+class LoggingSender(BaseSender):
+
+    def send(self, messages):
+        for message in messages:
+            logger.info('push %s tokens: %s', len(message['tokens']), message['body'])
+        return sum(len(message['tokens']) for message in messages)
+
+
+class InMemorySender(BaseSender):
+    outbox = []
+    _lock = threading.Lock()
+
+    def send(self, messages):
+        with self._lock:
+            self.outbox.extend(messages)
+        return sum(len(message['tokens']) for message in messages)
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls.outbox.clear()
+
+
+class PushGatewaySender(BaseSender):
+    """요청 1건에 메시지 여러 개: {'messages': [{'tokens', 'notification': {'title', 'body'}, 'data'}]}"""
+
+    def __init__(self):
+        self.session = requests.Session()
+        self.session.mount('http://', HTTPAdapter(pool_maxsize=4))
+        self.session.mount('https://', HTTPAdapter(pool_maxsize=4))
+
+    def send(self, messages):
+        response = self.session.post(
+            settings.NOTIFICATION_PUSH_URL,
+            json={'messages': [
+                {
+                    'tokens': message['tokens'],
+                    'notification': {'title': message['title'], 'body': message['body']},
+                    'data': message['data'],
+                }
+                for message in messages
+            ]},
+            headers={'Authorization': f'Bearer {settings.NOTIFICATION_PUSH_API_KEY}'},
+            timeout=10,
+        )
+        response.raise_for_status()
+        return response.json().get('success', 0)
+
+
+_senders = {}
+
+
+def get_sender():
+    path = settings.NOTIFICATION_SENDER
+    if path not in _senders:
+        _senders[path] = import_string(path)()
+    return _senders[path]
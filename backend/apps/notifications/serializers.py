@@ -0,0 +1,18 @@
+"""
+알림 시리얼라이저
+"""
+
+from rest_framework import serializers
+
+from apps.notifications.models import Device
+
+
+class DeviceSerializer(serializers.ModelSerializer):
+    """푸시 기기 등록 (같은 토큰이 다른 유저로 등록돼 있으면 현재 유저로 옮김)"""
+
+    token = serializers.CharField(max_length=255)
+
+    class Meta:
+        model = Device
+        fields = ['token', 'platform', 'created_at']
+        read_only_fields = ['created_at']
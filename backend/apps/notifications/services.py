@@ -0,0 +1,198 @@
+"""
+민원 상태 변경 알림
+- NotificationOutboxService.enqueue_status_change: 상태 변경과 같은 트랜잭션에서 아웃박스 INSERT 1건
+  (요청 경로에서는 좋아요 / 기기 조회나 푸시 발송을 하지 않음)
+- NotificationDispatcher: 워커 배치
+  1. 점유: NOTIFICATION_COALESCE_SECONDS 지난 미발송 행을 FOR UPDATE SKIP LOCKED로 골라 claimed_until 설정
+     (짧은 트랜잭션, 여러 워커 동시 실행 가능 / 대기 시간 동안 들어온 변경은 한 배치로 합쳐짐)
+  2. 수신자 확장: 민원별 최신 이벤트만 남기고 좋아요 + 작성자를 집합 쿼리로 확장 → 유저별로 민원 묶음
+     (변경한 본인 제외, 기기 없는 유저 제외) → 서버 사이드 커서로 스트리밍
+  3. 같은 민원 묶음을 받는 유저는 메시지 1건(기기 토큰 batch_size개)으로 묶어 발송기에 전달
+  4. 발송 완료 행 processed_at 기록 (발송 실패 시 점유 만료 후 재시도, NOTIFICATION_MAX_ATTEMPTS회까지)
+"""
+
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.grievances.models import Grievance, Like
+from apps.notifications.models import Device, NotificationOutbox
+from apps.notifications.senders import get_sender
+from core import metrics
+
+logger = logging.getLogger('baro.notifications')
+
+STATUS_LABELS = dict(Grievance.STATUS_CHOICES)
+
+
+class NotificationOutboxService:
+
+    @staticmethod
+    def enqueue_status_change(grievance, old_status, actor=None):
+        """호출하는 쪽의 트랜잭션 안에서 실행 (상태 변경과 함께 커밋 / 롤백)"""
+        return NotificationOutbox.objects.create(
+            grievance=grievance,
+            event='status_changed',
+            payload={
+                'old_status': old_status,
+                'new_status': grievance.status,
+                'title': grievance.title,
+                'actor_id': getattr(actor, 'pk', None),
+            },
+        )
+
+
+class NotificationDispatcher:
+    """
+    Attributes:
+        sender: 발송기 (기본: NOTIFICATION_SENDER)
+        batch_size: 배치당 최대 아웃박스 행 수
+        coalesce_seconds: 기록 후 발송까지 최소 대기 (연속 변경 합치기)
+        claim_seconds: 점유 유지 시간 (워커 중단 시 이후 재시도)
+    """
+
+    outbox_table = NotificationOutbox._meta.db_table
+    like_table = Like._meta.db_table
+    grievance_table = Grievance._meta.db_table
+    device_table = Device._meta.db_table
+
+    def __init__(self, sender=None, batch_size=None, coalesce_seconds=None, claim_seconds=300):
+        self.sender = sender or get_sender()
+        self.batch_size = batch_size or settings.NOTIFICATION_BATCH_SIZE
+        self.coalesce_seconds = settings.NOTIFICATION_COALESCE_SECONDS if coalesce_seconds is None else coalesce_seconds
+        self.claim_seconds = claim_seconds
+
+    def run(self, max_batches=None):
+        """
+        발송 대상이 없거나 max_batches에 도달할 때까지 반복
+
+        Returns:
+            {'events', 'recipients', 'messages', 'tokens'} 합계
+        """
+        totals = {'events': 0, 'recipients': 0, 'messages': 0, 'tokens': 0}
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            ids = self.claim()
+            if not ids:
+                break
+            batches += 1
+            stats = self.dispatch(ids)
+            for key in totals:
+                totals[key] += stats[key]
+        return totals
+
+    def claim(self):
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"""
+                UPDATE {self.outbox_table} SET claimed_until = now() + %s, attempts = attempts + 1
+                WHERE id IN (
+                    SELECT id FROM {self.outbox_table}
+                    WHERE processed_at IS NULL
+                      AND created_at <= now() - %s
+                      AND (claimed_until IS NULL OR claimed_until < now())
+                      AND attempts < %s
+                    ORDER BY id
+                    LIMIT %s
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING id
+            """, [
+                timedelta(seconds=self.claim_seconds),
+                timedelta(seconds=self.coalesce_seconds),
+                settings.NOTIFICATION_MAX_ATTEMPTS,
+                self.batch_size,
+            ])
+            return sorted(row[0] for row in cursor.fetchall())
+
+    def dispatch(self, outbox_ids):
+        """점유한 아웃박스 행 발송 후 완료 처리 (발송기 오류는 그대로 전파 → 점유 만료 후 재시도)"""
+        started = time.perf_counter()
+        events = self._latest_events(outbox_ids)
+        stats = {'events': len(outbox_ids), 'recipients': 0, 'messages': 0, 'tokens': 0}
+
+        pending = {}  # 민원 ID 묶음 → 기기 토큰
+        with connection.chunked_cursor() as cursor:
+            cursor.execute(self._recipients_sql(), [outbox_ids])
+            while True:
+                rows = cursor.fetchmany(2000)
+                if not rows:
+                    break
+                for user_id, grievance_ids, tokens in rows:
+                    stats['recipients'] += 1
+                    key = tuple(grievance_ids)
+                    pending.setdefault(key, []).extend(tokens)
+                    if len(pending[key]) >= self.sender.batch_size:
+                        self._send(events, key, pending.pop(key), stats)
+        for key, tokens in pending.items():
+            self._send(events, key, tokens, stats)
+
+        NotificationOutbox.objects.filter(pk__in=outbox_ids).update(processed_at=timezone.now(), claimed_until=None)
+        metrics.NOTIFICATION_BATCH_DURATION.observe(time.perf_counter() - started)
+        logger.info('dispatched %s', stats)
+        return stats
+
+    def _latest_events(self, outbox_ids):
+        """민원별 마지막 이벤트 내용 (같은 민원 여러 번 변경 → 최종 상태만 알림)"""
+        rows = NotificationOutbox.objects.filter(pk__in=outbox_ids).order_by('grievance_id', '-id').distinct(
+            'grievance_id'
+        ).values_list('grievance_id', 'payload')
+        return {str(grievance_id): payload for grievance_id, payload in rows}
+
+    def _recipients_sql(self):
+        return f"""
+            WITH latest AS (
+                SELECT DISTINCT ON (grievance_id) grievance_id, (payload->>'actor_id')::bigint AS actor_id
+                FROM {self.outbox_table}
+                WHERE id = ANY(%s)
+                ORDER BY grievance_id, id DESC
+            ), recipients AS (
+                SELECT l.user_id, latest.grievance_id, latest.actor_id
+                FROM {self.like_table} l JOIN latest ON l.grievance_id = latest.grievance_id
+                UNION
+                SELECT g.user_id, latest.grievance_id, latest.actor_id
+                FROM {self.grievance_table} g JOIN latest ON g.id = latest.grievance_id
+                WHERE g.user_id IS NOT NULL
+            ), targets AS (
+                SELECT user_id, array_agg(grievance_id::text ORDER BY grievance_id) AS grievance_ids
+                FROM recipients
+                WHERE user_id IS DISTINCT FROM actor_id
+                GROUP BY user_id
+            )
+            SELECT t.user_id, t.grievance_ids, array_agg(d.token)
+            FROM targets t JOIN {self.device_table} d ON d.user_id = t.user_id
+            GROUP BY t.user_id, t.grievance_ids
+        """
+
+    def _send(self, events, grievance_ids, tokens, stats):
+        if len(grievance_ids) == 1:
+            event = events[grievance_ids[0]]
+            body = f"'{event['title']}' 민원이 {STATUS_LABELS.get(event['new_status'], event['new_status'])} 상태로 변경되었습니다"
+        else:
+            body = f'관심 민원 {len(grievance_ids)}건의 상태가 변경되었습니다'
+
+        messages = [
+            {
+                'tokens': tokens[start:start + self.sender.batch_size],
+                'title': '민원 상태 변경',
+                'body': body,
+                'data': {'type': 'status_changed', 'grievance_ids': ','.join(grievance_ids)},
+            }
+            for start in range(0, len(tokens), self.sender.batch_size)
+        ]
+        delivered = self.sender.send(messages)
+        metrics.NOTIFICATION_DELIVERIES.labels('success').inc(delivered)
+        if delivered < len(tokens):
+            metrics.NOTIFICATION_DELIVERIES.labels('failure').inc(len(tokens) - delivered)
+        stats['messages'] += len(messages)
+        stats['tokens'] += len(tokens)
+
+    @staticmethod
+    def purge(older_than_days=7):
+        """발송 완료 후 지난 행 삭제"""
+        cutoff = timezone.now() - timedelta(days=older_than_days)
+        deleted, _ = NotificationOutbox.objects.filter(processed_at__lt=cutoff).delete()
+        return deleted
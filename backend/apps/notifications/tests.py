@@ -0,0 +1,127 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.grievances.models import Grievance, Like
+from apps.notifications.models import Device, NotificationOutbox
+from apps.notifications.senders import InMemorySender
+from apps.notifications.services import NotificationDispatcher
+from apps.users.models import CustomUser
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES, THROTTLE_BUCKETS={})
+class StatusChangeNotificationTest(TestCase):
+    """상태 변경 → 아웃박스 기록(요청 경로) → 워커 배치 발송"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.official = CustomUser.objects.create_user(
+            email='official@baro.app', password='pw', role='politician', is_verified=True
+        )
+        cls.author = CustomUser.objects.create_user(email='author@baro.app', password='pw')
+        cls.fan = CustomUser.objects.create_user(email='fan@baro.app', password='pw')
+        cls.silent = CustomUser.objects.create_user(email='silent@baro.app', password='pw')  # 기기 없음
+
+        cls.grievances = [
+            Grievance.objects.create(
+                user=cls.author, title=f'민원 {index}', content='내용', latitude=37.5, longitude=127.0
+            )
+            for index in range(2)
+        ]
+        for grievance in cls.grievances:
+            Like.objects.create(user=cls.fan, grievance=grievance)
+            Like.objects.create(user=cls.silent, grievance=grievance)
+            Like.objects.create(user=cls.official, grievance=grievance)
+
+        Device.objects.create(user=cls.author, token='author-phone')
+        Device.objects.create(user=cls.fan, token='fan-phone')
+        Device.objects.create(user=cls.fan, token='fan-tablet', platform='ios')
+        Device.objects.create(user=cls.official, token='official-phone')
+
+    def setUp(self):
+        cache.clear()
+        InMemorySender.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.official)
+
+    def update_status(self, grievance, new_status):
+        return self.client.patch(
+            f'/api/grievances/{grievance.pk}/update_status/', {'status': new_status}, format='json'
+        )
+
+    def test_update_status_writes_outbox_row(self):
+        response = self.update_status(self.grievances[0], 'in_progress')
+        self.assertEqual(response.status_code, 200)
+
+        event = NotificationOutbox.objects.get()
+        self.assertEqual(event.grievance_id, self.grievances[0].pk)
+        self.assertEqual(event.payload['old_status'], 'pending')
+        self.assertEqual(event.payload['new_status'], 'in_progress')
+        self.assertEqual(event.payload['actor_id'], self.official.pk)
+        self.assertIsNone(event.processed_at)
+        self.assertEqual(InMemorySender.outbox, [])  # 요청 경로에서는 발송하지 않음
+
+    def test_unchanged_status_writes_nothing(self):
+        self.update_status(self.grievances[0], 'pending')
+        self.assertFalse(NotificationOutbox.objects.exists())
+
+    def test_dispatch_coalesces_per_recipient(self):
+        self.update_status(self.grievances[0], 'in_progress')
+        self.update_status(self.grievances[0], 'resolved')
+        self.update_status(self.grievances[1], 'in_progress')
+
+        totals = NotificationDispatcher(sender=InMemorySender(), coalesce_seconds=0).run()
+
+        # 작성자 / 팬 모두 민원 2건 → 메시지 1건 (변경한 본인과 기기 없는 유저 제외)
+        self.assertEqual(totals, {'events': 3, 'recipients': 2, 'messages': 1, 'tokens': 3})
+        [message] = InMemorySender.outbox
+        self.assertCountEqual(message['tokens'], ['author-phone', 'fan-phone', 'fan-tablet'])
+        self.assertEqual(message['body'], '관심 민원 2건의 상태가 변경되었습니다')
+        self.assertFalse(NotificationOutbox.objects.filter(processed_at__isnull=True).exists())
+
+        # 재실행 시 발송 대상 없음
+        self.assertEqual(NotificationDispatcher(sender=InMemorySender(), coalesce_seconds=0).run()['events'], 0)
+
+    def test_dispatch_uses_latest_status(self):
+        self.update_status(self.grievances[0], 'in_progress')
+        self.update_status(self.grievances[0], 'resolved')
+
+        NotificationDispatcher(sender=InMemorySender(), coalesce_seconds=0).run()
+
+        [message] = InMemorySender.outbox
+        self.assertEqual(message['body'], "'민원 0' 민원이 완료 상태로 변경되었습니다")
+
+    def test_coalesce_window_defers_dispatch(self):
+        self.update_status(self.grievances[0], 'in_progress')
+        totals = NotificationDispatcher(sender=InMemorySender(), coalesce_seconds=3600).run()
+        self.assertEqual(totals['events'], 0)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, THROTTLE_BUCKETS={})
+class DeviceRegistrationTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = CustomUser.objects.create_user(email='user@baro.app', password='pw')
+        self.other = CustomUser.objects.create_user(email='other@baro.app', password='pw')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_register_and_reassign(self):
+        response = self.client.post('/api/notifications/devices/', {'token': 'abc', 'platform': 'ios'}, format='json')
+        self.assertEqual(response.status_code, 201)
+        response = self.client.post('/api/notifications/devices/', {'token': 'abc', 'platform': 'ios'}, format='json')
+        self.assertEqual(response.status_code, 200)
+
+        # 같은 기기로 다른 계정 로그인 → 토큰 소유자 변경
+        self.client.force_authenticate(self.other)
+        self.client.post('/api/notifications/devices/', {'token': 'abc'}, format='json')
+        self.assertEqual(Device.objects.get(token='abc').user, self.other)
+
+    def test_unregister(self):
+        Device.objects.create(user=self.user, token='abc')
+        response = self.client.delete('/api/notifications/devices/', {'token': 'abc'}, format='json')
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(Device.objects.exists())
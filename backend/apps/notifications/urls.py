@@ -0,0 +1,11 @@
+"""
+알림 URL 라우팅
+"""
+
+from django.urls import path
+
+from apps.notifications.views import DeviceView
+
+urlpatterns = [
+    path('notifications/devices/', DeviceView.as_view(), name='notification_devices'),
+]
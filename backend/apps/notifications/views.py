@@ -0,0 +1,39 @@
+"""
+알림 뷰
+"""
+
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.notifications.models import Device
+from apps.notifications.serializers import DeviceSerializer
+
+
+class DeviceView(APIView):
+    """
+    푸시 기기 토큰 등록 / 해제
+    POST /api/notifications/devices/ {"token": "...", "platform": "android"}
+    DELETE /api/notifications/devices/ {"token": "..."}
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = DeviceSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        device, created = Device.objects.update_or_create(
+            token=serializer.validated_data['token'],
+            defaults={
+                'user': request.user,
+                'platform': serializer.validated_data.get('platform', 'android'),
+            },
+        )
+        return Response(
+            DeviceSerializer(device).data,
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK
+        )
+
+    def delete(self, request):
+        Device.objects.filter(user=request.user, token=request.data.get('token', '')).delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
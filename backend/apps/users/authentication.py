@@ -0,0 +1,74 @@
+"""
+JWT 인증 (DB 조회 없는 유저 확인)
+- 토큰의 user_id 클레임 + Redis 캐시(JWT_USER_CACHE_TTL초)로 CachedUser 구성
+- 캐시에는 권한 판단 필드만 저장 (역할, 인증 여부, 지역, 활성 여부 등 / 패스워드 제외)
+- 유저 저장/삭제 시 시그널로 캐시 삭제 → 역할 변경, 인증 처리 즉시 반영
+  (QuerySet.update()처럼 시그널이 없는 변경은 TTL 후 반영)
+- 그 외 필드(email, nickname 등)는 처음 접근할 때 쿼리 1회로 로딩
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import router
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.users.models import CachedUser, CustomUser
+
+# 캐시에 저장하는 필드 (attname)
+CACHED_FIELDS = ('id', 'role', 'is_verified', 'area_id', 'is_active', 'is_staff', 'is_superuser', 'updated_at')
+
+
+def user_cache_key(user_id):
+    return f'auth_user:{user_id}'
+
+
+def invalidate_cached_user(user_id):
+    cache.delete(user_cache_key(user_id))
+
+
+def get_cached_user(user_id):
+    """
+    캐시된 권한 필드로 CachedUser 생성 (캐시 미스 시 필요한 컬럼만 1회 조회 후 저장)
+
+    Returns:
+        CachedUser 또는 None (존재하지 않는 유저)
+    """
+    key = user_cache_key(user_id)
+    values = cache.get(key)
+    if values is None:
+        values = CustomUser.objects.filter(pk=user_id).values(*CACHED_FIELDS).first()
+        if values is None:
+            return None
+        cache.set(key, values, timeout=settings.JWT_USER_CACHE_TTL)
+
+    return CachedUser.from_db(
+        router.db_for_read(CachedUser),
+        list(CACHED_FIELDS),
+        [values[name] for name in CACHED_FIELDS],
+    )
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication과 동일한 검증 + 캐시 기반 유저 확인
+    CHECK_REVOKE_TOKEN(패스워드 해시 비교) 사용 시에는 기존 방식(DB 조회)
+    """
+
+    def get_user(self, validated_token):
+        if getattr(api_settings, 'CHECK_REVOKE_TOKEN', False):
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+
+        user = get_cached_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found')
+        if not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+        return user
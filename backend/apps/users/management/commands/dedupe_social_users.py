@@ -0,0 +1,97 @@
+"""
+중복 소셜 계정 유저 병합
+같은 (oauth_provider, oauth_id)로 생성된 유저를 가장 먼저 가입한 유저 1명으로 합침
+- 유저를 참조하는 모든 FK(민원, 좋아요, 담당 구역, 보관 민원 등)를 남길 유저로 변경
+  (좋아요처럼 유저 포함 유니크 제약이 있으면 남길 유저에 이미 있는 행은 삭제)
+- 그룹 / 권한은 합친 뒤 나머지 유저 삭제
+- 그룹마다 별도 트랜잭션
+
+users_oauth_provider_id_uniq 제약(migration 0007) 추가 전에 실행:
+    python manage.py dedupe_social_users --dry-run
+    python manage.py dedupe_social_users
+    python manage.py migrate users
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, UniqueConstraint
+
+from apps.grievances.services import GrievanceVersionService
+from apps.users.models import CustomUser
+
+
+def _unique_field_sets(model, field):
+    """field를 포함하는 유니크 조합에서 field를 뺀 나머지 필드 이름 목록"""
+    sets = [tuple(fields) for fields in model._meta.unique_together]
+    sets += [
+        tuple(constraint.fields) for constraint in model._meta.constraints
+        if isinstance(constraint, UniqueConstraint) and constraint.fields and constraint.condition is None
+    ]
+    if field.unique:
+        sets.append((field.name,))
+    return [[name for name in fields if name != field.name] for fields in sets if field.name in fields]
+
+
+class Command(BaseCommand):
+    help = '같은 소셜 계정으로 중복 생성된 유저를 1명으로 병합'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='중복 목록만 출력')
+
+    def handle(self, *args, **options):
+        duplicates = list(
+            CustomUser.objects.filter(oauth_provider__isnull=False, oauth_id__isnull=False)
+            .values('oauth_provider', 'oauth_id')
+            .annotate(total=Count('pk'))
+            .filter(total__gt=1)
+            .order_by('oauth_provider', 'oauth_id')
+        )
+        if not duplicates:
+            self.stdout.write(self.style.SUCCESS('중복 소셜 계정 없음'))
+            return
+
+        removed = 0
+        for duplicate in duplicates:
+            users = list(
+                CustomUser.objects.filter(
+                    oauth_provider=duplicate['oauth_provider'], oauth_id=duplicate['oauth_id']
+                ).order_by('date_joined', 'pk')
+            )
+            keep, others = users[0], users[1:]
+            self.stdout.write(
+                f'{duplicate["oauth_provider"]}/{duplicate["oauth_id"]}: '
+                f'유저 {keep.pk} 유지, {[user.pk for user in others]} 병합'
+            )
+            if not options['dry_run']:
+                self.merge(keep, others)
+            removed += len(others)
+
+        if options['dry_run']:
+            self.stdout.write(f'병합 대상: {len(duplicates):,}개 계정, 유저 {removed:,}명')
+            return
+        GrievanceVersionService.bump([GrievanceVersionService.GLOBAL_KEY])
+        self.stdout.write(self.style.SUCCESS(f'병합: {len(duplicates):,}개 계정, 유저 {removed:,}명 삭제'))
+
+    @staticmethod
+    def merge(keep, others):
+        with transaction.atomic():
+            # 1명씩 합쳐야 나머지 유저끼리 겹치는 행(같은 민원 좋아요 등)도 유니크 충돌 없이 정리됨
+            for user in others:
+                for relation in CustomUser._meta.related_objects:
+                    if relation.many_to_many:
+                        continue
+                    model, field = relation.related_model, relation.field
+                    rows = model._base_manager.filter(**{field.name: user.pk})
+
+                    # 남길 유저에 같은 조합이 이미 있으면 (좋아요 등) 중복 행 삭제
+                    for rest in _unique_field_sets(model, field):
+                        kept = model._base_manager.filter(
+                            **{field.name: keep.pk}, **{name: OuterRef(name) for name in rest}
+                        )
+                        rows.filter(Exists(kept)).delete()
+
+                    rows.update(**{field.name: keep.pk})
+
+                keep.groups.add(*user.groups.all())
+                keep.user_permissions.add(*user.user_permissions.all())
+            CustomUser.objects.filter(pk__in=[user.pk for user in others]).delete()
@@ -0,0 +1,66 @@
+"""
+기존 token_blacklist 테이블 정리 / Redis 블랙리스트로 이전
+- 기본: 만료된 OutstandingToken 삭제 (BlacklistedToken은 CASCADE) → 배치 단위
+- --import-active: 아직 만료되지 않은 블랙리스트 JTI를 Redis에 남은 수명만큼 등록
+- --all: 만료 여부와 관계없이 전부 삭제 (--import-active 이후, token_blacklist 앱 제거 전)
+
+전환 순서:
+    1. TOKEN_BLACKLIST_BACKEND 기본값(TransitionTokenBlacklist)으로 배포
+    2. python manage.py purge_token_blacklist --import-active --all
+    3. TOKEN_BLACKLIST_BACKEND=apps.users.token_blacklist.RedisTokenBlacklist 로 배포
+
+사용 예:
+    python manage.py purge_token_blacklist --dry-run
+    python manage.py purge_token_blacklist --batch-size 5000
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework_simplejwt.utils import aware_utcnow
+
+from apps.users.token_blacklist import RedisTokenBlacklist
+
+
+class Command(BaseCommand):
+    help = '만료된 refresh 토큰 기록 삭제 (기존 블랙리스트를 Redis로 이전)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--import-active', action='store_true', help='만료 전 블랙리스트 토큰을 Redis에 등록')
+        parser.add_argument('--all', action='store_true', help='만료되지 않은 기록까지 전부 삭제')
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--dry-run', action='store_true', help='대상 수만 출력')
+
+    def handle(self, *args, **options):
+        try:
+            from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+        except RuntimeError:
+            raise CommandError('rest_framework_simplejwt.token_blacklist 앱이 INSTALLED_APPS에 없습니다')
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size는 1 이상이어야 합니다')
+
+        now = aware_utcnow()
+        active = BlacklistedToken.objects.filter(token__expires_at__gt=now)
+        targets = OutstandingToken.objects.all()
+        if not options['all']:
+            targets = targets.filter(expires_at__lte=now)
+
+        if options['dry_run']:
+            self.stdout.write(f'Redis 이전 대상: {active.count():,}건')
+            self.stdout.write(f'삭제 대상: {targets.count():,}건 (전체 {OutstandingToken.objects.count():,}건)')
+            return
+
+        if options['import_active']:
+            blacklist = RedisTokenBlacklist()
+            imported = 0
+            for jti, expires_at in active.values_list('token__jti', 'token__expires_at').iterator():
+                blacklist.add_jti(jti, expires_at.timestamp())
+                imported += 1
+            self.stdout.write(self.style.SUCCESS(f'Redis 등록: {imported:,}건'))
+
+        deleted = 0
+        while True:
+            ids = list(targets.order_by().values_list('pk', flat=True)[:options['batch_size']])
+            if not ids:
+                break
+            OutstandingToken.objects.filter(pk__in=ids).delete()
+            deleted += len(ids)
+        self.stdout.write(self.style.SUCCESS(f'삭제: {deleted:,}건'))
@@ -0,0 +1,38 @@
+# Generated by Django 5.0.1 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+def check_duplicates(apps, schema_editor):
+    """중복 소셜 계정이 남아 있으면 제약 추가 전에 중단 (python manage.py dedupe_social_users 먼저 실행)"""
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("""
+            SELECT oauth_provider, oauth_id, count(*) FROM users
+            WHERE oauth_provider IS NOT NULL AND oauth_id IS NOT NULL
+            GROUP BY oauth_provider, oauth_id
+            HAVING count(*) > 1
+            LIMIT 5
+        """)
+        duplicates = cursor.fetchall()
+    if duplicates:
+        sample = ', '.join(f'{provider}/{uid} ({count}명)' for provider, uid, count in duplicates)
+        raise RuntimeError(f'중복 소셜 계정이 있습니다: {sample} → python manage.py dedupe_social_users 실행 후 다시 migrate')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_cacheduser'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicates, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='customuser',
+            name='users_oauth_p_c54165_idx',
+        ),
+        migrations.AddConstraint(
+            model_name='customuser',
+            constraint=models.UniqueConstraint(fields=('oauth_provider', 'oauth_id'), name='users_oauth_provider_id_uniq'),
+        ),
+    ]
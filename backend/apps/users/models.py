@@ -4,7 +4,7 @@
 """
 
 from django.contrib.auth.models import AbstractUser, BaseUserManager
-from django.db import models
+from django.db import connections, models, router
 from django.core.validators import MinValueValidator
 
 
@@ -36,6 +36,57 @@ class CustomUserManager(BaseUserManager):
 
         return self.create_user(email, password, **extra_fields)
 
+    def get_or_create_social(self, provider, uid, defaults=None):
+        """
+        소셜 로그인 유저 조회 또는 생성 (SQL 1문장)
+        - 기존 유저: SELECT만 실행 (INSERT는 WHERE NOT EXISTS로 건너뜀)
+        - 신규 유저: INSERT ... ON CONFLICT (oauth_provider, oauth_id) DO NOTHING
+        - 동시 첫 로그인: 늦은 쪽은 먼저 커밋된 행과 충돌 → 결과 없음 → 새 스냅샷으로 1회 재실행
+        post_save 시그널은 보내지 않음 (신규 유저는 무효화할 인증 캐시가 없음)
+
+        Returns:
+            (유저, 생성 여부)
+        """
+        user = self.model(oauth_provider=provider, oauth_id=uid, **(defaults or {}))
+        user.email = self.normalize_email(user.email)
+        user.set_unusable_password()
+
+        db = self._db or router.db_for_write(self.model)
+        connection = connections[db]
+        quote = connection.ops.quote_name
+        fields = [field for field in self.model._meta.concrete_fields if not field.primary_key]
+        values = [field.get_db_prep_save(field.pre_save(user, add=True), connection) for field in fields]
+        columns = [field.column for field in self.model._meta.concrete_fields]
+        select_columns = ', '.join(quote(column) for column in columns)
+        table = quote(self.model._meta.db_table)
+
+        sql = f"""
+            WITH existing AS (
+                SELECT {select_columns} FROM {table} WHERE oauth_provider = %s AND oauth_id = %s
+            ), inserted AS (
+                INSERT INTO {table} ({', '.join(quote(field.column) for field in fields)})
+                SELECT {', '.join(f'CAST(%s AS {field.cast_db_type(connection)})' for field in fields)}
+                WHERE NOT EXISTS (SELECT 1 FROM existing)
+                ON CONFLICT (oauth_provider, oauth_id) DO NOTHING
+                RETURNING {select_columns}
+            )
+            SELECT {select_columns}, false FROM existing
+            UNION ALL
+            SELECT {select_columns}, true FROM inserted
+        """
+        params = [provider, uid, *values]
+        with connection.cursor() as cursor:
+            for _ in range(2):
+                cursor.execute(sql, params)
+                row = cursor.fetchone()
+                if row is not None:
+                    break
+            else:
+                raise self.model.DoesNotExist(f'social user upsert returned no row: {provider}/{uid}')
+
+        names = [field.attname for field in self.model._meta.concrete_fields]
+        return self.model.from_db(db, names, row[:-1]), row[-1]
+
 
 class CustomUser(AbstractUser):
     """
@@ -129,14 +180,27 @@ class CustomUser(AbstractUser):
         verbose_name_plural = '사용자'
         indexes = [
             models.Index(fields=['email']),
-            models.Index(fields=['oauth_provider', 'oauth_id']),
             models.Index(fields=['role']),
             models.Index(fields=['is_verified']),
         ]
+        constraints = [
+            # 소셜 계정 1개 = 유저 1명 (NULL은 중복 허용 → 이메일 가입 유저 영향 없음)
+            models.UniqueConstraint(fields=['oauth_provider', 'oauth_id'], name='users_oauth_provider_id_uniq'),
+        ]
+
+    # 민원 user_name(full_name) / 구역 leader_name(nickname)에 쓰이는 필드 (변경 시 민원 버전 증가)
+    DISPLAY_NAME_FIELDS = ('email', 'name', 'first_name', 'last_name', 'nickname')
 
     def __str__(self):
         return self.email
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """DB에서 읽은 시점의 표시 이름 필드 기록 (이름 변경 시 민원 / 구역 응답 캐시 무효화용, 지연 필드는 None)"""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_display_name = tuple(instance.__dict__.get(name) for name in cls.DISPLAY_NAME_FIELDS)
+        return instance
+
     @property
     def full_name(self):
         """전체 이름 반환"""
@@ -146,3 +210,21 @@ class CustomUser(AbstractUser):
         if self.first_name and self.last_name:
             return f"{self.last_name}{self.first_name}"
         return self.email
+
+
+class CachedUser(CustomUser):
+    """
+    JWT 인증용 경량 유저 (apps/users/authentication.py)
+    id / role / is_verified / area 등 권한 판단 필드만 채우고 나머지는 지연 로딩
+    - 지연 필드에 처음 접근하면 나머지 필드를 쿼리 1회로 한꺼번에 로딩
+    - CustomUser의 프록시라 FK 할당 / 쿼리 필터에 그대로 사용 가능
+    """
+
+    class Meta:
+        proxy = True
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        deferred = self.get_deferred_fields()
+        if fields is not None and deferred & set(fields):
+            fields = list(deferred | set(fields))
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
@@ -6,6 +6,15 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer as SimpleTokenObtainPairSerializer,
+    TokenRefreshSerializer as SimpleTokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.users.tokens import RefreshToken
 
 User = get_user_model()
 
@@ -94,3 +103,34 @@ class SocialLoginSerializer(serializers.Serializer):
         if not value:
             raise serializers.ValidationError("Access token is required")
         return value
+
+
+class TokenObtainPairSerializer(SimpleTokenObtainPairSerializer):
+    """이메일 로그인 (SIMPLE_JWT TOKEN_OBTAIN_SERIALIZER)"""
+    token_class = RefreshToken
+
+
+class TokenRefreshSerializer(SimpleTokenRefreshSerializer):
+    """
+    토큰 갱신 (SIMPLE_JWT TOKEN_REFRESH_SERIALIZER)
+    회전 시 기존 refresh 토큰을 블랙리스트에 등록, 이미 등록돼 있으면 거부
+    (같은 토큰으로 동시에 갱신해도 새 토큰은 한 번만 발급)
+    """
+    token_class = RefreshToken
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs['refresh'])
+
+        data = {'access': str(refresh.access_token)}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION and not refresh.blacklist():
+                raise TokenError(_('Token is blacklisted'))
+
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+
+            data['refresh'] = str(refresh)
+
+        return data
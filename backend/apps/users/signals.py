@@ -0,0 +1,18 @@
+"""
+유저 시그널
+저장/삭제 시 JWT 인증 캐시 삭제 (역할, 인증 여부, 지역 변경 즉시 반영)
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.users.authentication import invalidate_cached_user
+from apps.users.models import CachedUser, CustomUser
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_save, sender=CachedUser)
+@receiver(post_delete, sender=CustomUser)
+@receiver(post_delete, sender=CachedUser)
+def invalidate_auth_cache(sender, instance, **kwargs):
+    invalidate_cached_user(instance.pk)
@@ -0,0 +1,189 @@
+"""
+소셜 로그인 제공자 (Kakao / Naver) 사용자 정보 조회
+- 프로세스 공용 requests.Session (커넥션 풀 재사용 → 매 로그인 TCP/TLS 연결 수립 생략)
+- 토큰 → 프로필 결과를 SOCIAL_PROFILE_CACHE_TTL초 캐시 (키: 토큰 SHA-256, 원문 토큰은 저장 안 함)
+  → 앱 실행 직후 재시도 / 중복 요청은 외부 호출 없이 처리
+- 제공자별 서킷 브레이커: 연속 실패 시 SOCIAL_CIRCUIT_RESET_SECONDS 동안 즉시 ProviderUnavailable
+- 응답은 제공자와 무관한 프로필 dict로 정규화: {'provider', 'uid', 'email', 'nickname'}
+
+로컬 검증: core.provider_stubs.ProviderStubServer의 urls()로 KAKAO_USER_INFO_URL / NAVER_USER_INFO_URL 지정
+"""
+
+import hashlib
+import logging
+import threading
+import time
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+
+from core import metrics
+from core.circuit_breaker import CircuitBreaker, CircuitOpenError
+from core.timing import timed
+
+logger = logging.getLogger('baro.social')
+
+
+class SocialAuthError(Exception):
+    """제공자가 토큰을 거부 (만료 / 잘못된 토큰, 4xx)"""
+
+
+class ProviderUnavailable(Exception):
+    """제공자 장애 (네트워크 오류 / 타임아웃 / 5xx / 서킷 open)"""
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """프로세스 공용 세션 (urllib3 커넥션 풀은 스레드 안전)"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=settings.SOCIAL_HTTP_POOL_SIZE,
+                    max_retries=0,  # 재시도 대신 서킷 브레이커
+                )
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _session = session
+    return _session
+
+
+class SocialProvider:
+    """
+    제공자 공통 조회 흐름 (캐시 → 서킷 확인 → 호출 → 정규화)
+    하위 클래스: name, metric_name, url_setting, label, parse()
+    """
+
+    name = None
+    metric_name = None
+    url_setting = None
+    label = None  # 응답 메시지용 표시 이름
+
+    def __init__(self):
+        self.breaker = CircuitBreaker(
+            self.metric_name,
+            failure_threshold=settings.SOCIAL_CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=settings.SOCIAL_CIRCUIT_RESET_SECONDS,
+        )
+
+    @property
+    def url(self):
+        return getattr(settings, self.url_setting)
+
+    def cache_key(self, access_token):
+        digest = hashlib.sha256(access_token.encode()).hexdigest()
+        return f'social_profile:{self.name}:{digest}'
+
+    def headers(self, access_token):
+        return {'Authorization': f'Bearer {access_token}'}
+
+    def parse(self, data):
+        """제공자 응답 → 프로필 dict (식별자 없으면 SocialAuthError)"""
+        raise NotImplementedError
+
+    def get_profile(self, access_token):
+        key = self.cache_key(access_token)
+        profile = cache.get(key)
+        if profile is not None:
+            metrics.SOCIAL_PROFILE_CACHE.labels(self.name, 'hit').inc()
+            return profile
+        metrics.SOCIAL_PROFILE_CACHE.labels(self.name, 'miss').inc()
+
+        profile = self.fetch_profile(access_token)
+        cache.set(key, profile, timeout=settings.SOCIAL_PROFILE_CACHE_TTL)
+        return profile
+
+    def fetch_profile(self, access_token):
+        try:
+            self.breaker.before_call()
+        except CircuitOpenError as e:
+            metrics.EXTERNAL_API_REQUESTS.labels(self.metric_name, 'circuit_open').inc()
+            raise ProviderUnavailable(str(e))
+
+        started = time.perf_counter()
+        try:
+            with timed(self.name, external=True):
+                response = get_session().get(
+                    self.url,
+                    headers=self.headers(access_token),
+                    timeout=(settings.SOCIAL_CONNECT_TIMEOUT, settings.SOCIAL_READ_TIMEOUT),
+                )
+        except requests.exceptions.RequestException as e:
+            metrics.record_external_call(self.metric_name, time.perf_counter() - started)
+            self.breaker.record_failure()
+            logger.warning('%s user info request failed: %s', self.name, e)
+            raise ProviderUnavailable(f'{self.label} API 연결 실패')
+        metrics.record_external_call(self.metric_name, time.perf_counter() - started, response.status_code)
+
+        if response.status_code >= 500:
+            self.breaker.record_failure()
+            logger.warning('%s user info error %s: %s', self.name, response.status_code, response.text[:200])
+            raise ProviderUnavailable(f'{self.label} API Error: {response.status_code}')
+
+        self.breaker.record_success()
+        if response.status_code != 200:
+            logger.info('%s rejected token: %s', self.name, response.status_code)
+            raise SocialAuthError(f'{self.label} API Error: {response.text}')
+
+        try:
+            data = response.json()
+        except ValueError:
+            raise SocialAuthError(f'{self.label} API 응답 형식 오류')
+        return self.parse(data)
+
+
+class KakaoProvider(SocialProvider):
+    name = 'kakao'
+    metric_name = 'kakao_user'
+    url_setting = 'KAKAO_USER_INFO_URL'
+    label = 'Kakao'
+
+    def headers(self, access_token):
+        return {
+            'Authorization': f'Bearer {access_token}',
+            'Content-Type': 'application/x-www-form-urlencoded;charset=utf-8',
+        }
+
+    def parse(self, data):
+        if not data.get('id'):
+            raise SocialAuthError('Kakao 사용자 ID 없음')
+        account = data.get('kakao_account') or {}
+        return {
+            'provider': self.name,
+            'uid': str(data['id']),
+            'email': account.get('email'),
+            'nickname': (account.get('profile') or {}).get('nickname', ''),
+        }
+
+
+class NaverProvider(SocialProvider):
+    name = 'naver'
+    metric_name = 'naver_user'
+    url_setting = 'NAVER_USER_INFO_URL'
+    label = 'Naver'
+
+    def parse(self, data):
+        response = data.get('response') or {}
+        if data.get('resultcode', '00') != '00' or not response.get('id'):
+            raise SocialAuthError(f'Naver API Error: {data.get("message", "사용자 ID 없음")}')
+        return {
+            'provider': self.name,
+            'uid': str(response['id']),
+            'email': response.get('email'),
+            'nickname': response.get('name') or '',
+        }
+
+
+PROVIDERS = {provider.name: provider for provider in (KakaoProvider(), NaverProvider())}
+
+
+def get_provider(name):
+    return PROVIDERS[name]
@@ -1,3 +1,420 @@
-from django.test import TestCase
+import io
+import threading
+from datetime import timedelta
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, connections
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import AccessToken
+from rest_framework_simplejwt.utils import aware_utcnow
+
+from core.provider_stubs import ProviderStubServer
+from core.testing import QUERY_SCALE_SIZES, sql_fingerprint
+
+from apps.grievances.models import Area, Grievance, Like
+from apps.users.authentication import get_cached_user, user_cache_key
+from apps.users.models import CachedUser, CustomUser
+from apps.users.social import PROVIDERS
+from apps.users.token_blacklist import RedisTokenBlacklist
+from apps.users.tokens import RefreshToken
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CachedJWTAuthenticationTest(TestCase):
+    """토큰 클레임 + 캐시 기반 유저 확인 (유저 테이블 조회 생략)"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = CustomUser.objects.create_user(
+            email='official@baro.app', password='pw', nickname='담당자', role='politician'
+        )
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}')
+
+    @staticmethod
+    def _user_lookups(queries):
+        return [query['sql'] for query in queries if 'FROM "users" WHERE' in query['sql']]
+
+    def test_second_request_skips_user_query(self):
+        with CaptureQueriesContext(connection) as first:
+            self.client.get('/api/auth/me/')
+        with CaptureQueriesContext(connection) as second:
+            response = self.client.get('/api/auth/me/')
+
+        self.assertEqual(response.json()['email'], 'official@baro.app')
+        self.assertEqual(len(self._user_lookups(first.captured_queries)), 2)  # 캐시 채움 + 지연 필드 로딩
+        self.assertEqual(len(self._user_lookups(second.captured_queries)), 1)  # 지연 필드 로딩만
+
+    def test_save_invalidates_cached_permissions(self):
+        self.assertFalse(get_cached_user(self.user.pk).is_verified)
+
+        self.user.is_verified = True
+        self.user.save()
+
+        self.assertIsNone(cache.get(user_cache_key(self.user.pk)))
+        self.assertTrue(get_cached_user(self.user.pk).is_verified)
+
+    def test_deferred_fields_load_in_one_query(self):
+        user = get_cached_user(self.user.pk)
+        self.assertIsInstance(user, CachedUser)
+
+        with self.assertNumQueries(1):
+            self.assertEqual((user.email, user.nickname, user.full_name), ('official@baro.app', '담당자', 'official@baro.app'))
+
+    def test_inactive_user_is_rejected(self):
+        CustomUser.objects.filter(pk=self.user.pk).update(is_active=False)
+        cache.clear()
+
+        self.assertEqual(self.client.get('/api/auth/me/').status_code, 401)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, TOKEN_BLACKLIST_BACKEND='apps.users.token_blacklist.RedisTokenBlacklist')
+class RefreshTokenBlacklistTest(TestCase):
+    """Redis(JTI + TTL) 블랙리스트: 갱신 / 로그아웃 시 token_blacklist 테이블 미사용"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = CustomUser.objects.create_user(email='citizen@baro.app', password='pw', nickname='시민')
+        self.client = APIClient()
+
+    def _login(self):
+        response = self.client.post('/api/auth/login/', {'email': 'citizen@baro.app', 'password': 'pw'}, format='json')
+        return response.json()['refresh']
+
+    def test_rotated_token_cannot_be_reused(self):
+        refresh = self._login()
+
+        with CaptureQueriesContext(connection) as queries:
+            first = self.client.post('/api/auth/refresh/', {'refresh': refresh}, format='json')
+        second = self.client.post('/api/auth/refresh/', {'refresh': refresh}, format='json')
+
+        self.assertEqual(first.status_code, 200)
+        self.assertNotEqual(first.json()['refresh'], refresh)
+        self.assertEqual(second.status_code, 401)
+        self.assertFalse([query for query in queries.captured_queries if 'token_blacklist' in query['sql']])
+        self.assertFalse(OutstandingToken.objects.exists())
+
+        rotated = self.client.post('/api/auth/refresh/', {'refresh': first.json()['refresh']}, format='json')
+        self.assertEqual(rotated.status_code, 200)
+
+    def test_logout_blacklists_until_expiry(self):
+        refresh = RefreshToken(self._login())
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+
+        self.client.post('/api/auth/logout/', {'refresh': str(refresh)}, format='json')
+
+        self.assertTrue(RedisTokenBlacklist().contains(refresh))
+        self.assertGreater(RedisTokenBlacklist.ttl(refresh['exp']), 0)
+        self.assertEqual(RedisTokenBlacklist.ttl(refresh['exp'], now=aware_utcnow() + timedelta(days=8)), 0)
+        self.assertEqual(self.client.post('/api/auth/refresh/', {'refresh': str(refresh)}, format='json').status_code, 401)
+
+    def test_purge_imports_active_and_deletes_table_rows(self):
+        now = aware_utcnow()
+        active = OutstandingToken.objects.create(jti='active', token='t1', expires_at=now + timedelta(days=1))
+        BlacklistedToken.objects.create(token=active)
+        OutstandingToken.objects.create(jti='expired', token='t2', expires_at=now - timedelta(days=1))
+
+        call_command('purge_token_blacklist', stdout=io.StringIO())
+        self.assertEqual(list(OutstandingToken.objects.values_list('jti', flat=True)), ['active'])
+
+        call_command('purge_token_blacklist', '--import-active', '--all', stdout=io.StringIO())
+        self.assertFalse(OutstandingToken.objects.exists())
+        self.assertIsNotNone(cache.get(RedisTokenBlacklist.key('active')))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TransitionTokenBlacklistTest(TestCase):
+    """기본 저장소(TransitionTokenBlacklist): 전환 전 테이블에만 있는 블랙리스트도 거부"""
+
+    def test_table_only_blacklisted_token_is_rejected_by_default(self):
+        cache.clear()
+        user = CustomUser.objects.create_user(email='citizen@baro.app', password='pw')
+        refresh = RefreshToken.for_user(user)
+        outstanding = OutstandingToken.objects.create(
+            jti=refresh['jti'], token=str(refresh), expires_at=aware_utcnow() + timedelta(days=1)
+        )
+        BlacklistedToken.objects.create(token=outstanding)
+
+        response = APIClient().post('/api/auth/refresh/', {'refresh': str(refresh)}, format='json')
+        self.assertEqual(response.status_code, 401)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SocialLoginProviderTest(TestCase):
+    """로컬 스텁 서버 대상: 프로필 캐시 / 서킷 브레이커 / Kakao·Naver 공통 처리"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.stub = ProviderStubServer()
+        cls.stub.start_in_thread()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.stub.shutdown()
+        cls.stub.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        cache.clear()
+        self.stub.requests.clear()
+        self.stub.failure_status = None
+        for provider in PROVIDERS.values():
+            provider.breaker.reset()
+        self.addCleanup(lambda: [provider.breaker.reset() for provider in PROVIDERS.values()])
+        self.settings_override = self.settings(**self.stub.urls())
+        self.settings_override.enable()
+        self.addCleanup(self.settings_override.disable)
+        self.client = APIClient()
+
+    def test_repeated_token_uses_cached_profile(self):
+        first = self.client.post('/api/auth/kakao/', {'access_token': 'app-launch'}, format='json')
+        second = self.client.post('/api/auth/kakao/', {'access_token': 'app-launch'}, format='json')
+
+        self.assertEqual(first.status_code, 200)
+        self.assertTrue(first.json()['is_new_user'])
+        self.assertFalse(second.json()['is_new_user'])
+        self.assertEqual(first.json()['user']['id'], second.json()['user']['id'])
+        self.assertEqual(self.stub.requests['/v2/user/me'], 1)
+
+    def test_providers_share_login_flow(self):
+        response = self.client.post('/api/auth/naver/', {'access_token': 'naver-token'}, format='json')
+
+        self.assertEqual(response.json()['message'], '네이버 로그인 성공')
+        user = CustomUser.objects.get(oauth_provider='naver')
+        self.assertTrue(user.email.endswith('@stub.baro.test'))
+
+    def test_rejected_token_does_not_open_circuit(self):
+        for _ in range(PROVIDERS['kakao'].breaker.failure_threshold + 1):
+            response = self.client.post('/api/auth/kakao/', {'access_token': 'invalid-token'}, format='json')
+            self.assertEqual(response.status_code, 400)
+
+        self.assertEqual(PROVIDERS['kakao'].breaker.state, 'closed')
+
+    def test_provider_outage_opens_circuit(self):
+        self.stub.failure_status = 503
+        threshold = PROVIDERS['naver'].breaker.failure_threshold
+
+        for index in range(threshold + 3):
+            response = self.client.post('/api/auth/naver/', {'access_token': f'token-{index}'}, format='json')
+            self.assertEqual(response.status_code, 503)
+
+        # open 이후 요청은 스텁까지 가지 않음
+        self.assertEqual(self.stub.requests['/v1/nid/me'], threshold)
+        self.assertEqual(PROVIDERS['naver'].breaker.state, 'open')
+
+
+class SocialUserUpsertTest(TransactionTestCase):
+    """(oauth_provider, oauth_id) 유니크 + 단일 SQL 업서트: 동시 첫 로그인에도 유저 1명"""
+
+    def test_parallel_first_logins_create_one_user(self):
+        workers = 8
+        barrier = threading.Barrier(workers)
+        results, errors = [], []
+
+        def login():
+            try:
+                barrier.wait()
+                results.append(CustomUser.objects.get_or_create_social(
+                    'kakao', '12345', defaults={'email': 'kakao_12345@baro.app'}
+                ))
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=login) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(CustomUser.objects.filter(oauth_provider='kakao', oauth_id='12345').count(), 1)
+        self.assertEqual(len({user.pk for user, _ in results}), 1)
+        self.assertEqual(sum(created for _, created in results), 1)
+
+    def test_existing_user_is_one_query(self):
+        CustomUser.objects.get_or_create_social('naver', 'abc', defaults={'email': 'naver_abc@baro.app'})
+
+        with self.assertNumQueries(1):
+            user, created = CustomUser.objects.get_or_create_social('naver', 'abc', defaults={'email': 'x@baro.app'})
+
+        self.assertFalse(created)
+        self.assertEqual(user.email, 'naver_abc@baro.app')
+        self.assertFalse(user.has_usable_password())
+
+    def test_dedupe_merges_duplicate_accounts(self):
+        from apps.grievances.models import Grievance, Like
+
+        # 제약 추가 전 상태 재현
+        constraint = next(c for c in CustomUser._meta.constraints if c.name == 'users_oauth_provider_id_uniq')
+        with connection.schema_editor() as editor:
+            editor.remove_constraint(CustomUser, constraint)
+
+        first = CustomUser.objects.create_user(email='first@baro.app', oauth_provider='kakao', oauth_id='dup')
+        second = CustomUser.objects.create_user(email='second@baro.app', oauth_provider='kakao', oauth_id='dup')
+        grievance = Grievance.objects.create(
+            user=second, title='포트홀', content='도로 파손', location='강남구', latitude=37.4979, longitude=127.0276,
+        )
+        other = Grievance.objects.create(title='가로등', content='고장', location='강남구', latitude=37.5, longitude=127.03)
+        Like.objects.create(user=first, grievance=other)
+        Like.objects.create(user=second, grievance=other)
+        Like.objects.create(user=second, grievance=grievance)
+
+        call_command('dedupe_social_users', stdout=io.StringIO())
+
+        with connection.schema_editor() as editor:
+            editor.add_constraint(CustomUser, constraint)
+        self.assertEqual(list(CustomUser.objects.filter(oauth_id='dup').values_list('pk', flat=True)), [first.pk])
+        self.assertEqual(Grievance.objects.get(pk=grievance.pk).user_id, first.pk)
+        self.assertEqual(Like.objects.filter(user=first).count(), 2)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, THROTTLE_BUCKETS={'auth': (2, '1/min')})
+class AuthThrottleTest(TestCase):
+    """auth 범위 토큰 버킷: 버킷 크기만큼 허용 후 429 + Retry-After, IP별 분리"""
+
+    def setUp(self):
+        cache.clear()
+        CustomUser.objects.create_user(email='citizen@baro.app', password='pw')
+        self.client = APIClient()
+
+    def _login(self, ip='10.0.0.1'):
+        return self.client.post(
+            '/api/auth/login/', {'email': 'citizen@baro.app', 'password': 'pw'}, format='json', REMOTE_ADDR=ip,
+        )
+
+    def test_burst_then_throttled_with_retry_after(self):
+        self.assertEqual([self._login().status_code for _ in range(2)], [200, 200])
+
+        response = self._login()
+        self.assertEqual(response.status_code, 429)
+        self.assertGreaterEqual(int(response['Retry-After']), 1)
+        self.assertLessEqual(int(response['Retry-After']), 60)
+
+        self.assertEqual(self._login(ip='10.0.0.2').status_code, 200)
+
+    def test_forwarded_for_does_not_reset_bucket(self):
+        # NUM_PROXIES=0 → 클라이언트가 보낸 X-Forwarded-For는 무시하고 REMOTE_ADDR 기준
+        statuses = [
+            self.client.post(
+                '/api/auth/login/', {'email': 'citizen@baro.app', 'password': 'pw'}, format='json',
+                REMOTE_ADDR='10.0.0.1', HTTP_X_FORWARDED_FOR=f'203.0.113.{index}',
+            ).status_code
+            for index in range(3)
+        ]
+        self.assertEqual(statuses, [200, 200, 429])
+
+    def test_unscoped_views_are_not_throttled(self):
+        for _ in range(5):
+            self.assertNotEqual(self.client.get('/api/auth/me/', REMOTE_ADDR='10.0.0.1').status_code, 429)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class AuthQueryCountTest(TestCase):
+    """
+    인증 엔드포인트 SQL 쿼리 형태 고정 (가입 / 로그인 / 내 정보 / 카카오·네이버 로그인)
+    - 계정의 민원 / 좋아요 수를 1 / 20 / 100으로 바꿔도 정규화된 쿼리 목록이 같아야 함
+      (민원 엔드포인트는 apps.grievances.tests.QueryCountRegressionTest)
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.stub = ProviderStubServer()
+        cls.stub.start_in_thread()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.stub.shutdown()
+        cls.stub.server_close()
+        super().tearDownClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.area = Area.objects.get(name='강남구')
+        cls.accounts = {
+            size: CustomUser.objects.create_user(email=f'account{size}@baro.app', password='pw', area=cls.area)
+            for size in QUERY_SCALE_SIZES
+        }
+        for size, user in cls.accounts.items():
+            cls.add_activity(user, size)
+
+    @classmethod
+    def add_activity(cls, user, size):
+        """계정에 민원 / 좋아요 size개 (이미 있으면 그대로)"""
+        if Grievance.objects.filter(user=user).exists():
+            return
+        grievances = [
+            Grievance.objects.create(
+                user=user, title=f'민원 {index}', content='내용', location=cls.area.name,
+                latitude=37.5, longitude=127.0, area=cls.area,
+            )
+            for index in range(size)
+        ]
+        Like.objects.bulk_create([Like(user=user, grievance=grievance) for grievance in grievances])
+
+    def setUp(self):
+        for provider in PROVIDERS.values():
+            provider.breaker.reset()
+        self.addCleanup(lambda: [provider.breaker.reset() for provider in PROVIDERS.values()])
+        self.settings_override = self.settings(**self.stub.urls())
+        self.settings_override.enable()
+        self.addCleanup(self.settings_override.disable)
+        self.registered = 0
+
+    def _fingerprints(self, method, path, data=None, access_token=None):
+        """요청 1회에 실행된 쿼리의 정규화 목록 (캐시 비운 상태)"""
+        cache.clear()
+        client = APIClient()
+        if access_token is not None:
+            client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(client, method)(path, data, format='json')
+        self.assertLess(response.status_code, 400, path)
+        return [sql_fingerprint(query['sql']) for query in context.captured_queries]
+
+    def assertQueriesConstant(self, build):
+        build(QUERY_SCALE_SIZES[0])  # 워밍업 (ContentType 등 프로세스 캐시)
+        baseline = build(QUERY_SCALE_SIZES[0])
+        for size in QUERY_SCALE_SIZES[1:]:
+            with self.subTest(size=size):
+                fingerprints = build(size)
+                self.assertEqual(len(fingerprints), len(baseline), '\n'.join(fingerprints))
+                self.assertEqual(fingerprints, baseline)
+
+    def test_register(self):
+        def build(size):
+            self.registered += 1
+            return self._fingerprints('post', '/api/auth/register/', {
+                'email': f'new{size}-{self.registered}@baro.app', 'password': 'Baro!2345pw', 'password2': 'Baro!2345pw',
+            })
+        self.assertQueriesConstant(build)
+
+    def test_login(self):
+        self.assertQueriesConstant(lambda size: self._fingerprints(
+            'post', '/api/auth/login/', {'email': self.accounts[size].email, 'password': 'pw'}
+        ))
+
+    def test_me(self):
+        self.assertQueriesConstant(lambda size: self._fingerprints(
+            'get', '/api/auth/me/', access_token=AccessToken.for_user(self.accounts[size])
+        ))
+
+    def test_social_login_existing_user(self):
+        for provider in ('kakao', 'naver'):
+            def build(size):
+                path, data = f'/api/auth/{provider}/', {'access_token': f'{provider}-account-{size}'}
+                # 첫 로그인(가입)은 측정 제외, 이후 기존 계정 로그인 측정
+                user_id = APIClient().post(path, data, format='json').json()['user']['id']
+                self.add_activity(CustomUser.objects.get(pk=user_id), size)
+                return self._fingerprints('post', path, data)
+            with self.subTest(provider=provider):
+                self.assertQueriesConstant(build)
@@ -0,0 +1,117 @@
+"""
+refresh 토큰 블랙리스트 저장소
+- TOKEN_BLACKLIST_BACKEND: 저장소 클래스 경로 (기본 TransitionTokenBlacklist)
+- RedisTokenBlacklist: JTI를 Redis 키로 저장, TTL = 토큰 남은 수명 → 만료 토큰은 자동 삭제
+  (발급 토큰 기록 없음 / 갱신 시 DB 조회 없음)
+- DatabaseTokenBlacklist: 기존 simplejwt token_blacklist 테이블 (OutstandingToken / BlacklistedToken)
+- TransitionTokenBlacklist: Redis에 쓰고, Redis에 없으면 기존 테이블도 확인 (전환 기간용, 기본값)
+  → purge_token_blacklist --import-active 실행 후 TOKEN_BLACKLIST_BACKEND를 RedisTokenBlacklist로 지정
+
+Redis 장애 시(IGNORE_EXCEPTIONS) 블랙리스트 확인은 통과로 처리 (로그인 유지 우선)
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import aware_utcnow, datetime_from_epoch
+
+
+def _leeway_seconds():
+    leeway = api_settings.LEEWAY
+    if isinstance(leeway, timedelta):
+        return leeway.total_seconds()
+    return leeway or 0
+
+
+class RedisTokenBlacklist:
+    """JTI → Redis 키 (값 1, 만료 시각까지 유지)"""
+
+    key_prefix = 'token_blacklist'
+
+    @classmethod
+    def key(cls, jti):
+        return f'{cls.key_prefix}:{jti}'
+
+    @staticmethod
+    def ttl(exp, now=None):
+        """만료(exp, epoch 초)까지 남은 초 + LEEWAY (만료된 토큰은 0)"""
+        now = now or aware_utcnow()
+        remaining = (datetime_from_epoch(exp) - now).total_seconds()
+        if remaining <= 0:
+            return 0
+        return int(remaining + _leeway_seconds()) + 1
+
+    def add(self, token):
+        """
+        토큰 블랙리스트 등록
+
+        Returns:
+            새로 등록하면 True, 이미 등록된 토큰이면 False (동시 갱신 중복 사용 차단)
+        """
+        return self.add_jti(token[api_settings.JTI_CLAIM], token['exp'])
+
+    def add_jti(self, jti, exp):
+        ttl = self.ttl(exp)
+        if not ttl:
+            return True  # 이미 만료 → 토큰 검증에서 거부되므로 저장 불필요
+        # SET NX: 같은 토큰으로 동시에 갱신하면 하나만 성공 (Redis 오류 시 None → 통과)
+        return cache.add(self.key(jti), 1, timeout=ttl) is not False
+
+    def contains(self, token):
+        return cache.get(self.key(token[api_settings.JTI_CLAIM])) is not None
+
+    def outstand(self, token, user):
+        """발급 토큰은 기록하지 않음 (블랙리스트 대상만 저장)"""
+
+
+class DatabaseTokenBlacklist:
+    """기존 simplejwt token_blacklist 테이블 (INSTALLED_APPS에 token_blacklist 필요)"""
+
+    def add(self, token):
+        from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+        outstanding, _ = OutstandingToken.objects.get_or_create(
+            jti=token[api_settings.JTI_CLAIM],
+            defaults={
+                'token': str(token),
+                'expires_at': datetime_from_epoch(token['exp']),
+            },
+        )
+        _, created = BlacklistedToken.objects.get_or_create(token=outstanding)
+        return created
+
+    def contains(self, token):
+        from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+        return BlacklistedToken.objects.filter(token__jti=token[api_settings.JTI_CLAIM]).exists()
+
+    def outstand(self, token, user):
+        from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+        OutstandingToken.objects.create(
+            user=user,
+            jti=token[api_settings.JTI_CLAIM],
+            token=str(token),
+            created_at=token.current_time,
+            expires_at=datetime_from_epoch(token['exp']),
+        )
+
+
+class TransitionTokenBlacklist(RedisTokenBlacklist):
+    """Redis 저장 + 기존 테이블 확인 (전환 전에 블랙리스트된 토큰도 거부)"""
+
+    def contains(self, token):
+        return super().contains(token) or DatabaseTokenBlacklist().contains(token)
+
+
+_backends = {}
+
+
+def get_token_blacklist():
+    path = settings.TOKEN_BLACKLIST_BACKEND
+    if path not in _backends:
+        _backends[path] = import_string(path)()
+    return _backends[path]
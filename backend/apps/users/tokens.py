@@ -0,0 +1,35 @@
+"""
+JWT refresh 토큰
+simplejwt RefreshToken과 같은 클레임 / 수명, 블랙리스트만 TOKEN_BLACKLIST_BACKEND 저장소 사용
+(simplejwt BlacklistMixin의 token_blacklist 테이블 조회 / 발급 기록을 대체)
+"""
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import RefreshToken as SimpleRefreshToken, Token
+
+from apps.users.token_blacklist import get_token_blacklist
+
+
+class RefreshToken(SimpleRefreshToken):
+
+    def verify(self, *args, **kwargs):
+        self.check_blacklist()
+        Token.verify(self, *args, **kwargs)
+
+    def check_blacklist(self):
+        if get_token_blacklist().contains(self):
+            raise TokenError(_('Token is blacklisted'))
+
+    def blacklist(self):
+        """
+        Returns:
+            새로 블랙리스트에 등록하면 True, 이미 등록된 토큰이면 False
+        """
+        return get_token_blacklist().add(self)
+
+    @classmethod
+    def for_user(cls, user):
+        token = Token.for_user.__func__(cls, user)
+        get_token_blacklist().outstand(token, user)
+        return token
@@ -12,5 +12,6 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.development')
+os.environ.setdefault('BARO_SERVER_PROFILE', 'asgi')  # DB 연결 재사용 프로필 (settings 참고)
 
 application = get_asgi_application()
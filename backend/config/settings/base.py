@@ -47,12 +47,13 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'django.contrib.gis',  # PostGIS 지원
+    'django.contrib.postgres',  # pg_trgm 유사도 조회 (중복 민원 감지)
     'django.contrib.sites',  # Required by allauth
 
     # Third party apps
     'rest_framework',
     'rest_framework_simplejwt',
-    'rest_framework_simplejwt.token_blacklist',
+    'rest_framework_simplejwt.token_blacklist',  # 기존 블랙리스트 테이블 (purge_token_blacklist --all 후 제거 가능)
     'corsheaders',
     'django_filters',
     'allauth',
@@ -65,12 +66,18 @@ INSTALLED_APPS = [
     # Local apps
     'apps.users',
     'apps.grievances',
+    'apps.monitoring',
+    'apps.notifications',
 ]
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',  # CORS는 최상단에
+    'core.middleware.PrometheusMetricsMiddleware',  # /metrics 지표 수집
+    'core.middleware.ServerTimingMiddleware',  # 요청 성능 측정 (샘플링)
+    'apps.monitoring.middleware.SlowQueryMiddleware',  # 느린 쿼리 수집 (SLOW_QUERY_ENABLED)
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',  # 읽기 복제본 라우팅 (DB_REPLICA_HOSTS)
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -102,14 +109,30 @@ WSGI_APPLICATION = 'config.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
+# DB 연결 재사용 프로필 (config/wsgi.py, config/asgi.py가 BARO_SERVER_PROFILE 지정)
+# - wsgi: 워커(스레드)별 영구 연결 재사용 (CONN_MAX_AGE초 후 재연결 = 최대 수명)
+# - asgi: 요청마다 스레드가 바뀔 수 있어 영구 연결 비활성화 → PgBouncer 등 외부 풀 사용 권장
+# - DB_PGBOUNCER: PgBouncer 트랜잭션 풀링 대상이면 서버 사이드 커서 비활성화
+SERVER_PROFILE = os.environ.get('BARO_SERVER_PROFILE', 'wsgi')
+DB_CONN_MAX_AGE = config(
+    f'DB_CONN_MAX_AGE_{SERVER_PROFILE.upper()}',
+    default=0 if SERVER_PROFILE == 'asgi' else 60,
+    cast=int,
+)
+DB_CONN_HEALTH_CHECKS = config('DB_CONN_HEALTH_CHECKS', default=True, cast=bool)  # 재사용 전 연결 확인
+DB_PGBOUNCER = config('DB_PGBOUNCER', default=False, cast=bool)
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.contrib.gis.db.backends.postgis',
+        'ENGINE': 'core.db.backends.postgis',  # PostGIS + 연결 지표 (baro_db_connections_*)
         'NAME': config('DB_NAME', default='baro_db'),
         'USER': config('DB_USER', default='postgres'),
         'PASSWORD': config('DB_PASSWORD', default='postgres'),
         'HOST': config('DB_HOST', default='localhost'),
         'PORT': config('DB_PORT', default='5432'),
+        'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': DB_CONN_HEALTH_CHECKS,
+        'DISABLE_SERVER_SIDE_CURSORS': DB_PGBOUNCER,
         'OPTIONS': {
             'client_encoding': 'UTF8',
             'options': '-c lc_messages=C -c client_encoding=UTF8',
@@ -117,6 +140,24 @@ DATABASES = {
     }
 }
 
+# 읽기 복제본 (GET 요청의 읽기만 사용, core/db_router.py)
+# DB_REPLICA_HOSTS=host:port,host:port → DATABASES['replica_1'], ['replica_2'] ... (DB 이름/계정은 primary와 동일)
+DB_REPLICA_HOSTS = [host.strip() for host in config('DB_REPLICA_HOSTS', default='').split(',') if host.strip()]
+for index, replica in enumerate(DB_REPLICA_HOSTS, start=1):
+    replica_host, _, replica_port = replica.partition(':')
+    DATABASES[f'replica_{index}'] = {
+        **DATABASES['default'],
+        'HOST': replica_host,
+        'PORT': replica_port or DATABASES['default']['PORT'],
+        'OPTIONS': {**DATABASES['default']['OPTIONS'], 'connect_timeout': 3},  # 장애 시 빠르게 primary로
+        'TEST': {'MIRROR': 'default'},
+    }
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias.startswith('replica_')]
+DATABASE_ROUTERS = ['core.db_router.ReplicaRouter']
+REPLICA_MAX_LAG_SECONDS = config('REPLICA_MAX_LAG_SECONDS', default=5.0, cast=float)  # 초과 시 해당 복제본 제외
+REPLICA_LAG_CHECK_INTERVAL = config('REPLICA_LAG_CHECK_INTERVAL', default=5.0, cast=float)  # 프로세스별 확인 주기 (초)
+REPLICA_STICKY_SECONDS = config('REPLICA_STICKY_SECONDS', default=10, cast=int)  # 쓰기 후 primary 고정 시간
+
 # Cache Configuration (Redis)
 # https://docs.djangoproject.com/en/5.0/topics/cache/
 CACHES = {
@@ -141,6 +182,17 @@ CACHES = {
 # Custom User Model
 AUTH_USER_MODEL = 'users.CustomUser'
 
+# Password hashing
+# 새 패스워드는 PBKDF2 (Django 기본), import_legacy로 이관한 레거시 Argon2 해시(argon2$...)는 Argon2로 검증
+# (argon2-cffi 필요, 로그인 시 기본 해셔로 자동 재해시)
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -188,7 +240,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # REST Framework 설정
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.users.authentication.CachedJWTAuthentication',  # 유저 조회 캐시 (JWT_USER_CACHE_TTL)
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
@@ -202,8 +254,36 @@ REST_FRAMEWORK = {
     ],
     'EXCEPTION_HANDLER': 'core.exceptions.custom_exception_handler',
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'core.renderers.ORJSONRenderer',  # orjson 기반 (JSONRenderer와 동일한 출력)
+    ],
+    'DEFAULT_THROTTLE_CLASSES': [
+        'core.throttling.TokenBucketThrottle',  # throttle_scope가 있는 뷰만 제한
     ],
+    # 요청 제한 IP 판별: 앞단 신뢰 프록시 수 (0이면 REMOTE_ADDR만 사용)
+    # 리버스 프록시 / 로드밸런서 뒤에서는 실제 단계 수로 지정 (X-Forwarded-For 오른쪽에서 N번째 = 클라이언트)
+    # None(미지정)은 클라이언트가 보낸 X-Forwarded-For를 그대로 써서 요청마다 새 버킷을 받을 수 있으므로 사용하지 않음
+    'NUM_PROXIES': config('NUM_PROXIES', default=0, cast=int),
+}
+
+# 요청 제한 토큰 버킷: 범위 → (버킷 크기 = 연속 허용 수, 충전 속도)
+# 키는 범위 + 로그인 유저 (비로그인은 IP)
+THROTTLE_BUCKETS = {
+    'auth': (  # 회원가입 / 로그인 / 소셜 로그인
+        config('THROTTLE_AUTH_BURST', default=10, cast=int),
+        config('THROTTLE_AUTH_RATE', default='10/min'),
+    ),
+    'write': (  # 민원 생성 / 수정 / 삭제 / 상태 변경 (역지오코딩 호출 포함)
+        config('THROTTLE_WRITE_BURST', default=10, cast=int),
+        config('THROTTLE_WRITE_RATE', default='30/hour'),
+    ),
+    'like': (
+        config('THROTTLE_LIKE_BURST', default=30, cast=int),
+        config('THROTTLE_LIKE_RATE', default='60/min'),
+    ),
+    'password': (  # 비공개 민원 패스워드 확인 (대입 공격 방지)
+        config('THROTTLE_PASSWORD_BURST', default=5, cast=int),
+        config('THROTTLE_PASSWORD_RATE', default='5/min'),
+    ),
 }
 
 # JWT 설정
@@ -217,8 +297,20 @@ SIMPLE_JWT = {
     'AUTH_HEADER_TYPES': ('Bearer',),
     'USER_ID_FIELD': 'id',
     'USER_ID_CLAIM': 'user_id',
+    'TOKEN_OBTAIN_SERIALIZER': 'apps.users.serializers.TokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'apps.users.serializers.TokenRefreshSerializer',
 }
 
+# refresh 토큰 블랙리스트 저장소 (apps/users/token_blacklist.py)
+# 기본 TransitionTokenBlacklist (Redis + 기존 테이블 확인): 바로 Redis 전용으로 바꾸면 기존 테이블에만 있는
+# 로그아웃 / 회전된 토큰이 다시 유효해짐 → purge_token_blacklist --import-active 실행 후 RedisTokenBlacklist로 지정
+TOKEN_BLACKLIST_BACKEND = config(
+    'TOKEN_BLACKLIST_BACKEND', default='apps.users.token_blacklist.TransitionTokenBlacklist'
+)
+
+# JWT 인증 유저 캐시 (초) - 권한 필드만 캐시, 유저 저장 시 즉시 삭제
+JWT_USER_CACHE_TTL = config('JWT_USER_CACHE_TTL', default=60, cast=int)
+
 # CORS 설정
 CORS_ALLOW_ALL_ORIGINS = config('CORS_ALLOW_ALL', default=True, cast=bool)  # 개발용
 CORS_ALLOWED_ORIGINS = config(
@@ -242,6 +334,83 @@ CORS_ALLOW_HEADERS = [
 NAVER_MAP_CLIENT_ID = config('NAVER_MAP_CLIENT_ID', default='')
 NAVER_MAP_CLIENT_SECRET = config('NAVER_MAP_CLIENT_SECRET', default='')
 
+# 외부 API 주소 (부하 테스트 시 core.provider_stubs 스텁 서버로 교체 가능)
+NAVER_GEOCODE_API_URL = config(
+    'NAVER_GEOCODE_API_URL',
+    default='https://maps.apigw.ntruss.com/map-reversegeocode/v2/gc'
+)
+KAKAO_USER_INFO_URL = config('KAKAO_USER_INFO_URL', default='https://kapi.kakao.com/v2/user/me')
+NAVER_USER_INFO_URL = config('NAVER_USER_INFO_URL', default='https://openapi.naver.com/v1/nid/me')
+
+# 소셜 로그인 사용자 정보 조회 (apps/users/social.py)
+SOCIAL_HTTP_POOL_SIZE = config('SOCIAL_HTTP_POOL_SIZE', default=20, cast=int)  # 제공자 호스트별 유지 연결 수
+SOCIAL_CONNECT_TIMEOUT = config('SOCIAL_CONNECT_TIMEOUT', default=2.0, cast=float)
+SOCIAL_READ_TIMEOUT = config('SOCIAL_READ_TIMEOUT', default=3.0, cast=float)
+SOCIAL_PROFILE_CACHE_TTL = config('SOCIAL_PROFILE_CACHE_TTL', default=300, cast=int)  # 토큰 → 프로필 캐시 (초)
+SOCIAL_CIRCUIT_FAILURE_THRESHOLD = config('SOCIAL_CIRCUIT_FAILURE_THRESHOLD', default=5, cast=int)
+SOCIAL_CIRCUIT_RESET_SECONDS = config('SOCIAL_CIRCUIT_RESET_SECONDS', default=30, cast=int)
+
+# 요청 성능 측정 (Server-Timing 헤더 + 'baro.timing' 로그)
+SERVER_TIMING_SAMPLE_RATE = config('SERVER_TIMING_SAMPLE_RATE', default=0.05, cast=float)  # 측정 비율 (0 ~ 1)
+# 응답 헤더 노출 여부 (켜도 스태프 사용자 요청에만, 구간별 시간이 외부에 타이밍 정보로 새지 않도록)
+SERVER_TIMING_HEADER = config('SERVER_TIMING_HEADER', default=False, cast=bool)
+SERVER_TIMING_SLOW_MS = config('SERVER_TIMING_SLOW_MS', default=1000, cast=int)  # 이상이면 WARNING 로그
+
+# Prometheus /metrics: 'Authorization: Bearer <토큰>' 또는 허용 IP / 대역(REMOTE_ADDR)만, 둘 다 비면 모두 거부
+# 허용 IP는 프록시를 거치지 않는 스크레이퍼 주소만 (같은 호스트 nginx 뒤라면 127.0.0.1은 외부 요청도 포함)
+# gunicorn 다중 워커는 PROMETHEUS_MULTIPROC_DIR 환경변수 지정 (gunicorn.conf.py 참고)
+METRICS_AUTH_TOKEN = config('METRICS_AUTH_TOKEN', default='')
+METRICS_ALLOWED_IPS = [ip.strip() for ip in config('METRICS_ALLOWED_IPS', default='').split(',') if ip.strip()]
+
+# 느린 쿼리 수집 (opt-in, 관리자 페이지 '느린 쿼리'에서 확인)
+SLOW_QUERY_ENABLED = config('SLOW_QUERY_ENABLED', default=False, cast=bool)
+SLOW_QUERY_THRESHOLD_MS = config('SLOW_QUERY_THRESHOLD_MS', default=200, cast=int)
+SLOW_QUERY_MAX_PER_REQUEST = config('SLOW_QUERY_MAX_PER_REQUEST', default=5, cast=int)
+SLOW_QUERY_EXPLAIN_SAMPLE_RATE = config('SLOW_QUERY_EXPLAIN_SAMPLE_RATE', default=0.1, cast=float)
+# 샘플링 없이 항상 EXPLAIN할 유형 (spatial, search 쉼표 구분, 기본 없음 → 모든 유형 샘플링)
+SLOW_QUERY_EXPLAIN_KINDS = [kind.strip() for kind in config('SLOW_QUERY_EXPLAIN_KINDS', default='').split(',') if kind.strip()]
+SLOW_QUERY_EXPLAIN_TIMEOUT_MS = config('SLOW_QUERY_EXPLAIN_TIMEOUT_MS', default=5000, cast=int)
+SLOW_QUERY_STORE = config('SLOW_QUERY_STORE', default='db')  # db (slow_queries 테이블) / log (baro.slow_query 로거)
+
+# 완료 민원 보관 (manage.py archive_grievances, apps/grievances/archive.py)
+GRIEVANCE_ARCHIVE_AFTER_DAYS = config('GRIEVANCE_ARCHIVE_AFTER_DAYS', default=365, cast=int)  # 완료 후 보관까지 일수
+GRIEVANCE_ARCHIVE_BATCH_SIZE = config('GRIEVANCE_ARCHIVE_BATCH_SIZE', default=500, cast=int)
+GRIEVANCE_ARCHIVE_PAUSE_SECONDS = config('GRIEVANCE_ARCHIVE_PAUSE_SECONDS', default=1.0, cast=float)  # 배치 사이 대기
+GRIEVANCE_ARCHIVE_LOCK_TIMEOUT_MS = config('GRIEVANCE_ARCHIVE_LOCK_TIMEOUT_MS', default=2000, cast=int)
+
+# 상태 변경 알림 (apps/notifications, python manage.py dispatch_notifications --loop)
+NOTIFICATION_SENDER = config('NOTIFICATION_SENDER', default='apps.notifications.senders.LoggingSender')
+NOTIFICATION_PUSH_URL = config('NOTIFICATION_PUSH_URL', default='')  # PushGatewaySender 발송 주소
+NOTIFICATION_PUSH_API_KEY = config('NOTIFICATION_PUSH_API_KEY', default='')
+NOTIFICATION_BATCH_SIZE = config('NOTIFICATION_BATCH_SIZE', default=500, cast=int)  # 배치당 아웃박스 행 수
+NOTIFICATION_COALESCE_SECONDS = config('NOTIFICATION_COALESCE_SECONDS', default=30, cast=int)  # 연속 변경 합치기
+NOTIFICATION_MAX_ATTEMPTS = config('NOTIFICATION_MAX_ATTEMPTS', default=5, cast=int)
+
+# 인기(hot) 정렬 점수 (ordering=hot, python manage.py refresh_hot_scores)
+# 점수 = log10(1 + 최근 좋아요) + 접수 시각(epoch) / GRAVITY - 완료 감점
+# → GRAVITY초 늦게 접수된 민원은 최근 좋아요 10배와 동급, 완료 민원은 좋아요 10^PENALTY배만큼 뒤로
+HOT_SCORE_WINDOW_DAYS = config('HOT_SCORE_WINDOW_DAYS', default=7, cast=int)  # '최근 좋아요' 기간
+HOT_SCORE_GRAVITY_SECONDS = config('HOT_SCORE_GRAVITY_SECONDS', default=45000, cast=int)
+HOT_SCORE_RESOLVED_PENALTY = config('HOT_SCORE_RESOLVED_PENALTY', default=2.0, cast=float)
+
+# 구역 / 카테고리별 좋아요 순위 (Redis sorted set, python manage.py reconcile_leaderboards)
+LEADERBOARD_SIZE = config('LEADERBOARD_SIZE', default=100, cast=int)  # 키별 유지 개수 (조회 최대 수 이상)
+
+# 우리 동네 피드 (내 구역 + 인접 구역 최근 공개 민원, 구역별 Redis sorted set)
+# 인접 구역: 경계가 둘 다 있으면 경계 간 TOLERANCE 이내, 없으면 중심 좌표 간 RADIUS 이내 (python manage.py build_area_adjacency)
+NEIGHBOURHOOD_BOUNDARY_TOLERANCE_M = config('NEIGHBOURHOOD_BOUNDARY_TOLERANCE_M', default=50, cast=int)
+NEIGHBOURHOOD_RADIUS_KM = config('NEIGHBOURHOOD_RADIUS_KM', default=5.0, cast=float)
+NEIGHBOURHOOD_FEED_SIZE = config('NEIGHBOURHOOD_FEED_SIZE', default=200, cast=int)  # 구역별 유지 개수 (그 이전 페이지는 DB 조회)
+NEIGHBOURHOOD_FEED_TTL = config('NEIGHBOURHOOD_FEED_TTL', default=3600, cast=int)  # 시그널을 거치지 않는 변경(보관 / 대량 적재) 반영 주기 (초)
+# 피드 기간 (일): DB 조회에 created_at 하한 → grievances 월 파티션 중 최근 파티션만 읽음
+NEIGHBOURHOOD_FEED_WINDOW_DAYS = config('NEIGHBOURHOOD_FEED_WINDOW_DAYS', default=180, cast=int)
+
+# 중복 민원 감지 (반경 + 기간 + 제목 trigram 유사도, 인덱스 grievances_title_trgm + 좌표 공간 인덱스)
+# 인덱스 조건은 pg_trgm 기본 임계값(% 연산자, 0.3) → DUPLICATE_SIMILARITY는 0.3 이상에서만 의미 있음
+DUPLICATE_RADIUS_M = config('DUPLICATE_RADIUS_M', default=150, cast=int)
+DUPLICATE_WINDOW_DAYS = config('DUPLICATE_WINDOW_DAYS', default=30, cast=int)
+DUPLICATE_SIMILARITY = config('DUPLICATE_SIMILARITY', default=0.3, cast=float)
+
 # Logging 설정
 LOGGING = {
     'version': 1,
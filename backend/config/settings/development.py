@@ -21,6 +21,10 @@ CORS_ALLOW_ALL_ORIGINS = True
 #     }
 # }
 
+# 개발 환경에서는 모든 요청 측정, 스태프 사용자 요청에 Server-Timing 헤더
+SERVER_TIMING_SAMPLE_RATE = 1.0
+SERVER_TIMING_HEADER = True
+
 # Email backend - 콘솔에 이메일 출력
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 
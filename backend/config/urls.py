@@ -7,10 +7,14 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 
+from core.views import metrics_view
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('apps.grievances.urls')),
     path('api/', include('apps.users.urls')),
+    path('api/', include('apps.notifications.urls')),
+    path('metrics', metrics_view, name='metrics'),  # Prometheus
 ]
 
 # 개발 환경에서 미디어 파일 서빙
@@ -12,5 +12,6 @@ import os
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.development')
+os.environ.setdefault('BARO_SERVER_PROFILE', 'wsgi')  # DB 연결 재사용 프로필 (settings 참고)
 
 application = get_wsgi_application()
@@ -0,0 +1,85 @@
+"""
+외부 API 서킷 브레이커 (프로세스별 상태)
+- closed: 정상 호출, 연속 실패가 failure_threshold에 도달하면 open
+- open: reset_timeout초 동안 호출하지 않고 즉시 CircuitOpenError (장애 API에 타임아웃만큼 묶이지 않음)
+- half-open: reset_timeout 후 호출 1건만 허용 → 성공 시 closed, 실패 시 다시 open
+
+실패로 세는 것은 네트워크 오류 / 타임아웃 / 5xx뿐 (잘못된 토큰 등 4xx는 정상 응답)
+"""
+
+import threading
+import time
+
+from core import metrics
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# baro_circuit_breaker_state 값
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 0.5, OPEN: 1}
+
+
+class CircuitOpenError(Exception):
+    """열린 서킷으로 호출 차단"""
+
+
+class CircuitBreaker:
+    """
+    Attributes:
+        name: 지표 라벨 (예: kakao_user)
+        failure_threshold: open으로 바뀌는 연속 실패 수
+        reset_timeout: open 유지 시간 (초)
+    """
+
+    def __init__(self, name, failure_threshold=5, reset_timeout=30):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self):
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    def _refresh(self):
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._set_state(HALF_OPEN)
+
+    def _set_state(self, state):
+        self._state = state
+        self._probing = False
+        metrics.CIRCUIT_BREAKER_STATE.labels(self.name).set(STATE_VALUES[state])
+
+    def before_call(self):
+        """호출 전 확인 (차단 시 CircuitOpenError)"""
+        with self._lock:
+            self._refresh()
+            if self._state == OPEN or (self._state == HALF_OPEN and self._probing):
+                raise CircuitOpenError(f'{self.name} circuit open')
+            if self._state == HALF_OPEN:
+                self._probing = True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            if self._state != CLOSED:
+                self._set_state(CLOSED)
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                self._set_state(OPEN)
+
+    def reset(self):
+        with self._lock:
+            self._failures = 0
+            self._set_state(CLOSED)
@@ -0,0 +1,50 @@
+"""
+PostGIS 백엔드 + 연결 지표
+- 새 연결 수 / 연결 수립 시간(TCP + 인증 + 세션 초기화) / 현재 열린 연결 수
+- 연결 종료 사유: max_age (CONN_MAX_AGE 만료), health_check (CONN_HEALTH_CHECKS 실패),
+  unusable (오류 후 사용 불가), explicit (그 외 직접 close)
+
+settings: DATABASES[...]['ENGINE'] = 'core.db.backends.postgis'
+"""
+
+import time
+
+from django.contrib.gis.db.backends.postgis.base import DatabaseWrapper as PostGISDatabaseWrapper
+
+from core import metrics
+
+
+class DatabaseWrapper(PostGISDatabaseWrapper):
+
+    _close_reason = None
+
+    def connect(self):
+        started = time.perf_counter()
+        super().connect()
+        metrics.DB_CONNECTION_SETUP_DURATION.labels(self.alias).observe(time.perf_counter() - started)
+        metrics.DB_CONNECTIONS_OPENED.labels(self.alias).inc()
+        metrics.DB_CONNECTIONS_OPEN.labels(self.alias).inc()
+
+    def close(self):
+        was_open = self.connection is not None and not self.closed_in_transaction
+        try:
+            super().close()
+        finally:
+            if was_open and self.connection is None:
+                metrics.DB_CONNECTIONS_OPEN.labels(self.alias).dec()
+                metrics.DB_CONNECTIONS_CLOSED.labels(self.alias, self._close_reason or 'explicit').inc()
+
+    def close_if_health_check_failed(self):
+        self._close_reason = 'health_check'
+        try:
+            super().close_if_health_check_failed()
+        finally:
+            self._close_reason = None
+
+    def close_if_unusable_or_obsolete(self):
+        expired = self.close_at is not None and time.monotonic() >= self.close_at
+        self._close_reason = 'max_age' if expired else 'unusable'
+        try:
+            super().close_if_unusable_or_obsolete()
+        finally:
+            self._close_reason = None
@@ -0,0 +1,178 @@
+"""
+읽기 전용 복제본(replica) 라우팅
+- DB_REPLICA_HOSTS로 지정한 복제본이 DATABASES['replica_1'...]로 등록됨 (settings 참고)
+- core.middleware.ReplicaRoutingMiddleware가 요청마다 RoutingState를 활성화
+  - GET / HEAD / OPTIONS 요청의 읽기만 복제본으로 (요청 밖: 관리 명령, 셸 등은 항상 primary)
+  - 요청 중 쓰기가 한 번이라도 있으면 이후 읽기는 primary (create / like 직후 재조회 등)
+  - 쓰기가 있었던 사용자(JWT user_id) / 세션은 REPLICA_STICKY_SECONDS 동안 primary 고정
+- 복제 지연이 REPLICA_MAX_LAG_SECONDS를 넘거나 접속 불가인 복제본은 제외 → 남은 게 없으면 primary
+  (지연은 프로세스별로 REPLICA_LAG_CHECK_INTERVAL초마다 확인)
+- 버전 카운터로 ETag / 응답 캐시 키를 만드는 요청은 마지막 변경 후 복제본이 따라잡았다고 볼 수 없으면 primary
+  (require_primary_since, 지연된 복제본의 변경 전 행이 새 버전으로 캐시 / 304 유지되는 것 방지)
+"""
+
+import logging
+import random
+import threading
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+
+from core import metrics
+
+logger = logging.getLogger('baro.db_router')
+
+PRIMARY = 'default'
+
+_current_state = ContextVar('baro_db_routing', default=None)
+
+
+class RoutingState:
+    """
+    요청 1건의 라우팅 상태
+
+    Attributes:
+        use_replica: 복제본 읽기 허용 여부 (안전한 메서드 + 고정되지 않은 클라이언트)
+        wrote: 요청 중 쓰기 발생 여부 (이후 읽기는 primary)
+        replica: 이번 요청에 배정된 복제본 alias (첫 읽기 시 결정, 요청 내 동일)
+    """
+
+    def __init__(self, use_replica):
+        self.use_replica = use_replica
+        self.wrote = False
+        self.replica = None
+
+    def force_primary(self):
+        self.use_replica = False
+        self.replica = None
+
+
+def get_current_state():
+    return _current_state.get()
+
+
+def activate(state):
+    return _current_state.set(state)
+
+
+def deactivate(token):
+    _current_state.reset(token)
+
+
+def require_primary_since(last_modified):
+    """
+    last_modified(마지막 변경 epoch 초) 이후 복제본 반영을 보장할 수 없으면 이번 요청 읽기를 primary로
+    - 복제본 지연은 확인 시점에 REPLICA_MAX_LAG_SECONDS 이하, 확인은 REPLICA_LAG_CHECK_INTERVAL마다
+      → 변경 후 두 값의 합(+ 초 단위 절삭 1초)이 지나야 모든 사용 가능한 복제본에 반영
+    - 변경 시각을 모르면(None) primary
+    """
+    state = get_current_state()
+    if state is None or not state.use_replica or state.wrote:
+        return
+    window = settings.REPLICA_MAX_LAG_SECONDS + settings.REPLICA_LAG_CHECK_INTERVAL + 1
+    if last_modified is None or time.time() - last_modified <= window:
+        state.force_primary()
+
+
+class ReplicaHealth:
+    """
+    복제본별 지연(초) 확인 결과를 프로세스 메모리에 캐시
+    - 확인 실패(접속 불가 등)는 None → 다음 확인 시각까지 제외
+    """
+
+    LAG_SQL = """
+        SELECT CASE
+            WHEN NOT pg_is_in_recovery() THEN 0
+            WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+            ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+        END
+    """
+
+    _lock = threading.Lock()
+    _checked = {}  # alias → (monotonic 확인 시각, 지연 초 또는 None)
+
+    @classmethod
+    def lag(cls, alias):
+        now = time.monotonic()
+        checked = cls._checked.get(alias)
+        if checked and now - checked[0] < settings.REPLICA_LAG_CHECK_INTERVAL:
+            return checked[1]
+
+        with cls._lock:
+            checked = cls._checked.get(alias)
+            if checked and now - checked[0] < settings.REPLICA_LAG_CHECK_INTERVAL:
+                return checked[1]
+            lag = cls._measure(alias)
+            cls._checked[alias] = (now, lag)
+
+        if lag is not None:
+            metrics.DB_REPLICA_LAG.labels(alias).set(lag)
+        return lag
+
+    @classmethod
+    def _measure(cls, alias):
+        try:
+            with connections[alias].cursor() as cursor:
+                cursor.execute(cls.LAG_SQL)
+                return float(cursor.fetchone()[0])
+        except DatabaseError as e:
+            logger.warning('replica %s unavailable: %s', alias, e)
+            connections[alias].close_if_unusable_or_obsolete()
+            return None
+
+    @classmethod
+    def mark_down(cls, alias):
+        """요청 중 오류가 난 복제본을 다음 확인 시각까지 제외"""
+        with cls._lock:
+            cls._checked[alias] = (time.monotonic(), None)
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._checked.clear()
+
+    @classmethod
+    def healthy_replicas(cls):
+        max_lag = settings.REPLICA_MAX_LAG_SECONDS
+        healthy = []
+        for alias in settings.DATABASE_REPLICAS:
+            lag = cls.lag(alias)
+            if lag is not None and lag <= max_lag:
+                healthy.append(alias)
+        return healthy
+
+
+class ReplicaRouter:
+    """DATABASE_ROUTERS에 등록하는 라우터"""
+
+    def db_for_read(self, model, **hints):
+        state = get_current_state()
+        if state is None or not state.use_replica or state.wrote:
+            return PRIMARY
+
+        # 명시적 트랜잭션 안의 읽기는 쓰기와 같은 연결에서
+        if connections[PRIMARY].in_atomic_block:
+            return PRIMARY
+
+        if state.replica is None:
+            healthy = ReplicaHealth.healthy_replicas()
+            if not healthy:
+                state.force_primary()
+                return PRIMARY
+            state.replica = random.choice(healthy)
+        return state.replica
+
+    def db_for_write(self, model, **hints):
+        state = get_current_state()
+        if state is not None:
+            state.wrote = True
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 primary와 같은 데이터
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == PRIMARY
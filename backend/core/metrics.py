@@ -0,0 +1,175 @@
+"""
+Prometheus 지표 정의
+- HTTP: 뷰별 지연시간 히스토그램, 상태 코드 카운터, 요청당 SQL 수 히스토그램
+- 역지오코딩 캐시 히트/미스
+- 외부 API(Naver 역지오코딩, Kakao / Naver 로그인) 호출 시간 및 결과, 서킷 브레이커 상태
+- 소셜 로그인 프로필 캐시 히트/미스
+- 요청 제한(토큰 버킷) 범위별 허용 / 차단
+- 상태 변경 알림 발송 (기기 토큰 수, 배치 처리 시간)
+- 민원 상태 변경까지 걸린 시간 (접수 후 경과, 타임라인 이벤트 기록 시점)
+- 좋아요 순위 조회 출처 (Redis / 장애 시 DB)
+- 우리 동네 피드 조회 출처 (캐시 / 키 채움 / DB)
+- 이미지 처리(저장) 시간
+- 읽기 복제본 지연
+- DB 연결 수립 / 종료 (core.db.backends.postgis)
+
+gunicorn 다중 워커:
+    PROMETHEUS_MULTIPROC_DIR 환경변수를 지정하면 워커별 파일에 기록하고
+    /metrics에서 합산 (gunicorn.conf.py의 child_exit 훅이 종료된 워커 정리)
+"""
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+
+# 지연시간 버킷 (초) - HTTP / 외부 API / 이미지 처리 공용
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+# 민원 처리 소요 시간 버킷 (초) - 1시간 ~ 90일
+RESPONSE_TIME_BUCKETS = (3600, 6 * 3600, 86400, 3 * 86400, 7 * 86400, 14 * 86400, 30 * 86400, 90 * 86400)
+
+HTTP_REQUEST_DURATION = Histogram(
+    'baro_http_request_duration_seconds',
+    'HTTP 요청 처리 시간 (뷰별)',
+    ['view', 'method'],
+    buckets=REQUEST_BUCKETS,
+)
+HTTP_RESPONSES = Counter(
+    'baro_http_responses_total',
+    'HTTP 응답 수 (뷰 / 상태 코드별)',
+    ['view', 'method', 'status'],
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    'baro_db_queries_per_request',
+    '요청당 SQL 쿼리 수 (뷰별)',
+    ['view'],
+    buckets=QUERY_COUNT_BUCKETS,
+)
+GEOCODE_CACHE = Counter(
+    'baro_geocode_cache_total',
+    '역지오코딩 캐시 조회 결과 (hit / miss)',
+    ['result'],
+)
+EXTERNAL_API_REQUESTS = Counter(
+    'baro_external_api_requests_total',
+    '외부 API 호출 수 (결과별: success / client_error / error / circuit_open)',
+    ['provider', 'outcome'],
+)
+CIRCUIT_BREAKER_STATE = Gauge(
+    'baro_circuit_breaker_state',
+    '외부 API 서킷 브레이커 상태 (0: closed, 0.5: half-open, 1: open)',
+    ['provider'],
+    multiprocess_mode='max',
+)
+SOCIAL_PROFILE_CACHE = Counter(
+    'baro_social_profile_cache_total',
+    '소셜 로그인 토큰 → 프로필 캐시 조회 결과 (hit / miss)',
+    ['provider', 'result'],
+)
+EXTERNAL_API_DURATION = Histogram(
+    'baro_external_api_duration_seconds',
+    '외부 API 호출 시간',
+    ['provider'],
+    buckets=REQUEST_BUCKETS,
+)
+THROTTLE_DECISIONS = Counter(
+    'baro_throttle_total',
+    '요청 제한 판정 수 (범위별: allowed / throttled / error)',
+    ['scope', 'result'],
+)
+NOTIFICATION_DELIVERIES = Counter(
+    'baro_notification_deliveries_total',
+    '푸시 알림 전달 기기 수 (success / failure)',
+    ['result'],
+)
+NOTIFICATION_BATCH_DURATION = Histogram(
+    'baro_notification_batch_seconds',
+    '알림 아웃박스 배치 처리 시간 (수신자 확장 + 발송)',
+    buckets=REQUEST_BUCKETS,
+)
+GRIEVANCE_STATUS_ELAPSED = Histogram(
+    'baro_grievance_status_elapsed_seconds',
+    '민원 접수 후 상태 변경까지 걸린 시간 (변경 상태별)',
+    ['to_status'],
+    buckets=RESPONSE_TIME_BUCKETS,
+)
+LEADERBOARD_READS = Counter(
+    'baro_leaderboard_reads_total',
+    '좋아요 순위 조회 수 (redis / database: Redis 장애 시 집계 쿼리)',
+    ['source'],
+)
+NEIGHBOURHOOD_FEED_READS = Counter(
+    'baro_neighbourhood_feed_reads_total',
+    '우리 동네 피드 조회 수 (cache / rebuild: 키가 없어 DB로 채움 / database: 오래된 페이지, Redis 장애)',
+    ['source'],
+)
+IMAGE_PROCESSING_DURATION = Histogram(
+    'baro_image_processing_seconds',
+    '민원 이미지 처리 시간 (요청 단위)',
+    ['operation'],
+    buckets=REQUEST_BUCKETS,
+)
+DB_REPLICA_LAG = Gauge(
+    'baro_db_replica_lag_seconds',
+    '읽기 복제본 복제 지연 (마지막 확인 값)',
+    ['database'],
+    multiprocess_mode='max',
+)
+DB_CONNECTIONS_OPENED = Counter(
+    'baro_db_connections_opened_total',
+    'DB 새 연결 수',
+    ['database'],
+)
+DB_CONNECTIONS_CLOSED = Counter(
+    'baro_db_connections_closed_total',
+    'DB 연결 종료 수 (사유: max_age / health_check / unusable / explicit)',
+    ['database', 'reason'],
+)
+DB_CONNECTIONS_OPEN = Gauge(
+    'baro_db_connections_open',
+    '현재 열린 DB 연결 수 (워커 합산)',
+    ['database'],
+    multiprocess_mode='livesum',
+)
+DB_CONNECTION_SETUP_DURATION = Histogram(
+    'baro_db_connection_setup_seconds',
+    'DB 연결 수립 시간 (TCP + 인증 + 세션 초기화)',
+    ['database'],
+    buckets=REQUEST_BUCKETS,
+)
+
+
+def record_external_call(provider, seconds, status_code=None):
+    """
+    외부 API 호출 1건 기록
+    - status_code None: 네트워크 오류/타임아웃 → error
+    - 4xx: client_error (잘못된/만료된 토큰 등), 5xx: error
+    """
+    if status_code is None or status_code >= 500:
+        outcome = 'error'
+    elif status_code >= 400:
+        outcome = 'client_error'
+    else:
+        outcome = 'success'
+    EXTERNAL_API_DURATION.labels(provider).observe(seconds)
+    EXTERNAL_API_REQUESTS.labels(provider, outcome).inc()
+
+
+def render_latest():
+    """Prometheus 텍스트 형식 (다중 프로세스 모드면 워커 합산)"""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
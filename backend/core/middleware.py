@@ -0,0 +1,192 @@
+"""
+공통 미들웨어
+"""
+
+import logging
+import random
+import time
+from contextlib import ExitStack
+
+import jwt
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import OperationalError, connections
+
+from core import db_router, metrics
+from core.timing import RequestTimer, activate, deactivate
+
+logger = logging.getLogger('baro.timing')
+
+
+class ServerTimingMiddleware:
+    """
+    요청 성능 측정 미들웨어
+    - SERVER_TIMING_SAMPLE_RATE 비율의 요청만 측정 (나머지는 난수 1회 비용)
+    - 측정 요청: SQL 수/시간, 외부 API, 직렬화, 렌더링 시간을 'baro.timing' 로거의 구조화 필드(extra)로 기록
+    - Server-Timing 헤더는 SERVER_TIMING_HEADER가 켜져 있고 스태프 사용자 요청일 때만
+      (구간별 시간(비밀번호 해시, 외부 API 등)이 타이밍 부채널이 되지 않도록, 사용자는 DRF 인증 결과 기준)
+    - SERVER_TIMING_SLOW_MS 이상 걸린 요청은 WARNING 레벨
+    - 스트리밍 응답은 본문 생성 전까지만 측정
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, 'SERVER_TIMING_SAMPLE_RATE', 0.0)
+        self.expose_header = getattr(settings, 'SERVER_TIMING_HEADER', False)
+        self.slow_ms = getattr(settings, 'SERVER_TIMING_SLOW_MS', 1000)
+
+    def __call__(self, request):
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return self.get_response(request)
+
+        timer = RequestTimer()
+        token = activate(timer)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(timer.sql_wrapper))
+                response = self.get_response(request)
+        finally:
+            deactivate(token)
+
+        total = timer.elapsed
+        user = getattr(request, 'user', None)
+        if self.expose_header and user is not None and user.is_staff:
+            response['Server-Timing'] = timer.server_timing(total)
+
+        fields = timer.log_fields(total)
+        fields.update({
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+        })
+        level = logging.WARNING if fields['duration_ms'] >= self.slow_ms else logging.INFO
+        logger.log(
+            level,
+            '%s %s %s %sms (queries=%s sql=%sms external=%sms serialize=%sms render=%sms)',
+            request.method, request.path, response.status_code, fields['duration_ms'],
+            fields['query_count'], fields['sql_ms'], fields['external_ms'],
+            fields['serialize_ms'], fields['render_ms'],
+            extra={'timing': fields},
+        )
+        return response
+
+
+class QueryCounter:
+    """connection.execute_wrapper용 쿼리 수 집계"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class PrometheusMetricsMiddleware:
+    """
+    Prometheus 지표 수집 미들웨어 (모든 요청)
+    - 뷰 이름(URL name) 단위 라벨 → 경로 파라미터(UUID 등)로 라벨이 늘어나지 않음
+    - 지연시간 / 상태 코드 / 요청당 SQL 수 기록
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        counter = QueryCounter()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(counter))
+            response = self.get_response(request)
+        duration = time.perf_counter() - started
+
+        resolver_match = getattr(request, 'resolver_match', None)
+        view = resolver_match.view_name if resolver_match else 'unmatched'
+
+        metrics.HTTP_REQUEST_DURATION.labels(view, request.method).observe(duration)
+        metrics.HTTP_RESPONSES.labels(view, request.method, str(response.status_code)).inc()
+        metrics.DB_QUERIES_PER_REQUEST.labels(view).observe(counter.count)
+        return response
+
+
+class ReplicaRoutingMiddleware:
+    """
+    읽기 복제본 라우팅 상태 관리 (core.db_router.ReplicaRouter와 함께 사용)
+    - 안전한 메서드(GET/HEAD/OPTIONS) 요청만 복제본 읽기 허용
+    - 쓰기가 있었던 클라이언트는 REPLICA_STICKY_SECONDS 동안 primary 고정
+      (식별: JWT user_id 클레임 → 세션 키, 캐시 키 + 쿠키)
+    - 복제본 쿼리 오류 시 해당 복제본 제외 후 primary로 뷰 재실행 (안전한 메서드만)
+    - 복제본 미설정(DATABASE_REPLICAS 비어 있음) 시 비활성화
+    """
+
+    SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+    PIN_COOKIE = 'baro_db_pin'
+
+    def __init__(self, get_response):
+        if not settings.DATABASE_REPLICAS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.sticky_seconds = settings.REPLICA_STICKY_SECONDS
+
+    def __call__(self, request):
+        identity = self._client_identity(request)
+        use_replica = request.method in self.SAFE_METHODS and not self._is_pinned(request, identity)
+
+        state = db_router.RoutingState(use_replica)
+        token = db_router.activate(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            db_router.deactivate(token)
+
+        if state.wrote and self.sticky_seconds > 0:
+            if identity:
+                cache.set(self._pin_key(identity), 1, timeout=self.sticky_seconds)
+            response.set_cookie(self.PIN_COOKIE, '1', max_age=self.sticky_seconds, httponly=True, samesite='Lax')
+        return response
+
+    def process_exception(self, request, exception):
+        state = db_router.get_current_state()
+        if not isinstance(exception, OperationalError) or state is None or state.replica is None:
+            return None
+        if state.wrote or request.method not in self.SAFE_METHODS:
+            return None
+
+        db_router.logger.warning('replica %s failed, retrying on primary: %s', state.replica, exception)
+        db_router.ReplicaHealth.mark_down(state.replica)
+        connections[state.replica].close()
+        state.force_primary()
+
+        match = request.resolver_match
+        return match.func(request, *match.args, **match.kwargs)
+
+    def _is_pinned(self, request, identity):
+        if request.COOKIES.get(self.PIN_COOKIE):
+            return True
+        return bool(identity) and cache.get(self._pin_key(identity)) is not None
+
+    @staticmethod
+    def _pin_key(identity):
+        return f'db_pin:{identity}'
+
+    @staticmethod
+    def _client_identity(request):
+        """
+        DB 조회 없이 클라이언트 식별
+        JWT는 서명 검증 없이 user_id만 읽음 (라우팅 용도 - 위조해도 primary로 갈 뿐)
+        """
+        header = request.META.get('HTTP_AUTHORIZATION', '')
+        if header.startswith('Bearer '):
+            try:
+                claims = jwt.decode(header[7:], options={'verify_signature': False})
+            except jwt.InvalidTokenError:
+                claims = {}
+            user_id = claims.get(settings.SIMPLE_JWT.get('USER_ID_CLAIM', 'user_id'))
+            if user_id is not None:
+                return f'user:{user_id}'
+
+        session_key = request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+        return f'session:{session_key}' if session_key else None
@@ -3,7 +3,8 @@
 Flutter 앱의 페이징 요구사항에 맞춤
 """
 
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 
 
 class StandardResultsSetPagination(PageNumberPagination):
@@ -15,3 +16,29 @@ class StandardResultsSetPagination(PageNumberPagination):
     page_size = 20
     page_size_query_param = 'page_size'
     max_page_size = 100
+
+
+class HotScoreCursorPagination(CursorPagination):
+    """
+    인기순(ordering=hot) 키셋 페이징
+    - (hot_score, id) 인덱스 순서대로 이전 페이지 마지막 값 다음부터 조회 → 깊은 페이지도 OFFSET 비용 없음
+    - 응답: {"next": 커서 URL, "previous": 커서 URL, "results": [...]} (count 없음)
+    """
+    ordering = ('-hot_score', '-id')
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class HotOrderingFilter(OrderingFilter):
+    """
+    ordering=hot → (hot_score, id) 인덱스 순서
+    - 'hot'은 모델 필드가 아니라 ordering_fields 검증에서 빠지므로 별도 처리
+    - CursorPagination은 뷰의 OrderingFilter 정렬을 그대로 쓰므로 키셋 페이징 순서도 같이 맞춰짐
+    """
+    hot_param = 'hot'
+
+    def get_ordering(self, request, queryset, view):
+        if request.query_params.get(self.ordering_param) == self.hot_param:
+            return list(HotScoreCursorPagination.ordering)
+        return super().get_ordering(request, queryset, view)
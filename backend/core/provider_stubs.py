@@ -0,0 +1,179 @@
+"""
+외부 API 로컬 스텁 서버
+부하 테스트 / 통합 테스트에서 Naver 역지오코딩, Kakao / Naver 로그인 API, 푸시 발송(FCM 대신) 대체
+
+settings의 NAVER_GEOCODE_API_URL, KAKAO_USER_INFO_URL, NAVER_USER_INFO_URL을
+스텁 서버 주소로 지정해서 사용:
+    NAVER_GEOCODE_API_URL=http://127.0.0.1:8765/map-reversegeocode/v2/gc
+    KAKAO_USER_INFO_URL=http://127.0.0.1:8765/v2/user/me
+    NAVER_USER_INFO_URL=http://127.0.0.1:8765/v1/nid/me
+    NOTIFICATION_PUSH_URL=http://127.0.0.1:8765/push/send
+"""
+
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+
+class ProviderStubHandler(BaseHTTPRequestHandler):
+    """Naver Map / Kakao / Naver 응답 형식을 흉내내는 핸들러"""
+
+    server_version = 'BaroProviderStub/1.0'
+
+    def log_message(self, format, *args):
+        # 부하 테스트 중 콘솔 출력 억제
+        pass
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        routes = {
+            '/map-reversegeocode/v2/gc': self._naver_geocode,
+            '/v2/user/me': self._kakao_user,
+            '/v1/nid/me': self._naver_user,
+        }
+        handler = routes.get(parsed.path)
+        if handler is None:
+            return self._send(404, {'error': 'not found'})
+
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        self.server.count(parsed.path)
+        if self.server.failure_status:
+            return self._send(self.server.failure_status, {'error': 'stub failure'})
+        handler(parse_qs(parsed.query))
+
+    def do_POST(self):
+        parsed = urlparse(self.path)
+        if parsed.path != '/push/send':
+            return self._send(404, {'error': 'not found'})
+
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        self.server.count(parsed.path)
+        if self.server.failure_status:
+            return self._send(self.server.failure_status, {'error': 'stub failure'})
+
+        # 멀티캐스트 발송: 메시지별 기기 토큰 수만큼 성공 처리
+        messages = json.loads(body or b'{}').get('messages', [])
+        tokens = sum(len(message.get('tokens', [])) for message in messages)
+        self.server.count('push_tokens', tokens)
+        self._send(200, {'success': tokens, 'failure': 0})
+
+    def _send(self, status_code, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode()
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json;charset=UTF-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _token(self):
+        """Bearer 토큰 추출 ('invalid'로 시작하면 인증 실패 응답)"""
+        authorization = self.headers.get('Authorization', '')
+        token = authorization[len('Bearer '):] if authorization.startswith('Bearer ') else ''
+        if not token or token.startswith('invalid'):
+            return None
+        return token
+
+    @staticmethod
+    def _user_id(token):
+        """토큰별 고정 사용자 ID (같은 토큰 → 같은 사용자)"""
+        return int(hashlib.sha256(token.encode()).hexdigest()[:12], 16)
+
+    def _naver_geocode(self, query):
+        try:
+            lng, lat = (float(value) for value in query['coords'][0].split(','))
+        except (KeyError, ValueError):
+            return self._send(400, {'status': {'code': 100, 'name': 'invalid coords'}})
+
+        name = self.server.nearest_area(lat, lng)
+        self._send(200, {
+            'status': {'code': 0, 'name': 'ok', 'message': 'done'},
+            'results': [{
+                'name': 'addr',
+                'region': {
+                    'area1': {'name': '서울특별시'},
+                    'area2': {'name': name},
+                    'area3': {'name': ''},
+                },
+            }],
+        })
+
+    def _kakao_user(self, query):
+        token = self._token()
+        if token is None:
+            return self._send(401, {'msg': 'this access token does not exist', 'code': -401})
+
+        user_id = self._user_id(token)
+        self._send(200, {
+            'id': user_id,
+            'kakao_account': {
+                'email': f'kakao{user_id}@stub.baro.test',
+                'profile': {'nickname': f'카카오{user_id % 10000}'},
+            },
+        })
+
+    def _naver_user(self, query):
+        token = self._token()
+        if token is None:
+            return self._send(401, {'resultcode': '024', 'message': 'Authentication failed'})
+
+        user_id = self._user_id(token)
+        self._send(200, {
+            'resultcode': '00',
+            'message': 'success',
+            'response': {
+                'id': str(user_id),
+                'email': f'naver{user_id}@stub.baro.test',
+                'name': f'네이버{user_id % 10000}',
+            },
+        })
+
+
+class ProviderStubServer(ThreadingHTTPServer):
+    """
+    스텁 서버
+    - areas: [(이름, 위도, 경도)] → 역지오코딩은 가장 가까운 구역 이름 반환
+    - latency: 응답 지연(초) - 실제 외부 API 지연 재현용
+    - failure_status: 지정 시 모든 요청에 해당 상태 코드로 응답 (장애 / 서킷 브레이커 확인용)
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address=('127.0.0.1', 0), areas=(), latency=0.0):
+        super().__init__(address, ProviderStubHandler)
+        self.areas = list(areas) or [('강남구', 37.5172363, 127.0495556)]
+        self.latency = latency
+        self.failure_status = None
+        self.requests = {}
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def urls(self):
+        """settings 오버라이드용 URL"""
+        return {
+            'NAVER_GEOCODE_API_URL': f'{self.base_url}/map-reversegeocode/v2/gc',
+            'KAKAO_USER_INFO_URL': f'{self.base_url}/v2/user/me',
+            'NAVER_USER_INFO_URL': f'{self.base_url}/v1/nid/me',
+            'NOTIFICATION_PUSH_URL': f'{self.base_url}/push/send',
+        }
+
+    def nearest_area(self, lat, lng):
+        return min(self.areas, key=lambda area: (area[1] - lat) ** 2 + (area[2] - lng) ** 2)[0]
+
+    def count(self, path, amount=1):
+        with self._lock:
+            self.requests[path] = self.requests.get(path, 0) + amount
+
+    def start_in_thread(self):
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
@@ -0,0 +1,48 @@
+"""
+JSON 렌더러
+orjson 기반으로 DRF JSONRenderer와 동일한 바이트 출력 생성
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from core.timing import timed
+
+
+# datetime은 DRF 인코더로 넘겨서 '+00:00' → 'Z' 변환 규칙을 그대로 유지
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+_fallback_encoder = JSONEncoder()
+
+
+def _default(obj):
+    """orjson이 처리하지 못하는 타입 (lazy 문자열, Decimal, datetime 등)"""
+    return _fallback_encoder.default(obj)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    orjson 렌더러
+    - 기본 JSONRenderer와 동일한 JSON 계약 유지 (compact, UTF-8, \\u2028 이스케이프)
+    - indent 요청 시에만 기본 JSONRenderer로 위임
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with timed('render'):
+            return self._render(data, accepted_media_type, renderer_context)
+
+    def _render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=_default, option=ORJSON_OPTIONS)
+
+        # JSONRenderer와 동일하게 \u2028, \u2029 이스케이프 (JavaScript 호환)
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
@@ -0,0 +1,30 @@
+"""
+테스트 공용 헬퍼 (앱별 tests.py에서 함께 사용)
+- 쿼리 수 회귀 테스트 기준 크기 / SQL 정규화
+- 업로드용 이미지 파일
+"""
+
+import io
+import re
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+# 쿼리 수 회귀 테스트 기준 크기 (페이지 크기 / 연관 행 수)
+QUERY_SCALE_SIZES = (1, 20, 100)
+CREATE_IMAGE_COUNTS = (1, 5, 10)  # 생성 시 이미지 최대 10장
+
+
+def png_upload(name):
+    """ImageField 검증을 통과하는 1x1 PNG"""
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new('RGB', (1, 1)).save(buffer, format='PNG')
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/png')
+
+
+def sql_fingerprint(sql):
+    """쿼리 형태 비교용 정규화 (문자열/숫자 리터럴, IN 목록 제거)"""
+    sql = re.sub(r"'(?:[^']|'')*'", '?', sql)
+    sql = re.sub(r'\b\d+(?:\.\d+)?\b', '?', sql)
+    return re.sub(r'IN \([^)]*\)', 'IN (...)', sql)
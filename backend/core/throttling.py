@@ -0,0 +1,149 @@
+"""
+토큰 버킷 요청 제한 (DRF throttle)
+- 뷰의 throttle_scope(또는 액션별 throttle_scopes)에 해당하는 버킷만 사용 → 범위 없는 뷰는 비용 없음
+- 키: 범위 + 로그인 유저 ID (비로그인은 IP: NUM_PROXIES=0이면 REMOTE_ADDR, N이면 X-Forwarded-For 오른쪽에서 N번째)
+- 설정: THROTTLE_BUCKETS = {범위: (버킷 크기, 'N/단위')}
+  버킷 크기만큼 연속 요청 허용(burst) 후 'N/단위' 속도로 토큰 충전
+- Redis: Lua 스크립트 1회(EVALSHA)로 충전 + 차감을 원자적으로 처리 (시각은 Redis TIME → 서버 간 시계 차이 무관,
+  Redis 5 이상)
+  Redis가 아닌 캐시(테스트 LocMem 등)는 같은 알고리즘을 캐시 get/set으로 처리
+- 초과 시 429 + Retry-After (다음 토큰까지 남은 초), Redis 장애 시 통과 (IGNORE_EXCEPTIONS와 동일)
+"""
+
+import logging
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.throttling import BaseThrottle
+
+from core import metrics
+
+logger = logging.getLogger('baro.throttle')
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+# KEYS[1]: 버킷 키 / ARGV: 크기, 초당 충전량 → {허용 여부, 대기 초(문자열)}
+TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local allowed = 0
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    wait = (1 - tokens) / rate
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+return {allowed, tostring(wait)}
+"""
+
+
+def parse_rate(rate):
+    """'10/min' → 초당 충전량"""
+    count, period = rate.split('/')
+    return int(count) / PERIODS[period[0]]
+
+
+class RedisTokenBuckets:
+    """Lua 스크립트 기반 (프로세스당 스크립트 1회 등록, 이후 EVALSHA)"""
+
+    def __init__(self, client):
+        self.script = client.register_script(TOKEN_BUCKET_LUA)
+
+    def consume(self, key, capacity, rate):
+        allowed, wait = self.script(keys=[cache.make_key(key)], args=[capacity, rate])
+        return bool(allowed), float(wait)
+
+
+class CacheTokenBuckets:
+    """Redis가 아닌 캐시 백엔드용 (같은 알고리즘, 프로세스 내 잠금으로 직렬화)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def consume(self, key, capacity, rate):
+        with self._lock:
+            now = time.time()
+            tokens, ts = cache.get(key, (capacity, now))
+            tokens = min(capacity, tokens + max(0, now - ts) * rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            cache.set(key, (tokens, now), timeout=math.ceil(capacity / rate))
+            return allowed, 0.0 if allowed else (1 - tokens) / rate
+
+
+_redis_buckets = None
+_cache_buckets = CacheTokenBuckets()
+_buckets_lock = threading.Lock()
+
+
+def get_buckets():
+    """django-redis 캐시면 Lua 스크립트, 아니면(테스트 LocMem 등) 캐시 get/set"""
+    global _redis_buckets
+    if not hasattr(cache, 'client'):
+        return _cache_buckets
+    if _redis_buckets is None:
+        with _buckets_lock:
+            if _redis_buckets is None:
+                from django_redis import get_redis_connection
+                _redis_buckets = RedisTokenBuckets(get_redis_connection('default'))
+    return _redis_buckets
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    DEFAULT_THROTTLE_CLASSES에 등록
+    뷰: throttle_scope = 'auth' 또는 throttle_scopes = {'create': 'write', 'like': 'like'} (ViewSet 액션별)
+    """
+
+    def get_scope(self, view):
+        scopes = getattr(view, 'throttle_scopes', None)
+        if scopes:
+            return scopes.get(getattr(view, 'action', None))
+        return getattr(view, 'throttle_scope', None)
+
+    def get_cache_key(self, request, view, scope):
+        if request.user and request.user.is_authenticated:
+            ident = f'user:{request.user.pk}'
+        else:
+            ident = f'ip:{self.get_ident(request)}'
+        return f'throttle:{scope}:{ident}'
+
+    def allow_request(self, request, view):
+        self.wait_seconds = None
+        scope = self.get_scope(view)
+        if scope is None or scope not in settings.THROTTLE_BUCKETS:
+            return True
+
+        capacity, rate = settings.THROTTLE_BUCKETS[scope]
+        try:
+            allowed, wait = get_buckets().consume(self.get_cache_key(request, view, scope), capacity, parse_rate(rate))
+        except Exception as e:
+            logger.warning('throttle check failed (%s): %s', scope, e)
+            metrics.THROTTLE_DECISIONS.labels(scope, 'error').inc()
+            return True
+
+        metrics.THROTTLE_DECISIONS.labels(scope, 'allowed' if allowed else 'throttled').inc()
+        if not allowed:
+            self.wait_seconds = wait
+        return allowed
+
+    def wait(self):
+        if self.wait_seconds is None:
+            return None
+        return max(1, math.ceil(self.wait_seconds))
@@ -0,0 +1,150 @@
+"""
+요청 단위 성능 측정
+- core.middleware.ServerTimingMiddleware가 샘플링된 요청에만 RequestTimer 활성화
+- 서비스/시리얼라이저는 timed('geocode') 같은 구간 측정으로 시간을 기록
+- 측정 대상이 아닌 요청에서 timed()는 contextvar 조회 1회뿐인 no-op
+
+사용 예:
+    with timed('geocode', external=True):
+        response = requests.get(...)
+
+    @timed('area_match')
+    def match_area(...): ...
+"""
+
+import time
+from contextlib import ContextDecorator
+from contextvars import ContextVar
+
+from rest_framework import serializers
+
+
+_current_timer = ContextVar('baro_request_timer', default=None)
+
+
+class RequestTimer:
+    """
+    요청 1건의 구간별 소요 시간
+    - metrics: 이름 → [누적 초, 호출 수]
+    - SQL은 connection.execute_wrapper로 쿼리 수와 시간 집계
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.metrics = {}
+        self.external = set()
+        self.query_count = 0
+        self.sql_time = 0.0
+
+    def add(self, name, seconds, external=False):
+        metric = self.metrics.setdefault(name, [0.0, 0])
+        metric[0] += seconds
+        metric[1] += 1
+        if external:
+            self.external.add(name)
+
+    def sql_wrapper(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_time += time.perf_counter() - started
+            self.query_count += 1
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    @property
+    def external_time(self):
+        return sum(self.metrics[name][0] for name in self.external)
+
+    def metric_ms(self, name):
+        return round(self.metrics[name][0] * 1000, 2) if name in self.metrics else 0.0
+
+    def server_timing(self, total):
+        """Server-Timing 헤더 값 (구간은 서로 겹칠 수 있음: 예) area_match 안의 SQL은 db에도 포함)"""
+        entries = [f'db;dur={self.sql_time * 1000:.2f};desc="{self.query_count} queries"']
+        for name, (seconds, count) in self.metrics.items():
+            desc = f';desc="{count} calls"' if count > 1 else ''
+            entries.append(f'{name};dur={seconds * 1000:.2f}{desc}')
+        if self.external:
+            entries.append(f'external;dur={self.external_time * 1000:.2f}')
+        entries.append(f'total;dur={total * 1000:.2f}')
+        return ', '.join(entries)
+
+    def log_fields(self, total):
+        """구조화 로그 필드 (밀리초)"""
+        fields = {
+            'duration_ms': round(total * 1000, 2),
+            'query_count': self.query_count,
+            'sql_ms': round(self.sql_time * 1000, 2),
+            'external_ms': round(self.external_time * 1000, 2),
+            'serialize_ms': self.metric_ms('serialize'),
+            'render_ms': self.metric_ms('render'),
+        }
+        for name in self.metrics:
+            fields.setdefault(f'{name}_ms', self.metric_ms(name))
+        return fields
+
+
+def get_current_timer():
+    """현재 요청의 RequestTimer (측정 대상이 아니면 None)"""
+    return _current_timer.get()
+
+
+def activate(timer):
+    return _current_timer.set(timer)
+
+
+def deactivate(token):
+    _current_timer.reset(token)
+
+
+class timed(ContextDecorator):
+    """
+    구간 측정 (컨텍스트 매니저 / 데코레이터)
+    - name: Server-Timing 지표 이름 (영문, 공백 없이)
+    - external: 외부 API 호출이면 True (external_ms 합계에 포함)
+    """
+
+    def __init__(self, name, external=False):
+        self.name = name
+        self.external = external
+        self._timer = None
+
+    def _recreate_cm(self):
+        # 데코레이터로 쓸 때 호출마다 새 인스턴스 (스레드/재귀 안전)
+        return type(self)(self.name, self.external)
+
+    def __enter__(self):
+        self._timer = _current_timer.get()
+        if self._timer is not None:
+            self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._timer is not None:
+            self._timer.add(self.name, time.perf_counter() - self._started, self.external)
+        return False
+
+
+class TimedListSerializer(serializers.ListSerializer):
+    """many=True 직렬화 시간 측정"""
+
+    @property
+    def data(self):
+        with timed('serialize'):
+            return super().data
+
+
+class TimedSerializerMixin:
+    """
+    시리얼라이저 직렬화 시간 측정
+    many=True까지 측정하려면 Meta.list_serializer_class = TimedListSerializer 지정
+    """
+
+    @property
+    def data(self):
+        with timed('serialize'):
+            return super().data
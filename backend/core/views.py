@@ -0,0 +1,41 @@
+"""
+공통 뷰
+"""
+
+import ipaddress
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.crypto import constant_time_compare
+from django.views.decorators.http import require_GET
+
+from core.metrics import render_latest
+
+
+def is_allowed_metrics_ip(request):
+    """REMOTE_ADDR가 METRICS_ALLOWED_IPS(IP 또는 CIDR 대역)에 속하는지 (X-Forwarded-For는 보지 않음)"""
+    try:
+        address = ipaddress.ip_address(request.META.get('REMOTE_ADDR', ''))
+    except ValueError:
+        return False
+    return any(address in ipaddress.ip_network(network, strict=False) for network in settings.METRICS_ALLOWED_IPS)
+
+
+@require_GET
+def metrics_view(request):
+    """
+    Prometheus 스크레이프 엔드포인트
+    GET /metrics
+    - METRICS_ALLOWED_IPS 주소에서 온 요청은 허용
+    - 그 외에는 METRICS_AUTH_TOKEN Bearer 토큰 필요 (토큰 미설정이면 거부)
+    """
+    if not is_allowed_metrics_ip(request):
+        token = settings.METRICS_AUTH_TOKEN
+        if not token:
+            return HttpResponse(status=403)
+        authorization = request.headers.get('Authorization', '')
+        if not constant_time_compare(authorization, f'Bearer {token}'):
+            return HttpResponse(status=401)
+
+    content, content_type = render_latest()
+    return HttpResponse(content, content_type=content_type)
@@ -0,0 +1,25 @@
+"""
+gunicorn 설정 (backend/ 에서 `gunicorn config.wsgi` 실행 시 자동 로드)
+
+Prometheus 다중 워커 집계:
+    export PROMETHEUS_MULTIPROC_DIR=/tmp/baro-metrics
+    gunicorn config.wsgi
+- 워커마다 지표를 PROMETHEUS_MULTIPROC_DIR 파일에 기록, /metrics 요청 시 합산
+- 마스터 시작 시 이전 실행의 파일 삭제, 워커 종료 시 해당 워커의 gauge 파일 정리
+"""
+
+import os
+import shutil
+
+
+def on_starting(server):
+    directory = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+    if directory:
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory, exist_ok=True)
+
+
+def child_exit(server, worker):
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)